@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2019 Minoru Osuka
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 		http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import socket
+import timeit
+from logging import ERROR, getLogger
+from tempfile import TemporaryDirectory
+
+import yaml
+from pysyncobj import SyncObjConf
+
+from cockatrice.index_config import IndexConfig
+from cockatrice.indexer import Indexer
+
+DOCS = 50000
+NUMBER = 20
+QUERIES = [
+    ('text:engine', None),
+    ('text:retrieval OR text:engine', None),
+    ('text:engine', 'contributor:Nurg')
+]
+CONTRIBUTORS = ['43.225.167.166', 'Aistoff', 'KolbertBot', 'Citation bot', 'Nurg']
+
+
+def get_free_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(('', 0))
+        return sock.getsockname()[1]
+
+
+def get_doc(i):
+    return {
+        'id': str(i),
+        'title': 'Search engine (computing) {0}'.format(i),
+        'text': 'A search engine is an information retrieval system.' if i % 2 else 'A search engine.',
+        'contributor': CONTRIBUTORS[i % len(CONTRIBUTORS)],
+        'timestamp': '20180704'
+    }
+
+
+def main():
+    example_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '../example')
+    with open(example_dir + '/index_config.yaml', 'r', encoding='utf-8') as file_obj:
+        index_config_dict = yaml.safe_load(file_obj.read())
+    # the pages are searched every time instead of being served from the result cache
+    index_config_dict['searcher']['result_cache']['size'] = 0
+
+    with TemporaryDirectory() as temp_dir:
+        conf = SyncObjConf(fullDumpFile=temp_dir + '/index.zip', logCompactionMinTime=300,
+                           dynamicMembershipChange=True)
+        logger = getLogger('benchmark')
+        logger.setLevel(ERROR)
+        indexer = Indexer(port=get_free_port(), conf=conf, data_dir=temp_dir + '/index', grpc_port=get_free_port(),
+                          http_port=get_free_port(), logger=logger, http_logger=logger)
+        try:
+            indexer.create_index('benchmark', IndexConfig(index_config_dict), sync=True)
+            indexer.put_documents('benchmark', [get_doc(i) for i in range(DOCS)], sync=True)
+            indexer.commit_index('benchmark', sync=True)
+
+            for query, filter_query in QUERIES:
+                # the first count computes the bitsets of the segments, the following counts read them from the cache
+                first_count_time = timeit.timeit(
+                    lambda: indexer.count_documents('benchmark', query, 'text', filter_query=filter_query), number=1)
+                count = indexer.count_documents('benchmark', query, 'text', filter_query=filter_query)
+                search_time = timeit.timeit(
+                    lambda: indexer.search_documents('benchmark', query, 'text', 1, page_len=1,
+                                                     filter_query=filter_query), number=NUMBER) / NUMBER
+                count_time = timeit.timeit(
+                    lambda: indexer.count_documents('benchmark', query, 'text', filter_query=filter_query),
+                    number=NUMBER) / NUMBER
+                print('{0:>30} {1:>16}: {2:6d} documents, search {3:8.2f} ms, first count {4:8.2f} ms ({5:6.1f}x), '
+                      'count {6:8.2f} ms ({7:6.1f}x)'.format(query, filter_query or '', count, search_time * 1000,
+                                                             first_count_time * 1000, search_time / first_count_time,
+                                                             count_time * 1000, search_time / count_time))
+        finally:
+            indexer.stop()
+
+
+if __name__ == '__main__':
+    main()
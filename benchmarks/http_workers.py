@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2019 Minoru Osuka
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 		http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import socket
+import time
+from concurrent.futures import ThreadPoolExecutor
+from logging import ERROR, getLogger
+from threading import Thread
+
+import requests
+from flask import Flask
+from requests.adapters import HTTPAdapter
+
+from cockatrice.util.http import ThreadPoolWSGIServer
+
+HANDLER_TIME = 0.02
+CLIENTS = 16
+REQUESTS = 20
+WORKERS = [1, 4, 16]
+IDLE_CLIENTS = 8
+IDLE_WORKERS = 4
+
+
+def get_free_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(('', 0))
+        return sock.getsockname()[1]
+
+
+def get_app():
+    # a handler that spends the time of a small search
+    def search():
+        time.sleep(HANDLER_TIME)
+        return 'OK'
+
+    app = Flask('benchmark')
+    app.add_url_rule('/search', endpoint='search', view_func=search, methods=['GET'])
+    getLogger('werkzeug').setLevel(ERROR)
+
+    return app
+
+
+def start_server(app, max_workers):
+    port = get_free_port()
+    server = ThreadPoolWSGIServer('localhost', port, app, max_workers=max_workers, max_queue_size=100)
+    Thread(target=server.serve_forever, daemon=True).start()
+
+    return server, 'http://localhost:{0}/search'.format(port)
+
+
+def run_client(url, number):
+    # the requests of a client share a keep-alive connection, and are retried as the server may close an idle one
+    times = []
+    with requests.Session() as session:
+        session.mount('http://', HTTPAdapter(max_retries=3))
+        for _ in range(number):
+            start_time = time.time()
+            session.get(url).raise_for_status()
+            times.append(time.time() - start_time)
+
+    return times
+
+
+def get_percentile(times, percentile):
+    return sorted(times)[min(int(len(times) * percentile / 100), len(times) - 1)]
+
+
+def main():
+    app = get_app()
+
+    for max_workers in WORKERS:
+        server, url = start_server(app, max_workers)
+        try:
+            start_time = time.time()
+            with ThreadPoolExecutor(max_workers=CLIENTS) as executor:
+                list(executor.map(lambda _: run_client(url, REQUESTS), range(CLIENTS)))
+            elapsed = time.time() - start_time
+            print('workers {0:2d}, {1} keep-alive clients: {2:8.1f} req/s'.format(
+                max_workers, CLIENTS, CLIENTS * REQUESTS / elapsed))
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    # the idle keep-alive connections of more clients than workers are released for the active client
+    server, url = start_server(app, IDLE_WORKERS)
+    try:
+        sessions = [requests.Session() for _ in range(IDLE_CLIENTS)]
+        for session in sessions:
+            session.get(url).raise_for_status()
+        times = run_client(url, REQUESTS)
+        print('workers {0:2d}, {1} idle keep-alive clients: p50 {2:8.2f} ms, p99 {3:8.2f} ms'.format(
+            IDLE_WORKERS, IDLE_CLIENTS, get_percentile(times, 50) * 1000, get_percentile(times, 99) * 1000))
+        for session in sessions:
+            session.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
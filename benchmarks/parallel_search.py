@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2019 Minoru Osuka
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 		http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import random
+import socket
+import time
+from logging import ERROR, getLogger
+from tempfile import TemporaryDirectory
+
+import yaml
+from pysyncobj import SyncObjConf
+
+from cockatrice.index_config import IndexConfig
+from cockatrice.indexer import Indexer
+
+SEGMENTS = 8
+SEGMENT_DOCS = 5000
+DOC_WORDS = 100
+VOCABULARY = 20000
+NUMBER = 5
+PROCESSES = [0, 2, 4]
+QUERIES = ['w1', 'w2 OR w3', 'w4 OR w10 OR w100', 'w5 AND w6', 'w7 OR w1000']
+
+
+def get_free_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(('', 0))
+        return sock.getsockname()[1]
+
+
+def get_doc(rand, segment, i, weights):
+    # the words of the articles follow a zipf distribution as the words of the enwiki articles do
+    words = rand.choices(range(VOCABULARY), weights=weights, k=DOC_WORDS)
+    return {
+        'id': '{0}-{1}'.format(segment, i),
+        'url': 'https://en.wikipedia.org/wiki/{0}-{1}'.format(segment, i),
+        'title': 'Article {0} {1}'.format(segment, i),
+        'text': ' '.join(['w{0}'.format(word) for word in words])
+    }
+
+
+def get_percentile(times, percentile):
+    return sorted(times)[min(int(len(times) * percentile / 100), len(times) - 1)]
+
+
+def main():
+    example_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '../example')
+    with open(example_dir + '/enwiki_index_config.yaml', 'r', encoding='utf-8') as file_obj:
+        index_config_dict = yaml.safe_load(file_obj.read())
+    # the worker processes open the segments from the files of the index, each segment is written by a commit of the
+    # benchmark and every search is executed instead of being served from the result cache
+    index_config_dict['storage']['type'] = 'file'
+    index_config_dict['writer']['auto_commit']['period'] = 3600
+    index_config_dict['searcher'] = {'result_cache': {'size': 0}}
+
+    rand = random.Random(0)
+    weights = [1.0 / (rank + 1) for rank in range(VOCABULARY)]
+
+    with TemporaryDirectory() as temp_dir:
+        conf = SyncObjConf(fullDumpFile=temp_dir + '/index.zip', logCompactionMinTime=300,
+                           dynamicMembershipChange=True)
+        logger = getLogger('benchmark')
+        logger.setLevel(ERROR)
+        indexer = Indexer(port=get_free_port(), conf=conf, data_dir=temp_dir + '/index', grpc_port=get_free_port(),
+                          http_port=get_free_port(), logger=logger, http_logger=logger)
+        try:
+            indexer.create_index('enwiki', IndexConfig(index_config_dict), sync=True)
+            for segment in range(SEGMENTS):
+                indexer.put_documents('enwiki', [get_doc(rand, segment, i, weights) for i in range(SEGMENT_DOCS)],
+                                      sync=True)
+                indexer.commit_index('enwiki', sync=True)
+            print('{0} segments, {1} documents, {2} cpus'.format(
+                len(indexer.get_index('enwiki').reader().leaf_readers()), indexer.get_doc_count('enwiki'),
+                os.cpu_count()))
+
+            for processes in PROCESSES:
+                index_config_dict['searcher']['parallel_search'] = {'processes': processes}
+                indexer.close_index('enwiki', sync=True)
+                indexer.open_index('enwiki', IndexConfig(index_config_dict), sync=True)
+                # the worker processes are started and open the index on the first search
+                for query in QUERIES:
+                    indexer.search_documents('enwiki', query, 'text', 1)
+
+                times = []
+                for _ in range(NUMBER):
+                    for query in QUERIES:
+                        start_time = time.time()
+                        indexer.search_documents('enwiki', query, 'text', 1)
+                        times.append(time.time() - start_time)
+                print('processes {0}: p50 {1:8.2f} ms, p95 {2:8.2f} ms, p99 {3:8.2f} ms, max {4:8.2f} ms'.format(
+                    processes, get_percentile(times, 50) * 1000, get_percentile(times, 95) * 1000,
+                    get_percentile(times, 99) * 1000, max(times) * 1000))
+        finally:
+            indexer.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2019 Minoru Osuka
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 		http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import _pickle as pickle
+import timeit
+from datetime import datetime
+
+from cockatrice.protobuf.index_pb2 import SearchDocumentsResponse
+from cockatrice.util.protobuf import dict_to_document, document_to_dict
+
+HITS = 100
+NUMBER = 200
+
+
+def get_fields(i):
+    return {
+        'id': str(i),
+        'title': 'Search engine (computing) {0}'.format(i),
+        'text': 'A search engine is an information retrieval system designed to help find {0}. '.format(i) * 10,
+        'count': i,
+        'timestamp': datetime(2019, 1, 1)
+    }
+
+
+def encode_pickle():
+    results = {'total': HITS, 'hits': []}
+    for i in range(HITS):
+        results['hits'].append({'fields': get_fields(i), 'doc_num': i, 'score': 1.0, 'rank': i, 'pos': i})
+    return pickle.dumps(results)
+
+
+def encode_protobuf():
+    response = SearchDocumentsResponse()
+    response.total = HITS
+    for i in range(HITS):
+        hit = response.hits.add()
+        dict_to_document(get_fields(i), hit.doc)
+        hit.doc_num = i
+        hit.score = 1.0
+        hit.rank = i
+        hit.pos = i
+    return response.SerializeToString()
+
+
+def decode_pickle(data):
+    return [hit['fields'] for hit in pickle.loads(data)['hits']]
+
+
+def decode_protobuf(data):
+    response = SearchDocumentsResponse()
+    response.ParseFromString(data)
+    return [document_to_dict(hit.doc) for hit in response.hits]
+
+
+def main():
+    pickle_data = encode_pickle()
+    protobuf_data = encode_protobuf()
+
+    for name, encode, decode, data in [('pickle', encode_pickle, decode_pickle, pickle_data),
+                                       ('protobuf', encode_protobuf, decode_protobuf, protobuf_data)]:
+        encode_time = timeit.timeit(encode, number=NUMBER) / (NUMBER * HITS)
+        decode_time = timeit.timeit(lambda: decode(data), number=NUMBER) / (NUMBER * HITS)
+        print('{0:>8}: encode {1:6.2f} us/hit, decode {2:6.2f} us/hit, {3:6.1f} bytes/hit'.format(
+            name, encode_time * 1000000, decode_time * 1000000, len(data) / HITS))
+
+
+if __name__ == '__main__':
+    main()
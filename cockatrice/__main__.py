@@ -21,9 +21,9 @@ import sys
 from argparse import ArgumentDefaultsHelpFormatter, ArgumentParser
 
 from cockatrice import VERSION
-from cockatrice.cli import add_node, commit, create_index, create_snapshot, delete_document, delete_documents, \
-    delete_index, delete_node, get_document, get_index, get_snapshot, healthiness, liveness, optimize, put_document, \
-    put_documents, readiness, rollback, search, start_indexer, start_manager, status
+from cockatrice.cli import add_node, commit, count, create_index, create_snapshot, delete_document, delete_documents, \
+    delete_index, delete_node, get_document, get_documents, get_index, get_snapshot, healthiness, liveness, optimize, \
+    put_document, put_documents, readiness, rollback, search, start_indexer, start_manager, status
 
 
 def signal_handler(signal, frame):
@@ -35,6 +35,7 @@ def start_manager_handler(args):
                   log_compaction_min_entries=args.log_compaction_min_entries,
                   log_compaction_min_time=args.log_compaction_min_time, data_dir=args.data_dir,
                   grpc_port=args.grpc_port, grpc_max_workers=args.grpc_max_workers, http_port=args.http_port,
+                  http_max_workers=args.http_max_workers, http_max_queue_size=args.http_max_queue_size,
                   log_level=args.log_level, log_file=args.log_file, log_file_max_bytes=args.log_file_max_bytes,
                   log_file_backup_count=args.log_file_backup_count, http_log_file=args.http_log_file,
                   http_log_file_max_bytes=args.http_log_file_max_bytes,
@@ -46,10 +47,13 @@ def start_indexer_handler(args):
                   log_compaction_min_entries=args.log_compaction_min_entries,
                   log_compaction_min_time=args.log_compaction_min_time, data_dir=args.data_dir,
                   grpc_port=args.grpc_port, grpc_max_workers=args.grpc_max_workers, http_port=args.http_port,
-                  log_level=args.log_level, log_file=args.log_file, log_file_max_bytes=args.log_file_max_bytes,
-                  log_file_backup_count=args.log_file_backup_count, http_log_file=args.http_log_file,
-                  http_log_file_max_bytes=args.http_log_file_max_bytes,
-                  http_log_file_backup_count=args.http_log_file_backup_count)
+                  http_max_workers=args.http_max_workers, http_max_queue_size=args.http_max_queue_size,
+                  search_max_workers=args.search_max_workers, log_level=args.log_level, log_file=args.log_file,
+                  log_file_max_bytes=args.log_file_max_bytes, log_file_backup_count=args.log_file_backup_count,
+                  http_log_file=args.http_log_file, http_log_file_max_bytes=args.http_log_file_max_bytes,
+                  http_log_file_backup_count=args.http_log_file_backup_count, slow_log_file=args.slow_log_file,
+                  slow_log_file_max_bytes=args.slow_log_file_max_bytes,
+                  slow_log_file_backup_count=args.slow_log_file_backup_count)
 
 
 def create_index_handler(args):
@@ -82,6 +86,10 @@ def put_documents_handler(args):
     put_documents(args.index_name, args.documents, host=args.host, port=args.port, output=args.output, sync=args.sync)
 
 
+def get_documents_handler(args):
+    get_documents(args.index_name, args.document_ids, host=args.host, port=args.port, output=args.output)
+
+
 def delete_documents_handler(args):
     delete_documents(args.index_name, args.document_ids, host=args.host, port=args.port, output=args.output,
                      sync=args.sync)
@@ -104,6 +112,10 @@ def search_handler(args):
            weighting_file=args.weighting_file, host=args.host, port=args.port, output=args.output)
 
 
+def count_handler(args):
+    count(args.index_name, args.query, host=args.host, port=args.port, output=args.output)
+
+
 def add_node_handler(args):
     add_node(args.node_addr, host=args.host, port=args.port, output=args.output)
 
@@ -180,6 +192,12 @@ def main():
                                       help='the number of workers for gRPC server')
     parser_start_manager.add_argument('--http-port', dest='http_port', default=8080,
                                       metavar='HTTP_PORT', type=int, help='the port to listen on for HTTP traffic')
+    parser_start_manager.add_argument('--http-max-workers', dest='http_max_workers', default=10,
+                                      metavar='HTTP_MAX_WORKERS', type=int,
+                                      help='the number of workers for HTTP server')
+    parser_start_manager.add_argument('--http-max-queue-size', dest='http_max_queue_size', default=100,
+                                      metavar='HTTP_MAX_QUEUE_SIZE', type=int,
+                                      help='the number of HTTP connections allowed to wait for a worker')
     parser_start_manager.add_argument('--log-level', dest='log_level', default='DEBUG', metavar='LOG_LEVEL',
                                       type=str,
                                       help='log level')
@@ -224,6 +242,15 @@ def main():
                                       help='the number of workers for gRPC server')
     parser_start_indexer.add_argument('--http-port', dest='http_port', default=8080,
                                       metavar='HTTP_PORT', type=int, help='the port to listen on for HTTP traffic')
+    parser_start_indexer.add_argument('--http-max-workers', dest='http_max_workers', default=10,
+                                      metavar='HTTP_MAX_WORKERS', type=int,
+                                      help='the number of workers for HTTP server')
+    parser_start_indexer.add_argument('--http-max-queue-size', dest='http_max_queue_size', default=100,
+                                      metavar='HTTP_MAX_QUEUE_SIZE', type=int,
+                                      help='the number of HTTP connections allowed to wait for a worker')
+    parser_start_indexer.add_argument('--search-max-workers', dest='search_max_workers', default=10,
+                                      metavar='SEARCH_MAX_WORKERS', type=int,
+                                      help='the number of workers for the searches of multi searches')
     parser_start_indexer.add_argument('--log-level', dest='log_level', default='DEBUG', metavar='LOG_LEVEL', type=str,
                                       help='log level')
     parser_start_indexer.add_argument('--log-file', dest='log_file', default=None, metavar='LOG_FILE', type=str,
@@ -238,6 +265,12 @@ def main():
                                       metavar='HTTP_LOG_FILE_MAX_BYTES', type=int, help='http log file max bytes')
     parser_start_indexer.add_argument('--http-log-file-backup-count', dest='http_log_file_backup_count', default=5,
                                       metavar='HTTP_LOG_FILE_BACKUP_COUNT', type=int, help='http log file backup count')
+    parser_start_indexer.add_argument('--slow-log-file', dest='slow_log_file', default=None, metavar='SLOW_LOG_FILE',
+                                      type=str, help='slow log file')
+    parser_start_indexer.add_argument('--slow-log-file-max-bytes', dest='slow_log_file_max_bytes', default=512000000,
+                                      metavar='SLOW_LOG_FILE_MAX_BYTES', type=int, help='slow log file max bytes')
+    parser_start_indexer.add_argument('--slow-log-file-backup-count', dest='slow_log_file_backup_count', default=5,
+                                      metavar='SLOW_LOG_FILE_BACKUP_COUNT', type=int, help='slow log file backup count')
     parser_start_indexer.set_defaults(handler=start_indexer_handler)
 
     # create
@@ -350,6 +383,20 @@ def main():
     parser_get_document.add_argument('document_id', metavar='DOCUMENT_ID', type=str, help='the document id')
     parser_get_document.set_defaults(handler=get_document_handler)
 
+    # get documents
+    parser_get_documents = get_subparser.add_parser('documents', help='see `documents --help`',
+                                                    formatter_class=ArgumentDefaultsHelpFormatter)
+    parser_get_documents.add_argument('--host', dest='host', default='localhost', metavar='HOST', type=str,
+                                      help='the host address to listen on for http traffic')
+    parser_get_documents.add_argument('--port', dest='port', default=8080, metavar='PORT', type=int,
+                                      help='the port to listen on for HTTP traffic')
+    parser_get_documents.add_argument('--output', dest='output', default='yaml', metavar='OUTPUT', type=str,
+                                      help='the output format')
+    parser_get_documents.add_argument('index_name', metavar='INDEX_NAME', type=str, help='the index name')
+    parser_get_documents.add_argument('document_ids', metavar='DOCUMENT_IDS', type=str,
+                                      help='the comma separated document ID list')
+    parser_get_documents.set_defaults(handler=get_documents_handler)
+
     # get snapshot
     parser_get_snapshot = get_subparser.add_parser('snapshot', help='see `snapshot --help`',
                                                    formatter_class=ArgumentDefaultsHelpFormatter)
@@ -444,6 +491,19 @@ def main():
     parser_search.add_argument('query', metavar='QUERY', type=str, help='the query string')
     parser_search.set_defaults(handler=search_handler)
 
+    # count
+    parser_count = subparsers.add_parser('count', help='see `count --help`',
+                                         formatter_class=ArgumentDefaultsHelpFormatter)
+    parser_count.add_argument('--host', dest='host', default='localhost', metavar='HOST', type=str,
+                              help='the host address to listen on for http traffic')
+    parser_count.add_argument('--port', dest='port', default=8080, metavar='PORT', type=int,
+                              help='the port to listen on for HTTP traffic')
+    parser_count.add_argument('--output', dest='output', default='yaml', metavar='OUTPUT', type=str,
+                              help='the output format')
+    parser_count.add_argument('index_name', metavar='INDEX_NAME', type=str, help='the index name')
+    parser_count.add_argument('query', metavar='QUERY', type=str, help='the query string')
+    parser_count.set_defaults(handler=count_handler)
+
     # commit
     parser_commit = subparsers.add_parser('commit', help='see `commit --help`',
                                           formatter_class=ArgumentDefaultsHelpFormatter)
@@ -36,8 +36,9 @@ from cockatrice.manager import Manager
 def start_manager(host='localhost', port=7070, peer_addr=None, snapshot_file='/tmp/cockatrice/management.zip',
                   log_compaction_min_entries=5000, log_compaction_min_time=300,
                   data_dir='/tmp/cockatrice/management', grpc_port=5050, grpc_max_workers=10, http_port=8080,
-                  log_level='DEBUG', log_file=None, log_file_max_bytes=512000000, log_file_backup_count=5,
-                  http_log_file=None, http_log_file_max_bytes=512000000, http_log_file_backup_count=5):
+                  http_max_workers=10, http_max_queue_size=100, log_level='DEBUG', log_file=None,
+                  log_file_max_bytes=512000000, log_file_backup_count=5, http_log_file=None,
+                  http_log_file_max_bytes=512000000, http_log_file_backup_count=5):
     # create logger and handler
     logger = getLogger(NAME)
     log_handler = StreamHandler()
@@ -113,6 +114,7 @@ def start_manager(host='localhost', port=7070, peer_addr=None, snapshot_file='/t
     try:
         supervisor = Manager(host=host, port=port, seed_addr=peer_addr, conf=conf, data_dir=data_dir,
                              grpc_port=grpc_port, grpc_max_workers=grpc_max_workers, http_port=http_port,
+                             http_max_workers=http_max_workers, http_max_queue_size=http_max_queue_size,
                              logger=logger, http_logger=http_logger, metrics_registry=metrics_registry)
         while True:
             signal.pause()
@@ -125,9 +127,11 @@ def start_manager(host='localhost', port=7070, peer_addr=None, snapshot_file='/t
 
 def start_indexer(host='localhost', port=7070, peer_addr=None, snapshot_file='/tmp/cockatrice/index.zip',
                   log_compaction_min_entries=5000, log_compaction_min_time=300, data_dir='/tmp/cockatrice/index',
-                  grpc_port=5050, grpc_max_workers=10, http_port=8080, log_level='DEBUG', log_file=None,
-                  log_file_max_bytes=512000000, log_file_backup_count=5, http_log_file=None,
-                  http_log_file_max_bytes=512000000, http_log_file_backup_count=5):
+                  grpc_port=5050, grpc_max_workers=10, http_port=8080, http_max_workers=10, http_max_queue_size=100,
+                  search_max_workers=10, log_level='DEBUG', log_file=None, log_file_max_bytes=512000000,
+                  log_file_backup_count=5, http_log_file=None, http_log_file_max_bytes=512000000,
+                  http_log_file_backup_count=5, slow_log_file=None, slow_log_file_max_bytes=512000000,
+                  slow_log_file_backup_count=5):
     # create logger and handler
     logger = getLogger(NAME)
     log_handler = StreamHandler()
@@ -189,6 +193,27 @@ def start_indexer(host='localhost', port=7070, peer_addr=None, snapshot_file='/t
     # add http log handler
     http_logger.addHandler(http_log_handler)
 
+    # create slow logger and handler
+    slow_logger = getLogger(NAME + '_slow')
+    slow_log_handler = StreamHandler()
+
+    # determine slow log destination
+    if slow_log_file is not None:
+        os.makedirs(os.path.dirname(slow_log_file), exist_ok=True)
+        slow_log_handler = RotatingFileHandler(slow_log_file, 'a+', maxBytes=slow_log_file_max_bytes,
+                                               backupCount=slow_log_file_backup_count)
+
+    # determine slow log level
+    slow_logger.setLevel(INFO)
+    slow_log_handler.setLevel(INFO)
+
+    # set slow log format, each record is a json object
+    slow_handler_format = Formatter('%(message)s')
+    slow_log_handler.setFormatter(slow_handler_format)
+
+    # add slow log handler
+    slow_logger.addHandler(slow_log_handler)
+
     # metrics registry
     metrics_registry = CollectorRegistry()
 
@@ -204,8 +229,10 @@ def start_indexer(host='localhost', port=7070, peer_addr=None, snapshot_file='/t
     indexer = None
     try:
         indexer = Indexer(host=host, port=port, seed_addr=peer_addr, conf=conf, data_dir=data_dir,
-                          grpc_port=grpc_port, grpc_max_workers=grpc_max_workers, http_port=http_port, logger=logger,
-                          http_logger=http_logger, metrics_registry=metrics_registry)
+                          grpc_port=grpc_port, grpc_max_workers=grpc_max_workers, http_port=http_port,
+                          http_max_workers=http_max_workers, http_max_queue_size=http_max_queue_size,
+                          search_max_workers=search_max_workers, logger=logger, http_logger=http_logger,
+                          slow_logger=slow_logger, metrics_registry=metrics_registry)
         while True:
             signal.pause()
     except Exception as ex:
@@ -321,6 +348,16 @@ def put_documents(index_name, documents, host='localhost', port=8080, output='ya
         print(ex)
 
 
+def get_documents(index_name, document_ids, host='localhost', port=8080, output='yaml'):
+    try:
+        response = requests.get(
+            'http://{0}:{1}/indices/{2}/documents?ids={3}&output={4}'.format(host, port, index_name, document_ids,
+                                                                             output))
+        print(response.text)
+    except Exception as ex:
+        print(ex)
+
+
 def delete_documents(index_name, document_ids, host='localhost', port=8080, output='yaml', sync=False):
     try:
         content_type = ''
@@ -384,6 +421,15 @@ def search(index_name, query, page_num=1, page_len=10, weighting_file=None, host
         print(ex)
 
 
+def count(index_name, query, host='localhost', port=8080, output='yaml'):
+    try:
+        response = requests.get(
+            'http://{0}:{1}/indices/{2}/count?query={3}&output={4}'.format(host, port, index_name, query, output))
+        print(response.text)
+    except Exception as ex:
+        print(ex)
+
+
 def commit(index_name, host='localhost', port=8080, output='yaml', sync=False):
     try:
         response = requests.get(
@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2019 Minoru Osuka
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 		http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+from array import array
+from bisect import bisect_right
+from datetime import datetime
+
+from whoosh.sorting import Categorizer, Facets, FacetType
+from whoosh.support.relativedelta import relativedelta
+
+FACET_TYPES = ['field', 'range', 'date_range']
+
+MAX_BUCKETS = 10000
+
+GAP_PATTERN = re.compile(r'^\s*(\d+)\s*(year|month|week|day|hour|minute|second)s?\s*$')
+
+
+class SegmentOrdinals:
+    """Maps the documents of a segment to the ordinals of their values of a field.
+    """
+
+    def __init__(self, segment_searcher, fieldname):
+        reader = segment_searcher.reader()
+        fieldobj = segment_searcher.schema[fieldname]
+        doc_count = reader.doc_count_all()
+
+        self.values = []
+        self.ords = array('i', [-1]) * doc_count
+        # the other ordinals of the documents that have more than one term
+        self.extra_ords = {}
+
+        if reader.has_column(fieldname):
+            ordinals = {}
+            # columns can not tell a missing value from the default value of the column, so the documents with the
+            # default value are looked up in the terms or the stored values of the field
+            default_value = fieldobj.column_type.default_value()
+            default_docnums = []
+            column_reader = reader.column_reader(fieldname, translate=False)
+            for docnum in range(doc_count):
+                column_value = column_reader[docnum]
+                if column_value == default_value:
+                    default_docnums.append(docnum)
+                    continue
+                self.ords[docnum] = self.__get_ordinal(ordinals, fieldobj, column_value)
+            if len(default_docnums) > 0:
+                for docnum in self.__get_default_docnums(reader, fieldobj, fieldname, default_value, default_docnums):
+                    self.ords[docnum] = self.__get_ordinal(ordinals, fieldobj, default_value)
+        else:
+            for ordinal, term in enumerate(fieldobj.sortable_terms(reader, fieldname)):
+                self.values.append(fieldobj.from_bytes(term))
+                for docnum in reader.postings(fieldname, term).all_ids():
+                    if self.ords[docnum] < 0:
+                        self.ords[docnum] = ordinal
+                    else:
+                        self.extra_ords.setdefault(docnum, []).append(ordinal)
+
+    def __get_ordinal(self, ordinals, fieldobj, column_value):
+        ordinal = ordinals.get(column_value)
+        if ordinal is None:
+            ordinal = len(self.values)
+            ordinals[column_value] = ordinal
+            self.values.append(fieldobj.from_column_value(column_value))
+
+        return ordinal
+
+    @staticmethod
+    def __get_default_docnums(reader, fieldobj, fieldname, default_value, docnums):
+        # the documents of docnums that really have the default value of the column
+        try:
+            value = fieldobj.from_column_value(default_value)
+        except (OverflowError, ValueError):
+            # no document can have a default value that is out of the range of the field
+            return []
+
+        if fieldobj.indexed:
+            term = fieldobj.to_bytes(value)
+            if (fieldname, term) not in reader:
+                return []
+            docnums = set(docnums)
+            return [docnum for docnum in reader.postings(fieldname, term).all_ids() if docnum in docnums]
+        if fieldobj.stored:
+            return [docnum for docnum in docnums if reader.stored_fields(docnum).get(fieldname) == value]
+
+        # a field that is neither indexed nor stored has only its column
+        return []
+
+    def get_values(self, docnum):
+        ordinal = self.ords[docnum]
+        if ordinal < 0:
+            return []
+        if docnum not in self.extra_ords:
+            return [self.values[ordinal]]
+
+        return [self.values[ordinal]] + [self.values[extra_ordinal] for extra_ordinal in self.extra_ords[docnum]]
+
+    def get_size(self):
+        # approximate the memory held by the ordinals, counting 64 bytes for each value
+        return self.ords.itemsize * len(self.ords) + 64 * (len(self.values) + len(self.extra_ords))
+
+
+class OrdinalCategorizer(Categorizer):
+    allow_overlap = True
+
+    def __init__(self, fieldname, get_ordinals, buckets=None):
+        self.__fieldname = fieldname
+        self.__get_ordinals = get_ordinals
+        self.__bucket_starts = None if buckets is None else [start for start, _ in buckets]
+        self.__buckets = buckets
+        self.__ordinals = None
+
+    def set_searcher(self, segment_searcher, docoffset):
+        self.__ordinals = self.__get_ordinals(segment_searcher, self.__fieldname)
+
+    def keys_for(self, matcher, segment_docnum):
+        values = self.__ordinals.get_values(segment_docnum)
+        if self.__buckets is None:
+            return values
+
+        keys = []
+        for value in values:
+            i = bisect_right(self.__bucket_starts, value) - 1
+            if i >= 0 and value < self.__buckets[i][1] and self.__buckets[i] not in keys:
+                keys.append(self.__buckets[i])
+
+        return keys
+
+    def key_for(self, matcher, segment_docnum):
+        keys = self.keys_for(matcher, segment_docnum)
+
+        return keys[0] if len(keys) > 0 else None
+
+
+class OrdinalFacet(FacetType):
+    """Groups the documents by the values of a field, or by the buckets of a range.
+    """
+
+    def __init__(self, fieldname, get_ordinals, buckets=None):
+        self.fieldname = fieldname
+        self.get_ordinals = get_ordinals
+        self.buckets = buckets
+
+    def categorizer(self, global_searcher):
+        return OrdinalCategorizer(self.fieldname, self.get_ordinals, buckets=self.buckets)
+
+    def default_name(self):
+        return self.fieldname
+
+
+def get_gap(gap):
+    if isinstance(gap, (int, float)):
+        return gap
+
+    match = GAP_PATTERN.match(str(gap))
+    if match is None:
+        raise ValueError('invalid gap: {0}'.format(gap))
+
+    return relativedelta(**{match.group(2) + 's': int(match.group(1))})
+
+
+def get_datetime(value):
+    if isinstance(value, datetime):
+        return value
+
+    return datetime.fromisoformat(str(value))
+
+
+def get_number(value):
+    if isinstance(value, (int, float)):
+        return value
+
+    number = float(value)
+
+    return int(number) if number.is_integer() else number
+
+
+def get_buckets(start, end, gap):
+    buckets = []
+
+    bucket_start = start
+    while bucket_start < end:
+        bucket_end = bucket_start + gap
+        if bucket_end <= bucket_start:
+            raise ValueError('gap must be greater than 0')
+        buckets.append((bucket_start, min(bucket_end, end)))
+        if len(buckets) > MAX_BUCKETS:
+            raise ValueError('too many buckets, the maximum is {0}'.format(MAX_BUCKETS))
+        bucket_start = bucket_end
+
+    return buckets
+
+
+def get_facet_buckets(facet_dict):
+    facet_type = facet_dict.get('type') or 'field'
+    if facet_type not in FACET_TYPES:
+        raise ValueError('unsupported facet type: {0}'.format(facet_type))
+
+    if facet_type == 'field':
+        return None
+
+    for name in ['start', 'end', 'gap']:
+        if facet_dict.get(name) in [None, '']:
+            raise ValueError('{0} is required for {1} facet'.format(name, facet_type))
+
+    if facet_type == 'range':
+        return get_buckets(get_number(facet_dict['start']), get_number(facet_dict['end']),
+                           get_number(facet_dict['gap']))
+
+    return get_buckets(get_datetime(facet_dict['start']), get_datetime(facet_dict['end']), get_gap(facet_dict['gap']))
+
+
+def get_facets(facets_dict, schema, get_ordinals):
+    facets = Facets()
+
+    for facet_name, facet_dict in facets_dict.items():
+        fieldname = facet_dict.get('field') or facet_name
+        if fieldname not in schema:
+            raise ValueError('{0} does not exist in the schema'.format(fieldname))
+
+        facets.add_facet(facet_name, OrdinalFacet(fieldname, get_ordinals, buckets=get_facet_buckets(facet_dict)))
+
+    return facets
+
+
+def get_facet_counts(results, facets_dict):
+    def to_output(value):
+        return value.isoformat() if isinstance(value, datetime) else value
+
+    facet_counts = {}
+
+    for facet_name, facet_dict in facets_dict.items():
+        groups = results.groups(facet_name)
+
+        buckets = get_facet_buckets(facet_dict)
+        if buckets is None:
+            # the most frequent values first
+            counts = sorted([(count, value) for value, count in groups.items() if value is not None],
+                            key=lambda item: (-item[0], str(item[1])))
+            limit = facet_dict.get('limit') or 10
+            facet_counts[facet_name] = [{'value': to_output(value), 'count': count} for count, value in
+                                        counts[:limit]]
+        else:
+            # every bucket in order, including the empty ones
+            facet_counts[facet_name] = [{'start': to_output(start), 'end': to_output(end),
+                                         'count': groups.get((start, end), 0)} for start, end in buckets]
+
+    return facet_counts
+
+
+def merge_facet_counts(facet_counts_list, facets_dict):
+    # the counts of the same facets of several searches, the counts of the values are summed up from the most frequent
+    # values of each search, so a value that was not one of them in every search has a lower count
+    facet_counts = {}
+
+    for facet_name, facet_dict in facets_dict.items():
+        if get_facet_buckets(facet_dict) is None:
+            counts = {}
+            for search_facet_counts in facet_counts_list:
+                for facet_count in search_facet_counts[facet_name]:
+                    counts[facet_count['value']] = counts.get(facet_count['value'], 0) + facet_count['count']
+            limit = facet_dict.get('limit') or 10
+            facet_counts[facet_name] = [{'value': value, 'count': count} for value, count in
+                                        sorted(counts.items(), key=lambda item: (-item[1], str(item[0])))[:limit]]
+        else:
+            # the buckets are the same in every search
+            facet_counts[facet_name] = [dict(facet_count) for facet_count in facet_counts_list[0][facet_name]]
+            for search_facet_counts in facet_counts_list[1:]:
+                for merged_count, facet_count in zip(facet_counts[facet_name], search_facet_counts[facet_name]):
+                    merged_count['count'] += facet_count['count']
+
+    return facet_counts
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2019 Minoru Osuka
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 		http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from bisect import bisect_right
+
+from whoosh.idsets import BitSet, DocIdSet
+
+
+def get_segment_bitset(filter_query, subsearcher):
+    # deleted documents may be left in the bitset, the matchers of the searched query already skip them
+    matcher = filter_query.matcher(subsearcher, subsearcher.context())
+
+    return BitSet(matcher.all_ids(), size=subsearcher.reader().doc_count_all())
+
+
+def get_bitset_count(bitset, other=None):
+    # the bits are counted on integers instead of byte by byte, optionally only the bits that are also in other
+    bits = int.from_bytes(bitset.bits.tobytes(), 'little')
+    if other is not None:
+        bits &= int.from_bytes(other.bits.tobytes(), 'little')
+
+    return bin(bits).count('1')
+
+
+class FilterDocIdSet(DocIdSet):
+    """Document numbers allowed by a filter, made of the bitsets of the segments of a searcher.
+    """
+
+    def __init__(self, segment_bitsets):
+        self.__offsets = [offset for offset, _ in segment_bitsets]
+        self.__bitsets = [bitset for _, bitset in segment_bitsets]
+
+    def __contains__(self, docnum):
+        i = bisect_right(self.__offsets, docnum) - 1
+        if i < 0:
+            return False
+
+        return (docnum - self.__offsets[i]) in self.__bitsets[i]
+
+    def __iter__(self):
+        for offset, bitset in zip(self.__offsets, self.__bitsets):
+            for docnum in bitset:
+                yield offset + docnum
+
+    def __len__(self):
+        return sum([get_bitset_count(bitset) for bitset in self.__bitsets])
+
+    def get_bitset(self, offset):
+        # the bitset of the segment at the offset, or None if the segment has no bitset
+        i = bisect_right(self.__offsets, offset) - 1
+        if i < 0 or self.__offsets[i] != offset:
+            return None
+
+        return self.__bitsets[i]
+
+    def __bool__(self):
+        # whoosh ignores a filter that is false, but a filter that allows no documents still has to be applied
+        return True
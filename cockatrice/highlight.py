@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2019 Minoru Osuka
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 		http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from whoosh.highlight import ContextFragmenter, Highlighter, HtmlFormatter, PinpointFragmenter
+
+DEFAULT_TOP = 3
+
+DEFAULT_MAX_CHARS = 200
+
+DEFAULT_SURROUND = 20
+
+DEFAULT_CHAR_LIMIT = 10000
+
+
+def get_highlight_fields(highlight_dict, schema):
+    fields = highlight_dict.get('fields')
+    if isinstance(fields, str):
+        fields = [field.strip() for field in fields.split(',') if field.strip() != '']
+    if not fields:
+        raise ValueError('fields is required for highlight')
+
+    for field_name in fields:
+        if field_name not in schema:
+            raise ValueError('{0} does not exist in the schema'.format(field_name))
+        if not schema[field_name].stored:
+            raise ValueError('{0} is not stored'.format(field_name))
+
+    return fields
+
+
+def get_highlighters(highlight_dict, schema):
+    max_chars = highlight_dict.get('max_chars') or DEFAULT_MAX_CHARS
+    surround = highlight_dict.get('surround') or DEFAULT_SURROUND
+    # the number of characters of a hit that are looked at, which bounds the work per hit
+    char_limit = highlight_dict.get('char_limit') or DEFAULT_CHAR_LIMIT
+    formatter = HtmlFormatter(tagname=highlight_dict.get('tag') or 'b')
+
+    highlighters = {}
+
+    for field_name in get_highlight_fields(highlight_dict, schema):
+        if schema[field_name].supports('characters'):
+            # the positions of the matched terms are read from the postings instead of analyzing the stored text
+            fragmenter = PinpointFragmenter(maxchars=max_chars, surround=surround, autotrim=True,
+                                            charlimit=char_limit)
+        else:
+            fragmenter = ContextFragmenter(maxchars=max_chars, surround=surround, charlimit=char_limit)
+        highlighters[field_name] = Highlighter(fragmenter=fragmenter, formatter=formatter)
+
+    return highlighters
+
+
+def get_highlights(hit, highlighters, top=DEFAULT_TOP):
+    highlights = {}
+
+    for field_name, highlighter in highlighters.items():
+        if field_name not in hit:
+            continue
+        highlights[field_name] = highlighter.highlight_hit(hit, field_name, top=top)
+
+    return highlights
@@ -17,7 +17,9 @@
 from copy import deepcopy
 
 from whoosh.fields import Schema
+from whoosh.formats import Characters
 
+from cockatrice.scoring import get_multi_weighting
 from cockatrice.util.loader import get_instance
 
 
@@ -31,11 +33,25 @@ class IndexConfig:
             for field_name in self.__index_config_dict['schema'].keys():
                 field_type = self.__get_field_type(self.__index_config_dict['schema'][field_name]['field_type'])
                 for arg in self.__index_config_dict['schema'][field_name]['args'].keys():
-                    setattr(field_type, arg, self.__index_config_dict['schema'][field_name]['args'][arg])
+                    value = self.__index_config_dict['schema'][field_name]['args'][arg]
+                    if arg == 'sortable':
+                        # a sortable field keeps its values in a column, as the sortable argument of whoosh does
+                        field_type.column_type = field_type.default_column() if value else None
+                    elif arg == 'chars':
+                        # the postings keep the character positions of the terms, as the chars argument of whoosh does
+                        if value:
+                            field_type.format = Characters(field_boost=field_type.format.field_boost)
+                    else:
+                        setattr(field_type, arg, value)
                 self.__schema.add(field_name, field_type, glob=False)
 
             if not self.__validate():
                 raise ValueError('invalid schema')
+
+            # the weightings of the profiles are validated here, and are built and cached by the indexer, so only the
+            # config dict is pickled with the index config
+            for profile_name in self.get_weighting_profile_names():
+                get_multi_weighting({'weighting': self.get_weighting_profile(profile_name)})
         except Exception as ex:
             raise ex
 
@@ -154,3 +170,149 @@ class IndexConfig:
         except KeyError:
             limit = 10
         return limit
+
+    def get_writer_queue_batch_size(self):
+        try:
+            batch_size = self.__index_config_dict['writer']['queue']['batch_size']
+        except KeyError:
+            batch_size = 1000
+        return batch_size
+
+    def get_writer_queue_max_latency(self):
+        try:
+            max_latency = self.__index_config_dict['writer']['queue']['max_latency']
+        except KeyError:
+            max_latency = 0.0
+        return max_latency
+
+    def get_writer_queue_max_in_flight(self):
+        try:
+            max_in_flight = self.__index_config_dict['writer']['queue']['max_in_flight']
+        except KeyError:
+            max_in_flight = 4
+        return max_in_flight
+
+    def get_writer_queue_max_depth(self):
+        try:
+            max_depth = self.__index_config_dict['writer']['queue']['max_depth']
+        except KeyError:
+            max_depth = 100000
+        return max_depth
+
+    def get_writer_queue_timeout(self):
+        try:
+            timeout = self.__index_config_dict['writer']['queue']['timeout']
+        except KeyError:
+            timeout = 60.0
+        return timeout
+
+    def get_searcher_pool_size(self):
+        try:
+            pool_size = self.__index_config_dict['searcher']['pool_size']
+        except KeyError:
+            pool_size = 10
+        return pool_size
+
+    def get_searcher_query_cache_size(self):
+        try:
+            cache_size = self.__index_config_dict['searcher']['query_cache']['size']
+        except KeyError:
+            cache_size = 1000
+        return cache_size
+
+    def get_searcher_result_cache_size(self):
+        try:
+            cache_size = self.__index_config_dict['searcher']['result_cache']['size']
+        except KeyError:
+            cache_size = 0
+        return cache_size
+
+    def get_searcher_result_cache_max_bytes(self):
+        try:
+            max_bytes = self.__index_config_dict['searcher']['result_cache']['max_bytes']
+        except KeyError:
+            max_bytes = 0
+        return max_bytes
+
+    def get_searcher_filter_cache_size(self):
+        try:
+            cache_size = self.__index_config_dict['searcher']['filter_cache']['size']
+        except KeyError:
+            cache_size = 1000
+        return cache_size
+
+    def get_searcher_filter_cache_max_bytes(self):
+        try:
+            max_bytes = self.__index_config_dict['searcher']['filter_cache']['max_bytes']
+        except KeyError:
+            max_bytes = 0
+        return max_bytes
+
+    def get_searcher_facet_cache_size(self):
+        try:
+            cache_size = self.__index_config_dict['searcher']['facet_cache']['size']
+        except KeyError:
+            cache_size = 100
+        return cache_size
+
+    def get_searcher_facet_cache_max_bytes(self):
+        try:
+            max_bytes = self.__index_config_dict['searcher']['facet_cache']['max_bytes']
+        except KeyError:
+            max_bytes = 0
+        return max_bytes
+
+    def get_searcher_sort_cache_size(self):
+        try:
+            cache_size = self.__index_config_dict['searcher']['sort_cache']['size']
+        except KeyError:
+            cache_size = 100
+        return cache_size
+
+    def get_searcher_sort_cache_max_bytes(self):
+        try:
+            max_bytes = self.__index_config_dict['searcher']['sort_cache']['max_bytes']
+        except KeyError:
+            max_bytes = 0
+        return max_bytes
+
+    def get_searcher_parallel_search_processes(self):
+        try:
+            processes = self.__index_config_dict['searcher']['parallel_search']['processes']
+        except KeyError:
+            processes = 0
+        return processes
+
+    def get_slow_log_search_threshold(self):
+        try:
+            threshold = self.__index_config_dict['slow_log']['search_threshold']
+        except KeyError:
+            threshold = -1
+        return threshold
+
+    def get_slow_log_put_threshold(self):
+        try:
+            threshold = self.__index_config_dict['slow_log']['put_threshold']
+        except KeyError:
+            threshold = -1
+        return threshold
+
+    def get_slow_log_commit_threshold(self):
+        try:
+            threshold = self.__index_config_dict['slow_log']['commit_threshold']
+        except KeyError:
+            threshold = -1
+        return threshold
+
+    def get_slow_log_sample_rate(self):
+        try:
+            sample_rate = self.__index_config_dict['slow_log']['sample_rate']
+        except KeyError:
+            sample_rate = 0.0
+        return sample_rate
+
+    def get_weighting_profile_names(self):
+        return list((self.__index_config_dict.get('weighting_profiles') or {}).keys())
+
+    def get_weighting_profile(self, profile_name):
+        return (self.__index_config_dict.get('weighting_profiles') or {}).get(profile_name)
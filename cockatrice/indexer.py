@@ -15,37 +15,65 @@
 # limitations under the License.
 
 import copy
+import json
+import multiprocessing
 import os
+import random
 import re
 import threading
 import time
 import zipfile
+from bisect import bisect_left
 from concurrent import futures
+from datetime import datetime, timezone
+from fnmatch import fnmatchcase
+from functools import partial
 from http import HTTPStatus
-from logging import getLogger
-from threading import RLock, Thread, Timer
+from logging import INFO, getLogger
+from threading import Lock, RLock, Thread, Timer
 
 import grpc
 import pysyncobj.pickle as pickle
 import requests
 from prometheus_client.core import CollectorRegistry, Counter, Gauge, Histogram
-from pysyncobj import replicated, SyncObjConf
+from pysyncobj import FAIL_REASON, replicated, SyncObjConf, SyncObjException
 from whoosh.filedb.filestore import FileStorage
+from whoosh.collectors import FacetCollector, FilterCollector, TermsCollector, TimeLimit, TimeLimitCollector
 from whoosh.qparser import QueryParser
+from whoosh.scoring import BM25F
+from whoosh.searching import ResultsPage
+from whoosh.sorting import Count
 
 from cockatrice import NAME
+from cockatrice.facet import get_facet_counts, get_facets, merge_facet_counts, SegmentOrdinals
 from cockatrice.filestore.filestore import RamStorage
+from cockatrice.highlight import DEFAULT_TOP, get_highlighters, get_highlights
 from cockatrice.indexer_grpc import IndexGRPCServicer
 from cockatrice.indexer_http import IndexHTTPServicer
+from cockatrice.filter_cache import FilterDocIdSet, get_bitset_count, get_segment_bitset
+from cockatrice.profile import get_explanation, SearchProfile
 from cockatrice.protobuf.index_pb2_grpc import add_IndexServicer_to_server
+from cockatrice.results import DetachedResultsPage, get_fields, MergedResultsPage, project_fields
+from cockatrice.scoring import get_multi_weighting, get_weighting_dict, get_weighting_key
+from cockatrice.searcher_manager import SearcherManager
+from cockatrice.segment_search import get_segment_groups, get_segment_results, search_segments
+from cockatrice.sort import decode_search_after, get_hit_score_key, get_hit_sort_key, get_segment_sort_order, \
+    get_sort_fields, SCORE_FIELD, SearchAfterCollector
+from cockatrice.util.cache import LRUCache
 from cockatrice.util.http import HTTPServer
 from cockatrice.util.raft import add_node, get_leader, get_metadata, get_peers, RAFT_DATA_FILE, RaftNode
+from cockatrice.write_queue import WriteQueue, WriteQueueTimeoutError
+
+# a list or a glob of index names
+INDEX_PATTERN = re.compile(r'[,*?\[]')
+INDEX_GLOB_PATTERN = re.compile(r'[*?\[]')
 
 
 class Indexer(RaftNode):
     def __init__(self, host='localhost', port=7070, seed_addr=None, conf=SyncObjConf(),
                  data_dir='/tmp/cockatrice/index', grpc_port=5050, grpc_max_workers=10, http_port=8080,
-                 logger=getLogger(), http_logger=getLogger(), metrics_registry=CollectorRegistry()):
+                 http_max_workers=10, http_max_queue_size=100, search_max_workers=10, logger=getLogger(),
+                 http_logger=getLogger(), slow_logger=getLogger(), metrics_registry=CollectorRegistry()):
 
         self.__host = host
         self.__port = port
@@ -55,8 +83,12 @@ class Indexer(RaftNode):
         self.__grpc_port = grpc_port
         self.__grpc_max_workers = grpc_max_workers
         self.__http_port = http_port
+        self.__http_max_workers = http_max_workers
+        self.__http_max_queue_size = http_max_queue_size
+        self.__search_max_workers = search_max_workers
         self.__logger = logger
         self.__http_logger = http_logger
+        self.__slow_logger = slow_logger
         self.__metrics_registry = metrics_registry
 
         # metrics
@@ -84,6 +116,121 @@ class Indexer(RaftNode):
             ],
             registry=self.__metrics_registry
         )
+        self.__metrics_query_cache_hits_total = Counter(
+            '{0}_indexer_query_cache_hits_total'.format(NAME),
+            'The number of parsed queries and query parsers found in the cache.',
+            [
+                'index_name',
+                'cache'
+            ],
+            registry=self.__metrics_registry
+        )
+        self.__metrics_query_cache_misses_total = Counter(
+            '{0}_indexer_query_cache_misses_total'.format(NAME),
+            'The number of parsed queries and query parsers not found in the cache.',
+            [
+                'index_name',
+                'cache'
+            ],
+            registry=self.__metrics_registry
+        )
+        self.__metrics_result_cache_hits_total = Counter(
+            '{0}_indexer_result_cache_hits_total'.format(NAME),
+            'The number of search results served from the cache.',
+            [
+                'index_name'
+            ],
+            registry=self.__metrics_registry
+        )
+        self.__metrics_result_cache_misses_total = Counter(
+            '{0}_indexer_result_cache_misses_total'.format(NAME),
+            'The number of search results not found in the cache.',
+            [
+                'index_name'
+            ],
+            registry=self.__metrics_registry
+        )
+        self.__metrics_result_cache_evictions_total = Counter(
+            '{0}_indexer_result_cache_evictions_total'.format(NAME),
+            'The number of search results evicted from the cache to make room for others.',
+            [
+                'index_name'
+            ],
+            registry=self.__metrics_registry
+        )
+        self.__metrics_filter_cache_hits_total = Counter(
+            '{0}_indexer_filter_cache_hits_total'.format(NAME),
+            'The number of segment bitsets of filters found in the cache.',
+            [
+                'index_name'
+            ],
+            registry=self.__metrics_registry
+        )
+        self.__metrics_filter_cache_misses_total = Counter(
+            '{0}_indexer_filter_cache_misses_total'.format(NAME),
+            'The number of segment bitsets of filters not found in the cache.',
+            [
+                'index_name'
+            ],
+            registry=self.__metrics_registry
+        )
+        self.__metrics_facet_cache_hits_total = Counter(
+            '{0}_indexer_facet_cache_hits_total'.format(NAME),
+            'The number of segment ordinals of facet fields found in the cache.',
+            [
+                'index_name'
+            ],
+            registry=self.__metrics_registry
+        )
+        self.__metrics_facet_cache_misses_total = Counter(
+            '{0}_indexer_facet_cache_misses_total'.format(NAME),
+            'The number of segment ordinals of facet fields not found in the cache.',
+            [
+                'index_name'
+            ],
+            registry=self.__metrics_registry
+        )
+        self.__metrics_sort_cache_hits_total = Counter(
+            '{0}_indexer_sort_cache_hits_total'.format(NAME),
+            'The number of segment sort orders found in the cache.',
+            [
+                'index_name'
+            ],
+            registry=self.__metrics_registry
+        )
+        self.__metrics_sort_cache_misses_total = Counter(
+            '{0}_indexer_sort_cache_misses_total'.format(NAME),
+            'The number of segment sort orders not found in the cache.',
+            [
+                'index_name'
+            ],
+            registry=self.__metrics_registry
+        )
+        self.__metrics_search_timeouts_total = Counter(
+            '{0}_indexer_search_timeouts_total'.format(NAME),
+            'The number of searches stopped by their timeout.',
+            [
+                'index_name'
+            ],
+            registry=self.__metrics_registry
+        )
+        self.__metrics_write_queue_depth = Gauge(
+            '{0}_indexer_write_queue_depth'.format(NAME),
+            'The number of documents waiting in the write queue.',
+            [
+                'index_name'
+            ],
+            registry=self.__metrics_registry
+        )
+        self.__metrics_write_batch_size = Histogram(
+            '{0}_indexer_write_batch_size'.format(NAME),
+            'The number of documents applied in one batch.',
+            [
+                'index_name'
+            ],
+            buckets=(1, 5, 10, 50, 100, 500, 1000, 5000, 10000, float('inf')),
+            registry=self.__metrics_registry
+        )
 
         self.__self_addr = '{0}:{1}'.format(self.__host, self.__port)
         self.__peer_addrs = [] if self.__seed_addr is None else get_peers(bind_addr=self.__seed_addr, timeout=10)
@@ -95,9 +242,26 @@ class Indexer(RaftNode):
         self.__indices = {}
         self.__index_configs = {}
         self.__writers = {}
+        self.__searcher_managers = {}
+        self.__query_caches = {}
+        self.__query_parsers = {}
+        self.__result_caches = {}
+        # the filter, facet and sort caches are keyed by segment, as segments never change their documents, so their
+        # entries stay valid across generations and only the new segments are computed after a commit
+        self.__filter_caches = {}
+        self.__facet_caches = {}
+        self.__sort_caches = {}
+        self.__segment_pools = {}
+        self.__write_queues = {}
         self.__auto_commit_timers = {}
 
+        # the weightings built for the searches, shared by the indices
+        self.__weightings = LRUCache(max_size=100)
+
+        # the node lock guards the set of indices, the index locks guard the writer of each index
         self.__lock = RLock()
+        self.__index_locks = {}
+        self.__index_locks_lock = Lock()
 
         # create data dir
         os.makedirs(self.__data_dir, exist_ok=True)
@@ -150,6 +314,10 @@ class Indexer(RaftNode):
         self.metrics_timer = Timer(10, self.__record_index_metrics)
         self.metrics_timer.start()
 
+        # the searches of a multi search are run on their own workers, so that they do not wait for the workers of the
+        # servers that are running the multi searches
+        self.__search_executor = futures.ThreadPoolExecutor(max_workers=self.__search_max_workers)
+
         # start gRPC
         self.__grpc_server = grpc.server(futures.ThreadPoolExecutor(max_workers=self.__grpc_max_workers))
         add_IndexServicer_to_server(
@@ -161,7 +329,9 @@ class Indexer(RaftNode):
 
         # start HTTP server
         self.__http_servicer = IndexHTTPServicer(self, self.__logger, self.__http_logger, self.__metrics_registry)
-        self.__http_server = HTTPServer(self.__host, self.__http_port, self.__http_servicer)
+        self.__http_server = HTTPServer(self.__host, self.__http_port, self.__http_servicer,
+                                        max_workers=self.__http_max_workers,
+                                        max_queue_size=self.__http_max_queue_size, logger=self.__logger)
         self.__http_server.start()
         self.__logger.info('HTTP server has started')
 
@@ -176,10 +346,16 @@ class Indexer(RaftNode):
         self.__grpc_server.stop(grace=0.0)
         self.__logger.info('gRPC server has stopped')
 
+        self.__search_executor.shutdown(wait=True)
+
         self.metrics_timer.cancel()
 
         # close indices
         for index_name in list(self.__indices.keys()):
+            try:
+                self.flush_write_queue(index_name)
+            except WriteQueueTimeoutError as ex:
+                self.__logger.error(ex)
             self.__close_index(index_name)
 
         self.destroy()
@@ -202,6 +378,39 @@ class Indexer(RaftNode):
             func=func_name
         ).observe(time.time() - start_time)
 
+    def __log_slow(self, index_name, operation, start_time, get_record):
+        # the operations slower than the threshold of the index and a sample of the others are logged as json records,
+        # the record of an operation is built only when it is logged
+        took = time.time() - start_time
+
+        if not self.__slow_logger.isEnabledFor(INFO):
+            return
+
+        index_config = self.__index_configs.get(index_name)
+        if index_config is None:
+            return
+        threshold = {
+            'search': index_config.get_slow_log_search_threshold,
+            'put': index_config.get_slow_log_put_threshold,
+            'commit': index_config.get_slow_log_commit_threshold
+        }[operation]()
+        slow = 0 <= threshold <= took
+        if not slow and random.random() >= index_config.get_slow_log_sample_rate():
+            return
+
+        slow_record = {
+            'timestamp': datetime.fromtimestamp(start_time, timezone.utc).isoformat(),
+            'operation': operation,
+            'index_name': index_name,
+            'node': '{0}:{1}'.format(self.__host, self.__port),
+            'node_role': 'leader' if self._isLeader() else 'follower',
+            'took': took,
+            'threshold': threshold,
+            'slow': slow
+        }
+        slow_record.update(get_record())
+        self.__slow_logger.info(json.dumps(slow_record, default=str))
+
     # def __serialize_indices(self, filename):
     #     with self.__lock:
     #         try:
@@ -225,24 +434,25 @@ class Indexer(RaftNode):
                 # store the index files and raft logs to the snapshot file
                 with zipfile.ZipFile(filename, 'w', zipfile.ZIP_DEFLATED) as f:
                     for index_name in self.get_index_names():
-                        self.__commit_index(index_name)
-
-                        # with self.__get_writer(index_name).writelock:
-                        # with self.__indices[index_name].lock('WRITELOCK'):
-                        # index files
-                        for index_filename in self.get_index_files(index_name):
-                            if self.__index_configs.get(index_name).get_storage_type() == "ram":
-                                with self.__ram_storage.open_file(index_filename) as r:
-                                    f.writestr(index_filename, r.read())
-                            else:
-                                f.write(os.path.join(self.__file_storage.folder, index_filename), index_filename)
-                            self.__logger.debug('{0} has stored in {1}'.format(index_filename, filename))
-
-                        # index config file
-                        f.write(os.path.join(self.__file_storage.folder, self.get_index_config_file(index_name)),
-                                self.get_index_config_file(index_name))
-                        self.__logger.debug(
-                            '{0} has stored in {1}'.format(self.get_index_config_file(index_name), filename))
+                        with self.__get_index_lock(index_name):
+                            self.__commit_index(index_name)
+
+                            # with self.__get_writer(index_name).writelock:
+                            # with self.__indices[index_name].lock('WRITELOCK'):
+                            # index files
+                            for index_filename in self.get_index_files(index_name):
+                                if self.__index_configs.get(index_name).get_storage_type() == "ram":
+                                    with self.__ram_storage.open_file(index_filename) as r:
+                                        f.writestr(index_filename, r.read())
+                                else:
+                                    f.write(os.path.join(self.__file_storage.folder, index_filename), index_filename)
+                                self.__logger.debug('{0} has stored in {1}'.format(index_filename, filename))
+
+                            # index config file
+                            f.write(os.path.join(self.__file_storage.folder, self.get_index_config_file(index_name)),
+                                    self.get_index_config_file(index_name))
+                            self.__logger.debug(
+                                '{0} has stored in {1}'.format(self.get_index_config_file(index_name), filename))
 
                     # store the raft data
                     f.writestr(RAFT_DATA_FILE, pickle.dumps(raft_data))
@@ -349,6 +559,15 @@ class Indexer(RaftNode):
     def get_index_config_file(index_name):
         return '{0}_CONFIG'.format(index_name)
 
+    def __get_index_lock(self, index_name):
+        with self.__index_locks_lock:
+            index_lock = self.__index_locks.get(index_name, None)
+            if index_lock is None:
+                index_lock = RLock()
+                self.__index_locks[index_name] = index_lock
+
+        return index_lock
+
     def get_index_names(self):
         index_names = []
 
@@ -372,6 +591,22 @@ class Indexer(RaftNode):
     def is_index_open(self, index_name):
         return index_name in self.__indices
 
+    def resolve_index_names(self, index_pattern):
+        # a comma separated list of index names and globs of the names of the open indices
+        index_names = []
+
+        for name in [name.strip() for name in index_pattern.split(',') if name.strip() != '']:
+            if INDEX_GLOB_PATTERN.search(name):
+                matched_names = sorted([index_name for index_name in self.__indices.keys() if
+                                        fnmatchcase(index_name, name)])
+            elif self.is_index_open(name):
+                matched_names = [name]
+            else:
+                raise ValueError('{0} does not exist'.format(name))
+            index_names.extend([index_name for index_name in matched_names if index_name not in index_names])
+
+        return index_names
+
     @replicated
     def open_index(self, index_name, index_config=None):
         return self.__open_index(index_name, index_config=index_config)
@@ -408,6 +643,30 @@ class Indexer(RaftNode):
 
                 # open the index writer
                 self.__open_writer(index_name)
+
+                # open the searcher manager
+                self.__open_searcher_manager(index_name)
+
+                # open the query cache
+                self.__open_query_cache(index_name)
+
+                # open the result cache
+                self.__open_result_cache(index_name)
+
+                # open the filter cache
+                self.__open_filter_cache(index_name)
+
+                # open the facet cache
+                self.__open_facet_cache(index_name)
+
+                # open the sort cache
+                self.__open_sort_cache(index_name)
+
+                # open the segment pool
+                self.__open_segment_pool(index_name)
+
+                # open the write queue
+                self.__open_write_queue(index_name)
         except Exception as ex:
             self.__logger.error('failed to open {0}: {1}'.format(index_name, ex))
         finally:
@@ -415,8 +674,15 @@ class Indexer(RaftNode):
 
         return index
 
+    def close_index(self, index_name, sync=False):
+        # the writes queued on this node are replicated before the command closing the index, as the command can not
+        # wait for them in the thread applying the commands
+        self.flush_write_queue(index_name)
+
+        return self._close_index(index_name, sync=sync)
+
     @replicated
-    def close_index(self, index_name):
+    def _close_index(self, index_name):
         return self.__close_index(index_name)
 
     def __close_index(self, index_name):
@@ -424,20 +690,45 @@ class Indexer(RaftNode):
 
         index = None
 
-        try:
-            # close the index writer
-            self.__close_writer(index_name)
+        with self.__get_index_lock(index_name):
+            try:
+                # close the write queue
+                self.__close_write_queue(index_name)
 
-            # close the index
-            index = self.__indices.pop(index_name)
-            if index is not None:
-                self.__logger.debug('closing {0}'.format(index_name))
-                index.close()
-                self.__logger.info('{0} has closed'.format(index_name))
-        except Exception as ex:
-            self.__logger.error('failed to close {0}: {1}'.format(index_name, ex))
-        finally:
-            self.__record_metrics(start_time, 'close_index')
+                # close the index writer
+                self.__close_writer(index_name)
+
+                # close the searcher manager
+                self.__close_searcher_manager(index_name)
+
+                # close the query cache
+                self.__close_query_cache(index_name)
+
+                # close the result cache
+                self.__close_result_cache(index_name)
+
+                # close the filter cache
+                self.__close_filter_cache(index_name)
+
+                # close the facet cache
+                self.__close_facet_cache(index_name)
+
+                # close the sort cache
+                self.__close_sort_cache(index_name)
+
+                # close the segment pool
+                self.__close_segment_pool(index_name)
+
+                # close the index
+                index = self.__indices.pop(index_name)
+                if index is not None:
+                    self.__logger.debug('closing {0}'.format(index_name))
+                    index.close()
+                    self.__logger.info('{0} has closed'.format(index_name))
+            except Exception as ex:
+                self.__logger.error('failed to close {0}: {1}'.format(index_name, ex))
+            finally:
+                self.__record_metrics(start_time, 'close_index')
 
         return index
 
@@ -454,7 +745,7 @@ class Indexer(RaftNode):
 
         index = None
 
-        with self.__lock:
+        with self.__lock, self.__get_index_lock(index_name):
             try:
                 self.__logger.debug('creating {0}'.format(index_name))
 
@@ -480,6 +771,30 @@ class Indexer(RaftNode):
 
                 # open the index writer
                 self.__open_writer(index_name)
+
+                # open the searcher manager
+                self.__open_searcher_manager(index_name)
+
+                # open the query cache
+                self.__open_query_cache(index_name)
+
+                # open the result cache
+                self.__open_result_cache(index_name)
+
+                # open the filter cache
+                self.__open_filter_cache(index_name)
+
+                # open the facet cache
+                self.__open_facet_cache(index_name)
+
+                # open the sort cache
+                self.__open_sort_cache(index_name)
+
+                # open the segment pool
+                self.__open_segment_pool(index_name)
+
+                # open the write queue
+                self.__open_write_queue(index_name)
             except Exception as ex:
                 self.__logger.error('failed to create {0}: {1}'.format(index_name, ex))
             finally:
@@ -487,8 +802,14 @@ class Indexer(RaftNode):
 
         return index
 
+    def delete_index(self, index_name, sync=False):
+        # the writes queued on this node are replicated before the command deleting the index
+        self.flush_write_queue(index_name)
+
+        return self._delete_index(index_name, sync=sync)
+
     @replicated
-    def delete_index(self, index_name):
+    def _delete_index(self, index_name):
         return self.__delete_index(index_name)
 
     def __delete_index(self, index_name):
@@ -497,7 +818,7 @@ class Indexer(RaftNode):
 
         start_time = time.time()
 
-        with self.__lock:
+        with self.__lock, self.__get_index_lock(index_name):
             try:
                 self.__logger.debug('deleting {0}'.format(index_name))
 
@@ -590,16 +911,528 @@ class Indexer(RaftNode):
     def __get_writer(self, index_name):
         return self.__writers.get(index_name, None)
 
-    def __get_searcher(self, index_name, weighting=None):
+    def __open_searcher_manager(self, index_name):
+        searcher_manager = None
+
         try:
-            if weighting is None:
-                searcher = self.__indices.get(index_name).searcher()
+            searcher_manager = self.__searcher_managers.get(index_name, None)
+            if searcher_manager is None:
+                self.__logger.debug('opening searcher manager for {0}'.format(index_name))
+                searcher_manager = SearcherManager(self.__indices.get(index_name),
+                                                   pool_size=self.__index_configs.get(
+                                                       index_name).get_searcher_pool_size(),
+                                                   logger=self.__logger)
+                self.__searcher_managers[index_name] = searcher_manager
+                self.__logger.debug('searcher manager for {0} has opened'.format(index_name))
+        except Exception as ex:
+            self.__logger.error('failed to open searcher manager for {0}: {1}'.format(index_name, ex))
+
+        return searcher_manager
+
+    def __close_searcher_manager(self, index_name):
+        searcher_manager = None
+
+        try:
+            searcher_manager = self.__searcher_managers.pop(index_name, None)
+            if searcher_manager is not None:
+                self.__logger.debug('closing searcher manager for {0}'.format(index_name))
+                searcher_manager.close()
+                self.__logger.debug('searcher manager for {0} has closed'.format(index_name))
+        except Exception as ex:
+            self.__logger.error('failed to close searcher manager for {0}: {1}'.format(index_name, ex))
+
+        return searcher_manager
+
+    def __refresh_searcher_manager(self, index_name):
+        try:
+            searcher_manager = self.__searcher_managers.get(index_name, None)
+            if searcher_manager is not None and searcher_manager.refresh():
+                self.__logger.debug('searcher manager for {0} has refreshed'.format(index_name))
+
+                # the cached results of the previous generation will never be served again
+                result_cache = self.__result_caches.get(index_name, None)
+                if result_cache is not None:
+                    result_cache.clear()
+        except Exception as ex:
+            self.__logger.error('failed to refresh searcher manager for {0}: {1}'.format(index_name, ex))
+
+    def __open_query_cache(self, index_name):
+        query_cache = None
+
+        try:
+            query_cache = self.__query_caches.get(index_name, None)
+            if query_cache is None:
+                self.__logger.debug('opening query cache for {0}'.format(index_name))
+                cache_size = self.__index_configs.get(index_name).get_searcher_query_cache_size()
+                query_cache = LRUCache(max_size=cache_size)
+                self.__query_caches[index_name] = query_cache
+                self.__query_parsers[index_name] = LRUCache(max_size=cache_size)
+                self.__logger.debug('query cache for {0} has opened'.format(index_name))
+        except Exception as ex:
+            self.__logger.error('failed to open query cache for {0}: {1}'.format(index_name, ex))
+
+        return query_cache
+
+    def __close_query_cache(self, index_name):
+        query_cache = None
+
+        try:
+            # the parsed queries are bound to the schema of the index, so they are dropped with it
+            query_cache = self.__query_caches.pop(index_name, None)
+            self.__query_parsers.pop(index_name, None)
+            if query_cache is not None:
+                self.__logger.debug('query cache for {0} has closed'.format(index_name))
+        except Exception as ex:
+            self.__logger.error('failed to close query cache for {0}: {1}'.format(index_name, ex))
+
+        return query_cache
+
+    def __get_query_parser(self, index_name, search_field):
+        query_parsers = self.__query_parsers.get(index_name)
+
+        query_parser = query_parsers.get(search_field)
+        if query_parser is None:
+            self.__metrics_query_cache_misses_total.labels(index_name=index_name, cache='parser').inc()
+            query_parser = QueryParser(search_field, self.__index_configs.get(index_name).get_schema())
+            query_parsers.put(search_field, query_parser)
+        else:
+            self.__metrics_query_cache_hits_total.labels(index_name=index_name, cache='parser').inc()
+
+        return query_parser
+
+    def __parse_query(self, index_name, query, search_field):
+        query_cache = self.__query_caches.get(index_name)
+
+        query_obj = query_cache.get((search_field, query))
+        if query_obj is None:
+            self.__metrics_query_cache_misses_total.labels(index_name=index_name, cache='query').inc()
+            query_obj = self.__get_query_parser(index_name, search_field).parse(query)
+            query_cache.put((search_field, query), query_obj)
+        else:
+            self.__metrics_query_cache_hits_total.labels(index_name=index_name, cache='query').inc()
+
+        return query_obj
+
+    def __open_result_cache(self, index_name):
+        result_cache = None
+
+        try:
+            result_cache = self.__result_caches.get(index_name, None)
+            if result_cache is None:
+                self.__logger.debug('opening result cache for {0}'.format(index_name))
+                index_config = self.__index_configs.get(index_name)
+                result_cache = LRUCache(max_size=index_config.get_searcher_result_cache_size(),
+                                        max_bytes=index_config.get_searcher_result_cache_max_bytes())
+                self.__result_caches[index_name] = result_cache
+                self.__logger.debug('result cache for {0} has opened'.format(index_name))
+        except Exception as ex:
+            self.__logger.error('failed to open result cache for {0}: {1}'.format(index_name, ex))
+
+        return result_cache
+
+    def __close_result_cache(self, index_name):
+        result_cache = None
+
+        try:
+            result_cache = self.__result_caches.pop(index_name, None)
+            if result_cache is not None:
+                result_cache.clear()
+                self.__logger.debug('result cache for {0} has closed'.format(index_name))
+        except Exception as ex:
+            self.__logger.error('failed to close result cache for {0}: {1}'.format(index_name, ex))
+
+        return result_cache
+
+    def __get_result_cache_key(self, index_name, query_obj, page_num, page_len, weighting, filter_obj, options,
+                               kwargs):
+        result_cache = self.__result_caches.get(index_name, None)
+        if result_cache is None or result_cache.get_max_size() <= 0:
+            return None
+
+        try:
+            # the options such as facets and highlight are nested dicts and lists, so they are keyed by their json
+            options_key = json.dumps(options, sort_keys=True, default=str)
+            cache_key = (query_obj, page_num, page_len, get_weighting_key(weighting), filter_obj, options_key,
+                         tuple(sorted(kwargs.items())))
+            hash(cache_key)
+        except TypeError:
+            # the search can not be cached if any of its options is not hashable
+            return None
+
+        return cache_key
+
+    def __get_cached_results_page(self, index_name, cache_key, generation):
+        entry = self.__result_caches.get(index_name).get(cache_key)
+        if entry is None or entry[0] != generation:
+            self.__metrics_result_cache_misses_total.labels(index_name=index_name).inc()
+            return None
+
+        self.__metrics_result_cache_hits_total.labels(index_name=index_name).inc()
+
+        return entry[1]
+
+    def __put_cached_results_page(self, index_name, cache_key, generation, results_page):
+        result_cache = self.__result_caches.get(index_name)
+        if result_cache.get_max_size() <= 0:
+            return
+
+        # the size of the page is only needed to bound the bytes of the cache
+        size = results_page.get_size() if result_cache.get_max_bytes() > 0 else 0
+        evicted = result_cache.put(cache_key, (generation, results_page), size=size)
+        if evicted > 0:
+            self.__metrics_result_cache_evictions_total.labels(index_name=index_name).inc(evicted)
+
+    def __open_filter_cache(self, index_name):
+        filter_cache = None
+
+        try:
+            filter_cache = self.__filter_caches.get(index_name, None)
+            if filter_cache is None:
+                self.__logger.debug('opening filter cache for {0}'.format(index_name))
+                index_config = self.__index_configs.get(index_name)
+                filter_cache = LRUCache(max_size=index_config.get_searcher_filter_cache_size(),
+                                        max_bytes=index_config.get_searcher_filter_cache_max_bytes())
+                self.__filter_caches[index_name] = filter_cache
+                self.__logger.debug('filter cache for {0} has opened'.format(index_name))
+        except Exception as ex:
+            self.__logger.error('failed to open filter cache for {0}: {1}'.format(index_name, ex))
+
+        return filter_cache
+
+    def __close_filter_cache(self, index_name):
+        filter_cache = None
+
+        try:
+            filter_cache = self.__filter_caches.pop(index_name, None)
+            if filter_cache is not None:
+                filter_cache.clear()
+                self.__logger.debug('filter cache for {0} has closed'.format(index_name))
+        except Exception as ex:
+            self.__logger.error('failed to close filter cache for {0}: {1}'.format(index_name, ex))
+
+        return filter_cache
+
+    def __get_filter(self, index_name, searcher, filter_obj):
+        filter_cache = self.__filter_caches.get(index_name)
+
+        # the bitsets are cached per segment
+        segment_bitsets = []
+        for subsearcher, offset in searcher.leaf_searchers():
+            reader = subsearcher.reader()
+            if reader.doc_count_all() <= 0:
+                continue
+
+            cache_key = (reader.segment().segment_id(), filter_obj)
+            bitset = filter_cache.get(cache_key)
+            if bitset is None:
+                self.__metrics_filter_cache_misses_total.labels(index_name=index_name).inc()
+                bitset = get_segment_bitset(filter_obj, subsearcher)
+                filter_cache.put(cache_key, bitset, size=bitset.byte_count())
             else:
-                searcher = self.__indices.get(index_name).searcher(weighting=weighting)
+                self.__metrics_filter_cache_hits_total.labels(index_name=index_name).inc()
+            segment_bitsets.append((offset, bitset))
+
+        return FilterDocIdSet(segment_bitsets)
+
+    def __open_facet_cache(self, index_name):
+        facet_cache = None
+
+        try:
+            facet_cache = self.__facet_caches.get(index_name, None)
+            if facet_cache is None:
+                self.__logger.debug('opening facet cache for {0}'.format(index_name))
+                index_config = self.__index_configs.get(index_name)
+                facet_cache = LRUCache(max_size=index_config.get_searcher_facet_cache_size(),
+                                       max_bytes=index_config.get_searcher_facet_cache_max_bytes())
+                self.__facet_caches[index_name] = facet_cache
+                self.__logger.debug('facet cache for {0} has opened'.format(index_name))
+        except Exception as ex:
+            self.__logger.error('failed to open facet cache for {0}: {1}'.format(index_name, ex))
+
+        return facet_cache
+
+    def __close_facet_cache(self, index_name):
+        facet_cache = None
+
+        try:
+            facet_cache = self.__facet_caches.pop(index_name, None)
+            if facet_cache is not None:
+                facet_cache.clear()
+                self.__logger.debug('facet cache for {0} has closed'.format(index_name))
+        except Exception as ex:
+            self.__logger.error('failed to close facet cache for {0}: {1}'.format(index_name, ex))
+
+        return facet_cache
+
+    def __get_ordinals(self, index_name, segment_searcher, fieldname):
+        facet_cache = self.__facet_caches.get(index_name)
+
+        # the ordinals are cached per segment
+        cache_key = (segment_searcher.reader().segment().segment_id(), fieldname)
+        ordinals = facet_cache.get(cache_key)
+        if ordinals is None:
+            self.__metrics_facet_cache_misses_total.labels(index_name=index_name).inc()
+            ordinals = SegmentOrdinals(segment_searcher, fieldname)
+            facet_cache.put(cache_key, ordinals, size=ordinals.get_size())
+        else:
+            self.__metrics_facet_cache_hits_total.labels(index_name=index_name).inc()
+
+        return ordinals
+
+    def __open_sort_cache(self, index_name):
+        sort_cache = None
+
+        try:
+            sort_cache = self.__sort_caches.get(index_name, None)
+            if sort_cache is None:
+                self.__logger.debug('opening sort cache for {0}'.format(index_name))
+                index_config = self.__index_configs.get(index_name)
+                sort_cache = LRUCache(max_size=index_config.get_searcher_sort_cache_size(),
+                                      max_bytes=index_config.get_searcher_sort_cache_max_bytes())
+                self.__sort_caches[index_name] = sort_cache
+                self.__logger.debug('sort cache for {0} has opened'.format(index_name))
+        except Exception as ex:
+            self.__logger.error('failed to open sort cache for {0}: {1}'.format(index_name, ex))
+
+        return sort_cache
+
+    def __close_sort_cache(self, index_name):
+        sort_cache = None
+
+        try:
+            sort_cache = self.__sort_caches.pop(index_name, None)
+            if sort_cache is not None:
+                sort_cache.clear()
+                self.__logger.debug('sort cache for {0} has closed'.format(index_name))
+        except Exception as ex:
+            self.__logger.error('failed to close sort cache for {0}: {1}'.format(index_name, ex))
+
+        return sort_cache
+
+    def __open_segment_pool(self, index_name):
+        segment_pool = None
+
+        try:
+            segment_pool = self.__segment_pools.get(index_name, None)
+            index_config = self.__index_configs.get(index_name)
+            processes = index_config.get_searcher_parallel_search_processes()
+            # the worker processes open the segments from the files of the index, so the indices in memory are not
+            # searched in parallel
+            if segment_pool is None and processes > 0 and index_config.get_storage_type() != 'ram':
+                self.__logger.debug('opening segment pool for {0}'.format(index_name))
+                # the worker processes are spawned, as forking a process with running threads is not safe
+                segment_pool = futures.ProcessPoolExecutor(max_workers=processes,
+                                                           mp_context=multiprocessing.get_context('spawn'))
+                self.__segment_pools[index_name] = segment_pool
+                self.__logger.debug('segment pool for {0} has opened'.format(index_name))
+        except Exception as ex:
+            self.__logger.error('failed to open segment pool for {0}: {1}'.format(index_name, ex))
+
+        return segment_pool
+
+    def __close_segment_pool(self, index_name):
+        segment_pool = None
+
+        try:
+            segment_pool = self.__segment_pools.pop(index_name, None)
+            if segment_pool is not None:
+                segment_pool.shutdown(wait=True)
+                self.__logger.debug('segment pool for {0} has closed'.format(index_name))
+        except Exception as ex:
+            self.__logger.error('failed to close segment pool for {0}: {1}'.format(index_name, ex))
+
+        return segment_pool
+
+    def __search_segments(self, index_name, searcher, query_obj, limit, allow, timeout):
+        # the groups of segments of the searcher are searched by the worker processes of the index and their best
+        # documents are merged, or None is returned if they are not searched in parallel
+        segment_pool = self.__segment_pools.get(index_name, None)
+        if segment_pool is None:
+            return None, False
+
+        processes = self.__index_configs.get(index_name).get_searcher_parallel_search_processes()
+        groups = get_segment_groups(searcher, processes, allow=allow)
+        if len(groups) <= 1:
+            return None, False
+
+        try:
+            segment_futures = [segment_pool.submit(search_segments, self.__data_dir, index_name,
+                                                   searcher.reader().generation(), group, query_obj,
+                                                   searcher.weighting, limit, timeout=timeout) for group in groups]
+            segment_results = [segment_future.result() for segment_future in segment_futures]
+        except Exception as ex:
+            # such as when the index has been committed since the searcher was opened, the segments are searched in
+            # this thread instead
+            self.__logger.warning('failed to search the segments of {0} in parallel: {1}'.format(index_name, ex))
+            return None, False
+
+        return get_segment_results(searcher, query_obj, limit, segment_results)
+
+    def __get_sort_order(self, index_name, subsearcher, sort_fields):
+        sort_cache = self.__sort_caches.get(index_name)
+
+        # the sort orders are cached per segment
+        cache_key = (subsearcher.reader().segment().segment_id(), sort_fields)
+        order = sort_cache.get(cache_key)
+        if order is None:
+            self.__metrics_sort_cache_misses_total.labels(index_name=index_name).inc()
+            order = get_segment_sort_order(subsearcher, sort_fields)
+            sort_cache.put(cache_key, order, size=order.itemsize * len(order))
+        else:
+            self.__metrics_sort_cache_hits_total.labels(index_name=index_name).inc()
+
+        return order
+
+    def __open_write_queue(self, index_name):
+        write_queue = None
+
+        try:
+            write_queue = self.__write_queues.get(index_name, None)
+            if write_queue is None:
+                self.__logger.debug('opening write queue for {0}'.format(index_name))
+                index_config = self.__index_configs.get(index_name)
+                write_queue = WriteQueue(index_name, self.__apply_write_batch,
+                                         batch_size=index_config.get_writer_queue_batch_size(),
+                                         max_latency=index_config.get_writer_queue_max_latency(),
+                                         max_in_flight=index_config.get_writer_queue_max_in_flight(),
+                                         max_depth=index_config.get_writer_queue_max_depth(),
+                                         logger=self.__logger)
+                self.__write_queues[index_name] = write_queue
+                self.__logger.debug('write queue for {0} has opened'.format(index_name))
+        except Exception as ex:
+            self.__logger.error('failed to open write queue for {0}: {1}'.format(index_name, ex))
+
+        return write_queue
+
+    def __close_write_queue(self, index_name):
+        write_queue = None
+
+        try:
+            write_queue = self.__write_queues.pop(index_name, None)
+            if write_queue is not None:
+                self.__logger.debug('closing write queue for {0}'.format(index_name))
+                # the writes have been drained before the index closes, and the ones queued since then are not applied
+                if not write_queue.close(timeout=0.0):
+                    self.__logger.error('writes to {0} were discarded as the index has closed'.format(index_name))
+                self.__metrics_write_queue_depth.labels(index_name=index_name).set(0)
+                self.__logger.debug('write queue for {0} has closed'.format(index_name))
+        except Exception as ex:
+            self.__logger.error('failed to close write queue for {0}: {1}'.format(index_name, ex))
+
+        return write_queue
+
+    def __apply_write_batch(self, index_name, ops, callback):
+        self.__metrics_write_batch_size.labels(index_name=index_name).observe(sum([len(items) for _, items in ops]))
+
+        write_queue = self.__write_queues.get(index_name, None)
+        if write_queue is not None:
+            self.__metrics_write_queue_depth.labels(index_name=index_name).set(write_queue.get_depth())
+
+        def on_result(result, reason):
+            if reason == FAIL_REASON.SUCCESS:
+                callback(result, None)
+            else:
+                callback(None, SyncObjException(reason))
+
+        # the whole batch is replicated as one command and applied in one writer pass
+        self.write_documents(index_name, ops, callback=on_result)
+
+    def __queue_documents(self, index_name, op, items, sync=False):
+        write_queue = self.__write_queues.get(index_name, None)
+        if write_queue is None:
+            # fall back to the replicated command, which reports the missing index
+            if op == 'put':
+                return self.put_documents(index_name, items, sync=sync)
+            else:
+                return self.delete_documents(index_name, items, sync=sync)
+
+        # the writes wait for room in the queue and a synchronous write for being applied up to the timeout
+        timeout = self.__index_configs.get(index_name).get_writer_queue_timeout()
+        future = write_queue.put(op, items, timeout=timeout)
+        self.__metrics_write_queue_depth.labels(index_name=index_name).set(write_queue.get_depth())
+        if not sync:
+            return None
+
+        try:
+            return future.result(timeout=timeout)
+        except futures.TimeoutError:
+            raise WriteQueueTimeoutError('writes to {0} were not applied within {1} seconds'.format(index_name,
+                                                                                                  timeout))
+
+    def queue_put_document(self, index_name, doc_id, fields, sync=False):
+        index_config = self.__index_configs.get(index_name, None)
+        if index_config is None:
+            return self.put_document(index_name, doc_id, fields, sync=sync)
+
+        doc = copy.deepcopy(fields)
+        doc[index_config.get_doc_id_field()] = doc_id
+
+        return self.queue_put_documents(index_name, [doc], sync=sync)
+
+    def queue_put_documents(self, index_name, docs, sync=False):
+        return self.__queue_documents(index_name, 'put', docs, sync=sync)
+
+    def queue_delete_document(self, index_name, doc_id, sync=False):
+        return self.queue_delete_documents(index_name, [doc_id], sync=sync)
+
+    def queue_delete_documents(self, index_name, doc_ids, sync=False):
+        return self.__queue_documents(index_name, 'delete', doc_ids, sync=sync)
+
+    def flush_write_queue(self, index_name, timeout=None):
+        # wait until the writes queued so far have been applied, up to the timeout of the write queue by default
+        write_queue = self.__write_queues.get(index_name, None)
+        if write_queue is None:
+            return
+
+        if timeout is None:
+            timeout = self.__index_configs.get(index_name).get_writer_queue_timeout()
+        if not write_queue.flush(timeout=timeout):
+            raise WriteQueueTimeoutError('writes to {0} were not applied within {1} seconds'.format(index_name,
+                                                                                                  timeout))
+
+    def __get_searcher(self, index_name, weighting=None):
+        try:
+            searcher_manager = self.__searcher_managers.get(index_name)
+            # the pooled searcher swaps its weighting for the one of the search without reopening its readers
+            searcher = searcher_manager.acquire(weighting=self.__get_weighting(index_name, weighting))
         except Exception as ex:
             raise ex
 
-        return searcher
+        return searcher_manager, searcher
+
+    def __get_weighting(self, index_name, weighting):
+        # a weighting is the name of a weighting profile of the index, the weighting mapping of a search request, a
+        # weighting class or object, or None for the default profile of the index if any, and the weightings built
+        # from the mappings of the profiles and the requests and from the classes are cached, so the searches share
+        # the same weighting objects
+        if weighting is None:
+            index_config = self.__index_configs.get(index_name)
+            weighting = None if index_config is None else index_config.get_weighting_profile('default')
+            if weighting is None:
+                weighting = BM25F
+        elif isinstance(weighting, str):
+            index_config = self.__index_configs.get(index_name)
+            profile = None if index_config is None else index_config.get_weighting_profile(weighting)
+            if profile is None:
+                raise ValueError('weighting profile {0} does not exist in {1}'.format(weighting, index_name))
+            weighting = profile
+
+        if isinstance(weighting, dict):
+            key = json.dumps(weighting, sort_keys=True, default=str)
+        elif isinstance(weighting, type):
+            key = weighting
+        else:
+            return weighting
+
+        cached_weighting = self.__weightings.get(key)
+        if cached_weighting is None:
+            if isinstance(weighting, dict):
+                cached_weighting = get_multi_weighting({'weighting': weighting})
+            else:
+                cached_weighting = weighting()
+            self.__weightings.put(key, cached_weighting)
+
+        return cached_weighting
 
     @replicated
     def commit_index(self, index_name):
@@ -610,12 +1443,13 @@ class Indexer(RaftNode):
 
         success = False
 
-        with self.__lock:
+        with self.__get_index_lock(index_name):
             try:
                 self.__logger.debug('committing {0}'.format(index_name))
 
                 self.__get_writer(index_name).commit()
                 self.__open_writer(index_name)  # reopen writer
+                self.__refresh_searcher_manager(index_name)
 
                 self.__logger.info('{0} has committed'.format(index_name))
 
@@ -625,6 +1459,8 @@ class Indexer(RaftNode):
             finally:
                 self.__record_metrics(start_time, 'commit_index')
 
+        self.__log_slow(index_name, 'commit', start_time, lambda: {'success': success})
+
         return success
 
     @replicated
@@ -636,7 +1472,7 @@ class Indexer(RaftNode):
 
         success = False
 
-        with self.__lock:
+        with self.__get_index_lock(index_name):
             try:
                 self.__logger.debug('rolling back {0}'.format(index_name))
 
@@ -662,12 +1498,13 @@ class Indexer(RaftNode):
 
         success = False
 
-        with self.__lock:
+        with self.__get_index_lock(index_name):
             try:
                 self.__logger.debug('optimizing {0}'.format(index_name))
 
                 self.__get_writer(index_name).commit(optimize=True, merge=False)
                 self.__open_writer(index_name)  # reopen writer
+                self.__refresh_searcher_manager(index_name)
 
                 self.__logger.info('{0} has optimized'.format(index_name))
 
@@ -712,16 +1549,11 @@ class Indexer(RaftNode):
     def __put_documents(self, index_name, docs):
         start_time = time.time()
 
-        with self.__lock:
+        with self.__get_index_lock(index_name):
             try:
                 self.__logger.debug('putting documents to {0}'.format(index_name))
 
-                # count = self.__get_writer(index_name).update_documents(docs)
-
-                count = 0
-                for doc in docs:
-                    self.__get_writer(index_name).update_document(**doc)
-                    count += 1
+                count = self.__update_documents(index_name, docs)
 
                 self.__logger.info('{0} documents has put to {1}'.format(count, index_name))
             except Exception as ex:
@@ -730,21 +1562,53 @@ class Indexer(RaftNode):
             finally:
                 self.__record_metrics(start_time, 'put_documents')
 
+        self.__log_slow(index_name, 'put', start_time, lambda: {'docs': len(docs), 'count': count})
+
         return count
 
-    def get_document(self, index_name, doc_id):
+    def get_document(self, index_name, doc_id, fields=None):
+        start_time = time.time()
+
         try:
-            results_page = self.search_documents(index_name, doc_id,
-                                                 self.__index_configs.get(index_name).get_doc_id_field(), 1,
-                                                 page_len=1)
-            if results_page.total > 0:
+            fields = self.__get_stored_fields(index_name, [doc_id], fields=fields).get(doc_id)
+            if fields is not None:
                 self.__logger.debug('{0} was got from {1}'.format(doc_id, index_name))
             else:
                 self.__logger.debug('{0} did not exist in {1}'.format(doc_id, index_name))
         except Exception as ex:
             raise ex
+        finally:
+            self.__record_metrics(start_time, 'get_document')
 
-        return results_page
+        return fields
+
+    def get_documents(self, index_name, doc_ids, fields=None):
+        start_time = time.time()
+
+        try:
+            docs = self.__get_stored_fields(index_name, doc_ids, fields=fields)
+            self.__logger.debug('{0} documents ware got from {1}'.format(len(docs), index_name))
+        except Exception as ex:
+            raise ex
+        finally:
+            self.__record_metrics(start_time, 'get_documents')
+
+        return docs
+
+    def __get_stored_fields(self, index_name, doc_ids, fields=None):
+        doc_id_field = self.__index_configs.get(index_name).get_doc_id_field()
+
+        # look the ids up in the term dictionary and read the stored fields directly instead of running a search
+        searcher_manager, searcher = self.__get_searcher(index_name)
+        try:
+            fields = get_fields(fields, searcher.schema) if fields else None
+            docs = {}
+            for doc_id, doc_num in self.__find_doc_nums(searcher, doc_id_field, doc_ids):
+                docs[doc_id] = project_fields(searcher.stored_fields(doc_num), fields)
+        finally:
+            searcher_manager.release(searcher)
+
+        return docs
 
     @replicated
     def delete_document(self, index_name, doc_id):
@@ -760,17 +1624,11 @@ class Indexer(RaftNode):
     def __delete_documents(self, index_name, doc_ids):
         start_time = time.time()
 
-        with self.__lock:
+        with self.__get_index_lock(index_name):
             try:
                 self.__logger.debug('deleting documents from {0}'.format(index_name))
 
-                # count = self.__get_writer(index_name).delete_documents(doc_ids, doc_id_field=self.__index_configs.get(
-                #     index_name).get_doc_id_field())
-
-                count = 0
-                for doc_id in doc_ids:
-                    count += self.__get_writer(index_name).delete_by_term(
-                        self.__index_configs.get(index_name).get_doc_id_field(), doc_id)
+                count = self.__delete_by_ids(index_name, doc_ids)
 
                 self.__logger.info('{0} documents has deleted from {1}'.format(count, index_name))
             except Exception as ex:
@@ -781,22 +1639,440 @@ class Indexer(RaftNode):
 
         return count
 
-    def search_documents(self, index_name, query, search_field, page_num, page_len=10, weighting=None, **kwargs):
+    def __update_documents(self, index_name, docs):
+        writer = self.__get_writer(index_name)
+        doc_id_field = self.__index_configs.get(index_name).get_doc_id_field()
+
+        # the last one wins if the same id is put more than once in a batch
+        docs_by_id = {}
+        docs_without_id = []
+        for doc in docs:
+            if doc.get(doc_id_field) is None:
+                docs_without_id.append(doc)
+            else:
+                docs_by_id[doc[doc_id_field]] = doc
+
+        # delete the existing documents in one pass instead of running update_document for each document
+        self.__delete_by_ids(index_name, list(docs_by_id.keys()))
+
+        count = 0
+        for doc in list(docs_by_id.values()) + docs_without_id:
+            writer.add_document(**doc)
+            count += 1
+
+        return count
+
+    def __delete_by_ids(self, index_name, doc_ids):
+        writer = self.__get_writer(index_name)
+        doc_id_field = self.__index_configs.get(index_name).get_doc_id_field()
+
+        count = 0
+        with writer.searcher() as searcher:
+            for _, doc_num in self.__find_doc_nums(searcher, doc_id_field, doc_ids):
+                writer.delete_document(doc_num)
+                count += 1
+
+        return count
+
+    @staticmethod
+    def __find_doc_nums(searcher, fieldname, texts):
+        fieldobj = searcher.schema[fieldname]
+        texts_by_term = dict([(fieldobj.to_bytes(text), text) for text in texts])
+        terms = sorted(texts_by_term.keys())
+
+        doc_nums = []
+        for reader, offset in searcher.reader().leaf_readers():
+            if len(terms) == 0 or reader.doc_count() == 0:
+                continue
+
+            # merge the sorted terms with the term dictionary of the segment, stepping the cursor forward while the
+            # terms are adjacent and seeking only across gaps
+            cursor = reader.cursor(fieldname)
+            cursor.find(terms[0])
+            i = 0
+            while i < len(terms) and cursor.is_valid():
+                current = fieldobj.to_bytes(cursor.text())
+                if terms[i] < current:
+                    i = bisect_left(terms, current, i)
+                elif terms[i] == current:
+                    doc_nums.extend([(texts_by_term[current], offset + doc_num) for doc_num in
+                                     reader.postings(fieldname, current).all_ids() if not reader.is_deleted(doc_num)])
+                    i += 1
+                    cursor.next()
+                else:
+                    cursor.find(terms[i])
+
+        return doc_nums
+
+    @replicated
+    def write_documents(self, index_name, ops):
+        return self.__write_documents(index_name, ops)
+
+    def __write_documents(self, index_name, ops):
+        start_time = time.time()
+
+        counts = []
+
+        with self.__get_index_lock(index_name):
+            try:
+                self.__logger.debug('writing {0} operations to {1}'.format(len(ops), index_name))
+
+                # apply the operations in order, a failed operation does not affect the others
+                for op, items in ops:
+                    try:
+                        if op == 'put':
+                            counts.append(self.__update_documents(index_name, items))
+                        elif op == 'delete':
+                            counts.append(self.__delete_by_ids(index_name, items))
+                        else:
+                            raise ValueError('unsupported operation: {0}'.format(op))
+                    except Exception as ex:
+                        self.__logger.error('failed to {0} documents to {1}: {2}'.format(op, index_name, ex))
+                        counts.append(-1)
+
+                self.__logger.info('{0} operations has written to {1}'.format(len(ops), index_name))
+            finally:
+                self.__record_metrics(start_time, 'write_documents')
+
+        # the batches of the write queue are logged as puts, with the number of their operations
+        self.__log_slow(index_name, 'put', start_time, lambda: {
+            'operations': len(ops),
+            'docs': sum([len(items) for _, items in ops]),
+            'count': sum([count for count in counts if count > 0])
+        })
+
+        return counts
+
+    def search_documents(self, index_name, query, search_field, page_num, page_len=10, weighting=None,
+                         filter_query=None, facets=None, highlight=None, sort=None, search_after=None, fields=None,
+                         ids_only=False, count_only=False, timeout=None, profile=False, explain=False, **kwargs):
+        if INDEX_PATTERN.search(index_name):
+            return self.search_indices(self.resolve_index_names(index_name), query, search_field, page_num,
+                                       page_len=page_len, weighting=weighting, filter_query=filter_query,
+                                       facets=facets, highlight=highlight, sort=sort, search_after=search_after,
+                                       fields=fields, ids_only=ids_only, count_only=count_only, timeout=timeout,
+                                       profile=profile, explain=explain, **kwargs)
+
         start_time = time.time()
 
         try:
-            searcher = self.__get_searcher(index_name, weighting=weighting)
-            query_parser = QueryParser(search_field, self.get_schema(index_name))
-            query_obj = query_parser.parse(query)
-            results_page = searcher.search_page(query_obj, page_num, pagelen=page_len, **kwargs)
+            weighting = self.__get_weighting(index_name, weighting)
+            search_profile = SearchProfile(enabled=profile)
+            with search_profile.timer('parse'):
+                query_obj = self.__parse_query(index_name, query, search_field)
+                filter_obj = self.__parse_query(index_name, filter_query, search_field) if filter_query else None
+            if search_after and page_num != 1:
+                raise ValueError('page_num can not be used with search_after')
+
+            # the generation is read before the searcher is acquired, so that a page searched on a newer generation
+            # can only be tagged as older and never the other way around
+            generation = self.__searcher_managers.get(index_name).get_generation()
+            options = {'facets': facets, 'highlight': highlight, 'sort': sort, 'search_after': search_after,
+                       'fields': fields, 'ids_only': ids_only, 'count_only': count_only}
+            cache_key = None
+            # a profiled or explained search is always executed, and its page is not cached
+            if not profile and not explain:
+                cache_key = self.__get_result_cache_key(index_name, query_obj, page_num, page_len, weighting,
+                                                        filter_obj, options, kwargs)
+
+            results_page = None
+            if cache_key is not None:
+                results_page = self.__get_cached_results_page(index_name, cache_key, generation)
+            cached = results_page is not None
+
+            if results_page is None:
+                searcher_manager, searcher = self.__get_searcher(index_name, weighting=weighting)
+                try:
+                    if filter_obj is not None:
+                        kwargs['filter'] = self.__get_filter(index_name, searcher, filter_obj)
+                    if facets:
+                        kwargs['groupedby'] = get_facets(facets, searcher.schema,
+                                                         partial(self.__get_ordinals, index_name))
+                        kwargs['maptype'] = Count
+                    get_hit_fields = self.__get_hit_fields(index_name, searcher, fields, ids_only)
+                    highlighters = None
+                    if highlight and not count_only:
+                        highlighters = get_highlighters(highlight, searcher.schema)
+                        # the matched terms let the highlighters read the positions of the terms from the postings
+                        kwargs['terms'] = True
+                    next_search_after = None
+                    last_page = None
+                    sort_values = None
+                    if sort or search_after:
+                        page, next_search_after, sort_values, timed_out = self.__search_sorted_page(
+                            index_name, searcher, query_obj, page_num, page_len, sort or SCORE_FIELD, search_after,
+                            timeout, kwargs, search_profile)
+                        # the cursor of a partial page could skip the documents that were not collected
+                        last_page = None if timed_out else next_search_after is None
+                    else:
+                        if page_num < 1:
+                            raise ValueError('page_num must be >= 1')
+                        results = None
+                        # the facets and the matched terms are collected from every segment in this thread, as are
+                        # the matchers of a profiled search
+                        if not kwargs.get('groupedby') and not kwargs.get('terms') and not profile:
+                            with search_profile.timer('collect'):
+                                results, timed_out = self.__search_segments(index_name, searcher, query_obj,
+                                                                            page_num * page_len,
+                                                                            kwargs.get('filter'), timeout)
+                        if results is None:
+                            collector = search_profile.wrap_collector(
+                                searcher.collector(limit=page_num * page_len, **kwargs))
+                            with search_profile.timer('collect'):
+                                results, timed_out = self.__collect(searcher, search_profile.wrap_query(query_obj),
+                                                                    collector, timeout)
+                        page = ResultsPage(results, page_num, pagelen=page_len)
+                    if timed_out:
+                        self.__metrics_search_timeouts_total.labels(index_name=index_name).inc()
+                    facet_counts = None
+                    if facets:
+                        with search_profile.timer('facets'):
+                            facet_counts = get_facet_counts(page.results, facets)
+                    highlights = None
+                    if highlighters:
+                        top = highlight.get('top') or DEFAULT_TOP
+                        with search_profile.timer('highlight'):
+                            highlights = [get_highlights(hit, highlighters, top=top) for hit in page]
+                    explanations = None
+                    if explain and not count_only:
+                        with search_profile.timer('explain'):
+                            explanations = [get_explanation(searcher, query_obj, hit.docnum) for hit in page]
+                    # the detached page holds the stored fields of its hits, so the searcher can be released
+                    with search_profile.timer('stored_fields'):
+                        results_page = DetachedResultsPage(page, facets=facet_counts, highlights=highlights,
+                                                           search_after=next_search_after, last_page=last_page,
+                                                           get_fields=get_hit_fields, count_only=count_only,
+                                                           sort_values=sort_values, timed_out=timed_out,
+                                                           explanations=explanations)
+                    results_page.profile = search_profile.to_dict()
+                    # a partial page is not cached, so the same search is given the time to complete again
+                    if cache_key is not None and not timed_out:
+                        self.__put_cached_results_page(index_name, cache_key, generation, results_page)
+                finally:
+                    searcher_manager.release(searcher)
             self.__logger.info('{0} documents ware searched from {1}'.format(results_page.total, index_name))
         except Exception as ex:
             raise ex
         finally:
             self.__record_metrics(start_time, 'search_documents')
 
+        self.__log_slow(index_name, 'search', start_time, lambda: {
+            'query': query,
+            'search_field': search_field,
+            'filter_query': filter_query or None,
+            'weighting': get_weighting_dict(weighting),
+            'page_num': page_num,
+            'page_len': page_len,
+            'sort': sort,
+            'total': results_page.total,
+            'hits': len(list(results_page)),
+            'timed_out': results_page.timed_out,
+            'cached': cached,
+            'timings': search_profile.timings
+        })
+
+        return results_page
+
+    def __get_hit_fields(self, index_name, searcher, fields, ids_only):
+        if ids_only:
+            doc_id_field = self.__index_configs.get(index_name).get_doc_id_field()
+            if searcher.schema[doc_id_field].column_type is not None and searcher.reader().has_column(doc_id_field):
+                # the ids are read from the column of the doc id field without reading the stored fields, except in
+                # the segments written before the field was sortable, whose column is empty
+                column_reader = searcher.reader().column_reader(doc_id_field)
+                return lambda hit: {doc_id_field: column_reader[hit.docnum] or hit.fields().get(doc_id_field)}
+            return lambda hit: project_fields(hit.fields(), [doc_id_field])
+
+        if fields:
+            fields = get_fields(fields, searcher.schema)
+            return lambda hit: project_fields(hit.fields(), fields)
+
+        return None
+
+    def __search_sorted_page(self, index_name, searcher, query_obj, page_num, page_len, sort, search_after, timeout,
+                             kwargs, search_profile):
+        sort_fields = get_sort_fields(sort, searcher.schema)
+        search_after = decode_search_after(search_after) if search_after else None
+        limit = page_num * page_len
+
+        if any([field_name == SCORE_FIELD for field_name, _ in sort_fields]) or kwargs.get('groupedby') or \
+                kwargs.get('terms'):
+            # the scores, facets and matched terms need every matching document, so walk the matcher
+            collector = SearchAfterCollector(sort_fields, limit=limit, search_after=search_after)
+            wrapped_collector = collector
+            if kwargs.get('groupedby'):
+                wrapped_collector = FacetCollector(wrapped_collector, kwargs['groupedby'],
+                                                   maptype=kwargs.get('maptype'))
+            if kwargs.get('terms'):
+                wrapped_collector = TermsCollector(wrapped_collector)
+            if kwargs.get('filter') is not None:
+                wrapped_collector = FilterCollector(wrapped_collector, allow=kwargs['filter'])
+        else:
+            # the matching documents are cached, the timeout does not stop walking the sort order from the cursor
+            collector = SearchAfterCollector(sort_fields, limit=limit, search_after=search_after,
+                                             matches=self.__get_filter(index_name, searcher, query_obj),
+                                             allow=kwargs.get('filter'),
+                                             get_sort_order=partial(self.__get_sort_order, index_name))
+            wrapped_collector = collector
+            timeout = None
+
+        with search_profile.timer('collect'):
+            results, timed_out = self.__collect(searcher, search_profile.wrap_query(query_obj),
+                                                search_profile.wrap_collector(wrapped_collector), timeout)
+        page = ResultsPage(results, page_num, pagelen=page_len)
+        sort_values = collector.get_sort_values()[page.offset:page.offset + page.pagelen]
+        search_after = None if timed_out else collector.get_search_after()
+
+        return page, search_after, sort_values, timed_out
+
+    @staticmethod
+    def __collect(searcher, query_obj, collector, timeout):
+        # the collector is stopped after the timeout in seconds and keeps the documents it collected until then
+        if timeout is None:
+            searcher.search_with_collector(query_obj, collector)
+            return collector.results(), False
+
+        # the alarm signal can only be handled in the main thread
+        time_limit_collector = TimeLimitCollector(collector, timeout, use_alarm=False)
+        try:
+            searcher.search_with_collector(query_obj, time_limit_collector)
+        except TimeLimit:
+            results = time_limit_collector.results()
+            # the total is the number of the documents collected, as counting the others would run the query again
+            while hasattr(collector, 'child'):
+                collector = collector.child
+            results._total = getattr(collector, 'total', len(results.top_n))
+            return results, True
+
+        return time_limit_collector.results(), False
+
+    def search_indices(self, index_names, query, search_field, page_num, page_len=10, weighting=None,
+                       filter_query=None, facets=None, highlight=None, sort=None, search_after=None, fields=None,
+                       ids_only=False, count_only=False, timeout=None, profile=False, explain=False, **kwargs):
+        start_time = time.time()
+
+        try:
+            if search_after:
+                raise ValueError('search_after can not be used with several indices')
+
+            # each index is searched with its own searcher for the best hits up to the page, which are merged in the
+            # order of the scores or the sort values
+            searches = [partial(self.search_documents, index_name, query, search_field, 1,
+                                page_len=page_num * page_len, weighting=weighting, filter_query=filter_query,
+                                facets=facets, highlight=highlight, sort=sort, fields=fields, ids_only=ids_only,
+                                count_only=count_only, timeout=timeout, profile=profile, explain=explain, **kwargs)
+                        for index_name in index_names]
+            pages = list(zip(index_names, self.__execute(searches)))
+
+            key = get_hit_score_key
+            if sort and index_names:
+                key = partial(get_hit_sort_key, get_sort_fields(sort, self.get_schema(index_names[0])))
+            facet_counts = None
+            if facets and pages:
+                facet_counts = merge_facet_counts([page.facets for _, page in pages], facets)
+            results_page = MergedResultsPage(pages, page_num, page_len, key, facets=facet_counts)
+            self.__logger.info('{0} documents ware searched from {1}'.format(results_page.total,
+                                                                             ','.join(index_names)))
+        except Exception as ex:
+            raise ex
+        finally:
+            self.__record_metrics(start_time, 'search_indices')
+
         return results_page
 
+    def multi_search(self, searches):
+        start_time = time.time()
+
+        try:
+            # the searches share the searchers and the caches of their indices
+            results = self.__execute([partial(self.__search, search) for search in searches])
+            self.__logger.info('{0} searches ware executed'.format(len(results)))
+        except Exception as ex:
+            raise ex
+        finally:
+            self.__record_metrics(start_time, 'multi_search')
+
+        return results
+
+    def __execute(self, calls):
+        # a call that has not started when its result is waited for runs in the waiting thread, so a call running on
+        # the search executor, such as a search of several indices of a multi search, never waits for a free worker
+        call_futures = [self.__search_executor.submit(call) for call in calls]
+
+        return [call() if call_future.cancel() else call_future.result() for call, call_future in
+                zip(calls, call_futures)]
+
+    def __search(self, search):
+        # the results page or the error of a search of a multi search, with the time it took
+        start_time = time.time()
+
+        try:
+            return self.search_documents(**search), None, time.time() - start_time
+        except Exception as ex:
+            return None, ex, time.time() - start_time
+
+    def count_documents(self, index_name, query, search_field, filter_query=None):
+        start_time = time.time()
+
+        try:
+            query_obj = self.__parse_query(index_name, query, search_field)
+            filter_obj = self.__parse_query(index_name, filter_query, search_field) if filter_query else None
+
+            searcher_manager, searcher = self.__get_searcher(index_name)
+            try:
+                # the query is not scored, only the bits of its cached matching documents are counted
+                matches = self.__get_filter(index_name, searcher, query_obj)
+                allow = self.__get_filter(index_name, searcher, filter_obj) if filter_obj is not None else None
+
+                count = 0
+                for subsearcher, offset in searcher.leaf_searchers():
+                    bitset = matches.get_bitset(offset)
+                    if bitset is None:
+                        continue
+                    allowed = None
+                    if allow is not None:
+                        allowed = allow.get_bitset(offset)
+                        if allowed is None:
+                            continue
+                    count += get_bitset_count(bitset, allowed)
+
+                    # the cached bitsets may contain the documents deleted since they were cached
+                    reader = subsearcher.reader()
+                    if reader.has_deletions():
+                        count -= len([docnum for docnum in reader.segment().deleted_docs() if
+                                      docnum in bitset and (allowed is None or docnum in allowed)])
+            finally:
+                searcher_manager.release(searcher)
+            self.__logger.info('{0} documents ware counted from {1}'.format(count, index_name))
+        except Exception as ex:
+            raise ex
+        finally:
+            self.__record_metrics(start_time, 'count_documents')
+
+        return count
+
+    def scan_documents(self, index_name, query, search_field, weighting=None):
+        start_time = time.time()
+
+        searcher_manager, searcher = self.__get_searcher(index_name, weighting=weighting)
+        try:
+            query_obj = self.__parse_query(index_name, query, search_field)
+            context = searcher.context()
+
+            # walk the matchers segment by segment in index order instead of collecting and sorting all matches
+            count = 0
+            for subsearcher, offset in searcher.leaf_searchers():
+                matcher = query_obj.matcher(subsearcher, context)
+                while matcher.is_active():
+                    doc_num = offset + matcher.id()
+                    yield doc_num, matcher.score(), searcher.stored_fields(doc_num)
+                    count += 1
+                    matcher.next()
+            self.__logger.info('{0} documents ware scanned from {1}'.format(count, index_name))
+        finally:
+            searcher_manager.release(searcher)
+            self.__record_metrics(start_time, 'scan_documents')
+
     @replicated
     def create_snapshot(self):
         self.__create_snapshot()
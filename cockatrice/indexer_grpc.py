@@ -15,22 +15,25 @@
 # limitations under the License.
 
 import _pickle as pickle
+import json
+import threading
 import time
 from logging import getLogger
 
 from prometheus_client.core import CollectorRegistry, Counter, Histogram
-from whoosh.scoring import BM25F
 
 from cockatrice import NAME
 from cockatrice.index_config import IndexConfig
 from cockatrice.protobuf.common_pb2 import Status
-from cockatrice.protobuf.index_pb2 import CloseIndexResponse, CommitIndexResponse, CreateIndexResponse, \
-    CreateSnapshotResponse, DeleteDocumentResponse, DeleteDocumentsResponse, DeleteIndexResponse, DeleteNodeResponse, \
-    GetDocumentResponse, GetIndexResponse, GetSnapshotResponse, GetStatusResponse, IsAliveResponse, IsHealthyResponse, \
-    IsReadyResponse, IsSnapshotExistResponse, OpenIndexResponse, OptimizeIndexResponse, PutDocumentResponse, \
-    PutDocumentsResponse, PutNodeResponse, RollbackIndexResponse, SearchDocumentsResponse
+from cockatrice.protobuf.index_pb2 import CloseIndexResponse, CommitIndexResponse, CountDocumentsResponse, \
+    CreateIndexResponse, CreateSnapshotResponse, DeleteDocumentResponse, DeleteDocumentsResponse, DeleteIndexResponse, \
+    DeleteNodeResponse, GetDocumentResponse, GetDocumentsResponse, GetIndexResponse, GetSnapshotResponse, \
+    GetStatusResponse, IsAliveResponse, IsHealthyResponse, IsReadyResponse, IsSnapshotExistResponse, \
+    MultiSearchResponse, OpenIndexResponse, OptimizeIndexResponse, PutDocumentResponse, PutDocumentsResponse, \
+    PutNodeResponse, RollbackIndexResponse, SearchDocumentsResponse, StreamDeleteDocumentsResponse, \
+    StreamPutDocumentsResponse, StreamSearchDocumentsResponse
 from cockatrice.protobuf.index_pb2_grpc import IndexServicer
-from cockatrice.scoring import get_multi_weighting
+from cockatrice.util.protobuf import dict_to_document, document_to_dict
 
 
 class IndexGRPCServicer(IndexServicer):
@@ -252,6 +255,7 @@ class IndexGRPCServicer(IndexServicer):
         response = CommitIndexResponse()
 
         try:
+            self.__indexer.flush_write_queue(request.index_name)
             self.__indexer.commit_index(request.index_name, sync=request.sync)
 
             response.status.success = True
@@ -270,6 +274,7 @@ class IndexGRPCServicer(IndexServicer):
         response = RollbackIndexResponse()
 
         try:
+            self.__indexer.flush_write_queue(request.index_name)
             self.__indexer.rollback_index(request.index_name, sync=request.sync)
 
             response.status.success = True
@@ -288,6 +293,7 @@ class IndexGRPCServicer(IndexServicer):
         response = OptimizeIndexResponse()
 
         try:
+            self.__indexer.flush_write_queue(request.index_name)
             index = self.__indexer.optimize_index(request.index_name, sync=request.sync)
 
             if request.sync:
@@ -324,8 +330,8 @@ class IndexGRPCServicer(IndexServicer):
         response = PutDocumentResponse()
 
         try:
-            count = self.__indexer.put_document(request.index_name, request.doc_id, pickle.loads(request.fields),
-                                                sync=request.sync)
+            count = self.__indexer.queue_put_document(request.index_name, request.doc_id,
+                                                      document_to_dict(request.doc), sync=request.sync)
             if request.sync:
                 response.count = count
                 if response.count > 0:
@@ -334,7 +340,7 @@ class IndexGRPCServicer(IndexServicer):
                                                                                        request.index_name)
                 else:
                     response.status.success = False
-                    response.status.message = 'failed to put {0} to {1}'.format(request.document.id, request.index_name)
+                    response.status.message = 'failed to put {0} to {1}'.format(request.doc_id, request.index_name)
             else:
                 response.status.success = True
                 response.status.message = 'request was successfully accepted to put {0} to {1}'.format(request.doc_id,
@@ -353,13 +359,11 @@ class IndexGRPCServicer(IndexServicer):
         response = GetDocumentResponse()
 
         try:
-            results_page = self.__indexer.get_document(request.index_name, request.doc_id)
+            fields = self.__indexer.get_document(request.index_name, request.doc_id,
+                                                 fields=list(request.fields) or None)
 
-            if results_page.total > 0:
-                fields = {}
-                for i in results_page.results[0].iteritems():
-                    fields[i[0]] = i[1]
-                response.fields = pickle.dumps(fields)
+            if fields is not None:
+                dict_to_document(fields, response.doc)
 
                 response.status.success = True
                 response.status.message = '{0} was successfully got from {1}'.format(request.doc_id, request.index_name)
@@ -380,7 +384,7 @@ class IndexGRPCServicer(IndexServicer):
         response = DeleteDocumentResponse()
 
         try:
-            count = self.__indexer.delete_document(request.index_name, request.doc_id, sync=request.sync)
+            count = self.__indexer.queue_delete_document(request.index_name, request.doc_id, sync=request.sync)
 
             if request.sync:
                 response.count = count
@@ -413,8 +417,9 @@ class IndexGRPCServicer(IndexServicer):
         response = PutDocumentsResponse()
 
         try:
-            count = self.__indexer.put_documents(request.index_name, pickle.loads(request.docs),
-                                                 sync=request.sync)
+            count = self.__indexer.queue_put_documents(request.index_name,
+                                                       [document_to_dict(doc) for doc in request.docs],
+                                                       sync=request.sync)
             if request.sync:
                 response.count = count
                 if response.count > 0:
@@ -436,14 +441,40 @@ class IndexGRPCServicer(IndexServicer):
 
         return response
 
+    def GetDocuments(self, request, context):
+        start_time = time.time()
+
+        response = GetDocumentsResponse()
+
+        try:
+            found_docs = self.__indexer.get_documents(request.index_name, request.doc_ids,
+                                                      fields=list(request.fields) or None)
+
+            for doc_id in request.doc_ids:
+                if doc_id in found_docs:
+                    dict_to_document(found_docs[doc_id], response.docs.add())
+                else:
+                    response.not_found.append(doc_id)
+
+            response.status.success = True
+            response.status.message = '{0} documents were successfully got from {1}'.format(len(response.docs),
+                                                                                            request.index_name)
+        except Exception as ex:
+            response.status.success = False
+            response.status.message = str(ex)
+        finally:
+            self.__record_metrics(start_time, 'get_documents')
+
+        return response
+
     def DeleteDocuments(self, request, context):
         start_time = time.time()
 
         response = DeleteDocumentsResponse()
 
         try:
-            count = self.__indexer.delete_documents(request.index_name, pickle.loads(request.doc_ids),
-                                                    sync=request.sync)
+            count = self.__indexer.queue_delete_documents(request.index_name, list(request.doc_ids),
+                                                          sync=request.sync)
             if request.sync:
                 response.count = count
                 if response.count > 0:
@@ -465,60 +496,311 @@ class IndexGRPCServicer(IndexServicer):
 
         return response
 
-    def SearchDocuments(self, request, context):
+    def StreamPutDocuments(self, request_iterator, context):
         start_time = time.time()
 
-        response = SearchDocumentsResponse()
+        response = StreamPutDocumentsResponse()
 
         try:
-            search_field = request.search_field if request.search_field != '' else self.__indexer.get_schema(
-                request.index_name).get_default_search_field()
-            weighting = BM25F if request.weighting == b'' else get_multi_weighting(pickle.loads(request.weighting))
-
-            results_page = self.__indexer.search_documents(request.index_name, request.query, search_field,
-                                                           request.page_num, page_len=request.page_len,
-                                                           weighting=weighting)
-
-            if results_page.pagecount >= request.page_num or results_page.total <= 0:
-                results = {
-                    'is_last_page': results_page.is_last_page(),
-                    'page_count': results_page.pagecount,
-                    'page_len': results_page.pagelen,
-                    'page_num': results_page.pagenum,
-                    'total': results_page.total,
-                    'offset': results_page.offset
-                }
-                hits = []
-                for result in results_page.results[results_page.offset:]:
-                    fields = {}
-                    for item in result.iteritems():
-                        fields[item[0]] = item[1]
-                    hit = {
-                        'fields': fields,
-                        'doc_num': result.docnum,
-                        'score': result.score,
-                        'rank': result.rank,
-                        'pos': result.pos
-                    }
-                    hits.append(hit)
-                results['hits'] = hits
-
-                response.results = pickle.dumps(results)
+            # put documents chunk by chunk as they arrive on the stream
+            for request in request_iterator:
+                docs = [document_to_dict(doc) for doc in request.docs]
+                count = self.__indexer.queue_put_documents(request.index_name, docs, sync=request.sync)
+                if request.sync and count <= 0:
+                    response.failed_chunks.append(response.chunks)
+                else:
+                    response.count += count if request.sync else len(docs)
+                response.chunks += 1
 
-                response.status.success = True
-                response.status.message = '{0} documents were successfully searched from {1}'.format(results_page.total,
-                                                                                                     request.index_name)
+            if len(response.failed_chunks) > 0:
+                response.status.success = False
+                response.status.message = 'failed to put {0} of {1} chunks'.format(len(response.failed_chunks),
+                                                                                  response.chunks)
             else:
+                response.status.success = True
+                response.status.message = '{0} documents in {1} chunks were successfully put'.format(
+                    response.count, response.chunks)
+        except Exception as ex:
+            response.status.success = False
+            response.status.message = str(ex)
+        finally:
+            self.__record_metrics(start_time, 'stream_put_documents')
+
+        return response
+
+    def StreamDeleteDocuments(self, request_iterator, context):
+        start_time = time.time()
+
+        response = StreamDeleteDocumentsResponse()
+
+        try:
+            # delete documents chunk by chunk as they arrive on the stream
+            for request in request_iterator:
+                doc_ids = list(request.doc_ids)
+                count = self.__indexer.queue_delete_documents(request.index_name, doc_ids, sync=request.sync)
+                if request.sync and count <= 0:
+                    response.failed_chunks.append(response.chunks)
+                else:
+                    response.count += count if request.sync else len(doc_ids)
+                response.chunks += 1
+
+            if len(response.failed_chunks) > 0:
                 response.status.success = False
-                response.status.message = 'page_num must be <= {0}'.format(results_page.pagecount)
+                response.status.message = 'failed to delete {0} of {1} chunks'.format(len(response.failed_chunks),
+                                                                                     response.chunks)
+            else:
+                response.status.success = True
+                response.status.message = '{0} documents in {1} chunks were successfully deleted'.format(
+                    response.count, response.chunks)
+        except Exception as ex:
+            response.status.success = False
+            response.status.message = str(ex)
+        finally:
+            self.__record_metrics(start_time, 'stream_delete_documents')
+
+        return response
+
+    def SearchDocuments(self, request, context):
+        start_time = time.time()
+
+        response = SearchDocumentsResponse()
+
+        try:
+            results_page = self.__indexer.search_documents(**self.__get_search(request, context))
+
+            self.__put_results(response, results_page, request)
         except Exception as ex:
             response.status.success = False
             response.status.message = str(ex)
         finally:
+            response.time = time.time() - start_time
             self.__record_metrics(start_time, 'search_documents')
 
         return response
 
+    def __get_search(self, request, context):
+        search_field = request.search_field if request.search_field != '' else self.__indexer.get_schema(
+            request.index_name).get_default_search_field()
+
+        return {
+            'index_name': request.index_name,
+            'query': request.query,
+            'search_field': search_field,
+            'page_num': request.page_num,
+            'page_len': request.page_len,
+            'weighting': self.__get_weighting(request.weighting, request.weighting_profile),
+            'filter_query': request.filter,
+            'facets': self.__get_mapping(request.facets, 'facets'),
+            'highlight': self.__get_mapping(request.highlight, 'highlight'),
+            'sort': request.sort or None,
+            'search_after': request.search_after or None,
+            'fields': list(request.fields) or None,
+            'ids_only': request.ids_only,
+            'count_only': request.count_only,
+            'timeout': self.__get_timeout(request.timeout_ms, context),
+            'profile': request.profile,
+            'explain': request.explain
+        }
+
+    @staticmethod
+    def __get_mapping(value, name):
+        # the options of a search are sent as json objects, as in the body of a search request of the http api
+        if value == '':
+            return None
+
+        mapping = json.loads(value)
+        if not isinstance(mapping, dict):
+            raise ValueError('{0} must be a json object'.format(name))
+
+        return mapping
+
+    def __get_weighting(self, weighting, weighting_profile):
+        # the name of a weighting profile of the index or the weighting mapping of the request, whose weighting objects
+        # are built and cached by the indexer
+        if weighting == '':
+            return weighting_profile or None
+        if weighting_profile != '':
+            raise ValueError('weighting can not be used with weighting_profile')
+
+        return self.__get_mapping(weighting, 'weighting')
+
+    @staticmethod
+    def __get_timeout(timeout_ms, context):
+        # the search is stopped by its timeout or by the deadline of the call, whichever comes first, and is not
+        # executed at all if the deadline has passed while it was waiting for a worker
+        timeout = timeout_ms / 1000 if timeout_ms > 0 else None
+
+        # the time remaining of a call without a deadline is too large to be waited for
+        time_remaining = context.time_remaining()
+        if time_remaining < threading.TIMEOUT_MAX:
+            if time_remaining <= 0:
+                raise TimeoutError('the deadline of the call has passed')
+            timeout = time_remaining if timeout is None else min(timeout, time_remaining)
+
+        return timeout
+
+    @staticmethod
+    def __put_results(response, results_page, request):
+        start_time = time.time()
+
+        if results_page.pagecount < request.page_num and results_page.total > 0:
+            response.status.success = False
+            response.status.message = 'page_num must be <= {0}'.format(results_page.pagecount)
+            return
+
+        response.is_last_page = results_page.is_last_page()
+        response.page_count = results_page.pagecount
+        response.page_len = results_page.pagelen
+        response.page_num = results_page.pagenum
+        response.total = results_page.total
+        response.offset = results_page.offset
+        response.timed_out = results_page.timed_out
+        for result in results_page:
+            hit = response.hits.add()
+            dict_to_document(result.fields(), hit.doc)
+            hit.doc_num = result.docnum
+            hit.score = result.score
+            hit.rank = result.rank
+            hit.pos = result.pos
+            if result.highlights is not None:
+                hit.highlights.update(result.highlights)
+            if result.index_name is not None:
+                hit.index_name = result.index_name
+            if result.explanation is not None:
+                hit.explanation = json.dumps(result.explanation)
+        if results_page.facets is not None:
+            for facet_name, facet_counts in results_page.facets.items():
+                facet_result = response.facets.add()
+                facet_result.name = facet_name
+                for facet_count in facet_counts:
+                    count = facet_result.counts.add()
+                    count.value = str(facet_count.get('value', ''))
+                    count.start = str(facet_count.get('start', ''))
+                    count.end = str(facet_count.get('end', ''))
+                    count.count = facet_count['count']
+        if results_page.search_after is not None:
+            response.search_after = results_page.search_after
+        if results_page.profile is not None:
+            # the time spent building the response is added to the timings of the search
+            profile = results_page.profile.copy()
+            profile['timings'] = dict(profile.get('timings', {}), serialize=time.time() - start_time)
+            response.profile = json.dumps(profile)
+
+        response.status.success = True
+        response.status.message = '{0} documents were successfully searched from {1}'.format(results_page.total,
+                                                                                             request.index_name)
+
+    def MultiSearch(self, request, context):
+        start_time = time.time()
+
+        response = MultiSearchResponse()
+
+        try:
+            # the searches that can not be parsed are answered without being executed
+            searches = []
+            for search_request in request.searches:
+                search_response = response.responses.add()
+                try:
+                    searches.append((search_request, search_response, self.__get_search(search_request, context)))
+                except Exception as ex:
+                    search_response.status.success = False
+                    search_response.status.message = str(ex)
+
+            results = self.__indexer.multi_search([search for _, _, search in searches])
+
+            for (search_request, search_response, _), (results_page, error, search_time) in zip(searches, results):
+                if error is None:
+                    self.__put_results(search_response, results_page, search_request)
+                else:
+                    search_response.status.success = False
+                    search_response.status.message = str(error)
+                search_response.time = search_time
+
+            response.status.success = True
+            response.status.message = '{0} searches were successfully executed'.format(len(results))
+        except Exception as ex:
+            response.status.success = False
+            response.status.message = str(ex)
+        finally:
+            self.__record_metrics(start_time, 'multi_search')
+
+        return response
+
+    def CountDocuments(self, request, context):
+        start_time = time.time()
+
+        response = CountDocumentsResponse()
+
+        try:
+            response.count = self.__indexer.count_documents(request.index_name, request.query, request.search_field,
+                                                            filter_query=request.filter)
+
+            response.status.success = True
+            response.status.message = '{0} documents were successfully counted from {1}'.format(response.count,
+                                                                                                request.index_name)
+        except Exception as ex:
+            response.status.success = False
+            response.status.message = str(ex)
+        finally:
+            self.__record_metrics(start_time, 'count_documents')
+
+        return response
+
+    def StreamSearchDocuments(self, request, context):
+        start_time = time.time()
+
+        def close_hits(hits):
+            try:
+                hits.close()
+            except ValueError:
+                # the hits are being read in another thread, the searcher is released when they are collected
+                pass
+
+        def get_hit_batches(batch_size=100):
+            try:
+                search_field = request.search_field if request.search_field != '' else self.__indexer.get_schema(
+                    request.index_name).get_default_search_field()
+                weighting = self.__get_weighting(request.weighting, request.weighting_profile)
+
+                # the scan holds a searcher until it is closed, which is done when the rpc ends, even if it is
+                # cancelled by the client before reading all hits
+                hits = self.__indexer.scan_documents(request.index_name, request.query, search_field,
+                                                     weighting=weighting)
+                if not context.add_callback(lambda: close_hits(hits)):
+                    close_hits(hits)
+
+                # send the hits in batches as they are read from the index, a full batch is sent when the next hit
+                # is read, so the last response is the last batch, or a response with no hits if nothing matches
+                response = StreamSearchDocumentsResponse()
+                pos = 0
+                for doc_num, score, fields in hits:
+                    if len(response.hits) >= batch_size:
+                        response.status.success = True
+                        response.status.message = 'successfully got hits'
+                        yield response
+                        response = StreamSearchDocumentsResponse()
+                    hit = response.hits.add()
+                    dict_to_document(fields, hit.doc)
+                    hit.doc_num = doc_num
+                    hit.score = score
+                    # the hits are streamed in index order, so they are not ranked
+                    hit.pos = pos
+                    pos += 1
+                # the last response has the status of the whole search
+                response.status.success = True
+                response.status.message = '{0} documents were successfully searched from {1}'.format(
+                    pos, request.index_name)
+                yield response
+            except Exception as ex:
+                response = StreamSearchDocumentsResponse()
+                response.status.success = False
+                response.status.message = str(ex)
+                yield response
+            finally:
+                self.__record_metrics(start_time, 'stream_search_documents')
+
+        return get_hit_batches(batch_size=request.batch_size if request.batch_size > 0 else 100)
+
     def PutNode(self, request, context):
         start_time = time.time()
 
@@ -25,13 +25,13 @@ import yaml
 from flask import after_this_request, Flask, request, Response
 from prometheus_client.core import CollectorRegistry, Counter, Histogram
 from prometheus_client.exposition import CONTENT_TYPE_LATEST, generate_latest
-from whoosh.scoring import BM25F
+from werkzeug.datastructures import MultiDict
 from yaml.constructor import ConstructorError
 
 from cockatrice import NAME, VERSION
 from cockatrice.index_config import IndexConfig
-from cockatrice.scoring import get_multi_weighting
-from cockatrice.util.http import make_response, record_log, TRUE_STRINGS
+from cockatrice.util.http import iter_ndjson, make_response, record_log, TRUE_STRINGS
+from cockatrice.write_queue import WriteQueueTimeoutError
 
 
 class IndexHTTPServicer:
@@ -95,12 +95,17 @@ class IndexHTTPServicer:
                               view_func=self.__put_document, methods=['PUT'])
         self.app.add_url_rule('/indices/<index_name>/documents/<doc_id>', endpoint='delete_document',
                               view_func=self.__delete_document, methods=['DELETE'])
+        self.app.add_url_rule('/indices/<index_name>/documents', endpoint='get_documents',
+                              view_func=self.__get_documents, methods=['GET'])
         self.app.add_url_rule('/indices/<index_name>/documents', endpoint='put_documents',
                               view_func=self.__put_documents, methods=['PUT'])
         self.app.add_url_rule('/indices/<index_name>/documents', endpoint='delete_documents',
                               view_func=self.__delete_documents, methods=['DELETE'])
         self.app.add_url_rule('/indices/<index_name>/search', endpoint='search_documents',
                               view_func=self.__search_documents, methods=['GET', 'POST'])
+        self.app.add_url_rule('/indices/<index_name>/count', endpoint='count_documents',
+                              view_func=self.__count_documents, methods=['GET'])
+        self.app.add_url_rule('/_msearch', endpoint='multi_search', view_func=self.__multi_search, methods=['POST'])
         self.app.add_url_rule('/indices/<index_name>/optimize', endpoint='optimize_index',
                               view_func=self.__optimize_index, methods=['GET'])
         self.app.add_url_rule('/indices/<index_name>/commit', endpoint='commit',
@@ -298,6 +303,10 @@ class IndexHTTPServicer:
                 status_code = HTTPStatus.OK
             else:
                 status_code = HTTPStatus.ACCEPTED
+        except WriteQueueTimeoutError as ex:
+            data['error'] = '{0}'.format(ex.args[0])
+            status_code = HTTPStatus.SERVICE_UNAVAILABLE
+            self.__logger.error(ex)
         except Exception as ex:
             data['error'] = '{0}'.format(ex.args[0])
             status_code = HTTPStatus.INTERNAL_SERVER_ERROR
@@ -332,12 +341,17 @@ class IndexHTTPServicer:
             if request.args.get('sync', default='', type=str).lower() in TRUE_STRINGS:
                 sync = True
 
+            self.__indexer.flush_write_queue(index_name)
             self.__indexer.commit_index(index_name, sync=sync)
 
             if sync:
                 status_code = HTTPStatus.OK
             else:
                 status_code = HTTPStatus.ACCEPTED
+        except WriteQueueTimeoutError as ex:
+            data['error'] = '{0}'.format(ex.args[0])
+            status_code = HTTPStatus.SERVICE_UNAVAILABLE
+            self.__logger.error(ex)
         except Exception as ex:
             data['error'] = '{0}'.format(ex.args[0])
             status_code = HTTPStatus.INTERNAL_SERVER_ERROR
@@ -372,12 +386,17 @@ class IndexHTTPServicer:
             if request.args.get('sync', default='', type=str).lower() in TRUE_STRINGS:
                 sync = True
 
+            self.__indexer.flush_write_queue(index_name)
             self.__indexer.rollback_index(index_name, sync=sync)
 
             if sync:
                 status_code = HTTPStatus.OK
             else:
                 status_code = HTTPStatus.ACCEPTED
+        except WriteQueueTimeoutError as ex:
+            data['error'] = '{0}'.format(ex.args[0])
+            status_code = HTTPStatus.SERVICE_UNAVAILABLE
+            self.__logger.error(ex)
         except Exception as ex:
             data['error'] = '{0}'.format(ex.args[0])
             status_code = HTTPStatus.INTERNAL_SERVER_ERROR
@@ -412,12 +431,17 @@ class IndexHTTPServicer:
             if request.args.get('sync', default='', type=str).lower() in TRUE_STRINGS:
                 sync = True
 
+            self.__indexer.flush_write_queue(index_name)
             self.__indexer.optimize_index(index_name, sync=sync)
 
             if sync:
                 status_code = HTTPStatus.OK
             else:
                 status_code = HTTPStatus.ACCEPTED
+        except WriteQueueTimeoutError as ex:
+            data['error'] = '{0}'.format(ex.args[0])
+            status_code = HTTPStatus.SERVICE_UNAVAILABLE
+            self.__logger.error(ex)
         except Exception as ex:
             data['error'] = '{0}'.format(ex.args[0])
             status_code = HTTPStatus.INTERNAL_SERVER_ERROR
@@ -464,7 +488,7 @@ class IndexHTTPServicer:
             if request.args.get('sync', default='', type=str).lower() in TRUE_STRINGS:
                 sync = True
 
-            count = self.__indexer.put_document(index_name, doc_id, fields_dict, sync=sync)
+            count = self.__indexer.queue_put_document(index_name, doc_id, fields_dict, sync=sync)
 
             if sync:
                 if count > 0:
@@ -478,6 +502,10 @@ class IndexHTTPServicer:
             data['error'] = '{0}'.format(ex.args[0])
             status_code = HTTPStatus.BAD_REQUEST
             self.__logger.error(ex)
+        except WriteQueueTimeoutError as ex:
+            data['error'] = '{0}'.format(ex.args[0])
+            status_code = HTTPStatus.SERVICE_UNAVAILABLE
+            self.__logger.error(ex)
         except Exception as ex:
             data['error'] = '{0}'.format(ex.args[0])
             status_code = HTTPStatus.INTERNAL_SERVER_ERROR
@@ -508,16 +536,74 @@ class IndexHTTPServicer:
         status_code = None
 
         try:
-            results_page = self.__indexer.get_document(index_name, doc_id)
+            fields = request.args.get('fields', default='', type=str)
+
+            fields = self.__indexer.get_document(index_name, doc_id, fields=fields or None)
 
-            if results_page.total > 0:
-                fields = {}
-                for i in results_page.results[0].iteritems():
-                    fields[i[0]] = i[1]
+            if fields is not None:
                 data['fields'] = fields
                 status_code = HTTPStatus.OK
             else:
                 status_code = HTTPStatus.NOT_FOUND
+        except ValueError as ex:
+            data['error'] = '{0}'.format(ex.args[0])
+            status_code = HTTPStatus.BAD_REQUEST
+            self.__logger.error(ex)
+        except Exception as ex:
+            data['error'] = '{0}'.format(ex.args[0])
+            status_code = HTTPStatus.INTERNAL_SERVER_ERROR
+            self.__logger.error(ex)
+        finally:
+            data['time'] = time.time() - start_time
+            data['status'] = {'code': status_code.value, 'phrase': status_code.phrase,
+                              'description': status_code.description}
+
+        output = request.args.get('output', default='json', type=str).lower()
+
+        # make response
+        resp = make_response(data, output)
+        resp.status_code = status_code
+
+        return resp
+
+    def __get_documents(self, index_name):
+        start_time = time.time()
+
+        @after_this_request
+        def to_do_after_this_request(response):
+            record_log(request, response, logger=self.__http_logger)
+            self.__record_metrics(start_time, request, response)
+            return response
+
+        data = {}
+        status_code = None
+
+        try:
+            # accept both ?ids=1,2,3 and ?ids=1&ids=2&ids=3
+            doc_ids = []
+            for ids in request.args.getlist('ids', type=str):
+                doc_ids.extend([doc_id for doc_id in ids.split(',') if doc_id != ''])
+            if len(doc_ids) <= 0:
+                raise ValueError('ids is required')
+
+            fields = request.args.get('fields', default='', type=str)
+
+            found_docs = self.__indexer.get_documents(index_name, doc_ids, fields=fields or None)
+
+            docs = []
+            not_found = []
+            for doc_id in doc_ids:
+                if doc_id in found_docs:
+                    docs.append({'id': doc_id, 'fields': found_docs[doc_id]})
+                else:
+                    not_found.append(doc_id)
+            data['docs'] = docs
+            data['not_found'] = not_found
+            status_code = HTTPStatus.OK
+        except ValueError as ex:
+            data['error'] = '{0}'.format(ex.args[0])
+            status_code = HTTPStatus.BAD_REQUEST
+            self.__logger.error(ex)
         except Exception as ex:
             data['error'] = '{0}'.format(ex.args[0])
             status_code = HTTPStatus.INTERNAL_SERVER_ERROR
@@ -552,7 +638,7 @@ class IndexHTTPServicer:
             if request.args.get('sync', default='', type=str).lower() in TRUE_STRINGS:
                 sync = True
 
-            count = self.__indexer.delete_document(index_name, doc_id, sync=sync)
+            count = self.__indexer.queue_delete_document(index_name, doc_id, sync=sync)
 
             if sync:
                 if count > 0:
@@ -563,6 +649,10 @@ class IndexHTTPServicer:
                     status_code = HTTPStatus.INTERNAL_SERVER_ERROR
             else:
                 status_code = HTTPStatus.ACCEPTED
+        except WriteQueueTimeoutError as ex:
+            data['error'] = '{0}'.format(ex.args[0])
+            status_code = HTTPStatus.SERVICE_UNAVAILABLE
+            self.__logger.error(ex)
         except Exception as ex:
             data['error'] = '{0}'.format(ex.args[0])
             status_code = HTTPStatus.INTERNAL_SERVER_ERROR
@@ -581,6 +671,9 @@ class IndexHTTPServicer:
         return resp
 
     def __put_documents(self, index_name):
+        if request.mimetype == 'application/x-ndjson':
+            return self.__put_ndjson_documents(index_name)
+
         start_time = time.time()
 
         @after_this_request
@@ -606,7 +699,7 @@ class IndexHTTPServicer:
             if request.args.get('sync', default='', type=str).lower() in TRUE_STRINGS:
                 sync = True
 
-            count = self.__indexer.put_documents(index_name, docs_dict, sync=sync)
+            count = self.__indexer.queue_put_documents(index_name, docs_dict, sync=sync)
 
             if sync:
                 if count > 0:
@@ -620,11 +713,109 @@ class IndexHTTPServicer:
             data['error'] = '{0}'.format(ex.args[0])
             status_code = HTTPStatus.BAD_REQUEST
             self.__logger.error(ex)
+        except WriteQueueTimeoutError as ex:
+            data['error'] = '{0}'.format(ex.args[0])
+            status_code = HTTPStatus.SERVICE_UNAVAILABLE
+            self.__logger.error(ex)
+        except Exception as ex:
+            data['error'] = '{0}'.format(ex.args[0])
+            status_code = HTTPStatus.INTERNAL_SERVER_ERROR
+            self.__logger.error(ex)
+        finally:
+            data['time'] = time.time() - start_time
+            data['status'] = {'code': status_code.value, 'phrase': status_code.phrase,
+                              'description': status_code.description}
+
+        output = request.args.get('output', default='json', type=str).lower()
+
+        # make response
+        resp = make_response(data, output)
+        resp.status_code = status_code
+
+        return resp
+
+    def __put_ndjson_documents(self, index_name):
+        start_time = time.time()
+
+        @after_this_request
+        def to_do_after_this_request(response):
+            record_log(request, response, logger=self.__http_logger)
+            self.__record_metrics(start_time, request, response)
+            return response
+
+        data = {}
+        status_code = None
+
+        chunks = []
+        errors = []
+
+        def put_chunk(docs, first_line, last_line):
+            count = self.__indexer.queue_put_documents(index_name, docs, sync=sync)
+            chunks.append({
+                'first_line': first_line,
+                'last_line': last_line,
+                'count': count if sync else len(docs)
+            })
+
+        try:
+            charset = request.mimetype_params.get('charset', 'utf-8')
+
+            sync = False
+            if request.args.get('sync', default='', type=str).lower() in TRUE_STRINGS:
+                sync = True
+
+            chunk_size = request.args.get('chunk_size', default=1000, type=int)
+            if chunk_size <= 0:
+                raise ValueError('chunk_size must be > 0')
+
+            # parse the request body line by line and put the documents in bounded chunks
+            docs = []
+            first_line = 0
+            last_line = 0
+            for line_num, doc, error in iter_ndjson(request.stream, charset=charset,
+                                                    content_encoding=request.headers.get('Content-Encoding')):
+                if error is None and not isinstance(doc, dict):
+                    error = ValueError('document must be an object')
+                if error is not None:
+                    errors.append({'line': line_num, 'error': '{0}'.format(error)})
+                    continue
+
+                if len(docs) == 0:
+                    first_line = line_num
+                last_line = line_num
+                docs.append(doc)
+
+                if len(docs) >= chunk_size:
+                    put_chunk(docs, first_line, last_line)
+                    docs = []
+            if len(docs) > 0:
+                put_chunk(docs, first_line, last_line)
+
+            if len([chunk for chunk in chunks if chunk['count'] < 0]) > 0:
+                status_code = HTTPStatus.INTERNAL_SERVER_ERROR
+            elif len(chunks) == 0:
+                data['error'] = 'no documents'
+                status_code = HTTPStatus.BAD_REQUEST
+            elif sync:
+                status_code = HTTPStatus.CREATED
+            else:
+                status_code = HTTPStatus.ACCEPTED
+        except (EOFError, OSError, ValueError) as ex:
+            data['error'] = '{0}'.format(ex.args[0])
+            status_code = HTTPStatus.BAD_REQUEST
+            self.__logger.error(ex)
+        except WriteQueueTimeoutError as ex:
+            data['error'] = '{0}'.format(ex.args[0])
+            status_code = HTTPStatus.SERVICE_UNAVAILABLE
+            self.__logger.error(ex)
         except Exception as ex:
             data['error'] = '{0}'.format(ex.args[0])
             status_code = HTTPStatus.INTERNAL_SERVER_ERROR
             self.__logger.error(ex)
         finally:
+            data['count'] = sum([chunk['count'] for chunk in chunks if chunk['count'] > 0])
+            data['chunks'] = chunks
+            data['errors'] = errors
             data['time'] = time.time() - start_time
             data['status'] = {'code': status_code.value, 'phrase': status_code.phrase,
                               'description': status_code.description}
@@ -663,7 +854,7 @@ class IndexHTTPServicer:
             if request.args.get('sync', default='', type=str).lower() in TRUE_STRINGS:
                 sync = True
 
-            count = self.__indexer.delete_documents(index_name, doc_ids_list, sync=sync)
+            count = self.__indexer.queue_delete_documents(index_name, doc_ids_list, sync=sync)
 
             if sync:
                 if count > 0:
@@ -677,6 +868,10 @@ class IndexHTTPServicer:
             data['error'] = '{0}'.format(ex.args[0])
             status_code = HTTPStatus.BAD_REQUEST
             self.__logger.error(ex)
+        except WriteQueueTimeoutError as ex:
+            data['error'] = '{0}'.format(ex.args[0])
+            status_code = HTTPStatus.SERVICE_UNAVAILABLE
+            self.__logger.error(ex)
         except Exception as ex:
             data['error'] = '{0}'.format(ex.args[0])
             status_code = HTTPStatus.INTERNAL_SERVER_ERROR
@@ -707,53 +902,202 @@ class IndexHTTPServicer:
         status_code = None
 
         try:
-            query = request.args.get('query', default='', type=str)
-            search_field = request.args.get('search_field', default='', type=str)
-            page_num = request.args.get('page_num', default=1, type=int)
-            page_len = request.args.get('page_len', default=10, type=int)
-            weighting = BM25F
+            search_dict = {}
             if len(request.data) > 0:
                 mime = mimeparse.parse_mime_type(request.headers.get('Content-Type'))
                 charset = 'utf-8' if mime[2].get('charset') is None else mime[2].get('charset')
                 if mime[1] == 'yaml':
-                    weighting = get_multi_weighting(yaml.safe_load(request.data.decode(charset)))
+                    search_dict = yaml.safe_load(request.data.decode(charset))
                 elif mime[1] == 'json':
-                    weighting = get_multi_weighting(json.loads(request.data.decode(charset)))
+                    search_dict = json.loads(request.data.decode(charset))
                 else:
                     raise ValueError('unsupported format')
 
-            results_page = self.__indexer.search_documents(index_name, query, search_field, page_num,
-                                                           page_len=page_len, weighting=weighting)
-
-            if results_page.pagecount >= page_num or results_page.total <= 0:
-                results = {
-                    'is_last_page': results_page.is_last_page(),
-                    'page_count': results_page.pagecount,
-                    'page_len': results_page.pagelen,
-                    'page_num': results_page.pagenum,
-                    'total': results_page.total,
-                    'offset': results_page.offset
-                }
-                hits = []
-                for result in results_page.results[results_page.offset:]:
-                    fields = {}
-                    for item in result.iteritems():
-                        fields[item[0]] = item[1]
-                    hit = {
-                        'fields': fields,
-                        'doc_num': result.docnum,
-                        'score': result.score,
-                        'rank': result.rank,
-                        'pos': result.pos
-                    }
-                    hits.append(hit)
-                results['hits'] = hits
+            search = self.__get_search(request.args, search_dict)
+            results_page = self.__indexer.search_documents(index_name, **search)
 
-                data['results'] = results
-                status_code = HTTPStatus.OK
+            status_code = self.__put_results(data, results_page, search['page_num'])
+        except (ConstructorError, JSONDecodeError, ValueError) as ex:
+            data['error'] = '{0}'.format(ex.args[0])
+            status_code = HTTPStatus.BAD_REQUEST
+            self.__logger.error(ex)
+        except Exception as ex:
+            data['error'] = '{0}'.format(ex.args[0])
+            status_code = HTTPStatus.INTERNAL_SERVER_ERROR
+            self.__logger.error(ex)
+        finally:
+            data['time'] = time.time() - start_time
+            data['status'] = {'code': status_code.value, 'phrase': status_code.phrase,
+                              'description': status_code.description}
+
+        output = request.args.get('output', default='json', type=str).lower()
+
+        # make response
+        resp = make_response(data, output)
+        resp.status_code = status_code
+
+        return resp
+
+    @staticmethod
+    def __get_search(args, search_dict):
+        # the parameters of a search are read from the query string and the weighting, facets and highlight options
+        # from the request body
+        highlight_fields = args.get('highlight', default='', type=str)
+        search = {
+            'query': args.get('query', default='', type=str),
+            'search_field': args.get('search_field', default='', type=str),
+            'page_num': args.get('page_num', default=1, type=int),
+            'page_len': args.get('page_len', default=10, type=int),
+            'weighting': args.get('weighting_profile', default='', type=str) or None,
+            'filter_query': args.get('filter', default='', type=str),
+            'facets': None,
+            'highlight': {'fields': highlight_fields} if highlight_fields != '' else None,
+            'sort': args.get('sort', default='', type=str) or None,
+            'search_after': args.get('search_after', default='', type=str) or None,
+            'fields': args.get('fields', default='', type=str) or None,
+            'ids_only': args.get('ids_only', default='', type=str).lower() in TRUE_STRINGS,
+            'count_only': args.get('count_only', default='', type=str).lower() in TRUE_STRINGS,
+            'profile': args.get('profile', default='', type=str).lower() in TRUE_STRINGS,
+            'explain': args.get('explain', default='', type=str).lower() in TRUE_STRINGS
+        }
+
+        timeout_ms = args.get('timeout_ms', default=0, type=int)
+        if timeout_ms < 0:
+            raise ValueError('timeout_ms must be >= 0')
+        search['timeout'] = timeout_ms / 1000 if timeout_ms > 0 else None
+
+        if 'weighting' in search_dict:
+            # the weighting objects of the mapping are built and cached by the indexer
+            if search['weighting'] is not None:
+                raise ValueError('weighting can not be used with weighting_profile')
+            search['weighting'] = search_dict['weighting']
+            if not isinstance(search['weighting'], dict):
+                raise ValueError('weighting must be a mapping of field names to weightings')
+        if 'facets' in search_dict:
+            search['facets'] = search_dict['facets']
+            if not isinstance(search['facets'], dict):
+                raise ValueError('facets must be a mapping of facet names to facets')
+        if 'highlight' in search_dict:
+            search['highlight'] = search_dict['highlight']
+            if not isinstance(search['highlight'], dict):
+                raise ValueError('highlight must be a mapping of highlight options')
+
+        return search
+
+    @staticmethod
+    def __put_results(data, results_page, page_num):
+        start_time = time.time()
+
+        if results_page.pagecount < page_num and results_page.total > 0:
+            data['error'] = 'page_num must be <= {0}'.format(results_page.pagecount)
+            return HTTPStatus.BAD_REQUEST
+
+        results = {
+            'is_last_page': results_page.is_last_page(),
+            'page_count': results_page.pagecount,
+            'page_len': results_page.pagelen,
+            'page_num': results_page.pagenum,
+            'total': results_page.total,
+            'offset': results_page.offset,
+            'timed_out': results_page.timed_out
+        }
+        hits = []
+        for result in results_page:
+            fields = {}
+            for item in result.iteritems():
+                fields[item[0]] = item[1]
+            hit = {
+                'fields': fields,
+                'doc_num': result.docnum,
+                'score': result.score,
+                'rank': result.rank,
+                'pos': result.pos
+            }
+            if result.highlights is not None:
+                hit['highlights'] = result.highlights
+            if result.index_name is not None:
+                hit['index_name'] = result.index_name
+            if result.explanation is not None:
+                hit['explanation'] = result.explanation
+            hits.append(hit)
+        results['hits'] = hits
+        if results_page.facets is not None:
+            results['facets'] = results_page.facets
+        if results_page.search_after is not None:
+            results['search_after'] = results_page.search_after
+        if results_page.profile is not None:
+            # the time spent building the results is added to the timings of the search
+            profile = results_page.profile.copy()
+            profile['timings'] = dict(profile.get('timings', {}), serialize=time.time() - start_time)
+            results['profile'] = profile
+
+        data['results'] = results
+
+        return HTTPStatus.OK
+
+    def __multi_search(self):
+        start_time = time.time()
+
+        @after_this_request
+        def to_do_after_this_request(response):
+            record_log(request, response, logger=self.__http_logger)
+            self.__record_metrics(start_time, request, resp)
+            return response
+
+        data = {}
+        status_code = None
+
+        try:
+            mime = mimeparse.parse_mime_type(request.headers.get('Content-Type'))
+            charset = 'utf-8' if mime[2].get('charset') is None else mime[2].get('charset')
+            if mime[1] == 'yaml':
+                search_dicts = yaml.safe_load(request.data.decode(charset))
+            elif mime[1] == 'json':
+                search_dicts = json.loads(request.data.decode(charset))
             else:
-                data['error'] = 'page_num must be <= {0}'.format(results_page.pagecount)
-                status_code = HTTPStatus.BAD_REQUEST
+                raise ValueError('unsupported format')
+            if not isinstance(search_dicts, list):
+                raise ValueError('searches must be a list')
+
+            # the searches that can not be parsed are answered without being executed
+            responses = [{} for _ in search_dicts]
+            searches = []
+            for i, search_dict in enumerate(search_dicts):
+                try:
+                    if not isinstance(search_dict, dict) or search_dict.get('index_name', '') == '':
+                        raise ValueError('index_name is required')
+                    # an item of the searches has the parameters of the query string along with the request body
+                    args = MultiDict([(key, ','.join(value) if isinstance(value, list) else value) for key, value in
+                                      search_dict.items() if not isinstance(value, dict)])
+                    search = self.__get_search(args, dict([(key, value) for key, value in search_dict.items() if
+                                                           isinstance(value, dict)]))
+                    search['index_name'] = search_dict['index_name']
+                    searches.append((i, search))
+                except (ConstructorError, JSONDecodeError, ValueError) as ex:
+                    responses[i]['error'] = '{0}'.format(ex.args[0])
+                    responses[i]['time'] = 0.0
+                    responses[i]['status'] = HTTPStatus.BAD_REQUEST
+
+            results = self.__indexer.multi_search([search for _, search in searches])
+
+            for (i, search), (results_page, error, search_time) in zip(searches, results):
+                if error is None:
+                    responses[i]['status'] = self.__put_results(responses[i], results_page, search['page_num'])
+                elif isinstance(error, (ConstructorError, JSONDecodeError, ValueError)):
+                    responses[i]['error'] = '{0}'.format(error.args[0])
+                    responses[i]['status'] = HTTPStatus.BAD_REQUEST
+                    self.__logger.error(error)
+                else:
+                    responses[i]['error'] = '{0}'.format(error.args[0])
+                    responses[i]['status'] = HTTPStatus.INTERNAL_SERVER_ERROR
+                    self.__logger.error(error)
+                responses[i]['time'] = search_time
+
+            for response in responses:
+                response['status'] = {'code': response['status'].value, 'phrase': response['status'].phrase,
+                                      'description': response['status'].description}
+            data['responses'] = responses
+            status_code = HTTPStatus.OK
         except (ConstructorError, JSONDecodeError, ValueError) as ex:
             data['error'] = '{0}'.format(ex.args[0])
             status_code = HTTPStatus.BAD_REQUEST
@@ -775,6 +1119,46 @@ class IndexHTTPServicer:
 
         return resp
 
+    def __count_documents(self, index_name):
+        start_time = time.time()
+
+        @after_this_request
+        def to_do_after_this_request(response):
+            record_log(request, response, logger=self.__http_logger)
+            self.__record_metrics(start_time, request, resp)
+            return response
+
+        data = {}
+        status_code = None
+
+        try:
+            query = request.args.get('query', default='', type=str)
+            search_field = request.args.get('search_field', default='', type=str)
+            filter_query = request.args.get('filter', default='', type=str)
+
+            data['count'] = self.__indexer.count_documents(index_name, query, search_field, filter_query=filter_query)
+            status_code = HTTPStatus.OK
+        except ValueError as ex:
+            data['error'] = '{0}'.format(ex.args[0])
+            status_code = HTTPStatus.BAD_REQUEST
+            self.__logger.error(ex)
+        except Exception as ex:
+            data['error'] = '{0}'.format(ex.args[0])
+            status_code = HTTPStatus.INTERNAL_SERVER_ERROR
+            self.__logger.error(ex)
+        finally:
+            data['time'] = time.time() - start_time
+            data['status'] = {'code': status_code.value, 'phrase': status_code.phrase,
+                              'description': status_code.description}
+
+        output = request.args.get('output', default='json', type=str).lower()
+
+        # make response
+        resp = make_response(data, output)
+        resp.status_code = status_code
+
+        return resp
+
     def __put_node(self, node_name):
         start_time = time.time()
 
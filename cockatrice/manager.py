@@ -38,7 +38,8 @@ from cockatrice.util.raft import add_node, get_peers, get_snapshot, get_status,
 class Manager(RaftNode):
     def __init__(self, host='localhost', port=7070, seed_addr=None, conf=SyncObjConf(),
                  data_dir='/tmp/cockatrice/management', grpc_port=5050, grpc_max_workers=10, http_port=8080,
-                 logger=getLogger(), http_logger=getLogger(), metrics_registry=CollectorRegistry()):
+                 http_max_workers=10, http_max_queue_size=100, logger=getLogger(), http_logger=getLogger(),
+                 metrics_registry=CollectorRegistry()):
 
         self.__host = host
         self.__port = port
@@ -48,6 +49,8 @@ class Manager(RaftNode):
         self.__grpc_port = grpc_port
         self.__grpc_max_workers = grpc_max_workers
         self.__http_port = http_port
+        self.__http_max_workers = http_max_workers
+        self.__http_max_queue_size = http_max_queue_size
         self.__logger = logger
         self.__http_logger = http_logger
         self.__metrics_registry = metrics_registry
@@ -121,7 +124,9 @@ class Manager(RaftNode):
 
         # start HTTP server
         self.__http_servicer = ManagementHTTPServicer(self, self.__logger, self.__http_logger, self.__metrics_registry)
-        self.__http_server = HTTPServer(self.__host, self.__http_port, self.__http_servicer)
+        self.__http_server = HTTPServer(self.__host, self.__http_port, self.__http_servicer,
+                                        max_workers=self.__http_max_workers,
+                                        max_queue_size=self.__http_max_queue_size, logger=self.__logger)
         self.__http_server.start()
         self.__logger.info('HTTP server has started')
 
@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2019 Minoru Osuka
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 		http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+from contextlib import contextmanager
+
+from whoosh.collectors import WrappingCollector
+from whoosh.matching import WrappingMatcher
+from whoosh.query import WrappingQuery
+
+
+class ProfiledMatcher(WrappingMatcher):
+    """Matcher that adds its time and the postings it reads to the statistics of its clause.
+    """
+
+    def __init__(self, child, stats, boost=1.0):
+        super().__init__(child, boost=boost)
+        self.stats = stats
+
+    def copy(self):
+        return self.__class__(self.child.copy(), self.stats, boost=self.boost)
+
+    def _replacement(self, newchild):
+        return self.__class__(newchild, self.stats, boost=self.boost)
+
+    def all_ids(self):
+        start_time = time.perf_counter()
+        for docnum in self.child.all_ids():
+            self.stats['time'] += time.perf_counter() - start_time
+            self.stats['postings_read'] += 1
+            yield docnum
+            start_time = time.perf_counter()
+        self.stats['time'] += time.perf_counter() - start_time
+
+    def next(self):
+        start_time = time.perf_counter()
+        try:
+            return self.child.next()
+        finally:
+            self.stats['time'] += time.perf_counter() - start_time
+            self.stats['postings_read'] += 1
+
+    def skip_to(self, id):
+        start_time = time.perf_counter()
+        try:
+            return self.child.skip_to(id)
+        finally:
+            self.stats['time'] += time.perf_counter() - start_time
+            self.stats['postings_read'] += 1
+
+    def skip_to_quality(self, minquality):
+        start_time = time.perf_counter()
+        try:
+            return self.child.skip_to_quality(minquality / self.boost)
+        finally:
+            self.stats['time'] += time.perf_counter() - start_time
+
+    def score(self):
+        start_time = time.perf_counter()
+        try:
+            return self.child.score() * self.boost
+        finally:
+            self.stats['time'] += time.perf_counter() - start_time
+
+
+class ProfiledQuery(WrappingQuery):
+    """Query that profiles the matchers of its child.
+    """
+
+    def __init__(self, child, stats=None):
+        super().__init__(child)
+        self.stats = stats if stats is not None else {'time': 0.0, 'matchers': 0, 'postings_read': 0}
+
+    def _rewrap(self, child):
+        return self.__class__(child, self.stats)
+
+    def matcher(self, searcher, context=None):
+        start_time = time.perf_counter()
+        matcher = self.child.matcher(searcher, context)
+        self.stats['time'] += time.perf_counter() - start_time
+        self.stats['matchers'] += 1
+
+        return ProfiledMatcher(matcher, self.stats)
+
+
+class ProfiledCollector(WrappingCollector):
+    """Collector that records the segments it visits and the time spent in each of them.
+    """
+
+    def __init__(self, child, segments):
+        super().__init__(child)
+        self.segments = segments
+        self.__start_time = None
+
+    def set_subsearcher(self, subsearcher, offset):
+        self.__stop_segment()
+        self.__start_time = time.perf_counter()
+        reader = subsearcher.reader()
+        self.segments.append({
+            'segment_id': reader.segment().segment_id() if hasattr(reader, 'segment') else None,
+            'offset': offset,
+            'doc_count': reader.doc_count(),
+            'doc_count_all': reader.doc_count_all(),
+            'time': 0.0
+        })
+        super().set_subsearcher(subsearcher, offset)
+
+    def collect_matches(self):
+        # the child collects the matches of the segment with its own optimizations
+        self.child.collect_matches()
+
+    def finish(self):
+        self.__stop_segment()
+        super().finish()
+
+    def __stop_segment(self):
+        if self.__start_time is not None:
+            self.segments[-1]['time'] = time.perf_counter() - self.__start_time
+            self.__start_time = None
+
+
+class SearchProfile:
+    """Profile of a search.
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.timings = {}
+        self.segments = []
+        self.__query = None
+        self.__profiled_query = None
+
+    @contextmanager
+    def timer(self, phase):
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[phase] = self.timings.get(phase, 0.0) + time.perf_counter() - start_time
+
+    def wrap_query(self, query_obj):
+        if not self.enabled:
+            return query_obj
+
+        def wrap(q):
+            return ProfiledQuery(q.apply(wrap))
+
+        self.__query = query_obj
+        self.__profiled_query = wrap(query_obj)
+
+        return self.__profiled_query
+
+    def wrap_collector(self, collector):
+        if not self.enabled:
+            return collector
+
+        return ProfiledCollector(collector, self.segments)
+
+    def to_dict(self):
+        if not self.enabled:
+            return None
+
+        return {
+            'query': self.__get_clause(self.__query, self.__profiled_query),
+            'segments': self.segments,
+            'timings': self.timings.copy()
+        }
+
+    def __get_clause(self, query_obj, profiled_query):
+        if query_obj is None:
+            return None
+
+        clause = {
+            'type': query_obj.__class__.__name__,
+            'query': str(query_obj)
+        }
+        if profiled_query is not None:
+            clause.update(profiled_query.stats)
+
+        # the children of the profiled query are in the same order as the children of the parsed query
+        profiled_children = [] if profiled_query is None else list(profiled_query.child.children())
+        children = []
+        for i, child in enumerate(query_obj.children()):
+            profiled_child = profiled_children[i] if i < len(profiled_children) else None
+            if not isinstance(profiled_child, ProfiledQuery):
+                profiled_child = None
+            children.append(self.__get_clause(child, profiled_child))
+        if children:
+            clause['children'] = children
+
+        return clause
+
+
+def get_explanation(searcher, query_obj, docnum):
+    # the score of each term of the query in the document, with the statistics the scorer of the weighting model of
+    # the field computed it from, the score of the hit combines them according to the structure of the query
+    for subsearcher, offset in searcher.leaf_searchers():
+        if offset <= docnum < offset + subsearcher.reader().doc_count_all():
+            break
+    else:
+        return None
+    sub_docnum = docnum - offset
+    reader = subsearcher.reader()
+
+    terms = []
+    for field_name, btext in sorted(query_obj.existing_terms(reader, expand=True)):
+        field = searcher.schema[field_name]
+        if not field.scorable:
+            continue
+        matcher = subsearcher.postings(field_name, btext, weighting=searcher.weighting)
+        matcher.skip_to(sub_docnum)
+        if not matcher.is_active() or matcher.id() != sub_docnum:
+            continue
+        scorer = searcher.weighting.scorer(subsearcher, field_name, btext)
+        terms.append({
+            'field': field_name,
+            'term': field.from_bytes(btext),
+            'score': matcher.score(),
+            'frequency': matcher.weight(),
+            'field_length': reader.doc_field_length(sub_docnum, field_name),
+            'scorer': scorer.__class__.__name__,
+            'parameters': dict([(name, value) for name, value in vars(scorer).items() if
+                                not name.startswith('_') and isinstance(value, (int, float))])
+        })
+
+    return {'terms': terms}
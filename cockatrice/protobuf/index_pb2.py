@@ -20,7 +20,7 @@ DESCRIPTOR = _descriptor.FileDescriptor(
   package='protobuf',
   syntax='proto3',
   serialized_options=None,
-  serialized_pb=_b('\n\x1f\x63ockatrice/protobuf/index.proto\x12\x08protobuf\x1a cockatrice/protobuf/common.proto\"\x89\x02\n\nIndexStats\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x11\n\tdoc_count\x18\x02 \x01(\x03\x12\x15\n\rdoc_count_all\x18\x03 \x01(\x03\x12\x15\n\rlast_modified\x18\x04 \x01(\x01\x12\x19\n\x11latest_generation\x18\x05 \x01(\x03\x12\x0f\n\x07version\x18\x06 \x01(\x03\x12-\n\x07storage\x18\x07 \x01(\x0b\x32\x1c.protobuf.IndexStats.Storage\x1aQ\n\x07Storage\x12\x0e\n\x06\x66older\x18\x01 \x01(\t\x12\x15\n\rsupports_mmap\x18\x02 \x01(\x08\x12\x10\n\x08readonly\x18\x03 \x01(\x08\x12\r\n\x05\x66iles\x18\x04 \x03(\t\"L\n\x12\x43reateIndexRequest\x12\x12\n\nindex_name\x18\x01 \x01(\t\x12\x14\n\x0cindex_config\x18\x02 \x01(\x0c\x12\x0c\n\x04sync\x18\x03 \x01(\x08\"b\n\x13\x43reateIndexResponse\x12)\n\x0bindex_stats\x18\x01 \x01(\x0b\x32\x14.protobuf.IndexStats\x12 \n\x06status\x18\x02 \x01(\x0b\x32\x10.protobuf.Status\"%\n\x0fGetIndexRequest\x12\x12\n\nindex_name\x18\x01 \x01(\t\"_\n\x10GetIndexResponse\x12)\n\x0bindex_stats\x18\x01 \x01(\x0b\x32\x14.protobuf.IndexStats\x12 \n\x06status\x18\x02 \x01(\x0b\x32\x10.protobuf.Status\"6\n\x12\x44\x65leteIndexRequest\x12\x12\n\nindex_name\x18\x01 \x01(\t\x12\x0c\n\x04sync\x18\x02 \x01(\x08\"b\n\x13\x44\x65leteIndexResponse\x12)\n\x0bindex_stats\x18\x01 \x01(\x0b\x32\x14.protobuf.IndexStats\x12 \n\x06status\x18\x02 \x01(\x0b\x32\x10.protobuf.Status\"J\n\x10OpenIndexRequest\x12\x12\n\nindex_name\x18\x01 \x01(\t\x12\x14\n\x0cindex_config\x18\x02 \x01(\x0c\x12\x0c\n\x04sync\x18\x03 \x01(\x08\"`\n\x11OpenIndexResponse\x12)\n\x0bindex_stats\x18\x01 \x01(\x0b\x32\x14.protobuf.IndexStats\x12 \n\x06status\x18\x02 \x01(\x0b\x32\x10.protobuf.Status\"5\n\x11\x43loseIndexRequest\x12\x12\n\nindex_name\x18\x01 \x01(\t\x12\x0c\n\x04sync\x18\x02 \x01(\x08\"a\n\x12\x43loseIndexResponse\x12)\n\x0bindex_stats\x18\x01 \x01(\x0b\x32\x14.protobuf.IndexStats\x12 \n\x06status\x18\x02 \x01(\x0b\x32\x10.protobuf.Status\"6\n\x12\x43ommitIndexRequest\x12\x12\n\nindex_name\x18\x01 \x01(\t\x12\x0c\n\x04sync\x18\x02 \x01(\x08\"7\n\x13\x43ommitIndexResponse\x12 \n\x06status\x18\x01 \x01(\x0b\x32\x10.protobuf.Status\"8\n\x14RollbackIndexRequest\x12\x12\n\nindex_name\x18\x01 \x01(\t\x12\x0c\n\x04sync\x18\x02 \x01(\x08\"9\n\x15RollbackIndexResponse\x12 \n\x06status\x18\x01 \x01(\x0b\x32\x10.protobuf.Status\"8\n\x14OptimizeIndexRequest\x12\x12\n\nindex_name\x18\x01 \x01(\t\x12\x0c\n\x04sync\x18\x02 \x01(\x08\"d\n\x15OptimizeIndexResponse\x12)\n\x0bindex_stats\x18\x01 \x01(\x0b\x32\x14.protobuf.IndexStats\x12 \n\x06status\x18\x02 \x01(\x0b\x32\x10.protobuf.Status\"V\n\x12PutDocumentRequest\x12\x12\n\nindex_name\x18\x01 \x01(\t\x12\x0e\n\x06\x64oc_id\x18\x02 \x01(\t\x12\x0e\n\x06\x66ields\x18\x03 \x01(\x0c\x12\x0c\n\x04sync\x18\x04 \x01(\x08\"F\n\x13PutDocumentResponse\x12\r\n\x05\x63ount\x18\x01 \x01(\x03\x12 \n\x06status\x18\x02 \x01(\x0b\x32\x10.protobuf.Status\"8\n\x12GetDocumentRequest\x12\x12\n\nindex_name\x18\x01 \x01(\t\x12\x0e\n\x06\x64oc_id\x18\x02 \x01(\t\"G\n\x13GetDocumentResponse\x12\x0e\n\x06\x66ields\x18\x01 \x01(\x0c\x12 \n\x06status\x18\x02 \x01(\x0b\x32\x10.protobuf.Status\"I\n\x15\x44\x65leteDocumentRequest\x12\x12\n\nindex_name\x18\x01 \x01(\t\x12\x0e\n\x06\x64oc_id\x18\x02 \x01(\t\x12\x0c\n\x04sync\x18\x03 \x01(\x08\"I\n\x16\x44\x65leteDocumentResponse\x12\r\n\x05\x63ount\x18\x01 \x01(\x03\x12 \n\x06status\x18\x02 \x01(\x0b\x32\x10.protobuf.Status\"E\n\x13PutDocumentsRequest\x12\x12\n\nindex_name\x18\x01 \x01(\t\x12\x0c\n\x04\x64ocs\x18\x02 \x01(\x0c\x12\x0c\n\x04sync\x18\x03 \x01(\x08\"G\n\x14PutDocumentsResponse\x12\r\n\x05\x63ount\x18\x01 \x01(\x03\x12 \n\x06status\x18\x02 \x01(\x0b\x32\x10.protobuf.Status\"K\n\x16\x44\x65leteDocumentsRequest\x12\x12\n\nindex_name\x18\x01 \x01(\t\x12\x0f\n\x07\x64oc_ids\x18\x02 \x01(\x0c\x12\x0c\n\x04sync\x18\x03 \x01(\x08\"J\n\x17\x44\x65leteDocumentsResponse\x12\r\n\x05\x63ount\x18\x01 \x01(\x03\x12 \n\x06status\x18\x02 \x01(\x0b\x32\x10.protobuf.Status\"\x88\x01\n\x16SearchDocumentsRequest\x12\x12\n\nindex_name\x18\x01 \x01(\t\x12\r\n\x05query\x18\x02 \x01(\t\x12\x14\n\x0csearch_field\x18\x03 \x01(\t\x12\x10\n\x08page_num\x18\x04 \x01(\x03\x12\x10\n\x08page_len\x18\x05 \x01(\x03\x12\x11\n\tweighting\x18\x06 \x01(\x0c\"L\n\x17SearchDocumentsResponse\x12\x0f\n\x07results\x18\x01 \x01(\x0c\x12 \n\x06status\x18\x02 \x01(\x0b\x32\x10.protobuf.Status\"#\n\x0ePutNodeRequest\x12\x11\n\tnode_name\x18\x01 \x01(\t\"3\n\x0fPutNodeResponse\x12 \n\x06status\x18\x01 \x01(\x0b\x32\x10.protobuf.Status\"&\n\x11\x44\x65leteNodeRequest\x12\x11\n\tnode_name\x18\x01 \x01(\t\"6\n\x12\x44\x65leteNodeResponse\x12 \n\x06status\x18\x01 \x01(\x0b\x32\x10.protobuf.Status\"\x18\n\x16IsSnapshotExistRequest\"J\n\x17IsSnapshotExistResponse\x12\r\n\x05\x65xist\x18\x01 \x01(\x08\x12 \n\x06status\x18\x02 \x01(\x0b\x32\x10.protobuf.Status\"%\n\x15\x43reateSnapshotRequest\x12\x0c\n\x04sync\x18\x01 \x01(\x08\":\n\x16\x43reateSnapshotResponse\x12 \n\x06status\x18\x01 \x01(\x0b\x32\x10.protobuf.Status\"(\n\x12GetSnapshotRequest\x12\x12\n\nchunk_size\x18\x01 \x01(\x03\"T\n\x13GetSnapshotResponse\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\r\n\x05\x63hunk\x18\x02 \x01(\x0c\x12 \n\x06status\x18\x03 \x01(\x0b\x32\x10.protobuf.Status\"\x12\n\x10IsHealthyRequest\"F\n\x11IsHealthyResponse\x12\x0f\n\x07healthy\x18\x01 \x01(\x08\x12 \n\x06status\x18\x02 \x01(\x0b\x32\x10.protobuf.Status\"\x10\n\x0eIsAliveRequest\"B\n\x0fIsAliveResponse\x12\r\n\x05\x61live\x18\x01 \x01(\x08\x12 \n\x06status\x18\x02 \x01(\x0b\x32\x10.protobuf.Status\"\x10\n\x0eIsReadyRequest\"B\n\x0fIsReadyResponse\x12\r\n\x05ready\x18\x01 \x01(\x08\x12 \n\x06status\x18\x02 \x01(\x0b\x32\x10.protobuf.Status\"\x12\n\x10GetStatusRequest\"J\n\x11GetStatusResponse\x12\x13\n\x0bnode_status\x18\x01 \x01(\x0c\x12 \n\x06status\x18\x02 \x01(\x0b\x32\x10.protobuf.Status2\x8b\x0e\n\x05Index\x12L\n\x0b\x43reateIndex\x12\x1c.protobuf.CreateIndexRequest\x1a\x1d.protobuf.CreateIndexResponse\"\x00\x12L\n\x0b\x44\x65leteIndex\x12\x1c.protobuf.DeleteIndexRequest\x1a\x1d.protobuf.DeleteIndexResponse\"\x00\x12\x46\n\tOpenIndex\x12\x1a.protobuf.OpenIndexRequest\x1a\x1b.protobuf.OpenIndexResponse\"\x00\x12I\n\nCloseIndex\x12\x1b.protobuf.CloseIndexRequest\x1a\x1c.protobuf.CloseIndexResponse\"\x00\x12\x43\n\x08GetIndex\x12\x19.protobuf.GetIndexRequest\x1a\x1a.protobuf.GetIndexResponse\"\x00\x12L\n\x0b\x43ommitIndex\x12\x1c.protobuf.CommitIndexRequest\x1a\x1d.protobuf.CommitIndexResponse\"\x00\x12R\n\rRollbackIndex\x12\x1e.protobuf.RollbackIndexRequest\x1a\x1f.protobuf.RollbackIndexResponse\"\x00\x12R\n\rOptimizeIndex\x12\x1e.protobuf.OptimizeIndexRequest\x1a\x1f.protobuf.OptimizeIndexResponse\"\x00\x12L\n\x0bPutDocument\x12\x1c.protobuf.PutDocumentRequest\x1a\x1d.protobuf.PutDocumentResponse\"\x00\x12L\n\x0bGetDocument\x12\x1c.protobuf.GetDocumentRequest\x1a\x1d.protobuf.GetDocumentResponse\"\x00\x12U\n\x0e\x44\x65leteDocument\x12\x1f.protobuf.DeleteDocumentRequest\x1a .protobuf.DeleteDocumentResponse\"\x00\x12O\n\x0cPutDocuments\x12\x1d.protobuf.PutDocumentsRequest\x1a\x1e.protobuf.PutDocumentsResponse\"\x00\x12X\n\x0f\x44\x65leteDocuments\x12 .protobuf.DeleteDocumentsRequest\x1a!.protobuf.DeleteDocumentsResponse\"\x00\x12X\n\x0fSearchDocuments\x12 .protobuf.SearchDocumentsRequest\x1a!.protobuf.SearchDocumentsResponse\"\x00\x12@\n\x07PutNode\x12\x18.protobuf.PutNodeRequest\x1a\x19.protobuf.PutNodeResponse\"\x00\x12I\n\nDeleteNode\x12\x1b.protobuf.DeleteNodeRequest\x1a\x1c.protobuf.DeleteNodeResponse\"\x00\x12X\n\x0fIsSnapshotExist\x12 .protobuf.IsSnapshotExistRequest\x1a!.protobuf.IsSnapshotExistResponse\"\x00\x12U\n\x0e\x43reateSnapshot\x12\x1f.protobuf.CreateSnapshotRequest\x1a .protobuf.CreateSnapshotResponse\"\x00\x12N\n\x0bGetSnapshot\x12\x1c.protobuf.GetSnapshotRequest\x1a\x1d.protobuf.GetSnapshotResponse\"\x00\x30\x01\x12\x46\n\tIsHealthy\x12\x1a.protobuf.IsHealthyRequest\x1a\x1b.protobuf.IsHealthyResponse\"\x00\x12@\n\x07IsAlive\x12\x18.protobuf.IsAliveRequest\x1a\x19.protobuf.IsAliveResponse\"\x00\x12@\n\x07IsReady\x12\x18.protobuf.IsReadyRequest\x1a\x19.protobuf.IsReadyResponse\"\x00\x12\x46\n\tGetStatus\x12\x1a.protobuf.GetStatusRequest\x1a\x1b.protobuf.GetStatusResponse\"\x00\x62\x06proto3')
+  serialized_pb=_b('\n\x1f\x63ockatrice/protobuf/index.proto\x12\x08protobuf\x1a cockatrice/protobuf/common.proto\"\x89\x02\n\nIndexStats\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x11\n\tdoc_count\x18\x02 \x01(\x03\x12\x15\n\rdoc_count_all\x18\x03 \x01(\x03\x12\x15\n\rlast_modified\x18\x04 \x01(\x01\x12\x19\n\x11latest_generation\x18\x05 \x01(\x03\x12\x0f\n\x07version\x18\x06 \x01(\x03\x12-\n\x07storage\x18\x07 \x01(\x0b\x32\x1c.protobuf.IndexStats.Storage\x1aQ\n\x07Storage\x12\x0e\n\x06\x66older\x18\x01 \x01(\t\x12\x15\n\rsupports_mmap\x18\x02 \x01(\x08\x12\x10\n\x08readonly\x18\x03 \x01(\x08\x12\r\n\x05\x66iles\x18\x04 \x03(\t\"\xa9\x01\n\x05\x46ield\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x16\n\x0cstring_value\x18\x02 \x01(\tH\x00\x12\x13\n\tint_value\x18\x03 \x01(\x03H\x00\x12\x15\n\x0b\x66loat_value\x18\x04 \x01(\x01H\x00\x12\x14\n\nbool_value\x18\x05 \x01(\x08H\x00\x12\x15\n\x0b\x62ytes_value\x18\x06 \x01(\x0cH\x00\x12\x18\n\x0e\x64\x61tetime_value\x18\x07 \x01(\tH\x00\x42\x07\n\x05value\"+\n\x08\x44ocument\x12\x1f\n\x06\x66ields\x18\x01 \x03(\x0b\x32\x0f.protobuf.Field\"\xf0\x01\n\x03Hit\x12\x1f\n\x03\x64oc\x18\x01 \x01(\x0b\x32\x12.protobuf.Document\x12\x0f\n\x07\x64oc_num\x18\x02 \x01(\x03\x12\r\n\x05score\x18\x03 \x01(\x01\x12\x0c\n\x04rank\x18\x04 \x01(\x03\x12\x0b\n\x03pos\x18\x05 \x01(\x03\x12\x31\n\nhighlights\x18\x06 \x03(\x0b\x32\x1d.protobuf.Hit.HighlightsEntry\x12\x12\n\nindex_name\x18\x07 \x01(\t\x12\x13\n\x0b\x65xplanation\x18\x08 \x01(\t\x1a\x31\n\x0fHighlightsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"F\n\nFacetCount\x12\r\n\x05value\x18\x01 \x01(\t\x12\r\n\x05start\x18\x02 \x01(\t\x12\x0b\n\x03\x65nd\x18\x03 \x01(\t\x12\r\n\x05\x63ount\x18\x04 \x01(\x03\"A\n\x0b\x46\x61\x63\x65tResult\x12\x0c\n\x04name\x18\x01 \x01(\t\x12$\n\x06\x63ounts\x18\x02 \x03(\x0b\x32\x14.protobuf.FacetCount\"L\n\x12\x43reateIndexRequest\x12\x12\n\nindex_name\x18\x01 \x01(\t\x12\x14\n\x0cindex_config\x18\x02 \x01(\x0c\x12\x0c\n\x04sync\x18\x03 \x01(\x08\"b\n\x13\x43reateIndexResponse\x12)\n\x0bindex_stats\x18\x01 \x01(\x0b\x32\x14.protobuf.IndexStats\x12 \n\x06status\x18\x02 \x01(\x0b\x32\x10.protobuf.Status\"%\n\x0fGetIndexRequest\x12\x12\n\nindex_name\x18\x01 \x01(\t\"_\n\x10GetIndexResponse\x12)\n\x0bindex_stats\x18\x01 \x01(\x0b\x32\x14.protobuf.IndexStats\x12 \n\x06status\x18\x02 \x01(\x0b\x32\x10.protobuf.Status\"6\n\x12\x44\x65leteIndexRequest\x12\x12\n\nindex_name\x18\x01 \x01(\t\x12\x0c\n\x04sync\x18\x02 \x01(\x08\"b\n\x13\x44\x65leteIndexResponse\x12)\n\x0bindex_stats\x18\x01 \x01(\x0b\x32\x14.protobuf.IndexStats\x12 \n\x06status\x18\x02 \x01(\x0b\x32\x10.protobuf.Status\"J\n\x10OpenIndexRequest\x12\x12\n\nindex_name\x18\x01 \x01(\t\x12\x14\n\x0cindex_config\x18\x02 \x01(\x0c\x12\x0c\n\x04sync\x18\x03 \x01(\x08\"`\n\x11OpenIndexResponse\x12)\n\x0bindex_stats\x18\x01 \x01(\x0b\x32\x14.protobuf.IndexStats\x12 \n\x06status\x18\x02 \x01(\x0b\x32\x10.protobuf.Status\"5\n\x11\x43loseIndexRequest\x12\x12\n\nindex_name\x18\x01 \x01(\t\x12\x0c\n\x04sync\x18\x02 \x01(\x08\"a\n\x12\x43loseIndexResponse\x12)\n\x0bindex_stats\x18\x01 \x01(\x0b\x32\x14.protobuf.IndexStats\x12 \n\x06status\x18\x02 \x01(\x0b\x32\x10.protobuf.Status\"6\n\x12\x43ommitIndexRequest\x12\x12\n\nindex_name\x18\x01 \x01(\t\x12\x0c\n\x04sync\x18\x02 \x01(\x08\"7\n\x13\x43ommitIndexResponse\x12 \n\x06status\x18\x01 \x01(\x0b\x32\x10.protobuf.Status\"8\n\x14RollbackIndexRequest\x12\x12\n\nindex_name\x18\x01 \x01(\t\x12\x0c\n\x04sync\x18\x02 \x01(\x08\"9\n\x15RollbackIndexResponse\x12 \n\x06status\x18\x01 \x01(\x0b\x32\x10.protobuf.Status\"8\n\x14OptimizeIndexRequest\x12\x12\n\nindex_name\x18\x01 \x01(\t\x12\x0c\n\x04sync\x18\x02 \x01(\x08\"d\n\x15OptimizeIndexResponse\x12)\n\x0bindex_stats\x18\x01 \x01(\x0b\x32\x14.protobuf.IndexStats\x12 \n\x06status\x18\x02 \x01(\x0b\x32\x10.protobuf.Status\"m\n\x12PutDocumentRequest\x12\x12\n\nindex_name\x18\x01 \x01(\t\x12\x0e\n\x06\x64oc_id\x18\x02 \x01(\t\x12\x0c\n\x04sync\x18\x04 \x01(\x08\x12\x1f\n\x03\x64oc\x18\x05 \x01(\x0b\x32\x12.protobuf.DocumentJ\x04\x08\x03\x10\x04\"F\n\x13PutDocumentResponse\x12\r\n\x05\x63ount\x18\x01 \x01(\x03\x12 \n\x06status\x18\x02 \x01(\x0b\x32\x10.protobuf.Status\"H\n\x12GetDocumentRequest\x12\x12\n\nindex_name\x18\x01 \x01(\t\x12\x0e\n\x06\x64oc_id\x18\x02 \x01(\t\x12\x0e\n\x06\x66ields\x18\x03 \x03(\t\"^\n\x13GetDocumentResponse\x12 \n\x06status\x18\x02 \x01(\x0b\x32\x10.protobuf.Status\x12\x1f\n\x03\x64oc\x18\x03 \x01(\x0b\x32\x12.protobuf.DocumentJ\x04\x08\x01\x10\x02\"I\n\x15\x44\x65leteDocumentRequest\x12\x12\n\nindex_name\x18\x01 \x01(\t\x12\x0e\n\x06\x64oc_id\x18\x02 \x01(\t\x12\x0c\n\x04sync\x18\x03 \x01(\x08\"I\n\x16\x44\x65leteDocumentResponse\x12\r\n\x05\x63ount\x18\x01 \x01(\x03\x12 \n\x06status\x18\x02 \x01(\x0b\x32\x10.protobuf.Status\"_\n\x13PutDocumentsRequest\x12\x12\n\nindex_name\x18\x01 \x01(\t\x12\x0c\n\x04sync\x18\x03 \x01(\x08\x12 \n\x04\x64ocs\x18\x04 \x03(\x0b\x32\x12.protobuf.DocumentJ\x04\x08\x02\x10\x03\"G\n\x14PutDocumentsResponse\x12\r\n\x05\x63ount\x18\x01 \x01(\x03\x12 \n\x06status\x18\x02 \x01(\x0b\x32\x10.protobuf.Status\"J\n\x13GetDocumentsRequest\x12\x12\n\nindex_name\x18\x01 \x01(\t\x12\x0f\n\x07\x64oc_ids\x18\x02 \x03(\t\x12\x0e\n\x06\x66ields\x18\x03 \x03(\t\"m\n\x14GetDocumentsResponse\x12 \n\x04\x64ocs\x18\x01 \x03(\x0b\x32\x12.protobuf.Document\x12\x11\n\tnot_found\x18\x02 \x03(\t\x12 \n\x06status\x18\x03 \x01(\x0b\x32\x10.protobuf.Status\"Q\n\x16\x44\x65leteDocumentsRequest\x12\x12\n\nindex_name\x18\x01 \x01(\t\x12\x0c\n\x04sync\x18\x03 \x01(\x08\x12\x0f\n\x07\x64oc_ids\x18\x04 \x03(\tJ\x04\x08\x02\x10\x03\"J\n\x17\x44\x65leteDocumentsResponse\x12\r\n\x05\x63ount\x18\x01 \x01(\x03\x12 \n\x06status\x18\x02 \x01(\x0b\x32\x10.protobuf.Status\"e\n\x19StreamPutDocumentsRequest\x12\x12\n\nindex_name\x18\x01 \x01(\t\x12\x0c\n\x04sync\x18\x03 \x01(\x08\x12 \n\x04\x64ocs\x18\x04 \x03(\x0b\x32\x12.protobuf.DocumentJ\x04\x08\x02\x10\x03\"t\n\x1aStreamPutDocumentsResponse\x12\r\n\x05\x63ount\x18\x01 \x01(\x03\x12\x0e\n\x06\x63hunks\x18\x02 \x01(\x03\x12\x15\n\rfailed_chunks\x18\x03 \x03(\x03\x12 \n\x06status\x18\x04 \x01(\x0b\x32\x10.protobuf.Status\"W\n\x1cStreamDeleteDocumentsRequest\x12\x12\n\nindex_name\x18\x01 \x01(\t\x12\x0c\n\x04sync\x18\x03 \x01(\x08\x12\x0f\n\x07\x64oc_ids\x18\x04 \x03(\tJ\x04\x08\x02\x10\x03\"w\n\x1dStreamDeleteDocumentsResponse\x12\r\n\x05\x63ount\x18\x01 \x01(\x03\x12\x0e\n\x06\x63hunks\x18\x02 \x01(\x03\x12\x15\n\rfailed_chunks\x18\x03 \x03(\x03\x12 \n\x06status\x18\x04 \x01(\x0b\x32\x10.protobuf.Status\"\xe6\x02\n\x16SearchDocumentsRequest\x12\x12\n\nindex_name\x18\x01 \x01(\t\x12\r\n\x05query\x18\x02 \x01(\t\x12\x14\n\x0csearch_field\x18\x03 \x01(\t\x12\x10\n\x08page_num\x18\x04 \x01(\x03\x12\x10\n\x08page_len\x18\x05 \x01(\x03\x12\x11\n\tweighting\x18\x06 \x01(\t\x12\x0e\n\x06\x66ilter\x18\x07 \x01(\t\x12\x0e\n\x06\x66\x61\x63\x65ts\x18\x08 \x01(\t\x12\x11\n\thighlight\x18\t \x01(\t\x12\x0c\n\x04sort\x18\n \x01(\t\x12\x14\n\x0csearch_after\x18\x0b \x01(\t\x12\x0e\n\x06\x66ields\x18\x0c \x03(\t\x12\x10\n\x08ids_only\x18\r \x01(\x08\x12\x12\n\ncount_only\x18\x0e \x01(\x08\x12\x12\n\ntimeout_ms\x18\x0f \x01(\x03\x12\x0f\n\x07profile\x18\x10 \x01(\x08\x12\x0f\n\x07\x65xplain\x18\x11 \x01(\x08\x12\x19\n\x11weighting_profile\x18\x12 \x01(\t\"\xba\x02\n\x17SearchDocumentsResponse\x12 \n\x06status\x18\x02 \x01(\x0b\x32\x10.protobuf.Status\x12\x14\n\x0cis_last_page\x18\x03 \x01(\x08\x12\x12\n\npage_count\x18\x04 \x01(\x03\x12\x10\n\x08page_len\x18\x05 \x01(\x03\x12\x10\n\x08page_num\x18\x06 \x01(\x03\x12\r\n\x05total\x18\x07 \x01(\x03\x12\x0e\n\x06offset\x18\x08 \x01(\x03\x12\x1b\n\x04hits\x18\t \x03(\x0b\x32\r.protobuf.Hit\x12%\n\x06\x66\x61\x63\x65ts\x18\n \x03(\x0b\x32\x15.protobuf.FacetResult\x12\x14\n\x0csearch_after\x18\x0b \x01(\t\x12\x0c\n\x04time\x18\x0c \x01(\x01\x12\x11\n\ttimed_out\x18\r \x01(\x08\x12\x0f\n\x07profile\x18\x0e \x01(\tJ\x04\x08\x01\x10\x02\"H\n\x12MultiSearchRequest\x12\x32\n\x08searches\x18\x01 \x03(\x0b\x32 .protobuf.SearchDocumentsRequest\"m\n\x13MultiSearchResponse\x12\x34\n\tresponses\x18\x01 \x03(\x0b\x32!.protobuf.SearchDocumentsResponse\x12 \n\x06status\x18\x02 \x01(\x0b\x32\x10.protobuf.Status\"`\n\x15\x43ountDocumentsRequest\x12\x12\n\nindex_name\x18\x01 \x01(\t\x12\r\n\x05query\x18\x02 \x01(\t\x12\x14\n\x0csearch_field\x18\x03 \x01(\t\x12\x0e\n\x06\x66ilter\x18\x04 \x01(\t\"I\n\x16\x43ountDocumentsResponse\x12\r\n\x05\x63ount\x18\x01 \x01(\x03\x12 \n\x06status\x18\x02 \x01(\x0b\x32\x10.protobuf.Status\"\x99\x01\n\x1cStreamSearchDocumentsRequest\x12\x12\n\nindex_name\x18\x01 \x01(\t\x12\r\n\x05query\x18\x02 \x01(\t\x12\x14\n\x0csearch_field\x18\x03 \x01(\t\x12\x11\n\tweighting\x18\x04 \x01(\t\x12\x12\n\nbatch_size\x18\x05 \x01(\x03\x12\x19\n\x11weighting_profile\x18\x06 \x01(\t\"^\n\x1dStreamSearchDocumentsResponse\x12\x1b\n\x04hits\x18\x01 \x03(\x0b\x32\r.protobuf.Hit\x12 \n\x06status\x18\x02 \x01(\x0b\x32\x10.protobuf.Status\"#\n\x0ePutNodeRequest\x12\x11\n\tnode_name\x18\x01 \x01(\t\"3\n\x0fPutNodeResponse\x12 \n\x06status\x18\x01 \x01(\x0b\x32\x10.protobuf.Status\"&\n\x11\x44\x65leteNodeRequest\x12\x11\n\tnode_name\x18\x01 \x01(\t\"6\n\x12\x44\x65leteNodeResponse\x12 \n\x06status\x18\x01 \x01(\x0b\x32\x10.protobuf.Status\"\x18\n\x16IsSnapshotExistRequest\"J\n\x17IsSnapshotExistResponse\x12\r\n\x05\x65xist\x18\x01 \x01(\x08\x12 \n\x06status\x18\x02 \x01(\x0b\x32\x10.protobuf.Status\"%\n\x15\x43reateSnapshotRequest\x12\x0c\n\x04sync\x18\x01 \x01(\x08\":\n\x16\x43reateSnapshotResponse\x12 \n\x06status\x18\x01 \x01(\x0b\x32\x10.protobuf.Status\"(\n\x12GetSnapshotRequest\x12\x12\n\nchunk_size\x18\x01 \x01(\x03\"T\n\x13GetSnapshotResponse\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\r\n\x05\x63hunk\x18\x02 \x01(\x0c\x12 \n\x06status\x18\x03 \x01(\x0b\x32\x10.protobuf.Status\"\x12\n\x10IsHealthyRequest\"F\n\x11IsHealthyResponse\x12\x0f\n\x07healthy\x18\x01 \x01(\x08\x12 \n\x06status\x18\x02 \x01(\x0b\x32\x10.protobuf.Status\"\x10\n\x0eIsAliveRequest\"B\n\x0fIsAliveResponse\x12\r\n\x05\x61live\x18\x01 \x01(\x08\x12 \n\x06status\x18\x02 \x01(\x0b\x32\x10.protobuf.Status\"\x10\n\x0eIsReadyRequest\"B\n\x0fIsReadyResponse\x12\r\n\x05ready\x18\x01 \x01(\x08\x12 \n\x06status\x18\x02 \x01(\x0b\x32\x10.protobuf.Status\"\x12\n\x10GetStatusRequest\"J\n\x11GetStatusResponse\x12\x13\n\x0bnode_status\x18\x01 \x01(\x0c\x12 \n\x06status\x18\x02 \x01(\x0b\x32\x10.protobuf.Status2\xc2\x12\n\x05Index\x12L\n\x0b\x43reateIndex\x12\x1c.protobuf.CreateIndexRequest\x1a\x1d.protobuf.CreateIndexResponse\"\x00\x12L\n\x0b\x44\x65leteIndex\x12\x1c.protobuf.DeleteIndexRequest\x1a\x1d.protobuf.DeleteIndexResponse\"\x00\x12\x46\n\tOpenIndex\x12\x1a.protobuf.OpenIndexRequest\x1a\x1b.protobuf.OpenIndexResponse\"\x00\x12I\n\nCloseIndex\x12\x1b.protobuf.CloseIndexRequest\x1a\x1c.protobuf.CloseIndexResponse\"\x00\x12\x43\n\x08GetIndex\x12\x19.protobuf.GetIndexRequest\x1a\x1a.protobuf.GetIndexResponse\"\x00\x12L\n\x0b\x43ommitIndex\x12\x1c.protobuf.CommitIndexRequest\x1a\x1d.protobuf.CommitIndexResponse\"\x00\x12R\n\rRollbackIndex\x12\x1e.protobuf.RollbackIndexRequest\x1a\x1f.protobuf.RollbackIndexResponse\"\x00\x12R\n\rOptimizeIndex\x12\x1e.protobuf.OptimizeIndexRequest\x1a\x1f.protobuf.OptimizeIndexResponse\"\x00\x12L\n\x0bPutDocument\x12\x1c.protobuf.PutDocumentRequest\x1a\x1d.protobuf.PutDocumentResponse\"\x00\x12L\n\x0bGetDocument\x12\x1c.protobuf.GetDocumentRequest\x1a\x1d.protobuf.GetDocumentResponse\"\x00\x12U\n\x0e\x44\x65leteDocument\x12\x1f.protobuf.DeleteDocumentRequest\x1a .protobuf.DeleteDocumentResponse\"\x00\x12O\n\x0cPutDocuments\x12\x1d.protobuf.PutDocumentsRequest\x1a\x1e.protobuf.PutDocumentsResponse\"\x00\x12O\n\x0cGetDocuments\x12\x1d.protobuf.GetDocumentsRequest\x1a\x1e.protobuf.GetDocumentsResponse\"\x00\x12X\n\x0f\x44\x65leteDocuments\x12 .protobuf.DeleteDocumentsRequest\x1a!.protobuf.DeleteDocumentsResponse\"\x00\x12\x63\n\x12StreamPutDocuments\x12#.protobuf.StreamPutDocumentsRequest\x1a$.protobuf.StreamPutDocumentsResponse\"\x00(\x01\x12l\n\x15StreamDeleteDocuments\x12&.protobuf.StreamDeleteDocumentsRequest\x1a\'.protobuf.StreamDeleteDocumentsResponse\"\x00(\x01\x12X\n\x0fSearchDocuments\x12 .protobuf.SearchDocumentsRequest\x1a!.protobuf.SearchDocumentsResponse\"\x00\x12U\n\x0e\x43ountDocuments\x12\x1f.protobuf.CountDocumentsRequest\x1a .protobuf.CountDocumentsResponse\"\x00\x12L\n\x0bMultiSearch\x12\x1c.protobuf.MultiSearchRequest\x1a\x1d.protobuf.MultiSearchResponse\"\x00\x12l\n\x15StreamSearchDocuments\x12&.protobuf.StreamSearchDocumentsRequest\x1a\'.protobuf.StreamSearchDocumentsResponse\"\x00\x30\x01\x12@\n\x07PutNode\x12\x18.protobuf.PutNodeRequest\x1a\x19.protobuf.PutNodeResponse\"\x00\x12I\n\nDeleteNode\x12\x1b.protobuf.DeleteNodeRequest\x1a\x1c.protobuf.DeleteNodeResponse\"\x00\x12X\n\x0fIsSnapshotExist\x12 .protobuf.IsSnapshotExistRequest\x1a!.protobuf.IsSnapshotExistResponse\"\x00\x12U\n\x0e\x43reateSnapshot\x12\x1f.protobuf.CreateSnapshotRequest\x1a .protobuf.CreateSnapshotResponse\"\x00\x12N\n\x0bGetSnapshot\x12\x1c.protobuf.GetSnapshotRequest\x1a\x1d.protobuf.GetSnapshotResponse\"\x00\x30\x01\x12\x46\n\tIsHealthy\x12\x1a.protobuf.IsHealthyRequest\x1a\x1b.protobuf.IsHealthyResponse\"\x00\x12@\n\x07IsAlive\x12\x18.protobuf.IsAliveRequest\x1a\x19.protobuf.IsAliveResponse\"\x00\x12@\n\x07IsReady\x12\x18.protobuf.IsReadyRequest\x1a\x19.protobuf.IsReadyResponse\"\x00\x12\x46\n\tGetStatus\x12\x1a.protobuf.GetStatusRequest\x1a\x1b.protobuf.GetStatusResponse\"\x00\x62\x06proto3')
   ,
   dependencies=[cockatrice_dot_protobuf_dot_common__pb2.DESCRIPTOR,])
 
@@ -151,6 +151,320 @@ _INDEXSTATS = _descriptor.Descriptor(
 )
 
 
+_FIELD = _descriptor.Descriptor(
+  name='Field',
+  full_name='protobuf.Field',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='protobuf.Field.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='string_value', full_name='protobuf.Field.string_value', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='int_value', full_name='protobuf.Field.int_value', index=2,
+      number=3, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='float_value', full_name='protobuf.Field.float_value', index=3,
+      number=4, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='bool_value', full_name='protobuf.Field.bool_value', index=4,
+      number=5, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='bytes_value', full_name='protobuf.Field.bytes_value', index=5,
+      number=6, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='datetime_value', full_name='protobuf.Field.datetime_value', index=6,
+      number=7, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='value', full_name='protobuf.Field.value',
+      index=0, containing_type=None, fields=[]),
+  ],
+  serialized_start=348,
+  serialized_end=517,
+)
+
+
+_DOCUMENT = _descriptor.Descriptor(
+  name='Document',
+  full_name='protobuf.Document',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='fields', full_name='protobuf.Document.fields', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=519,
+  serialized_end=562,
+)
+
+
+_HIT_HIGHLIGHTSENTRY = _descriptor.Descriptor(
+  name='HighlightsEntry',
+  full_name='protobuf.Hit.HighlightsEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='protobuf.Hit.HighlightsEntry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='protobuf.Hit.HighlightsEntry.value', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=_b('8\001'),
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=756,
+  serialized_end=805,
+)
+
+_HIT = _descriptor.Descriptor(
+  name='Hit',
+  full_name='protobuf.Hit',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='doc', full_name='protobuf.Hit.doc', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='doc_num', full_name='protobuf.Hit.doc_num', index=1,
+      number=2, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='score', full_name='protobuf.Hit.score', index=2,
+      number=3, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='rank', full_name='protobuf.Hit.rank', index=3,
+      number=4, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='pos', full_name='protobuf.Hit.pos', index=4,
+      number=5, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='highlights', full_name='protobuf.Hit.highlights', index=5,
+      number=6, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='index_name', full_name='protobuf.Hit.index_name', index=6,
+      number=7, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='explanation', full_name='protobuf.Hit.explanation', index=7,
+      number=8, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_HIT_HIGHLIGHTSENTRY, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=565,
+  serialized_end=805,
+)
+
+
+_FACETCOUNT = _descriptor.Descriptor(
+  name='FacetCount',
+  full_name='protobuf.FacetCount',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='value', full_name='protobuf.FacetCount.value', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='start', full_name='protobuf.FacetCount.start', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='end', full_name='protobuf.FacetCount.end', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='count', full_name='protobuf.FacetCount.count', index=3,
+      number=4, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=807,
+  serialized_end=877,
+)
+
+
+_FACETRESULT = _descriptor.Descriptor(
+  name='FacetResult',
+  full_name='protobuf.FacetResult',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='protobuf.FacetResult.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='counts', full_name='protobuf.FacetResult.counts', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=879,
+  serialized_end=944,
+)
+
+
 _CREATEINDEXREQUEST = _descriptor.Descriptor(
   name='CreateIndexRequest',
   full_name='protobuf.CreateIndexRequest',
@@ -191,8 +505,8 @@ _CREATEINDEXREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=347,
-  serialized_end=423,
+  serialized_start=946,
+  serialized_end=1022,
 )
 
 
@@ -229,8 +543,8 @@ _CREATEINDEXRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=425,
-  serialized_end=523,
+  serialized_start=1024,
+  serialized_end=1122,
 )
 
 
@@ -260,8 +574,8 @@ _GETINDEXREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=525,
-  serialized_end=562,
+  serialized_start=1124,
+  serialized_end=1161,
 )
 
 
@@ -298,8 +612,8 @@ _GETINDEXRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=564,
-  serialized_end=659,
+  serialized_start=1163,
+  serialized_end=1258,
 )
 
 
@@ -336,8 +650,8 @@ _DELETEINDEXREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=661,
-  serialized_end=715,
+  serialized_start=1260,
+  serialized_end=1314,
 )
 
 
@@ -374,8 +688,8 @@ _DELETEINDEXRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=717,
-  serialized_end=815,
+  serialized_start=1316,
+  serialized_end=1414,
 )
 
 
@@ -419,8 +733,8 @@ _OPENINDEXREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=817,
-  serialized_end=891,
+  serialized_start=1416,
+  serialized_end=1490,
 )
 
 
@@ -457,8 +771,8 @@ _OPENINDEXRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=893,
-  serialized_end=989,
+  serialized_start=1492,
+  serialized_end=1588,
 )
 
 
@@ -495,8 +809,8 @@ _CLOSEINDEXREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=991,
-  serialized_end=1044,
+  serialized_start=1590,
+  serialized_end=1643,
 )
 
 
@@ -533,8 +847,8 @@ _CLOSEINDEXRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1046,
-  serialized_end=1143,
+  serialized_start=1645,
+  serialized_end=1742,
 )
 
 
@@ -571,8 +885,8 @@ _COMMITINDEXREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1145,
-  serialized_end=1199,
+  serialized_start=1744,
+  serialized_end=1798,
 )
 
 
@@ -602,8 +916,8 @@ _COMMITINDEXRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1201,
-  serialized_end=1256,
+  serialized_start=1800,
+  serialized_end=1855,
 )
 
 
@@ -640,8 +954,8 @@ _ROLLBACKINDEXREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1258,
-  serialized_end=1314,
+  serialized_start=1857,
+  serialized_end=1913,
 )
 
 
@@ -671,8 +985,8 @@ _ROLLBACKINDEXRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1316,
-  serialized_end=1373,
+  serialized_start=1915,
+  serialized_end=1972,
 )
 
 
@@ -709,8 +1023,8 @@ _OPTIMIZEINDEXREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1375,
-  serialized_end=1431,
+  serialized_start=1974,
+  serialized_end=2030,
 )
 
 
@@ -747,8 +1061,8 @@ _OPTIMIZEINDEXRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1433,
-  serialized_end=1533,
+  serialized_start=2032,
+  serialized_end=2132,
 )
 
 
@@ -774,16 +1088,16 @@ _PUTDOCUMENTREQUEST = _descriptor.Descriptor(
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='fields', full_name='protobuf.PutDocumentRequest.fields', index=2,
-      number=3, type=12, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b(""),
+      name='sync', full_name='protobuf.PutDocumentRequest.sync', index=2,
+      number=4, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='sync', full_name='protobuf.PutDocumentRequest.sync', index=3,
-      number=4, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
+      name='doc', full_name='protobuf.PutDocumentRequest.doc', index=3,
+      number=5, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
@@ -799,8 +1113,8 @@ _PUTDOCUMENTREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1535,
-  serialized_end=1621,
+  serialized_start=2134,
+  serialized_end=2243,
 )
 
 
@@ -837,8 +1151,8 @@ _PUTDOCUMENTRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1623,
-  serialized_end=1693,
+  serialized_start=2245,
+  serialized_end=2315,
 )
 
 
@@ -863,6 +1177,13 @@ _GETDOCUMENTREQUEST = _descriptor.Descriptor(
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='fields', full_name='protobuf.GetDocumentRequest.fields', index=2,
+      number=3, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
@@ -875,8 +1196,8 @@ _GETDOCUMENTREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1695,
-  serialized_end=1751,
+  serialized_start=2317,
+  serialized_end=2389,
 )
 
 
@@ -888,15 +1209,15 @@ _GETDOCUMENTRESPONSE = _descriptor.Descriptor(
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='fields', full_name='protobuf.GetDocumentResponse.fields', index=0,
-      number=1, type=12, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b(""),
+      name='status', full_name='protobuf.GetDocumentResponse.status', index=0,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='status', full_name='protobuf.GetDocumentResponse.status', index=1,
-      number=2, type=11, cpp_type=10, label=1,
+      name='doc', full_name='protobuf.GetDocumentResponse.doc', index=1,
+      number=3, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
@@ -913,8 +1234,8 @@ _GETDOCUMENTRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1753,
-  serialized_end=1824,
+  serialized_start=2391,
+  serialized_end=2485,
 )
 
 
@@ -933,19 +1254,657 @@ _DELETEDOCUMENTREQUEST = _descriptor.Descriptor(
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='doc_id', full_name='protobuf.DeleteDocumentRequest.doc_id', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
+      name='doc_id', full_name='protobuf.DeleteDocumentRequest.doc_id', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='sync', full_name='protobuf.DeleteDocumentRequest.sync', index=2,
+      number=3, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2487,
+  serialized_end=2560,
+)
+
+
+_DELETEDOCUMENTRESPONSE = _descriptor.Descriptor(
+  name='DeleteDocumentResponse',
+  full_name='protobuf.DeleteDocumentResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='count', full_name='protobuf.DeleteDocumentResponse.count', index=0,
+      number=1, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='status', full_name='protobuf.DeleteDocumentResponse.status', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2562,
+  serialized_end=2635,
+)
+
+
+_PUTDOCUMENTSREQUEST = _descriptor.Descriptor(
+  name='PutDocumentsRequest',
+  full_name='protobuf.PutDocumentsRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='index_name', full_name='protobuf.PutDocumentsRequest.index_name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='sync', full_name='protobuf.PutDocumentsRequest.sync', index=1,
+      number=3, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='docs', full_name='protobuf.PutDocumentsRequest.docs', index=2,
+      number=4, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2637,
+  serialized_end=2732,
+)
+
+
+_PUTDOCUMENTSRESPONSE = _descriptor.Descriptor(
+  name='PutDocumentsResponse',
+  full_name='protobuf.PutDocumentsResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='count', full_name='protobuf.PutDocumentsResponse.count', index=0,
+      number=1, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='status', full_name='protobuf.PutDocumentsResponse.status', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2734,
+  serialized_end=2805,
+)
+
+
+_GETDOCUMENTSREQUEST = _descriptor.Descriptor(
+  name='GetDocumentsRequest',
+  full_name='protobuf.GetDocumentsRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='index_name', full_name='protobuf.GetDocumentsRequest.index_name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='doc_ids', full_name='protobuf.GetDocumentsRequest.doc_ids', index=1,
+      number=2, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='fields', full_name='protobuf.GetDocumentsRequest.fields', index=2,
+      number=3, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2807,
+  serialized_end=2881,
+)
+
+
+_GETDOCUMENTSRESPONSE = _descriptor.Descriptor(
+  name='GetDocumentsResponse',
+  full_name='protobuf.GetDocumentsResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='docs', full_name='protobuf.GetDocumentsResponse.docs', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='not_found', full_name='protobuf.GetDocumentsResponse.not_found', index=1,
+      number=2, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='status', full_name='protobuf.GetDocumentsResponse.status', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2883,
+  serialized_end=2992,
+)
+
+
+_DELETEDOCUMENTSREQUEST = _descriptor.Descriptor(
+  name='DeleteDocumentsRequest',
+  full_name='protobuf.DeleteDocumentsRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='index_name', full_name='protobuf.DeleteDocumentsRequest.index_name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='sync', full_name='protobuf.DeleteDocumentsRequest.sync', index=1,
+      number=3, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='doc_ids', full_name='protobuf.DeleteDocumentsRequest.doc_ids', index=2,
+      number=4, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2994,
+  serialized_end=3075,
+)
+
+
+_DELETEDOCUMENTSRESPONSE = _descriptor.Descriptor(
+  name='DeleteDocumentsResponse',
+  full_name='protobuf.DeleteDocumentsResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='count', full_name='protobuf.DeleteDocumentsResponse.count', index=0,
+      number=1, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='status', full_name='protobuf.DeleteDocumentsResponse.status', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3077,
+  serialized_end=3151,
+)
+
+
+_STREAMPUTDOCUMENTSREQUEST = _descriptor.Descriptor(
+  name='StreamPutDocumentsRequest',
+  full_name='protobuf.StreamPutDocumentsRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='index_name', full_name='protobuf.StreamPutDocumentsRequest.index_name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='sync', full_name='protobuf.StreamPutDocumentsRequest.sync', index=1,
+      number=3, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='docs', full_name='protobuf.StreamPutDocumentsRequest.docs', index=2,
+      number=4, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3153,
+  serialized_end=3254,
+)
+
+
+_STREAMPUTDOCUMENTSRESPONSE = _descriptor.Descriptor(
+  name='StreamPutDocumentsResponse',
+  full_name='protobuf.StreamPutDocumentsResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='count', full_name='protobuf.StreamPutDocumentsResponse.count', index=0,
+      number=1, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='chunks', full_name='protobuf.StreamPutDocumentsResponse.chunks', index=1,
+      number=2, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='failed_chunks', full_name='protobuf.StreamPutDocumentsResponse.failed_chunks', index=2,
+      number=3, type=3, cpp_type=2, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='status', full_name='protobuf.StreamPutDocumentsResponse.status', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3256,
+  serialized_end=3372,
+)
+
+
+_STREAMDELETEDOCUMENTSREQUEST = _descriptor.Descriptor(
+  name='StreamDeleteDocumentsRequest',
+  full_name='protobuf.StreamDeleteDocumentsRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='index_name', full_name='protobuf.StreamDeleteDocumentsRequest.index_name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='sync', full_name='protobuf.StreamDeleteDocumentsRequest.sync', index=1,
+      number=3, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='doc_ids', full_name='protobuf.StreamDeleteDocumentsRequest.doc_ids', index=2,
+      number=4, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3374,
+  serialized_end=3461,
+)
+
+
+_STREAMDELETEDOCUMENTSRESPONSE = _descriptor.Descriptor(
+  name='StreamDeleteDocumentsResponse',
+  full_name='protobuf.StreamDeleteDocumentsResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='count', full_name='protobuf.StreamDeleteDocumentsResponse.count', index=0,
+      number=1, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='chunks', full_name='protobuf.StreamDeleteDocumentsResponse.chunks', index=1,
+      number=2, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='failed_chunks', full_name='protobuf.StreamDeleteDocumentsResponse.failed_chunks', index=2,
+      number=3, type=3, cpp_type=2, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='status', full_name='protobuf.StreamDeleteDocumentsResponse.status', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3463,
+  serialized_end=3582,
+)
+
+
+_SEARCHDOCUMENTSREQUEST = _descriptor.Descriptor(
+  name='SearchDocumentsRequest',
+  full_name='protobuf.SearchDocumentsRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='index_name', full_name='protobuf.SearchDocumentsRequest.index_name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='query', full_name='protobuf.SearchDocumentsRequest.query', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='search_field', full_name='protobuf.SearchDocumentsRequest.search_field', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='page_num', full_name='protobuf.SearchDocumentsRequest.page_num', index=3,
+      number=4, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='page_len', full_name='protobuf.SearchDocumentsRequest.page_len', index=4,
+      number=5, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='weighting', full_name='protobuf.SearchDocumentsRequest.weighting', index=5,
+      number=6, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='filter', full_name='protobuf.SearchDocumentsRequest.filter', index=6,
+      number=7, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='facets', full_name='protobuf.SearchDocumentsRequest.facets', index=7,
+      number=8, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='highlight', full_name='protobuf.SearchDocumentsRequest.highlight', index=8,
+      number=9, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='sort', full_name='protobuf.SearchDocumentsRequest.sort', index=9,
+      number=10, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='search_after', full_name='protobuf.SearchDocumentsRequest.search_after', index=10,
+      number=11, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='fields', full_name='protobuf.SearchDocumentsRequest.fields', index=11,
+      number=12, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='ids_only', full_name='protobuf.SearchDocumentsRequest.ids_only', index=12,
+      number=13, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='count_only', full_name='protobuf.SearchDocumentsRequest.count_only', index=13,
+      number=14, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='timeout_ms', full_name='protobuf.SearchDocumentsRequest.timeout_ms', index=14,
+      number=15, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='profile', full_name='protobuf.SearchDocumentsRequest.profile', index=15,
+      number=16, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='sync', full_name='protobuf.DeleteDocumentRequest.sync', index=2,
-      number=3, type=8, cpp_type=7, label=1,
+      name='explain', full_name='protobuf.SearchDocumentsRequest.explain', index=16,
+      number=17, type=8, cpp_type=7, label=1,
       has_default_value=False, default_value=False,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='weighting_profile', full_name='protobuf.SearchDocumentsRequest.weighting_profile', index=17,
+      number=18, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
@@ -958,29 +1917,106 @@ _DELETEDOCUMENTREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1826,
-  serialized_end=1899,
+  serialized_start=3585,
+  serialized_end=3943,
 )
 
 
-_DELETEDOCUMENTRESPONSE = _descriptor.Descriptor(
-  name='DeleteDocumentResponse',
-  full_name='protobuf.DeleteDocumentResponse',
+_SEARCHDOCUMENTSRESPONSE = _descriptor.Descriptor(
+  name='SearchDocumentsResponse',
+  full_name='protobuf.SearchDocumentsResponse',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='count', full_name='protobuf.DeleteDocumentResponse.count', index=0,
-      number=1, type=3, cpp_type=2, label=1,
+      name='status', full_name='protobuf.SearchDocumentsResponse.status', index=0,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='is_last_page', full_name='protobuf.SearchDocumentsResponse.is_last_page', index=1,
+      number=3, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='page_count', full_name='protobuf.SearchDocumentsResponse.page_count', index=2,
+      number=4, type=3, cpp_type=2, label=1,
       has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='status', full_name='protobuf.DeleteDocumentResponse.status', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
+      name='page_len', full_name='protobuf.SearchDocumentsResponse.page_len', index=3,
+      number=5, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='page_num', full_name='protobuf.SearchDocumentsResponse.page_num', index=4,
+      number=6, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='total', full_name='protobuf.SearchDocumentsResponse.total', index=5,
+      number=7, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='offset', full_name='protobuf.SearchDocumentsResponse.offset', index=6,
+      number=8, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='hits', full_name='protobuf.SearchDocumentsResponse.hits', index=7,
+      number=9, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='facets', full_name='protobuf.SearchDocumentsResponse.facets', index=8,
+      number=10, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='search_after', full_name='protobuf.SearchDocumentsResponse.search_after', index=9,
+      number=11, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='time', full_name='protobuf.SearchDocumentsResponse.time', index=10,
+      number=12, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='timed_out', full_name='protobuf.SearchDocumentsResponse.timed_out', index=11,
+      number=13, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='profile', full_name='protobuf.SearchDocumentsResponse.profile', index=12,
+      number=14, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
@@ -996,36 +2032,22 @@ _DELETEDOCUMENTRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1901,
-  serialized_end=1974,
+  serialized_start=3946,
+  serialized_end=4260,
 )
 
 
-_PUTDOCUMENTSREQUEST = _descriptor.Descriptor(
-  name='PutDocumentsRequest',
-  full_name='protobuf.PutDocumentsRequest',
+_MULTISEARCHREQUEST = _descriptor.Descriptor(
+  name='MultiSearchRequest',
+  full_name='protobuf.MultiSearchRequest',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='index_name', full_name='protobuf.PutDocumentsRequest.index_name', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='docs', full_name='protobuf.PutDocumentsRequest.docs', index=1,
-      number=2, type=12, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b(""),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='sync', full_name='protobuf.PutDocumentsRequest.sync', index=2,
-      number=3, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
+      name='searches', full_name='protobuf.MultiSearchRequest.searches', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
@@ -1041,27 +2063,27 @@ _PUTDOCUMENTSREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1976,
-  serialized_end=2045,
+  serialized_start=4262,
+  serialized_end=4334,
 )
 
 
-_PUTDOCUMENTSRESPONSE = _descriptor.Descriptor(
-  name='PutDocumentsResponse',
-  full_name='protobuf.PutDocumentsResponse',
+_MULTISEARCHRESPONSE = _descriptor.Descriptor(
+  name='MultiSearchResponse',
+  full_name='protobuf.MultiSearchResponse',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='count', full_name='protobuf.PutDocumentsResponse.count', index=0,
-      number=1, type=3, cpp_type=2, label=1,
-      has_default_value=False, default_value=0,
+      name='responses', full_name='protobuf.MultiSearchResponse.responses', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='status', full_name='protobuf.PutDocumentsResponse.status', index=1,
+      name='status', full_name='protobuf.MultiSearchResponse.status', index=1,
       number=2, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
@@ -1079,36 +2101,43 @@ _PUTDOCUMENTSRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2047,
-  serialized_end=2118,
+  serialized_start=4336,
+  serialized_end=4445,
 )
 
 
-_DELETEDOCUMENTSREQUEST = _descriptor.Descriptor(
-  name='DeleteDocumentsRequest',
-  full_name='protobuf.DeleteDocumentsRequest',
+_COUNTDOCUMENTSREQUEST = _descriptor.Descriptor(
+  name='CountDocumentsRequest',
+  full_name='protobuf.CountDocumentsRequest',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='index_name', full_name='protobuf.DeleteDocumentsRequest.index_name', index=0,
+      name='index_name', full_name='protobuf.CountDocumentsRequest.index_name', index=0,
       number=1, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=_b("").decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='doc_ids', full_name='protobuf.DeleteDocumentsRequest.doc_ids', index=1,
-      number=2, type=12, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b(""),
+      name='query', full_name='protobuf.CountDocumentsRequest.query', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='sync', full_name='protobuf.DeleteDocumentsRequest.sync', index=2,
-      number=3, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
+      name='search_field', full_name='protobuf.CountDocumentsRequest.search_field', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='filter', full_name='protobuf.CountDocumentsRequest.filter', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
@@ -1124,27 +2153,27 @@ _DELETEDOCUMENTSREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2120,
-  serialized_end=2195,
+  serialized_start=4447,
+  serialized_end=4543,
 )
 
 
-_DELETEDOCUMENTSRESPONSE = _descriptor.Descriptor(
-  name='DeleteDocumentsResponse',
-  full_name='protobuf.DeleteDocumentsResponse',
+_COUNTDOCUMENTSRESPONSE = _descriptor.Descriptor(
+  name='CountDocumentsResponse',
+  full_name='protobuf.CountDocumentsResponse',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='count', full_name='protobuf.DeleteDocumentsResponse.count', index=0,
+      name='count', full_name='protobuf.CountDocumentsResponse.count', index=0,
       number=1, type=3, cpp_type=2, label=1,
       has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='status', full_name='protobuf.DeleteDocumentsResponse.status', index=1,
+      name='status', full_name='protobuf.CountDocumentsResponse.status', index=1,
       number=2, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
@@ -1162,57 +2191,57 @@ _DELETEDOCUMENTSRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2197,
-  serialized_end=2271,
+  serialized_start=4545,
+  serialized_end=4618,
 )
 
 
-_SEARCHDOCUMENTSREQUEST = _descriptor.Descriptor(
-  name='SearchDocumentsRequest',
-  full_name='protobuf.SearchDocumentsRequest',
+_STREAMSEARCHDOCUMENTSREQUEST = _descriptor.Descriptor(
+  name='StreamSearchDocumentsRequest',
+  full_name='protobuf.StreamSearchDocumentsRequest',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='index_name', full_name='protobuf.SearchDocumentsRequest.index_name', index=0,
+      name='index_name', full_name='protobuf.StreamSearchDocumentsRequest.index_name', index=0,
       number=1, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=_b("").decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='query', full_name='protobuf.SearchDocumentsRequest.query', index=1,
+      name='query', full_name='protobuf.StreamSearchDocumentsRequest.query', index=1,
       number=2, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=_b("").decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='search_field', full_name='protobuf.SearchDocumentsRequest.search_field', index=2,
+      name='search_field', full_name='protobuf.StreamSearchDocumentsRequest.search_field', index=2,
       number=3, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=_b("").decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='page_num', full_name='protobuf.SearchDocumentsRequest.page_num', index=3,
-      number=4, type=3, cpp_type=2, label=1,
-      has_default_value=False, default_value=0,
+      name='weighting', full_name='protobuf.StreamSearchDocumentsRequest.weighting', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='page_len', full_name='protobuf.SearchDocumentsRequest.page_len', index=4,
+      name='batch_size', full_name='protobuf.StreamSearchDocumentsRequest.batch_size', index=4,
       number=5, type=3, cpp_type=2, label=1,
       has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='weighting', full_name='protobuf.SearchDocumentsRequest.weighting', index=5,
-      number=6, type=12, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b(""),
+      name='weighting_profile', full_name='protobuf.StreamSearchDocumentsRequest.weighting_profile', index=5,
+      number=6, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
@@ -1228,27 +2257,27 @@ _SEARCHDOCUMENTSREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2274,
-  serialized_end=2410,
+  serialized_start=4621,
+  serialized_end=4774,
 )
 
 
-_SEARCHDOCUMENTSRESPONSE = _descriptor.Descriptor(
-  name='SearchDocumentsResponse',
-  full_name='protobuf.SearchDocumentsResponse',
+_STREAMSEARCHDOCUMENTSRESPONSE = _descriptor.Descriptor(
+  name='StreamSearchDocumentsResponse',
+  full_name='protobuf.StreamSearchDocumentsResponse',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='results', full_name='protobuf.SearchDocumentsResponse.results', index=0,
-      number=1, type=12, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b(""),
+      name='hits', full_name='protobuf.StreamSearchDocumentsResponse.hits', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='status', full_name='protobuf.SearchDocumentsResponse.status', index=1,
+      name='status', full_name='protobuf.StreamSearchDocumentsResponse.status', index=1,
       number=2, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
@@ -1266,8 +2295,8 @@ _SEARCHDOCUMENTSRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2412,
-  serialized_end=2488,
+  serialized_start=4776,
+  serialized_end=4870,
 )
 
 
@@ -1297,8 +2326,8 @@ _PUTNODEREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2490,
-  serialized_end=2525,
+  serialized_start=4872,
+  serialized_end=4907,
 )
 
 
@@ -1328,8 +2357,8 @@ _PUTNODERESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2527,
-  serialized_end=2578,
+  serialized_start=4909,
+  serialized_end=4960,
 )
 
 
@@ -1359,8 +2388,8 @@ _DELETENODEREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2580,
-  serialized_end=2618,
+  serialized_start=4962,
+  serialized_end=5000,
 )
 
 
@@ -1390,8 +2419,8 @@ _DELETENODERESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2620,
-  serialized_end=2674,
+  serialized_start=5002,
+  serialized_end=5056,
 )
 
 
@@ -1414,8 +2443,8 @@ _ISSNAPSHOTEXISTREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2676,
-  serialized_end=2700,
+  serialized_start=5058,
+  serialized_end=5082,
 )
 
 
@@ -1452,8 +2481,8 @@ _ISSNAPSHOTEXISTRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2702,
-  serialized_end=2776,
+  serialized_start=5084,
+  serialized_end=5158,
 )
 
 
@@ -1483,8 +2512,8 @@ _CREATESNAPSHOTREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2778,
-  serialized_end=2815,
+  serialized_start=5160,
+  serialized_end=5197,
 )
 
 
@@ -1514,8 +2543,8 @@ _CREATESNAPSHOTRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2817,
-  serialized_end=2875,
+  serialized_start=5199,
+  serialized_end=5257,
 )
 
 
@@ -1545,8 +2574,8 @@ _GETSNAPSHOTREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2877,
-  serialized_end=2917,
+  serialized_start=5259,
+  serialized_end=5299,
 )
 
 
@@ -1590,8 +2619,8 @@ _GETSNAPSHOTRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2919,
-  serialized_end=3003,
+  serialized_start=5301,
+  serialized_end=5385,
 )
 
 
@@ -1614,8 +2643,8 @@ _ISHEALTHYREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3005,
-  serialized_end=3023,
+  serialized_start=5387,
+  serialized_end=5405,
 )
 
 
@@ -1652,8 +2681,8 @@ _ISHEALTHYRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3025,
-  serialized_end=3095,
+  serialized_start=5407,
+  serialized_end=5477,
 )
 
 
@@ -1676,8 +2705,8 @@ _ISALIVEREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3097,
-  serialized_end=3113,
+  serialized_start=5479,
+  serialized_end=5495,
 )
 
 
@@ -1714,8 +2743,8 @@ _ISALIVERESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3115,
-  serialized_end=3181,
+  serialized_start=5497,
+  serialized_end=5563,
 )
 
 
@@ -1738,8 +2767,8 @@ _ISREADYREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3183,
-  serialized_end=3199,
+  serialized_start=5565,
+  serialized_end=5581,
 )
 
 
@@ -1776,8 +2805,8 @@ _ISREADYRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3201,
-  serialized_end=3267,
+  serialized_start=5583,
+  serialized_end=5649,
 )
 
 
@@ -1800,8 +2829,8 @@ _GETSTATUSREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3269,
-  serialized_end=3287,
+  serialized_start=5651,
+  serialized_end=5669,
 )
 
 
@@ -1838,12 +2867,35 @@ _GETSTATUSRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3289,
-  serialized_end=3363,
+  serialized_start=5671,
+  serialized_end=5745,
 )
 
 _INDEXSTATS_STORAGE.containing_type = _INDEXSTATS
 _INDEXSTATS.fields_by_name['storage'].message_type = _INDEXSTATS_STORAGE
+_FIELD.oneofs_by_name['value'].fields.append(
+  _FIELD.fields_by_name['string_value'])
+_FIELD.fields_by_name['string_value'].containing_oneof = _FIELD.oneofs_by_name['value']
+_FIELD.oneofs_by_name['value'].fields.append(
+  _FIELD.fields_by_name['int_value'])
+_FIELD.fields_by_name['int_value'].containing_oneof = _FIELD.oneofs_by_name['value']
+_FIELD.oneofs_by_name['value'].fields.append(
+  _FIELD.fields_by_name['float_value'])
+_FIELD.fields_by_name['float_value'].containing_oneof = _FIELD.oneofs_by_name['value']
+_FIELD.oneofs_by_name['value'].fields.append(
+  _FIELD.fields_by_name['bool_value'])
+_FIELD.fields_by_name['bool_value'].containing_oneof = _FIELD.oneofs_by_name['value']
+_FIELD.oneofs_by_name['value'].fields.append(
+  _FIELD.fields_by_name['bytes_value'])
+_FIELD.fields_by_name['bytes_value'].containing_oneof = _FIELD.oneofs_by_name['value']
+_FIELD.oneofs_by_name['value'].fields.append(
+  _FIELD.fields_by_name['datetime_value'])
+_FIELD.fields_by_name['datetime_value'].containing_oneof = _FIELD.oneofs_by_name['value']
+_DOCUMENT.fields_by_name['fields'].message_type = _FIELD
+_HIT_HIGHLIGHTSENTRY.containing_type = _HIT
+_HIT.fields_by_name['doc'].message_type = _DOCUMENT
+_HIT.fields_by_name['highlights'].message_type = _HIT_HIGHLIGHTSENTRY
+_FACETRESULT.fields_by_name['counts'].message_type = _FACETCOUNT
 _CREATEINDEXRESPONSE.fields_by_name['index_stats'].message_type = _INDEXSTATS
 _CREATEINDEXRESPONSE.fields_by_name['status'].message_type = cockatrice_dot_protobuf_dot_common__pb2._STATUS
 _GETINDEXRESPONSE.fields_by_name['index_stats'].message_type = _INDEXSTATS
@@ -1858,12 +2910,28 @@ _COMMITINDEXRESPONSE.fields_by_name['status'].message_type = cockatrice_dot_prot
 _ROLLBACKINDEXRESPONSE.fields_by_name['status'].message_type = cockatrice_dot_protobuf_dot_common__pb2._STATUS
 _OPTIMIZEINDEXRESPONSE.fields_by_name['index_stats'].message_type = _INDEXSTATS
 _OPTIMIZEINDEXRESPONSE.fields_by_name['status'].message_type = cockatrice_dot_protobuf_dot_common__pb2._STATUS
+_PUTDOCUMENTREQUEST.fields_by_name['doc'].message_type = _DOCUMENT
 _PUTDOCUMENTRESPONSE.fields_by_name['status'].message_type = cockatrice_dot_protobuf_dot_common__pb2._STATUS
 _GETDOCUMENTRESPONSE.fields_by_name['status'].message_type = cockatrice_dot_protobuf_dot_common__pb2._STATUS
+_GETDOCUMENTRESPONSE.fields_by_name['doc'].message_type = _DOCUMENT
 _DELETEDOCUMENTRESPONSE.fields_by_name['status'].message_type = cockatrice_dot_protobuf_dot_common__pb2._STATUS
+_PUTDOCUMENTSREQUEST.fields_by_name['docs'].message_type = _DOCUMENT
 _PUTDOCUMENTSRESPONSE.fields_by_name['status'].message_type = cockatrice_dot_protobuf_dot_common__pb2._STATUS
+_GETDOCUMENTSRESPONSE.fields_by_name['docs'].message_type = _DOCUMENT
+_GETDOCUMENTSRESPONSE.fields_by_name['status'].message_type = cockatrice_dot_protobuf_dot_common__pb2._STATUS
 _DELETEDOCUMENTSRESPONSE.fields_by_name['status'].message_type = cockatrice_dot_protobuf_dot_common__pb2._STATUS
+_STREAMPUTDOCUMENTSREQUEST.fields_by_name['docs'].message_type = _DOCUMENT
+_STREAMPUTDOCUMENTSRESPONSE.fields_by_name['status'].message_type = cockatrice_dot_protobuf_dot_common__pb2._STATUS
+_STREAMDELETEDOCUMENTSRESPONSE.fields_by_name['status'].message_type = cockatrice_dot_protobuf_dot_common__pb2._STATUS
 _SEARCHDOCUMENTSRESPONSE.fields_by_name['status'].message_type = cockatrice_dot_protobuf_dot_common__pb2._STATUS
+_SEARCHDOCUMENTSRESPONSE.fields_by_name['hits'].message_type = _HIT
+_SEARCHDOCUMENTSRESPONSE.fields_by_name['facets'].message_type = _FACETRESULT
+_MULTISEARCHREQUEST.fields_by_name['searches'].message_type = _SEARCHDOCUMENTSREQUEST
+_MULTISEARCHRESPONSE.fields_by_name['responses'].message_type = _SEARCHDOCUMENTSRESPONSE
+_MULTISEARCHRESPONSE.fields_by_name['status'].message_type = cockatrice_dot_protobuf_dot_common__pb2._STATUS
+_COUNTDOCUMENTSRESPONSE.fields_by_name['status'].message_type = cockatrice_dot_protobuf_dot_common__pb2._STATUS
+_STREAMSEARCHDOCUMENTSRESPONSE.fields_by_name['hits'].message_type = _HIT
+_STREAMSEARCHDOCUMENTSRESPONSE.fields_by_name['status'].message_type = cockatrice_dot_protobuf_dot_common__pb2._STATUS
 _PUTNODERESPONSE.fields_by_name['status'].message_type = cockatrice_dot_protobuf_dot_common__pb2._STATUS
 _DELETENODERESPONSE.fields_by_name['status'].message_type = cockatrice_dot_protobuf_dot_common__pb2._STATUS
 _ISSNAPSHOTEXISTRESPONSE.fields_by_name['status'].message_type = cockatrice_dot_protobuf_dot_common__pb2._STATUS
@@ -1874,6 +2942,11 @@ _ISALIVERESPONSE.fields_by_name['status'].message_type = cockatrice_dot_protobuf
 _ISREADYRESPONSE.fields_by_name['status'].message_type = cockatrice_dot_protobuf_dot_common__pb2._STATUS
 _GETSTATUSRESPONSE.fields_by_name['status'].message_type = cockatrice_dot_protobuf_dot_common__pb2._STATUS
 DESCRIPTOR.message_types_by_name['IndexStats'] = _INDEXSTATS
+DESCRIPTOR.message_types_by_name['Field'] = _FIELD
+DESCRIPTOR.message_types_by_name['Document'] = _DOCUMENT
+DESCRIPTOR.message_types_by_name['Hit'] = _HIT
+DESCRIPTOR.message_types_by_name['FacetCount'] = _FACETCOUNT
+DESCRIPTOR.message_types_by_name['FacetResult'] = _FACETRESULT
 DESCRIPTOR.message_types_by_name['CreateIndexRequest'] = _CREATEINDEXREQUEST
 DESCRIPTOR.message_types_by_name['CreateIndexResponse'] = _CREATEINDEXRESPONSE
 DESCRIPTOR.message_types_by_name['GetIndexRequest'] = _GETINDEXREQUEST
@@ -1898,10 +2971,22 @@ DESCRIPTOR.message_types_by_name['DeleteDocumentRequest'] = _DELETEDOCUMENTREQUE
 DESCRIPTOR.message_types_by_name['DeleteDocumentResponse'] = _DELETEDOCUMENTRESPONSE
 DESCRIPTOR.message_types_by_name['PutDocumentsRequest'] = _PUTDOCUMENTSREQUEST
 DESCRIPTOR.message_types_by_name['PutDocumentsResponse'] = _PUTDOCUMENTSRESPONSE
+DESCRIPTOR.message_types_by_name['GetDocumentsRequest'] = _GETDOCUMENTSREQUEST
+DESCRIPTOR.message_types_by_name['GetDocumentsResponse'] = _GETDOCUMENTSRESPONSE
 DESCRIPTOR.message_types_by_name['DeleteDocumentsRequest'] = _DELETEDOCUMENTSREQUEST
 DESCRIPTOR.message_types_by_name['DeleteDocumentsResponse'] = _DELETEDOCUMENTSRESPONSE
+DESCRIPTOR.message_types_by_name['StreamPutDocumentsRequest'] = _STREAMPUTDOCUMENTSREQUEST
+DESCRIPTOR.message_types_by_name['StreamPutDocumentsResponse'] = _STREAMPUTDOCUMENTSRESPONSE
+DESCRIPTOR.message_types_by_name['StreamDeleteDocumentsRequest'] = _STREAMDELETEDOCUMENTSREQUEST
+DESCRIPTOR.message_types_by_name['StreamDeleteDocumentsResponse'] = _STREAMDELETEDOCUMENTSRESPONSE
 DESCRIPTOR.message_types_by_name['SearchDocumentsRequest'] = _SEARCHDOCUMENTSREQUEST
 DESCRIPTOR.message_types_by_name['SearchDocumentsResponse'] = _SEARCHDOCUMENTSRESPONSE
+DESCRIPTOR.message_types_by_name['MultiSearchRequest'] = _MULTISEARCHREQUEST
+DESCRIPTOR.message_types_by_name['MultiSearchResponse'] = _MULTISEARCHRESPONSE
+DESCRIPTOR.message_types_by_name['CountDocumentsRequest'] = _COUNTDOCUMENTSREQUEST
+DESCRIPTOR.message_types_by_name['CountDocumentsResponse'] = _COUNTDOCUMENTSRESPONSE
+DESCRIPTOR.message_types_by_name['StreamSearchDocumentsRequest'] = _STREAMSEARCHDOCUMENTSREQUEST
+DESCRIPTOR.message_types_by_name['StreamSearchDocumentsResponse'] = _STREAMSEARCHDOCUMENTSRESPONSE
 DESCRIPTOR.message_types_by_name['PutNodeRequest'] = _PUTNODEREQUEST
 DESCRIPTOR.message_types_by_name['PutNodeResponse'] = _PUTNODERESPONSE
 DESCRIPTOR.message_types_by_name['DeleteNodeRequest'] = _DELETENODEREQUEST
@@ -1937,6 +3022,49 @@ IndexStats = _reflection.GeneratedProtocolMessageType('IndexStats', (_message.Me
 _sym_db.RegisterMessage(IndexStats)
 _sym_db.RegisterMessage(IndexStats.Storage)
 
+Field = _reflection.GeneratedProtocolMessageType('Field', (_message.Message,), dict(
+  DESCRIPTOR = _FIELD,
+  __module__ = 'cockatrice.protobuf.index_pb2'
+  # @@protoc_insertion_point(class_scope:protobuf.Field)
+  ))
+_sym_db.RegisterMessage(Field)
+
+Document = _reflection.GeneratedProtocolMessageType('Document', (_message.Message,), dict(
+  DESCRIPTOR = _DOCUMENT,
+  __module__ = 'cockatrice.protobuf.index_pb2'
+  # @@protoc_insertion_point(class_scope:protobuf.Document)
+  ))
+_sym_db.RegisterMessage(Document)
+
+Hit = _reflection.GeneratedProtocolMessageType('Hit', (_message.Message,), dict(
+
+  HighlightsEntry = _reflection.GeneratedProtocolMessageType('HighlightsEntry', (_message.Message,), dict(
+    DESCRIPTOR = _HIT_HIGHLIGHTSENTRY,
+    __module__ = 'cockatrice.protobuf.index_pb2'
+    # @@protoc_insertion_point(class_scope:protobuf.Hit.HighlightsEntry)
+    ))
+  ,
+  DESCRIPTOR = _HIT,
+  __module__ = 'cockatrice.protobuf.index_pb2'
+  # @@protoc_insertion_point(class_scope:protobuf.Hit)
+  ))
+_sym_db.RegisterMessage(Hit)
+_sym_db.RegisterMessage(Hit.HighlightsEntry)
+
+FacetCount = _reflection.GeneratedProtocolMessageType('FacetCount', (_message.Message,), dict(
+  DESCRIPTOR = _FACETCOUNT,
+  __module__ = 'cockatrice.protobuf.index_pb2'
+  # @@protoc_insertion_point(class_scope:protobuf.FacetCount)
+  ))
+_sym_db.RegisterMessage(FacetCount)
+
+FacetResult = _reflection.GeneratedProtocolMessageType('FacetResult', (_message.Message,), dict(
+  DESCRIPTOR = _FACETRESULT,
+  __module__ = 'cockatrice.protobuf.index_pb2'
+  # @@protoc_insertion_point(class_scope:protobuf.FacetResult)
+  ))
+_sym_db.RegisterMessage(FacetResult)
+
 CreateIndexRequest = _reflection.GeneratedProtocolMessageType('CreateIndexRequest', (_message.Message,), dict(
   DESCRIPTOR = _CREATEINDEXREQUEST,
   __module__ = 'cockatrice.protobuf.index_pb2'
@@ -2105,6 +3233,20 @@ PutDocumentsResponse = _reflection.GeneratedProtocolMessageType('PutDocumentsRes
   ))
 _sym_db.RegisterMessage(PutDocumentsResponse)
 
+GetDocumentsRequest = _reflection.GeneratedProtocolMessageType('GetDocumentsRequest', (_message.Message,), dict(
+  DESCRIPTOR = _GETDOCUMENTSREQUEST,
+  __module__ = 'cockatrice.protobuf.index_pb2'
+  # @@protoc_insertion_point(class_scope:protobuf.GetDocumentsRequest)
+  ))
+_sym_db.RegisterMessage(GetDocumentsRequest)
+
+GetDocumentsResponse = _reflection.GeneratedProtocolMessageType('GetDocumentsResponse', (_message.Message,), dict(
+  DESCRIPTOR = _GETDOCUMENTSRESPONSE,
+  __module__ = 'cockatrice.protobuf.index_pb2'
+  # @@protoc_insertion_point(class_scope:protobuf.GetDocumentsResponse)
+  ))
+_sym_db.RegisterMessage(GetDocumentsResponse)
+
 DeleteDocumentsRequest = _reflection.GeneratedProtocolMessageType('DeleteDocumentsRequest', (_message.Message,), dict(
   DESCRIPTOR = _DELETEDOCUMENTSREQUEST,
   __module__ = 'cockatrice.protobuf.index_pb2'
@@ -2119,6 +3261,34 @@ DeleteDocumentsResponse = _reflection.GeneratedProtocolMessageType('DeleteDocume
   ))
 _sym_db.RegisterMessage(DeleteDocumentsResponse)
 
+StreamPutDocumentsRequest = _reflection.GeneratedProtocolMessageType('StreamPutDocumentsRequest', (_message.Message,), dict(
+  DESCRIPTOR = _STREAMPUTDOCUMENTSREQUEST,
+  __module__ = 'cockatrice.protobuf.index_pb2'
+  # @@protoc_insertion_point(class_scope:protobuf.StreamPutDocumentsRequest)
+  ))
+_sym_db.RegisterMessage(StreamPutDocumentsRequest)
+
+StreamPutDocumentsResponse = _reflection.GeneratedProtocolMessageType('StreamPutDocumentsResponse', (_message.Message,), dict(
+  DESCRIPTOR = _STREAMPUTDOCUMENTSRESPONSE,
+  __module__ = 'cockatrice.protobuf.index_pb2'
+  # @@protoc_insertion_point(class_scope:protobuf.StreamPutDocumentsResponse)
+  ))
+_sym_db.RegisterMessage(StreamPutDocumentsResponse)
+
+StreamDeleteDocumentsRequest = _reflection.GeneratedProtocolMessageType('StreamDeleteDocumentsRequest', (_message.Message,), dict(
+  DESCRIPTOR = _STREAMDELETEDOCUMENTSREQUEST,
+  __module__ = 'cockatrice.protobuf.index_pb2'
+  # @@protoc_insertion_point(class_scope:protobuf.StreamDeleteDocumentsRequest)
+  ))
+_sym_db.RegisterMessage(StreamDeleteDocumentsRequest)
+
+StreamDeleteDocumentsResponse = _reflection.GeneratedProtocolMessageType('StreamDeleteDocumentsResponse', (_message.Message,), dict(
+  DESCRIPTOR = _STREAMDELETEDOCUMENTSRESPONSE,
+  __module__ = 'cockatrice.protobuf.index_pb2'
+  # @@protoc_insertion_point(class_scope:protobuf.StreamDeleteDocumentsResponse)
+  ))
+_sym_db.RegisterMessage(StreamDeleteDocumentsResponse)
+
 SearchDocumentsRequest = _reflection.GeneratedProtocolMessageType('SearchDocumentsRequest', (_message.Message,), dict(
   DESCRIPTOR = _SEARCHDOCUMENTSREQUEST,
   __module__ = 'cockatrice.protobuf.index_pb2'
@@ -2133,6 +3303,48 @@ SearchDocumentsResponse = _reflection.GeneratedProtocolMessageType('SearchDocume
   ))
 _sym_db.RegisterMessage(SearchDocumentsResponse)
 
+MultiSearchRequest = _reflection.GeneratedProtocolMessageType('MultiSearchRequest', (_message.Message,), dict(
+  DESCRIPTOR = _MULTISEARCHREQUEST,
+  __module__ = 'cockatrice.protobuf.index_pb2'
+  # @@protoc_insertion_point(class_scope:protobuf.MultiSearchRequest)
+  ))
+_sym_db.RegisterMessage(MultiSearchRequest)
+
+MultiSearchResponse = _reflection.GeneratedProtocolMessageType('MultiSearchResponse', (_message.Message,), dict(
+  DESCRIPTOR = _MULTISEARCHRESPONSE,
+  __module__ = 'cockatrice.protobuf.index_pb2'
+  # @@protoc_insertion_point(class_scope:protobuf.MultiSearchResponse)
+  ))
+_sym_db.RegisterMessage(MultiSearchResponse)
+
+CountDocumentsRequest = _reflection.GeneratedProtocolMessageType('CountDocumentsRequest', (_message.Message,), dict(
+  DESCRIPTOR = _COUNTDOCUMENTSREQUEST,
+  __module__ = 'cockatrice.protobuf.index_pb2'
+  # @@protoc_insertion_point(class_scope:protobuf.CountDocumentsRequest)
+  ))
+_sym_db.RegisterMessage(CountDocumentsRequest)
+
+CountDocumentsResponse = _reflection.GeneratedProtocolMessageType('CountDocumentsResponse', (_message.Message,), dict(
+  DESCRIPTOR = _COUNTDOCUMENTSRESPONSE,
+  __module__ = 'cockatrice.protobuf.index_pb2'
+  # @@protoc_insertion_point(class_scope:protobuf.CountDocumentsResponse)
+  ))
+_sym_db.RegisterMessage(CountDocumentsResponse)
+
+StreamSearchDocumentsRequest = _reflection.GeneratedProtocolMessageType('StreamSearchDocumentsRequest', (_message.Message,), dict(
+  DESCRIPTOR = _STREAMSEARCHDOCUMENTSREQUEST,
+  __module__ = 'cockatrice.protobuf.index_pb2'
+  # @@protoc_insertion_point(class_scope:protobuf.StreamSearchDocumentsRequest)
+  ))
+_sym_db.RegisterMessage(StreamSearchDocumentsRequest)
+
+StreamSearchDocumentsResponse = _reflection.GeneratedProtocolMessageType('StreamSearchDocumentsResponse', (_message.Message,), dict(
+  DESCRIPTOR = _STREAMSEARCHDOCUMENTSRESPONSE,
+  __module__ = 'cockatrice.protobuf.index_pb2'
+  # @@protoc_insertion_point(class_scope:protobuf.StreamSearchDocumentsResponse)
+  ))
+_sym_db.RegisterMessage(StreamSearchDocumentsResponse)
+
 PutNodeRequest = _reflection.GeneratedProtocolMessageType('PutNodeRequest', (_message.Message,), dict(
   DESCRIPTOR = _PUTNODEREQUEST,
   __module__ = 'cockatrice.protobuf.index_pb2'
@@ -2260,6 +3472,7 @@ GetStatusResponse = _reflection.GeneratedProtocolMessageType('GetStatusResponse'
 _sym_db.RegisterMessage(GetStatusResponse)
 
 
+_HIT_HIGHLIGHTSENTRY._options = None
 
 _INDEX = _descriptor.ServiceDescriptor(
   name='Index',
@@ -2267,8 +3480,8 @@ _INDEX = _descriptor.ServiceDescriptor(
   file=DESCRIPTOR,
   index=0,
   serialized_options=None,
-  serialized_start=3366,
-  serialized_end=5169,
+  serialized_start=5748,
+  serialized_end=8118,
   methods=[
   _descriptor.MethodDescriptor(
     name='CreateIndex',
@@ -2378,28 +3591,82 @@ _INDEX = _descriptor.ServiceDescriptor(
     output_type=_PUTDOCUMENTSRESPONSE,
     serialized_options=None,
   ),
+  _descriptor.MethodDescriptor(
+    name='GetDocuments',
+    full_name='protobuf.Index.GetDocuments',
+    index=12,
+    containing_service=None,
+    input_type=_GETDOCUMENTSREQUEST,
+    output_type=_GETDOCUMENTSRESPONSE,
+    serialized_options=None,
+  ),
   _descriptor.MethodDescriptor(
     name='DeleteDocuments',
     full_name='protobuf.Index.DeleteDocuments',
-    index=12,
+    index=13,
     containing_service=None,
     input_type=_DELETEDOCUMENTSREQUEST,
     output_type=_DELETEDOCUMENTSRESPONSE,
     serialized_options=None,
   ),
+  _descriptor.MethodDescriptor(
+    name='StreamPutDocuments',
+    full_name='protobuf.Index.StreamPutDocuments',
+    index=14,
+    containing_service=None,
+    input_type=_STREAMPUTDOCUMENTSREQUEST,
+    output_type=_STREAMPUTDOCUMENTSRESPONSE,
+    serialized_options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='StreamDeleteDocuments',
+    full_name='protobuf.Index.StreamDeleteDocuments',
+    index=15,
+    containing_service=None,
+    input_type=_STREAMDELETEDOCUMENTSREQUEST,
+    output_type=_STREAMDELETEDOCUMENTSRESPONSE,
+    serialized_options=None,
+  ),
   _descriptor.MethodDescriptor(
     name='SearchDocuments',
     full_name='protobuf.Index.SearchDocuments',
-    index=13,
+    index=16,
     containing_service=None,
     input_type=_SEARCHDOCUMENTSREQUEST,
     output_type=_SEARCHDOCUMENTSRESPONSE,
     serialized_options=None,
   ),
+  _descriptor.MethodDescriptor(
+    name='CountDocuments',
+    full_name='protobuf.Index.CountDocuments',
+    index=17,
+    containing_service=None,
+    input_type=_COUNTDOCUMENTSREQUEST,
+    output_type=_COUNTDOCUMENTSRESPONSE,
+    serialized_options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='MultiSearch',
+    full_name='protobuf.Index.MultiSearch',
+    index=18,
+    containing_service=None,
+    input_type=_MULTISEARCHREQUEST,
+    output_type=_MULTISEARCHRESPONSE,
+    serialized_options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='StreamSearchDocuments',
+    full_name='protobuf.Index.StreamSearchDocuments',
+    index=19,
+    containing_service=None,
+    input_type=_STREAMSEARCHDOCUMENTSREQUEST,
+    output_type=_STREAMSEARCHDOCUMENTSRESPONSE,
+    serialized_options=None,
+  ),
   _descriptor.MethodDescriptor(
     name='PutNode',
     full_name='protobuf.Index.PutNode',
-    index=14,
+    index=20,
     containing_service=None,
     input_type=_PUTNODEREQUEST,
     output_type=_PUTNODERESPONSE,
@@ -2408,7 +3675,7 @@ _INDEX = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='DeleteNode',
     full_name='protobuf.Index.DeleteNode',
-    index=15,
+    index=21,
     containing_service=None,
     input_type=_DELETENODEREQUEST,
     output_type=_DELETENODERESPONSE,
@@ -2417,7 +3684,7 @@ _INDEX = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='IsSnapshotExist',
     full_name='protobuf.Index.IsSnapshotExist',
-    index=16,
+    index=22,
     containing_service=None,
     input_type=_ISSNAPSHOTEXISTREQUEST,
     output_type=_ISSNAPSHOTEXISTRESPONSE,
@@ -2426,7 +3693,7 @@ _INDEX = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='CreateSnapshot',
     full_name='protobuf.Index.CreateSnapshot',
-    index=17,
+    index=23,
     containing_service=None,
     input_type=_CREATESNAPSHOTREQUEST,
     output_type=_CREATESNAPSHOTRESPONSE,
@@ -2435,7 +3702,7 @@ _INDEX = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='GetSnapshot',
     full_name='protobuf.Index.GetSnapshot',
-    index=18,
+    index=24,
     containing_service=None,
     input_type=_GETSNAPSHOTREQUEST,
     output_type=_GETSNAPSHOTRESPONSE,
@@ -2444,7 +3711,7 @@ _INDEX = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='IsHealthy',
     full_name='protobuf.Index.IsHealthy',
-    index=19,
+    index=25,
     containing_service=None,
     input_type=_ISHEALTHYREQUEST,
     output_type=_ISHEALTHYRESPONSE,
@@ -2453,7 +3720,7 @@ _INDEX = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='IsAlive',
     full_name='protobuf.Index.IsAlive',
-    index=20,
+    index=26,
     containing_service=None,
     input_type=_ISALIVEREQUEST,
     output_type=_ISALIVERESPONSE,
@@ -2462,7 +3729,7 @@ _INDEX = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='IsReady',
     full_name='protobuf.Index.IsReady',
-    index=21,
+    index=27,
     containing_service=None,
     input_type=_ISREADYREQUEST,
     output_type=_ISREADYRESPONSE,
@@ -2471,7 +3738,7 @@ _INDEX = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='GetStatus',
     full_name='protobuf.Index.GetStatus',
-    index=22,
+    index=28,
     containing_service=None,
     input_type=_GETSTATUSREQUEST,
     output_type=_GETSTATUSRESPONSE,
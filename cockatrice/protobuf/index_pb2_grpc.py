@@ -74,16 +74,46 @@ class IndexStub(object):
         request_serializer=cockatrice_dot_protobuf_dot_index__pb2.PutDocumentsRequest.SerializeToString,
         response_deserializer=cockatrice_dot_protobuf_dot_index__pb2.PutDocumentsResponse.FromString,
         )
+    self.GetDocuments = channel.unary_unary(
+        '/protobuf.Index/GetDocuments',
+        request_serializer=cockatrice_dot_protobuf_dot_index__pb2.GetDocumentsRequest.SerializeToString,
+        response_deserializer=cockatrice_dot_protobuf_dot_index__pb2.GetDocumentsResponse.FromString,
+        )
     self.DeleteDocuments = channel.unary_unary(
         '/protobuf.Index/DeleteDocuments',
         request_serializer=cockatrice_dot_protobuf_dot_index__pb2.DeleteDocumentsRequest.SerializeToString,
         response_deserializer=cockatrice_dot_protobuf_dot_index__pb2.DeleteDocumentsResponse.FromString,
         )
+    self.StreamPutDocuments = channel.stream_unary(
+        '/protobuf.Index/StreamPutDocuments',
+        request_serializer=cockatrice_dot_protobuf_dot_index__pb2.StreamPutDocumentsRequest.SerializeToString,
+        response_deserializer=cockatrice_dot_protobuf_dot_index__pb2.StreamPutDocumentsResponse.FromString,
+        )
+    self.StreamDeleteDocuments = channel.stream_unary(
+        '/protobuf.Index/StreamDeleteDocuments',
+        request_serializer=cockatrice_dot_protobuf_dot_index__pb2.StreamDeleteDocumentsRequest.SerializeToString,
+        response_deserializer=cockatrice_dot_protobuf_dot_index__pb2.StreamDeleteDocumentsResponse.FromString,
+        )
     self.SearchDocuments = channel.unary_unary(
         '/protobuf.Index/SearchDocuments',
         request_serializer=cockatrice_dot_protobuf_dot_index__pb2.SearchDocumentsRequest.SerializeToString,
         response_deserializer=cockatrice_dot_protobuf_dot_index__pb2.SearchDocumentsResponse.FromString,
         )
+    self.CountDocuments = channel.unary_unary(
+        '/protobuf.Index/CountDocuments',
+        request_serializer=cockatrice_dot_protobuf_dot_index__pb2.CountDocumentsRequest.SerializeToString,
+        response_deserializer=cockatrice_dot_protobuf_dot_index__pb2.CountDocumentsResponse.FromString,
+        )
+    self.MultiSearch = channel.unary_unary(
+        '/protobuf.Index/MultiSearch',
+        request_serializer=cockatrice_dot_protobuf_dot_index__pb2.MultiSearchRequest.SerializeToString,
+        response_deserializer=cockatrice_dot_protobuf_dot_index__pb2.MultiSearchResponse.FromString,
+        )
+    self.StreamSearchDocuments = channel.unary_stream(
+        '/protobuf.Index/StreamSearchDocuments',
+        request_serializer=cockatrice_dot_protobuf_dot_index__pb2.StreamSearchDocumentsRequest.SerializeToString,
+        response_deserializer=cockatrice_dot_protobuf_dot_index__pb2.StreamSearchDocumentsResponse.FromString,
+        )
     self.PutNode = channel.unary_unary(
         '/protobuf.Index/PutNode',
         request_serializer=cockatrice_dot_protobuf_dot_index__pb2.PutNodeRequest.SerializeToString,
@@ -219,6 +249,13 @@ class IndexServicer(object):
     context.set_details('Method not implemented!')
     raise NotImplementedError('Method not implemented!')
 
+  def GetDocuments(self, request, context):
+    # missing associated documentation comment in .proto file
+    pass
+    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+    context.set_details('Method not implemented!')
+    raise NotImplementedError('Method not implemented!')
+
   def DeleteDocuments(self, request, context):
     # missing associated documentation comment in .proto file
     pass
@@ -226,6 +263,20 @@ class IndexServicer(object):
     context.set_details('Method not implemented!')
     raise NotImplementedError('Method not implemented!')
 
+  def StreamPutDocuments(self, request_iterator, context):
+    # missing associated documentation comment in .proto file
+    pass
+    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+    context.set_details('Method not implemented!')
+    raise NotImplementedError('Method not implemented!')
+
+  def StreamDeleteDocuments(self, request_iterator, context):
+    # missing associated documentation comment in .proto file
+    pass
+    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+    context.set_details('Method not implemented!')
+    raise NotImplementedError('Method not implemented!')
+
   def SearchDocuments(self, request, context):
     # missing associated documentation comment in .proto file
     pass
@@ -233,6 +284,27 @@ class IndexServicer(object):
     context.set_details('Method not implemented!')
     raise NotImplementedError('Method not implemented!')
 
+  def CountDocuments(self, request, context):
+    # missing associated documentation comment in .proto file
+    pass
+    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+    context.set_details('Method not implemented!')
+    raise NotImplementedError('Method not implemented!')
+
+  def MultiSearch(self, request, context):
+    # missing associated documentation comment in .proto file
+    pass
+    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+    context.set_details('Method not implemented!')
+    raise NotImplementedError('Method not implemented!')
+
+  def StreamSearchDocuments(self, request, context):
+    # missing associated documentation comment in .proto file
+    pass
+    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+    context.set_details('Method not implemented!')
+    raise NotImplementedError('Method not implemented!')
+
   def PutNode(self, request, context):
     # missing associated documentation comment in .proto file
     pass
@@ -359,16 +431,46 @@ def add_IndexServicer_to_server(servicer, server):
           request_deserializer=cockatrice_dot_protobuf_dot_index__pb2.PutDocumentsRequest.FromString,
           response_serializer=cockatrice_dot_protobuf_dot_index__pb2.PutDocumentsResponse.SerializeToString,
       ),
+      'GetDocuments': grpc.unary_unary_rpc_method_handler(
+          servicer.GetDocuments,
+          request_deserializer=cockatrice_dot_protobuf_dot_index__pb2.GetDocumentsRequest.FromString,
+          response_serializer=cockatrice_dot_protobuf_dot_index__pb2.GetDocumentsResponse.SerializeToString,
+      ),
       'DeleteDocuments': grpc.unary_unary_rpc_method_handler(
           servicer.DeleteDocuments,
           request_deserializer=cockatrice_dot_protobuf_dot_index__pb2.DeleteDocumentsRequest.FromString,
           response_serializer=cockatrice_dot_protobuf_dot_index__pb2.DeleteDocumentsResponse.SerializeToString,
       ),
+      'StreamPutDocuments': grpc.stream_unary_rpc_method_handler(
+          servicer.StreamPutDocuments,
+          request_deserializer=cockatrice_dot_protobuf_dot_index__pb2.StreamPutDocumentsRequest.FromString,
+          response_serializer=cockatrice_dot_protobuf_dot_index__pb2.StreamPutDocumentsResponse.SerializeToString,
+      ),
+      'StreamDeleteDocuments': grpc.stream_unary_rpc_method_handler(
+          servicer.StreamDeleteDocuments,
+          request_deserializer=cockatrice_dot_protobuf_dot_index__pb2.StreamDeleteDocumentsRequest.FromString,
+          response_serializer=cockatrice_dot_protobuf_dot_index__pb2.StreamDeleteDocumentsResponse.SerializeToString,
+      ),
       'SearchDocuments': grpc.unary_unary_rpc_method_handler(
           servicer.SearchDocuments,
           request_deserializer=cockatrice_dot_protobuf_dot_index__pb2.SearchDocumentsRequest.FromString,
           response_serializer=cockatrice_dot_protobuf_dot_index__pb2.SearchDocumentsResponse.SerializeToString,
       ),
+      'CountDocuments': grpc.unary_unary_rpc_method_handler(
+          servicer.CountDocuments,
+          request_deserializer=cockatrice_dot_protobuf_dot_index__pb2.CountDocumentsRequest.FromString,
+          response_serializer=cockatrice_dot_protobuf_dot_index__pb2.CountDocumentsResponse.SerializeToString,
+      ),
+      'MultiSearch': grpc.unary_unary_rpc_method_handler(
+          servicer.MultiSearch,
+          request_deserializer=cockatrice_dot_protobuf_dot_index__pb2.MultiSearchRequest.FromString,
+          response_serializer=cockatrice_dot_protobuf_dot_index__pb2.MultiSearchResponse.SerializeToString,
+      ),
+      'StreamSearchDocuments': grpc.unary_stream_rpc_method_handler(
+          servicer.StreamSearchDocuments,
+          request_deserializer=cockatrice_dot_protobuf_dot_index__pb2.StreamSearchDocumentsRequest.FromString,
+          response_serializer=cockatrice_dot_protobuf_dot_index__pb2.StreamSearchDocumentsResponse.SerializeToString,
+      ),
       'PutNode': grpc.unary_unary_rpc_method_handler(
           servicer.PutNode,
           request_deserializer=cockatrice_dot_protobuf_dot_index__pb2.PutNodeRequest.FromString,
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2019 Minoru Osuka
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 		http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import _pickle as pickle
+import copy
+from heapq import merge
+from itertools import islice
+from math import ceil
+
+
+def get_fields(fields, schema):
+    # a comma separated list or a list of the stored fields to return
+    if isinstance(fields, str):
+        fields = [field_name.strip() for field_name in fields.split(',') if field_name.strip() != '']
+    if not fields:
+        raise ValueError('fields requires at least one field')
+
+    for field_name in fields:
+        if field_name not in schema:
+            raise ValueError('{0} does not exist in the schema'.format(field_name))
+        if not schema[field_name].stored:
+            raise ValueError('{0} is not stored'.format(field_name))
+
+    return fields
+
+
+def project_fields(stored_fields, fields):
+    if fields is None:
+        return stored_fields
+
+    return dict([(field_name, value) for field_name, value in stored_fields.items() if field_name in fields])
+
+
+class DetachedHit:
+    """Hit detached from the searcher.
+    """
+
+    def __init__(self, hit, highlights=None, get_fields=None, sort_values=None, explanation=None):
+        self.docnum = hit.docnum
+        self.score = hit.score
+        self.rank = hit.rank
+        self.pos = hit.pos
+        self.highlights = highlights
+        self.sort_values = sort_values
+        self.explanation = explanation
+        self.index_name = None
+
+        self.__fields = hit.fields() if get_fields is None else get_fields(hit)
+
+    def fields(self):
+        return self.__fields.copy()
+
+    def iteritems(self):
+        return iter(self.__fields.items())
+
+    def items(self):
+        return list(self.__fields.items())
+
+    def keys(self):
+        return list(self.__fields.keys())
+
+    def get(self, key, default=None):
+        return self.__fields.get(key, default)
+
+    def __getitem__(self, key):
+        return self.__fields[key]
+
+    def __contains__(self, key):
+        return key in self.__fields
+
+
+class DetachedResultsPage:
+    """Results page detached from the searcher, so it can be kept after the searcher has been released.
+    """
+
+    def __init__(self, results_page, facets=None, highlights=None, search_after=None, last_page=None, get_fields=None,
+                 count_only=False, sort_values=None, timed_out=False, explanations=None):
+        self.total = results_page.total
+        self.pagecount = results_page.pagecount
+        self.pagelen = results_page.pagelen
+        self.pagenum = results_page.pagenum
+        self.offset = results_page.offset
+        self.facets = facets
+        self.search_after = search_after
+        self.timed_out = timed_out
+        self.profile = None
+        self.__last_page = last_page
+
+        hits = [] if count_only else list(results_page)
+        if highlights is None:
+            highlights = [None] * len(hits)
+        if sort_values is None:
+            sort_values = [None] * len(hits)
+        if explanations is None:
+            explanations = [None] * len(hits)
+        self.__hits = [DetachedHit(hit, highlights=hit_highlights, get_fields=get_fields, sort_values=hit_sort_values,
+                                   explanation=hit_explanation)
+                       for hit, hit_highlights, hit_sort_values, hit_explanation in
+                       zip(hits, highlights, sort_values, explanations)]
+
+    def is_last_page(self):
+        if self.__last_page is not None:
+            return self.__last_page
+
+        return self.pagecount == 0 or self.pagenum == self.pagecount
+
+    def get_size(self):
+        # approximate the memory held by the page with the size of its serialized stored fields, highlights and facet
+        # counts, which is only computed for the pages put in a cache bounded by bytes
+        serialized = pickle.dumps(([(hit.fields(), hit.highlights) for hit in self.__hits], self.facets))
+
+        return len(serialized) + 64 * (len(self.__hits) + 1)
+
+    def __getitem__(self, n):
+        return self.__hits[n]
+
+    def __iter__(self):
+        return iter(self.__hits)
+
+    def __len__(self):
+        return self.total
+
+
+class MergedResultsPage:
+    """Results page merged from the detached pages of several indices.
+    """
+
+    def __init__(self, pages, page_num, page_len, key, facets=None):
+        self.total = sum([page.total for _, page in pages])
+        self.pagecount = int(ceil(self.total / page_len))
+        self.pagenum = min(self.pagecount, page_num)
+        self.offset = max(self.pagenum - 1, 0) * page_len
+        self.pagelen = max(min(page_len, self.total - self.offset), 0)
+        self.facets = facets
+        self.search_after = None
+        self.timed_out = any([page.timed_out for _, page in pages])
+        # the profiles of the searches of the indices, if they were profiled
+        self.profile = None
+        if any([page.profile is not None for _, page in pages]):
+            self.profile = {'indices': dict([(index_name, page.profile) for index_name, page in pages])}
+
+        def get_hits(index_name, page):
+            for hit in page:
+                # the hits of the pages may be cached, so they are copied before they are changed
+                merged_hit = copy.copy(hit)
+                merged_hit.index_name = index_name
+                yield merged_hit
+
+        merged_hits = merge(*[get_hits(index_name, page) for index_name, page in pages], key=key)
+        self.__hits = list(islice(merged_hits, self.offset, self.offset + self.pagelen))
+        for pos, hit in enumerate(self.__hits, self.offset):
+            hit.rank = pos
+            hit.pos = pos
+
+    def is_last_page(self):
+        return self.pagecount == 0 or self.pagenum == self.pagecount
+
+    def __getitem__(self, n):
+        return self.__hits[n]
+
+    def __iter__(self):
+        return iter(self.__hits)
+
+    def __len__(self):
+        return self.total
@@ -48,3 +48,46 @@ def get_multi_weighting(weighting_dict):
         raise ex
 
     return weighting
+
+
+def get_weighting_key(weighting):
+    # weighting objects compare by identity, so build a hashable key from their classes and arguments instead
+    def freeze(value):
+        if isinstance(value, dict):
+            return tuple(sorted([(k, freeze(v)) for k, v in value.items()]))
+        if isinstance(value, (list, tuple, set)):
+            return tuple([freeze(v) for v in value])
+        return value
+
+    if weighting is None or isinstance(weighting, type):
+        return weighting
+
+    if isinstance(weighting, MultiWeighting):
+        return (MultiWeighting, get_weighting_key(weighting.default),
+                tuple(sorted([(field_name, get_weighting_key(field_weighting)) for field_name, field_weighting in
+                              weighting.weightings.items()])))
+
+    return weighting.__class__, freeze(vars(weighting))
+
+
+def get_weighting_dict(weighting):
+    # the classes and the arguments of a weighting in the format of the weighting of a search request body, to be logged
+    def get_class_dict(instance):
+        if isinstance(instance, type):
+            return {'class': '{0}.{1}'.format(instance.__module__, instance.__name__)}
+        class_dict = {'class': '{0}.{1}'.format(instance.__class__.__module__, instance.__class__.__name__)}
+        class_args = dict([(k, v) for k, v in vars(instance).items() if not k.startswith('_')])
+        if class_args:
+            class_dict['args'] = class_args
+        return class_dict
+
+    if weighting is None:
+        return None
+
+    if isinstance(weighting, MultiWeighting):
+        weighting_dict = {'default': get_class_dict(weighting.default)}
+        for field_name, field_weighting in weighting.weightings.items():
+            weighting_dict[field_name] = get_class_dict(field_weighting)
+        return weighting_dict
+
+    return {'default': get_class_dict(weighting)}
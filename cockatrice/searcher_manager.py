@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2019 Minoru Osuka
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 		http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+from logging import getLogger
+
+from whoosh.scoring import BM25F
+
+
+class SearcherManager:
+    """Pool of the searchers of the current generation of an index.
+    """
+
+    def __init__(self, index, pool_size=10, logger=getLogger()):
+        self.__index = index
+        self.__pool_size = pool_size
+        self.__logger = logger
+
+        self.__generation = self.__index.latest_generation()
+        self.__idle_searchers = []
+        self.__leases = {}
+        self.__closed = False
+
+        self.__lock = threading.Lock()
+
+    def acquire(self, weighting=None):
+        with self.__lock:
+            if self.__closed:
+                raise ValueError('searcher manager for {0} has closed'.format(self.__index.indexname))
+
+            if len(self.__idle_searchers) > 0:
+                searcher = self.__idle_searchers.pop()
+            else:
+                searcher = self.__index.searcher()
+                self.__logger.debug('searcher for {0} has opened (generation={1})'.format(self.__index.indexname,
+                                                                                        self.__generation))
+
+            self.__leases[id(searcher)] = (searcher, self.__generation)
+
+        self.__set_weighting(searcher, weighting)
+
+        return searcher
+
+    def release(self, searcher):
+        with self.__lock:
+            lease = self.__leases.pop(id(searcher), None)
+            if lease is None:
+                return
+
+            if self.__closed or lease[1] != self.__generation or len(self.__idle_searchers) >= self.__pool_size:
+                searcher.close()
+                self.__logger.debug('searcher for {0} has closed (generation={1})'.format(self.__index.indexname,
+                                                                                        lease[1]))
+            else:
+                self.__idle_searchers.append(searcher)
+
+    def refresh(self):
+        with self.__lock:
+            generation = self.__index.latest_generation()
+            if generation == self.__generation:
+                return False
+
+            self.__generation = generation
+            idle_searchers = self.__idle_searchers
+            self.__idle_searchers = []
+
+        for searcher in idle_searchers:
+            searcher.close()
+        self.__logger.debug('searchers for {0} has refreshed (generation={1})'.format(self.__index.indexname,
+                                                                                    generation))
+
+        return True
+
+    def close(self):
+        with self.__lock:
+            self.__closed = True
+            idle_searchers = self.__idle_searchers
+            self.__idle_searchers = []
+
+        for searcher in idle_searchers:
+            searcher.close()
+
+    def get_generation(self):
+        return self.__generation
+
+    def get_lease_count(self):
+        return len(self.__leases)
+
+    def get_idle_count(self):
+        return len(self.__idle_searchers)
+
+    @staticmethod
+    def __set_weighting(searcher, weighting):
+        if weighting is None:
+            weighting = BM25F
+        if type(weighting) is type:
+            weighting = weighting()
+
+        if searcher.weighting is weighting:
+            return
+
+        # weighting is bound at searcher creation, so swap it on the searcher and its sub-searchers
+        for subsearcher, _ in searcher.leaf_searchers():
+            subsearcher.weighting = weighting
+        searcher.weighting = weighting
+        # the idf cache shared by the searcher and its sub-searchers is computed by the weighting, so it is only kept
+        # by the searches of the same weighting object
+        searcher._idf_cache.clear()
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2019 Minoru Osuka
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 		http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+from heapq import nlargest
+
+from whoosh.collectors import FilterCollector, TimeLimit, TimeLimitCollector, TopCollector
+from whoosh.filedb.filestore import FileStorage
+from whoosh.searching import Searcher
+
+from cockatrice.filter_cache import FilterDocIdSet
+
+# the readers opened by a worker process, by the path of the storage and the index name
+_readers = {}
+
+
+def get_segment_groups(searcher, parallelism, allow=None):
+    # the segments of the searcher split into at most parallelism groups of about the same number of documents, each
+    # segment with its offset and the bitset of the documents allowed by the filter, the segments with no allowed
+    # documents are left out
+    segments = []
+    for subsearcher, offset in searcher.leaf_searchers():
+        bitset = None
+        if allow is not None:
+            bitset = allow.get_bitset(offset)
+            if bitset is None:
+                continue
+        reader = subsearcher.reader()
+        segments.append((reader.doc_count_all(), (reader.segment().segment_id(), offset, bitset)))
+
+    groups = [[] for _ in range(min(parallelism, len(segments)))]
+    doc_counts = [0] * len(groups)
+    for doc_count, segment in sorted(segments, key=lambda item: -item[0]):
+        i = doc_counts.index(min(doc_counts))
+        groups[i].append(segment)
+        doc_counts[i] += doc_count
+
+    return groups
+
+
+def get_index_reader(storage_path, index_name, generation):
+    # the reader of the latest generation of the index, kept open by the worker process until the index is committed
+    reader = _readers.get((storage_path, index_name))
+    if reader is None or reader.generation() != generation:
+        if reader is not None:
+            reader.close()
+            del _readers[(storage_path, index_name)]
+        index = FileStorage(storage_path, supports_mmap=True, readonly=True).open_index(indexname=index_name)
+        reader = index.reader()
+        _readers[(storage_path, index_name)] = reader
+
+    if reader.generation() != generation:
+        # the index has been committed since the searcher of the search was opened
+        raise ValueError('generation {0} of {1} is not the latest'.format(generation, index_name))
+
+    return reader
+
+
+def search_segments(storage_path, index_name, generation, segments, query, weighting, limit, timeout=None):
+    # search the segments of a group in a worker process with a searcher of the whole index, so the documents are
+    # scored with the statistics of the whole index, and return the best limit (score, -docnum) items, the number of
+    # the matching documents and whether the timeout stopped the search
+    deadline = None if timeout is None else time.time() + timeout
+    searcher = Searcher(get_index_reader(storage_path, index_name, generation), weighting=weighting, closereader=False)
+    leaf_searchers = dict([(subsearcher.reader().segment().segment_id(), (subsearcher, offset)) for
+                           subsearcher, offset in searcher.leaf_searchers()])
+
+    items = []
+    total = 0
+    timed_out = False
+
+    for segment_id, offset, bitset in segments:
+        subsearcher, segment_offset = leaf_searchers[segment_id]
+        if segment_offset != offset:
+            raise ValueError('segment {0} of {1} has moved'.format(segment_id, index_name))
+
+        # neither the blocks of the segment are skipped by their quality nor the matchers replaced by the ones that
+        # only match the documents above the minimum score, so the matching documents are all counted in one pass
+        # instead of running the query again for the total
+        top_collector = TopCollector(limit=limit, usequality=False, replace=0)
+        collector = top_collector
+        if bitset is not None:
+            collector = FilterCollector(collector, allow=FilterDocIdSet([(offset, bitset)]))
+        if deadline is not None:
+            # the segments of the group share the timeout, the alarm signal is not used as for the other searches
+            collector = TimeLimitCollector(collector, max(deadline - time.time(), 0), use_alarm=False)
+
+        collector.prepare(searcher, query, searcher.context())
+        try:
+            collector.set_subsearcher(subsearcher, offset)
+            collector.collect_matches()
+        except TimeLimit:
+            timed_out = True
+        finally:
+            collector.finish()
+
+        items.extend(top_collector.items)
+        total += top_collector.total
+        if timed_out:
+            break
+
+    return nlargest(limit, items), total, timed_out
+
+
+def get_segment_results(searcher, query, limit, segment_results):
+    # the results of the best limit items of the groups of segments, in the order of a search of the whole searcher
+    collector = TopCollector(limit=limit, usequality=False)
+    collector.prepare(searcher, query, searcher.context())
+    collector.items = nlargest(limit, [item for items, _, _ in segment_results for item in items])
+    collector.total = sum([total for _, total, _ in segment_results])
+
+    return collector.results(), any([timed_out for _, _, timed_out in segment_results])
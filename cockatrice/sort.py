@@ -0,0 +1,317 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2019 Minoru Osuka
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 		http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import base64
+import json
+from array import array
+from heapq import heappush, heapreplace
+
+from whoosh.collectors import ScoredCollector
+
+from cockatrice.filter_cache import get_bitset_count
+
+SCORE_FIELD = '_score'
+
+
+class Reversed:
+    """Value in reverse order, for the values that can not be negated.
+    """
+
+    __slots__ = ['value']
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+
+class DefaultColumnReader:
+    """Column reader of the segments without the column of a field.
+    """
+
+    def __init__(self, default_value):
+        self.__default_value = default_value
+
+    def __getitem__(self, docnum):
+        return self.__default_value
+
+
+def get_sort_fields(sort, schema):
+    # a comma separated list of fields, a field prefixed with - is sorted in descending order and _score is sorted from
+    # the highest score
+    if isinstance(sort, str):
+        sort = [field_name.strip() for field_name in sort.split(',') if field_name.strip() != '']
+
+    sort_fields = []
+
+    for field_name in sort:
+        reverse = field_name.startswith('-')
+        if reverse:
+            field_name = field_name[1:]
+        if field_name == SCORE_FIELD:
+            sort_fields.append((SCORE_FIELD, True))
+            continue
+        if field_name not in schema:
+            raise ValueError('{0} does not exist in the schema'.format(field_name))
+        if schema[field_name].column_type is None:
+            raise ValueError('{0} is not sortable'.format(field_name))
+        sort_fields.append((field_name, reverse))
+
+    if len(sort_fields) <= 0:
+        raise ValueError('sort requires at least one field')
+
+    return tuple(sort_fields)
+
+
+def get_column_readers(subsearcher, sort_fields):
+    # the columns are read without translating them, so the values compare as they are stored
+    reader = subsearcher.reader()
+
+    column_readers = []
+    for field_name, _ in sort_fields:
+        if field_name == SCORE_FIELD:
+            column_readers.append(None)
+        elif reader.has_column(field_name):
+            column_readers.append(reader.column_reader(field_name, translate=False))
+        else:
+            # a segment written before the field was sortable has the default value for all of its documents
+            column_readers.append(DefaultColumnReader(subsearcher.schema[field_name].column_type.default_value()))
+
+    return column_readers
+
+
+def get_sort_key(sort_fields, values):
+    # the sort key of a document, the smaller key comes first
+    sort_key = []
+    for (_, reverse), value in zip(sort_fields, values):
+        if not reverse:
+            sort_key.append(value)
+        elif isinstance(value, (int, float)):
+            sort_key.append(0 - value)
+        else:
+            sort_key.append(Reversed(value))
+
+    return tuple(sort_key)
+
+
+def get_hit_sort_key(sort_fields, hit):
+    return get_sort_key(sort_fields, hit.sort_values)
+
+
+def get_hit_score_key(hit):
+    # the hits with the highest score come first
+    return 0 - hit.score
+
+
+def get_segment_sort_order(subsearcher, sort_fields):
+    # the document numbers of the segment in the order of the sort fields, the ties in the order of the document numbers
+    column_readers = get_column_readers(subsearcher, sort_fields)
+    doc_count = subsearcher.reader().doc_count_all()
+
+    sort_keys = [get_sort_key(sort_fields, [column_reader[docnum] for column_reader in column_readers]) for docnum in
+                 range(doc_count)]
+
+    return array('i', sorted(range(doc_count), key=lambda docnum: (sort_keys[docnum], docnum)))
+
+
+def encode_search_after(values, docnum):
+    # the raw values of the columns are numbers or bytes, the bytes are encoded in base64 to be written in json
+    encoded_values = [base64.b64encode(value).decode('ascii') if isinstance(value, bytes) else value for value in
+                      values]
+
+    return base64.urlsafe_b64encode(json.dumps([encoded_values, docnum]).encode('utf-8')).decode('ascii')
+
+
+def decode_search_after(search_after):
+    try:
+        encoded_values, docnum = json.loads(base64.urlsafe_b64decode(search_after.encode('ascii')).decode('utf-8'))
+        values = [base64.b64decode(value) if isinstance(value, str) else value for value in encoded_values]
+        docnum = int(docnum)
+    except Exception:
+        raise ValueError('invalid search_after: {0}'.format(search_after))
+
+    return values, docnum
+
+
+class SearchAfterCollector(ScoredCollector):
+    """Collector of the top documents in the order of the sort fields, after the cursor of search_after.
+    """
+
+    def __init__(self, sort_fields, limit=10, search_after=None, matches=None, allow=None, get_sort_order=None,
+                 **kwargs):
+        ScoredCollector.__init__(self, **kwargs)
+        self.sort_fields = sort_fields
+        self.scored = any([field_name == SCORE_FIELD for field_name, _ in sort_fields])
+        self.limit = limit
+        self.total = 0
+
+        self.__after = None
+        if search_after is not None:
+            values, docnum = search_after
+            if len(values) != len(sort_fields):
+                raise ValueError('search_after must have {0} sort values'.format(len(sort_fields)))
+            self.__after = (get_sort_key(sort_fields, values), docnum)
+
+        self.__matches = matches
+        self.__allow = allow
+        # with the matching documents, each segment is walked in its sort order from the cursor instead of the matcher
+        self.__get_sort_order = None if self.scored or matches is None else get_sort_order
+        self.__column_readers = []
+
+    def prepare(self, top_searcher, q, context):
+        ScoredCollector.prepare(self, top_searcher, q, context)
+        self.total = 0
+
+    def set_subsearcher(self, subsearcher, offset):
+        ScoredCollector.set_subsearcher(self, subsearcher, offset)
+        self.__column_readers = get_column_readers(subsearcher, self.sort_fields)
+
+    def matches(self):
+        if self.scored:
+            return ScoredCollector.matches(self)
+
+        # without scores the quality of the blocks can not be used to skip them, so walk the matcher as it is
+        return self.matcher.all_ids()
+
+    def collect_matches(self):
+        if self.__get_sort_order is None:
+            return ScoredCollector.collect_matches(self)
+
+        bitset = self.__matches.get_bitset(self.offset)
+        if bitset is None:
+            return
+
+        # the walk reads about limit * doc_count / matched documents of the sort order, so the few matching documents
+        # of a rare query are collected directly instead
+        doc_count = self.subsearcher.reader().doc_count_all()
+        matched = get_bitset_count(bitset)
+        if (self.limit + 1) * doc_count > matched * matched:
+            return self.__collect_bitset(bitset)
+
+        order = self.__get_sort_order(self.subsearcher, self.sort_fields)
+
+        # the documents before the cursor are skipped by a binary search on the sort order
+        start = 0
+        if self.__after is not None:
+            end = len(order)
+            while start < end:
+                middle = (start + end) // 2
+                if self.__after < self.__get_item(order[middle]):
+                    end = middle
+                else:
+                    start = middle + 1
+
+        # the cached matching documents may have been deleted since they were cached
+        reader = self.subsearcher.reader()
+        has_deletions = reader.has_deletions()
+
+        # one more document than the limit tells if there is a page after the collected documents
+        found = 0
+        for i in range(start, len(order)):
+            sub_docnum = order[i]
+            if sub_docnum not in bitset:
+                continue
+            if self.__allow is not None and self.offset + sub_docnum not in self.__allow:
+                continue
+            if has_deletions and reader.is_deleted(sub_docnum):
+                continue
+            self.__push(self.offset + sub_docnum, 0.0)
+            found += 1
+            if found > self.limit:
+                break
+
+    def __collect_bitset(self, bitset):
+        reader = self.subsearcher.reader()
+        has_deletions = reader.has_deletions()
+
+        for sub_docnum in bitset:
+            if self.__allow is not None and self.offset + sub_docnum not in self.__allow:
+                continue
+            if has_deletions and reader.is_deleted(sub_docnum):
+                continue
+            self.__push(self.offset + sub_docnum, 0.0)
+
+    def collect(self, sub_docnum):
+        if self.scored:
+            return ScoredCollector.collect(self, sub_docnum)
+
+        return self._collect(self.offset + sub_docnum, 0.0)
+
+    def __get_values(self, global_docnum, score):
+        sub_docnum = global_docnum - self.offset
+
+        return [score if column_reader is None else column_reader[sub_docnum] for column_reader in
+                self.__column_readers]
+
+    def __get_item(self, sub_docnum):
+        global_docnum = self.offset + sub_docnum
+
+        return get_sort_key(self.sort_fields, self.__get_values(global_docnum, 0.0)), global_docnum
+
+    def __push(self, global_docnum, score):
+        values = self.__get_values(global_docnum, score)
+        item = (get_sort_key(self.sort_fields, values), global_docnum)
+        if self.__after is not None and not self.__after < item:
+            return
+
+        # the heap keeps the worst of the best documents on the top
+        items = self.items
+        if len(items) <= self.limit:
+            heappush(items, (Reversed(item), score, values))
+        elif item < items[0][0].value:
+            heapreplace(items, (Reversed(item), score, values))
+
+    def _collect(self, global_docnum, score):
+        self.total += 1
+        self.__push(global_docnum, score)
+
+        return 0
+
+    def count(self):
+        if self.__get_sort_order is None:
+            return self.total
+
+        # the matching documents were not all walked, so count them from the sets
+        reader = self.top_searcher.reader()
+        has_deletions = reader.has_deletions()
+        if self.__allow is None and not has_deletions:
+            return len(self.__matches)
+
+        return len([docnum for docnum in self.__matches if (self.__allow is None or docnum in self.__allow) and
+                    not (has_deletions and reader.is_deleted(docnum))])
+
+    def __get_sorted_items(self):
+        return sorted([(entry.value, score, values) for entry, score, values in self.items])[:self.limit]
+
+    def results(self):
+        return self._results([(score, item[1]) for item, score, _ in self.__get_sorted_items()])
+
+    def get_sort_values(self):
+        # the raw values of the sort fields of the collected documents, in their order
+        return [values for _, _, values in self.__get_sorted_items()]
+
+    def get_search_after(self):
+        # the cursor of the page after the collected documents, or None if no documents are left
+        if len(self.items) <= self.limit:
+            return None
+
+        item, _, values = self.__get_sorted_items()[-1]
+
+        return encode_search_after(values, item[1])
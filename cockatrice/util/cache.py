@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2019 Minoru Osuka
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 		http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+from collections import OrderedDict
+
+
+class LRUCache:
+    """Thread safe cache that evicts the least recently used entries beyond max_size entries or max_bytes.
+    """
+
+    def __init__(self, max_size=1000, max_bytes=0):
+        # a max_size of 0 or less disables the cache, a max_bytes of 0 or less does not bound the bytes
+        self.__max_size = max_size
+        self.__max_bytes = max_bytes
+
+        self.__entries = OrderedDict()
+        self.__bytes = 0
+        self.__lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self.__lock:
+            try:
+                value, _ = self.__entries[key]
+            except KeyError:
+                return default
+            self.__entries.move_to_end(key)
+
+        return value
+
+    def put(self, key, value, size=0):
+        # returns the number of entries evicted to make room for the value
+        if self.__max_size <= 0 or 0 < self.__max_bytes < size:
+            return 0
+
+        evicted = 0
+        with self.__lock:
+            if key in self.__entries:
+                self.__bytes -= self.__entries.pop(key)[1]
+            self.__entries[key] = (value, size)
+            self.__bytes += size
+            while len(self.__entries) > self.__max_size or 0 < self.__max_bytes < self.__bytes:
+                _, (_, evicted_size) = self.__entries.popitem(last=False)
+                self.__bytes -= evicted_size
+                evicted += 1
+
+        return evicted
+
+    def pop(self, key, default=None):
+        with self.__lock:
+            if key not in self.__entries:
+                return default
+            value, size = self.__entries.pop(key)
+            self.__bytes -= size
+
+        return value
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
+            self.__bytes = 0
+
+    def get_max_size(self):
+        return self.__max_size
+
+    def get_max_bytes(self):
+        return self.__max_bytes
+
+    def get_bytes(self):
+        return self.__bytes
+
+    def __len__(self):
+        with self.__lock:
+            return len(self.__entries)
+
+    def __contains__(self, key):
+        with self.__lock:
+            return key in self.__entries
@@ -14,14 +14,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import gzip
 import json
+import select
 import time
+from concurrent.futures import ThreadPoolExecutor
 from logging import getLogger
-from threading import Thread
+from threading import BoundedSemaphore, Lock, Thread
 
 import yaml
 from flask import Response
-from werkzeug.serving import make_server
+from werkzeug.serving import BaseWSGIServer, make_server, WSGIRequestHandler
 
 TRUE_STRINGS = ['true', 'yes', 'on', 't', 'y', '1']
 
@@ -69,10 +72,143 @@ class HTTPServerThread(Thread):
         self.server.shutdown()
 
 
+def iter_ndjson(stream, charset='utf-8', content_encoding=None):
+    if content_encoding == 'gzip':
+        stream = gzip.GzipFile(fileobj=stream, mode='rb')
+    elif content_encoding not in [None, '', 'identity']:
+        raise ValueError('unsupported content encoding: {0}'.format(content_encoding))
+
+    line_num = 0
+    for line in stream:
+        line_num += 1
+        line = line.strip()
+        if len(line) == 0:
+            continue
+
+        try:
+            yield line_num, json.loads(line.decode(charset)), None
+        except (UnicodeDecodeError, ValueError) as ex:
+            yield line_num, None, ex
+
+
+class KeepAliveWSGIRequestHandler(WSGIRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        # a request being read or written must not hold a worker forever
+        self.timeout = self.server.keep_alive_timeout
+        super().setup()
+        self.__request_count = 0
+
+    def handle_one_request(self):
+        if self.__request_count > 0 and not self.__wait_next_request():
+            self.close_connection = True
+            return
+        self.__request_count += 1
+
+        return super().handle_one_request()
+
+    def end_headers(self):
+        # the connection of a response is closed while other connections are waiting for a worker
+        if not self.close_connection and self.server.has_waiting_requests():
+            self.send_header('Connection', 'close')
+        super().end_headers()
+
+    def __wait_next_request(self):
+        # an idle keep-alive connection holds its worker, so it is closed after the idle timeout, or as soon as other
+        # connections are waiting for a worker
+        deadline = time.time() + self.server.keep_alive_idle_timeout
+        self.connection.settimeout(0.0)
+        try:
+            # the next request may already be buffered
+            if len(self.rfile.peek(1)) > 0:
+                return True
+            while not self.server.has_waiting_requests():
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return False
+                readable, _, _ = select.select([self.connection], [], [], min(remaining, 0.1))
+                if readable:
+                    # nothing to read from a readable connection means that the client has closed it
+                    return len(self.rfile.peek(1)) > 0
+            return False
+        except OSError:
+            return False
+        finally:
+            self.connection.settimeout(self.timeout)
+
+
+class ThreadPoolWSGIServer(BaseWSGIServer):
+    multithread = True
+
+    def __init__(self, host, port, app, max_workers=10, max_queue_size=100, keep_alive_timeout=5,
+                 keep_alive_idle_timeout=1, logger=getLogger()):
+        self.__logger = logger
+
+        BaseWSGIServer.__init__(self, host, port, app, handler=KeepAliveWSGIRequestHandler)
+        self.keep_alive_timeout = keep_alive_timeout
+        self.keep_alive_idle_timeout = keep_alive_idle_timeout
+
+        self.__executor = ThreadPoolExecutor(max_workers=max_workers)
+
+        # the number of connections being served or waiting for a worker
+        self.__slots = BoundedSemaphore(max_workers + max_queue_size)
+
+        # the number of connections waiting for a worker
+        self.__waiting = 0
+        self.__waiting_lock = Lock()
+
+    def has_waiting_requests(self):
+        return self.__waiting > 0
+
+    def process_request(self, request, client_address):
+        if not self.__slots.acquire(blocking=False):
+            self.__logger.warning('request queue is full, rejecting the connection from {0}'.format(client_address))
+            self.__reject_request(request)
+            return
+
+        with self.__waiting_lock:
+            self.__waiting += 1
+        try:
+            self.__executor.submit(self.__process_request, request, client_address)
+        except Exception as ex:
+            with self.__waiting_lock:
+                self.__waiting -= 1
+            self.__slots.release()
+            self.__logger.error(ex)
+            self.shutdown_request(request)
+
+    def __process_request(self, request, client_address):
+        with self.__waiting_lock:
+            self.__waiting -= 1
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+            self.__slots.release()
+
+    def __reject_request(self, request):
+        try:
+            request.sendall(b'HTTP/1.1 503 Service Unavailable\r\nContent-Length: 0\r\nConnection: close\r\n\r\n')
+        except Exception as ex:
+            self.__logger.error(ex)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        BaseWSGIServer.server_close(self)
+        self.__executor.shutdown(wait=False)
+
+
 class HTTPServer(Thread):
-    def __init__(self, host, port, servicer):
+    def __init__(self, host, port, servicer, max_workers=10, max_queue_size=100, keep_alive_timeout=5,
+                 keep_alive_idle_timeout=1, logger=getLogger()):
         Thread.__init__(self)
-        self.server = make_server(host, port, servicer.app)
+        self.server = ThreadPoolWSGIServer(host, port, servicer.app, max_workers=max_workers,
+                                           max_queue_size=max_queue_size, keep_alive_timeout=keep_alive_timeout,
+                                           keep_alive_idle_timeout=keep_alive_idle_timeout, logger=logger)
         self.context = servicer.app.app_context()
         self.context.push()
 
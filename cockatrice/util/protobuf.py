@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2019 Minoru Osuka
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 		http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from datetime import datetime
+
+from cockatrice.protobuf.index_pb2 import Document
+
+
+def set_field_value(field, value):
+    if value is None:
+        return
+    # bool is a subclass of int, so check it first
+    if isinstance(value, bool):
+        field.bool_value = value
+    elif isinstance(value, int):
+        field.int_value = value
+    elif isinstance(value, float):
+        field.float_value = value
+    elif isinstance(value, str):
+        field.string_value = value
+    elif isinstance(value, bytes):
+        field.bytes_value = value
+    elif isinstance(value, datetime):
+        field.datetime_value = value.isoformat()
+    else:
+        raise ValueError('unsupported field value type: {0}'.format(type(value).__name__))
+
+
+def get_field_value(field):
+    kind = field.WhichOneof('value')
+    if kind is None:
+        return None
+    elif kind == 'datetime_value':
+        return datetime.fromisoformat(field.datetime_value)
+    else:
+        return getattr(field, kind)
+
+
+def dict_to_document(fields_dict, doc=None):
+    if doc is None:
+        doc = Document()
+
+    for name, value in fields_dict.items():
+        field = doc.fields.add()
+        field.name = name
+        set_field_value(field, value)
+
+    return doc
+
+
+def document_to_dict(doc):
+    return {field.name: get_field_value(field) for field in doc.fields}
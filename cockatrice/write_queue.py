@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2019 Minoru Osuka
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 		http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from functools import partial
+from logging import getLogger
+
+
+class WriteQueueTimeoutError(Exception):
+    """Raised when a write is not queued or applied within its timeout.
+    """
+
+
+class WriteQueue:
+    """Bounded queue that applies the writes to an index in batches.
+    """
+
+    def __init__(self, index_name, write_func, batch_size=1000, max_latency=0.0, max_in_flight=4, max_depth=100000,
+                 logger=getLogger()):
+        self.__index_name = index_name
+        self.__write_func = write_func
+        self.__batch_size = batch_size
+        self.__max_latency = max_latency
+        self.__max_in_flight = max_in_flight
+        self.__max_depth = max_depth
+        self.__logger = logger
+
+        self.__queue = deque()
+        self.__depth = 0
+        self.__submitted = 0
+        self.__applied = 0
+        self.__in_flight = 0
+        self.__closed = False
+
+        self.__condition = threading.Condition()
+
+        self.__thread = threading.Thread(target=self.__run, daemon=True)
+        self.__thread.start()
+
+    def put(self, op, items, timeout=None):
+        future = Future()
+
+        with self.__condition:
+            # a write larger than max_depth is queued once the queue is empty
+            if not self.__condition.wait_for(
+                    lambda: self.__closed or self.__depth == 0 or self.__depth + len(items) <= self.__max_depth,
+                    timeout=timeout):
+                raise WriteQueueTimeoutError('write queue for {0} is full'.format(self.__index_name))
+            if self.__closed:
+                raise ValueError('write queue for {0} has closed'.format(self.__index_name))
+
+            self.__queue.append((op, items, future))
+            self.__depth += len(items)
+            self.__submitted += 1
+            self.__condition.notify_all()
+
+        return future
+
+    def flush(self, timeout=None):
+        # wait until the writes queued so far have been applied
+        with self.__condition:
+            submitted = self.__submitted
+            return self.__condition.wait_for(lambda: self.__applied >= submitted, timeout=timeout)
+
+    def close(self, timeout=None):
+        # no more writes are accepted, the writes queued so far are applied up to the timeout and the ones still queued
+        # then fail without being applied
+        with self.__condition:
+            self.__closed = True
+            self.__condition.notify_all()
+
+            submitted = self.__submitted
+            if self.__condition.wait_for(lambda: self.__applied >= submitted, timeout=timeout):
+                return True
+
+            discarded = list(self.__queue)
+            self.__queue.clear()
+            self.__depth = 0
+            self.__applied += len(discarded)
+            self.__condition.notify_all()
+
+        for _, _, future in discarded:
+            future.set_exception(ValueError('write queue for {0} has closed'.format(self.__index_name)))
+
+        return False
+
+    def get_depth(self):
+        return self.__depth
+
+    def __take_batch(self):
+        with self.__condition:
+            while len(self.__queue) == 0 or self.__in_flight >= self.__max_in_flight:
+                if self.__closed and len(self.__queue) == 0:
+                    return None
+                self.__condition.wait()
+
+            # wait for more writes until the batch is full or the max latency has passed
+            deadline = time.time() + self.__max_latency
+            while self.__depth < self.__batch_size and not self.__closed:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                self.__condition.wait(remaining)
+
+            batch = []
+            size = 0
+            while len(self.__queue) > 0 and (len(batch) == 0 or size + len(self.__queue[0][1]) <= self.__batch_size):
+                op, items, future = self.__queue.popleft()
+                batch.append((op, items, future))
+                size += len(items)
+                self.__depth -= len(items)
+            self.__in_flight += 1
+
+            # the writes waiting for room in the queue
+            self.__condition.notify_all()
+
+        return batch
+
+    def __run(self):
+        while True:
+            batch = self.__take_batch()
+            if batch is None:
+                return
+
+            # the batch completes asynchronously, so the next one can be sent while this one is applied
+            try:
+                self.__write_func(self.__index_name, [(op, items) for op, items, _ in batch],
+                                  partial(self.__complete_batch, batch))
+            except Exception as ex:
+                self.__complete_batch(batch, None, ex)
+
+    def __complete_batch(self, batch, counts, error):
+        if error is None:
+            for (_, _, future), count in zip(batch, counts):
+                future.set_result(count)
+        else:
+            self.__logger.error('failed to write a batch to {0}: {1}'.format(self.__index_name, error))
+            for _, _, future in batch:
+                future.set_exception(error)
+
+        with self.__condition:
+            self.__in_flight -= 1
+            self.__applied += len(batch)
+            self.__condition.notify_all()
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2019 Minoru Osuka
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 		http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from datetime import datetime
+
+from whoosh.fields import DATETIME, ID, KEYWORD, NUMERIC, Schema
+from whoosh.filedb.filestore import RamStorage
+from whoosh.query import Every
+from whoosh.sorting import Count
+
+from cockatrice.facet import get_buckets, get_facet_counts, get_facets, get_gap, merge_facet_counts, SegmentOrdinals
+
+
+class TestSegmentOrdinals(unittest.TestCase):
+    def test_get_values(self):
+        # the values are read from the columns of the sortable fields and from the terms of the others
+        for sortable in [True, False]:
+            schema = Schema(id=ID(unique=True, stored=True), price=NUMERIC(sortable=sortable),
+                            timestamp=DATETIME(sortable=sortable), tag=KEYWORD(sortable=sortable))
+            index = RamStorage().create_index(schema)
+
+            writer = index.writer()
+            writer.add_document(id='1', price=5, tag='a')
+            writer.add_document(id='2', timestamp=datetime(2018, 1, 1))
+            writer.commit()
+
+            with index.searcher() as searcher:
+                ordinals = SegmentOrdinals(searcher, 'price')
+                self.assertEqual([[5], []], [ordinals.get_values(docnum) for docnum in range(2)])
+
+                ordinals = SegmentOrdinals(searcher, 'timestamp')
+                self.assertEqual([[], [datetime(2018, 1, 1)]], [ordinals.get_values(docnum) for docnum in range(2)])
+
+                ordinals = SegmentOrdinals(searcher, 'tag')
+                self.assertEqual([['a'], []], [ordinals.get_values(docnum) for docnum in range(2)])
+                self.assertTrue(ordinals.get_size() > 0)
+
+    def test_default_values(self):
+        # the values equal to the default value of the column are told from the missing values by their terms
+        schema = Schema(id=ID(unique=True, stored=True), count=NUMERIC(sortable=True, default=0),
+                        price=NUMERIC(sortable=True))
+        index = RamStorage().create_index(schema)
+
+        writer = index.writer()
+        writer.add_document(id='1', count=0, price=2147483647)
+        writer.add_document(id='2', count=3, price=1)
+        writer.add_document(id='3')
+        writer.commit()
+
+        with index.searcher() as searcher:
+            ordinals = SegmentOrdinals(searcher, 'count')
+            self.assertEqual([[0], [3], []], [ordinals.get_values(docnum) for docnum in range(3)])
+
+            ordinals = SegmentOrdinals(searcher, 'price')
+            self.assertEqual([[2147483647], [1], []], [ordinals.get_values(docnum) for docnum in range(3)])
+
+    def test_multiple_values(self):
+        schema = Schema(id=ID(unique=True, stored=True), tag=KEYWORD)
+        index = RamStorage().create_index(schema)
+
+        writer = index.writer()
+        writer.add_document(id='1', tag='a b')
+        writer.add_document(id='2', tag='b')
+        writer.commit()
+
+        with index.searcher() as searcher:
+            ordinals = SegmentOrdinals(searcher, 'tag')
+            self.assertEqual([['a', 'b'], ['b']], [ordinals.get_values(docnum) for docnum in range(2)])
+
+
+class TestFacets(unittest.TestCase):
+    def test_get_gap(self):
+        self.assertEqual(datetime(2018, 3, 31), datetime(2018, 1, 31) + get_gap('2 months'))
+        self.assertEqual(datetime(2018, 1, 2), datetime(2018, 1, 1) + get_gap('1 day'))
+        self.assertEqual(10, get_gap(10))
+
+        with self.assertRaises(ValueError):
+            get_gap('1 fortnight')
+
+    def test_get_buckets(self):
+        self.assertEqual([(0, 10), (10, 20), (20, 25)], get_buckets(0, 25, 10))
+        self.assertEqual([], get_buckets(10, 0, 10))
+
+        with self.assertRaises(ValueError):
+            get_buckets(0, 10, 0)
+        with self.assertRaises(ValueError):
+            get_buckets(0, 100000, 1)
+
+    def test_get_facet_counts(self):
+        schema = Schema(id=ID(unique=True, stored=True), price=NUMERIC(sortable=True), tag=KEYWORD)
+        index = RamStorage().create_index(schema)
+
+        # two segments
+        for docs in [[('1', 5, 'a b'), ('2', 15, 'b')], [('3', 25, 'b c'), ('4', 40, 'c')]]:
+            writer = index.writer()
+            for doc_id, price, tag in docs:
+                writer.add_document(id=doc_id, price=price, tag=tag)
+            writer.commit(merge=False)
+
+        facets_dict = {
+            'tag': {'limit': 2},
+            'price': {'type': 'range', 'start': 0, 'end': 30, 'gap': 10}
+        }
+
+        with index.searcher() as searcher:
+            results = searcher.search(Every(), groupedby=get_facets(facets_dict, schema, SegmentOrdinals),
+                                      maptype=Count)
+            facet_counts = get_facet_counts(results, facets_dict)
+
+        self.assertEqual([{'value': 'b', 'count': 3}, {'value': 'c', 'count': 2}], facet_counts['tag'])
+        self.assertEqual([{'start': 0, 'end': 10, 'count': 1}, {'start': 10, 'end': 20, 'count': 1},
+                          {'start': 20, 'end': 30, 'count': 1}], facet_counts['price'])
+
+    def test_merge_facet_counts(self):
+        facets_dict = {
+            'tag': {'limit': 2},
+            'price': {'type': 'range', 'start': 0, 'end': 20, 'gap': 10}
+        }
+        facet_counts_list = [
+            {
+                'tag': [{'value': 'b', 'count': 3}, {'value': 'c', 'count': 2}],
+                'price': [{'start': 0, 'end': 10, 'count': 1}, {'start': 10, 'end': 20, 'count': 2}]
+            },
+            {
+                'tag': [{'value': 'a', 'count': 4}, {'value': 'c', 'count': 2}],
+                'price': [{'start': 0, 'end': 10, 'count': 0}, {'start': 10, 'end': 20, 'count': 3}]
+            }
+        ]
+
+        facet_counts = merge_facet_counts(facet_counts_list, facets_dict)
+        self.assertEqual([{'value': 'a', 'count': 4}, {'value': 'c', 'count': 4}], facet_counts['tag'])
+        self.assertEqual([{'start': 0, 'end': 10, 'count': 1}, {'start': 10, 'end': 20, 'count': 5}],
+                         facet_counts['price'])
+
+        # the counts of the searches are not changed
+        self.assertEqual(1, facet_counts_list[0]['price'][0]['count'])
+
+    def test_get_facets(self):
+        schema = Schema(id=ID(unique=True, stored=True))
+
+        with self.assertRaises(ValueError):
+            get_facets({'tag': {}}, schema, SegmentOrdinals)
+        with self.assertRaises(ValueError):
+            get_facets({'id': {'type': 'histogram'}}, schema, SegmentOrdinals)
+        with self.assertRaises(ValueError):
+            get_facets({'id': {'type': 'range', 'start': 0}}, schema, SegmentOrdinals)
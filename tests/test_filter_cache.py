@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2019 Minoru Osuka
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 		http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from whoosh.fields import ID, KEYWORD, Schema
+from whoosh.filedb.filestore import RamStorage
+from whoosh.idsets import BitSet
+from whoosh.query import Term
+
+from cockatrice.filter_cache import FilterDocIdSet, get_bitset_count, get_segment_bitset
+
+
+class TestFilterDocIdSet(unittest.TestCase):
+    def test_contains(self):
+        filter_set = FilterDocIdSet([(0, BitSet([1, 3], size=5)), (5, BitSet([0, 2], size=3)), (8, BitSet(size=2))])
+
+        self.assertEqual([1, 3, 5, 7], [docnum for docnum in range(10) if docnum in filter_set])
+        self.assertEqual([1, 3, 5, 7], list(filter_set))
+        self.assertEqual(4, len(filter_set))
+
+        # the bits are counted alone or with the bits of another bitset
+        self.assertEqual(2, get_bitset_count(BitSet([1, 3], size=5)))
+        self.assertEqual(1, get_bitset_count(BitSet([1, 3], size=5), BitSet([3, 4], size=5)))
+        self.assertEqual(0, get_bitset_count(BitSet(size=5)))
+
+        # the bitsets of the segments are found by their offsets
+        self.assertEqual([0, 2], list(filter_set.get_bitset(5)))
+        self.assertIsNone(filter_set.get_bitset(3))
+
+    def test_empty(self):
+        filter_set = FilterDocIdSet([(0, BitSet(size=5))])
+
+        # an empty filter is still applied
+        self.assertTrue(filter_set)
+        self.assertFalse(0 in filter_set)
+        self.assertEqual(0, len(filter_set))
+
+    def test_get_segment_bitset(self):
+        schema = Schema(id=ID(unique=True, stored=True), tag=KEYWORD)
+        index = RamStorage().create_index(schema)
+
+        # two segments
+        for ids in [['1', '2', '3'], ['4', '5']]:
+            writer = index.writer()
+            for doc_id in ids:
+                writer.add_document(id=doc_id, tag='odd' if int(doc_id) % 2 == 1 else 'even')
+            writer.commit(merge=False)
+
+        with index.searcher() as searcher:
+            segment_bitsets = [(offset, get_segment_bitset(Term('tag', 'odd'), subsearcher)) for subsearcher, offset
+                               in searcher.leaf_searchers()]
+            self.assertEqual(2, len(segment_bitsets))
+
+            filter_set = FilterDocIdSet(segment_bitsets)
+            self.assertEqual(['1', '3', '5'], sorted([searcher.stored_fields(docnum)['id'] for docnum in filter_set]))
+
+            results = searcher.search(Term('tag', 'odd') | Term('tag', 'even'), filter=filter_set)
+            self.assertEqual(['1', '3', '5'], sorted([hit['id'] for hit in results]))
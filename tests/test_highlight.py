@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2019 Minoru Osuka
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 		http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from whoosh.fields import ID, Schema, TEXT
+from whoosh.filedb.filestore import RamStorage
+from whoosh.highlight import ContextFragmenter, PinpointFragmenter
+from whoosh.qparser import QueryParser
+
+from cockatrice.highlight import get_highlight_fields, get_highlighters, get_highlights
+
+
+class TestHighlight(unittest.TestCase):
+    def setUp(self):
+        self.schema = Schema(id=ID(unique=True, stored=True), title=TEXT(stored=True),
+                             text=TEXT(stored=True, chars=True), body=TEXT)
+
+    def test_get_highlight_fields(self):
+        self.assertEqual(['title', 'text'], get_highlight_fields({'fields': 'title, text'}, self.schema))
+        self.assertEqual(['text'], get_highlight_fields({'fields': ['text']}, self.schema))
+
+        with self.assertRaises(ValueError):
+            get_highlight_fields({}, self.schema)
+        with self.assertRaises(ValueError):
+            get_highlight_fields({'fields': ['unknown']}, self.schema)
+        with self.assertRaises(ValueError):
+            get_highlight_fields({'fields': ['body']}, self.schema)
+
+    def test_get_highlighters(self):
+        highlighters = get_highlighters({'fields': ['title', 'text'], 'char_limit': 100}, self.schema)
+
+        # the character positions are only read from the postings of the fields that keep them
+        self.assertIsInstance(highlighters['text'].fragmenter, PinpointFragmenter)
+        self.assertIsInstance(highlighters['title'].fragmenter, ContextFragmenter)
+        self.assertEqual(100, highlighters['title'].fragmenter.charlimit)
+
+    def test_get_highlights(self):
+        index = RamStorage().create_index(self.schema)
+
+        writer = index.writer()
+        writer.add_document(id='1', title='search engine', text='a search engine finds information')
+        writer.add_document(id='2', title='information retrieval', text='information retrieval by search')
+        writer.commit()
+
+        highlighters = get_highlighters({'fields': ['title', 'text'], 'tag': 'em'}, self.schema)
+        query = QueryParser('text', self.schema).parse('text:search OR title:search')
+
+        with index.searcher() as searcher:
+            page = searcher.search_page(query, 1, pagelen=10, terms=True)
+            highlights = dict([(hit['id'], get_highlights(hit, highlighters)) for hit in page])
+
+        self.assertIn('<em class="match term0">search</em>', highlights['1']['title'])
+        self.assertIn('<em class="match term0">search</em>', highlights['1']['text'])
+        self.assertIn('<em class="match term0">search</em>', highlights['2']['text'])
+        # a field without any matched term has no fragments
+        self.assertEqual('', highlights['2']['title'])
@@ -16,6 +16,7 @@
 
 import json
 import os
+import pickle
 import unittest
 from tempfile import TemporaryDirectory
 
@@ -158,3 +159,428 @@ class TestIndexConfig(unittest.TestCase):
         index_config = IndexConfig(index_config_dict)
 
         self.assertTrue(index_config.get_writer_multi_segment())
+
+    def test_yaml_get_writer_queue_batch_size(self):
+        file_path = self.example_dir + '/index_config.yaml'
+        with open(file_path, 'r', encoding='utf-8') as file_obj:
+            index_config_dict = yaml.safe_load(file_obj.read())
+
+        index_config = IndexConfig(index_config_dict)
+
+        self.assertEqual(1000, index_config.get_writer_queue_batch_size())
+
+    def test_json_get_writer_queue_batch_size(self):
+        file_path = self.example_dir + '/index_config.json'
+        with open(file_path, 'r', encoding='utf-8') as file_obj:
+            index_config_dict = json.loads(file_obj.read())
+
+        index_config = IndexConfig(index_config_dict)
+
+        self.assertEqual(1000, index_config.get_writer_queue_batch_size())
+
+    def test_yaml_get_writer_queue_max_latency(self):
+        file_path = self.example_dir + '/index_config.yaml'
+        with open(file_path, 'r', encoding='utf-8') as file_obj:
+            index_config_dict = yaml.safe_load(file_obj.read())
+
+        index_config = IndexConfig(index_config_dict)
+
+        self.assertEqual(0.0, index_config.get_writer_queue_max_latency())
+
+    def test_json_get_writer_queue_max_latency(self):
+        file_path = self.example_dir + '/index_config.json'
+        with open(file_path, 'r', encoding='utf-8') as file_obj:
+            index_config_dict = json.loads(file_obj.read())
+
+        index_config = IndexConfig(index_config_dict)
+
+        self.assertEqual(0.0, index_config.get_writer_queue_max_latency())
+
+    def test_yaml_get_writer_queue_max_in_flight(self):
+        file_path = self.example_dir + '/index_config.yaml'
+        with open(file_path, 'r', encoding='utf-8') as file_obj:
+            index_config_dict = yaml.safe_load(file_obj.read())
+
+        index_config = IndexConfig(index_config_dict)
+
+        self.assertEqual(4, index_config.get_writer_queue_max_in_flight())
+
+    def test_json_get_writer_queue_max_in_flight(self):
+        file_path = self.example_dir + '/index_config.json'
+        with open(file_path, 'r', encoding='utf-8') as file_obj:
+            index_config_dict = json.loads(file_obj.read())
+
+        index_config = IndexConfig(index_config_dict)
+
+        self.assertEqual(4, index_config.get_writer_queue_max_in_flight())
+
+    def test_yaml_get_writer_queue_max_depth(self):
+        file_path = self.example_dir + '/index_config.yaml'
+        with open(file_path, 'r', encoding='utf-8') as file_obj:
+            index_config_dict = yaml.safe_load(file_obj.read())
+
+        index_config = IndexConfig(index_config_dict)
+
+        self.assertEqual(100000, index_config.get_writer_queue_max_depth())
+
+    def test_json_get_writer_queue_max_depth(self):
+        file_path = self.example_dir + '/index_config.json'
+        with open(file_path, 'r', encoding='utf-8') as file_obj:
+            index_config_dict = json.loads(file_obj.read())
+
+        index_config = IndexConfig(index_config_dict)
+
+        self.assertEqual(100000, index_config.get_writer_queue_max_depth())
+
+    def test_yaml_get_writer_queue_timeout(self):
+        file_path = self.example_dir + '/index_config.yaml'
+        with open(file_path, 'r', encoding='utf-8') as file_obj:
+            index_config_dict = yaml.safe_load(file_obj.read())
+
+        index_config = IndexConfig(index_config_dict)
+
+        self.assertEqual(60.0, index_config.get_writer_queue_timeout())
+
+    def test_json_get_writer_queue_timeout(self):
+        file_path = self.example_dir + '/index_config.json'
+        with open(file_path, 'r', encoding='utf-8') as file_obj:
+            index_config_dict = json.loads(file_obj.read())
+
+        index_config = IndexConfig(index_config_dict)
+
+        self.assertEqual(60.0, index_config.get_writer_queue_timeout())
+
+    def test_yaml_get_searcher_pool_size(self):
+        file_path = self.example_dir + '/index_config.yaml'
+        with open(file_path, 'r', encoding='utf-8') as file_obj:
+            index_config_dict = yaml.safe_load(file_obj.read())
+
+        index_config = IndexConfig(index_config_dict)
+
+        self.assertEqual(10, index_config.get_searcher_pool_size())
+
+    def test_json_get_searcher_pool_size(self):
+        file_path = self.example_dir + '/index_config.json'
+        with open(file_path, 'r', encoding='utf-8') as file_obj:
+            index_config_dict = json.loads(file_obj.read())
+
+        index_config = IndexConfig(index_config_dict)
+
+        self.assertEqual(10, index_config.get_searcher_pool_size())
+
+    def test_yaml_get_searcher_query_cache_size(self):
+        file_path = self.example_dir + '/index_config.yaml'
+        with open(file_path, 'r', encoding='utf-8') as file_obj:
+            index_config_dict = yaml.safe_load(file_obj.read())
+
+        index_config = IndexConfig(index_config_dict)
+
+        self.assertEqual(1000, index_config.get_searcher_query_cache_size())
+
+    def test_json_get_searcher_query_cache_size(self):
+        file_path = self.example_dir + '/index_config.json'
+        with open(file_path, 'r', encoding='utf-8') as file_obj:
+            index_config_dict = json.loads(file_obj.read())
+
+        index_config = IndexConfig(index_config_dict)
+
+        self.assertEqual(1000, index_config.get_searcher_query_cache_size())
+
+    def test_yaml_get_searcher_result_cache_size(self):
+        file_path = self.example_dir + '/index_config.yaml'
+        with open(file_path, 'r', encoding='utf-8') as file_obj:
+            index_config_dict = yaml.safe_load(file_obj.read())
+
+        index_config = IndexConfig(index_config_dict)
+
+        self.assertEqual(100, index_config.get_searcher_result_cache_size())
+
+    def test_json_get_searcher_result_cache_size(self):
+        file_path = self.example_dir + '/index_config.json'
+        with open(file_path, 'r', encoding='utf-8') as file_obj:
+            index_config_dict = json.loads(file_obj.read())
+
+        index_config = IndexConfig(index_config_dict)
+
+        self.assertEqual(100, index_config.get_searcher_result_cache_size())
+
+    def test_yaml_get_searcher_result_cache_max_bytes(self):
+        file_path = self.example_dir + '/index_config.yaml'
+        with open(file_path, 'r', encoding='utf-8') as file_obj:
+            index_config_dict = yaml.safe_load(file_obj.read())
+
+        index_config = IndexConfig(index_config_dict)
+
+        self.assertEqual(10485760, index_config.get_searcher_result_cache_max_bytes())
+
+    def test_json_get_searcher_result_cache_max_bytes(self):
+        file_path = self.example_dir + '/index_config.json'
+        with open(file_path, 'r', encoding='utf-8') as file_obj:
+            index_config_dict = json.loads(file_obj.read())
+
+        index_config = IndexConfig(index_config_dict)
+
+        self.assertEqual(10485760, index_config.get_searcher_result_cache_max_bytes())
+
+    def test_yaml_get_searcher_filter_cache_size(self):
+        file_path = self.example_dir + '/index_config.yaml'
+        with open(file_path, 'r', encoding='utf-8') as file_obj:
+            index_config_dict = yaml.safe_load(file_obj.read())
+
+        index_config = IndexConfig(index_config_dict)
+
+        self.assertEqual(1000, index_config.get_searcher_filter_cache_size())
+
+    def test_json_get_searcher_filter_cache_size(self):
+        file_path = self.example_dir + '/index_config.json'
+        with open(file_path, 'r', encoding='utf-8') as file_obj:
+            index_config_dict = json.loads(file_obj.read())
+
+        index_config = IndexConfig(index_config_dict)
+
+        self.assertEqual(1000, index_config.get_searcher_filter_cache_size())
+
+    def test_yaml_get_searcher_filter_cache_max_bytes(self):
+        file_path = self.example_dir + '/index_config.yaml'
+        with open(file_path, 'r', encoding='utf-8') as file_obj:
+            index_config_dict = yaml.safe_load(file_obj.read())
+
+        index_config = IndexConfig(index_config_dict)
+
+        self.assertEqual(0, index_config.get_searcher_filter_cache_max_bytes())
+
+    def test_json_get_searcher_filter_cache_max_bytes(self):
+        file_path = self.example_dir + '/index_config.json'
+        with open(file_path, 'r', encoding='utf-8') as file_obj:
+            index_config_dict = json.loads(file_obj.read())
+
+        index_config = IndexConfig(index_config_dict)
+
+        self.assertEqual(0, index_config.get_searcher_filter_cache_max_bytes())
+
+    def test_yaml_get_searcher_facet_cache_size(self):
+        file_path = self.example_dir + '/index_config.yaml'
+        with open(file_path, 'r', encoding='utf-8') as file_obj:
+            index_config_dict = yaml.safe_load(file_obj.read())
+
+        index_config = IndexConfig(index_config_dict)
+
+        self.assertEqual(100, index_config.get_searcher_facet_cache_size())
+
+    def test_json_get_searcher_facet_cache_size(self):
+        file_path = self.example_dir + '/index_config.json'
+        with open(file_path, 'r', encoding='utf-8') as file_obj:
+            index_config_dict = json.loads(file_obj.read())
+
+        index_config = IndexConfig(index_config_dict)
+
+        self.assertEqual(100, index_config.get_searcher_facet_cache_size())
+
+    def test_yaml_get_searcher_facet_cache_max_bytes(self):
+        file_path = self.example_dir + '/index_config.yaml'
+        with open(file_path, 'r', encoding='utf-8') as file_obj:
+            index_config_dict = yaml.safe_load(file_obj.read())
+
+        index_config = IndexConfig(index_config_dict)
+
+        self.assertEqual(0, index_config.get_searcher_facet_cache_max_bytes())
+
+    def test_json_get_searcher_facet_cache_max_bytes(self):
+        file_path = self.example_dir + '/index_config.json'
+        with open(file_path, 'r', encoding='utf-8') as file_obj:
+            index_config_dict = json.loads(file_obj.read())
+
+        index_config = IndexConfig(index_config_dict)
+
+        self.assertEqual(0, index_config.get_searcher_facet_cache_max_bytes())
+
+    def test_yaml_get_schema_sortable(self):
+        file_path = self.example_dir + '/index_config.yaml'
+        with open(file_path, 'r', encoding='utf-8') as file_obj:
+            index_config_dict = yaml.safe_load(file_obj.read())
+
+        index_config = IndexConfig(index_config_dict)
+
+        self.assertIsNotNone(index_config.get_schema()['timestamp'].column_type)
+        self.assertIsNone(index_config.get_schema()['text'].column_type)
+
+    def test_yaml_get_schema_chars(self):
+        file_path = self.example_dir + '/index_config.yaml'
+        with open(file_path, 'r', encoding='utf-8') as file_obj:
+            index_config_dict = yaml.safe_load(file_obj.read())
+
+        index_config = IndexConfig(index_config_dict)
+
+        self.assertTrue(index_config.get_schema()['text'].supports('characters'))
+        self.assertFalse(index_config.get_schema()['title'].supports('characters'))
+
+    def test_yaml_get_searcher_sort_cache_size(self):
+        file_path = self.example_dir + '/index_config.yaml'
+        with open(file_path, 'r', encoding='utf-8') as file_obj:
+            index_config_dict = yaml.safe_load(file_obj.read())
+
+        index_config = IndexConfig(index_config_dict)
+
+        self.assertEqual(100, index_config.get_searcher_sort_cache_size())
+
+    def test_json_get_searcher_sort_cache_size(self):
+        file_path = self.example_dir + '/index_config.json'
+        with open(file_path, 'r', encoding='utf-8') as file_obj:
+            index_config_dict = json.loads(file_obj.read())
+
+        index_config = IndexConfig(index_config_dict)
+
+        self.assertEqual(100, index_config.get_searcher_sort_cache_size())
+
+    def test_yaml_get_searcher_sort_cache_max_bytes(self):
+        file_path = self.example_dir + '/index_config.yaml'
+        with open(file_path, 'r', encoding='utf-8') as file_obj:
+            index_config_dict = yaml.safe_load(file_obj.read())
+
+        index_config = IndexConfig(index_config_dict)
+
+        self.assertEqual(0, index_config.get_searcher_sort_cache_max_bytes())
+
+    def test_json_get_searcher_sort_cache_max_bytes(self):
+        file_path = self.example_dir + '/index_config.json'
+        with open(file_path, 'r', encoding='utf-8') as file_obj:
+            index_config_dict = json.loads(file_obj.read())
+
+        index_config = IndexConfig(index_config_dict)
+
+        self.assertEqual(0, index_config.get_searcher_sort_cache_max_bytes())
+
+    def test_yaml_get_searcher_parallel_search_processes(self):
+        file_path = self.example_dir + '/index_config.yaml'
+        with open(file_path, 'r', encoding='utf-8') as file_obj:
+            index_config_dict = yaml.safe_load(file_obj.read())
+
+        index_config = IndexConfig(index_config_dict)
+
+        self.assertEqual(0, index_config.get_searcher_parallel_search_processes())
+
+    def test_json_get_searcher_parallel_search_processes(self):
+        file_path = self.example_dir + '/index_config.json'
+        with open(file_path, 'r', encoding='utf-8') as file_obj:
+            index_config_dict = json.loads(file_obj.read())
+
+        index_config = IndexConfig(index_config_dict)
+
+        self.assertEqual(0, index_config.get_searcher_parallel_search_processes())
+
+    def test_yaml_get_slow_log_search_threshold(self):
+        file_path = self.example_dir + '/index_config.yaml'
+        with open(file_path, 'r', encoding='utf-8') as file_obj:
+            index_config_dict = yaml.safe_load(file_obj.read())
+
+        index_config = IndexConfig(index_config_dict)
+
+        self.assertEqual(1.0, index_config.get_slow_log_search_threshold())
+
+    def test_json_get_slow_log_search_threshold(self):
+        file_path = self.example_dir + '/index_config.json'
+        with open(file_path, 'r', encoding='utf-8') as file_obj:
+            index_config_dict = json.loads(file_obj.read())
+
+        index_config = IndexConfig(index_config_dict)
+
+        self.assertEqual(1.0, index_config.get_slow_log_search_threshold())
+
+    def test_yaml_get_slow_log_put_threshold(self):
+        file_path = self.example_dir + '/index_config.yaml'
+        with open(file_path, 'r', encoding='utf-8') as file_obj:
+            index_config_dict = yaml.safe_load(file_obj.read())
+
+        index_config = IndexConfig(index_config_dict)
+
+        self.assertEqual(5.0, index_config.get_slow_log_put_threshold())
+
+    def test_json_get_slow_log_put_threshold(self):
+        file_path = self.example_dir + '/index_config.json'
+        with open(file_path, 'r', encoding='utf-8') as file_obj:
+            index_config_dict = json.loads(file_obj.read())
+
+        index_config = IndexConfig(index_config_dict)
+
+        self.assertEqual(5.0, index_config.get_slow_log_put_threshold())
+
+    def test_yaml_get_slow_log_commit_threshold(self):
+        file_path = self.example_dir + '/index_config.yaml'
+        with open(file_path, 'r', encoding='utf-8') as file_obj:
+            index_config_dict = yaml.safe_load(file_obj.read())
+
+        index_config = IndexConfig(index_config_dict)
+
+        self.assertEqual(10.0, index_config.get_slow_log_commit_threshold())
+
+    def test_json_get_slow_log_commit_threshold(self):
+        file_path = self.example_dir + '/index_config.json'
+        with open(file_path, 'r', encoding='utf-8') as file_obj:
+            index_config_dict = json.loads(file_obj.read())
+
+        index_config = IndexConfig(index_config_dict)
+
+        self.assertEqual(10.0, index_config.get_slow_log_commit_threshold())
+
+    def test_yaml_get_slow_log_sample_rate(self):
+        file_path = self.example_dir + '/index_config.yaml'
+        with open(file_path, 'r', encoding='utf-8') as file_obj:
+            index_config_dict = yaml.safe_load(file_obj.read())
+
+        index_config = IndexConfig(index_config_dict)
+
+        self.assertEqual(0.0, index_config.get_slow_log_sample_rate())
+
+    def test_json_get_slow_log_sample_rate(self):
+        file_path = self.example_dir + '/index_config.json'
+        with open(file_path, 'r', encoding='utf-8') as file_obj:
+            index_config_dict = json.loads(file_obj.read())
+
+        index_config = IndexConfig(index_config_dict)
+
+        self.assertEqual(0.0, index_config.get_slow_log_sample_rate())
+
+    def test_yaml_get_weighting_profile(self):
+        file_path = self.example_dir + '/index_config.yaml'
+        with open(file_path, 'r', encoding='utf-8') as file_obj:
+            index_config_dict = yaml.safe_load(file_obj.read())
+
+        index_config = IndexConfig(index_config_dict)
+
+        self.assertEqual(['default', 'tf_idf'], index_config.get_weighting_profile_names())
+        self.assertEqual({'default': {'class': 'whoosh.scoring.BM25F', 'args': {'B': 0.75, 'K1': 1.2}}},
+                         index_config.get_weighting_profile('default'))
+        self.assertEqual({'default': {'class': 'whoosh.scoring.TF_IDF'}}, index_config.get_weighting_profile('tf_idf'))
+        self.assertIsNone(index_config.get_weighting_profile('unknown'))
+
+    def test_json_get_weighting_profile(self):
+        file_path = self.example_dir + '/index_config.json'
+        with open(file_path, 'r', encoding='utf-8') as file_obj:
+            index_config_dict = json.loads(file_obj.read())
+
+        index_config = IndexConfig(index_config_dict)
+
+        self.assertEqual(['default', 'tf_idf'], index_config.get_weighting_profile_names())
+        self.assertEqual({'default': {'class': 'whoosh.scoring.BM25F', 'args': {'B': 0.75, 'K1': 1.2}}},
+                         index_config.get_weighting_profile('default'))
+        self.assertEqual({'default': {'class': 'whoosh.scoring.TF_IDF'}}, index_config.get_weighting_profile('tf_idf'))
+        self.assertIsNone(index_config.get_weighting_profile('unknown'))
+
+    def test_get_weighting_profile_old_pickle(self):
+        file_path = self.example_dir + '/index_config.yaml'
+        with open(file_path, 'r', encoding='utf-8') as file_obj:
+            index_config_dict = yaml.safe_load(file_obj.read())
+        del index_config_dict['weighting_profiles']
+
+        # an index config pickled before the weighting profiles has only the config dict and the schema, and its
+        # unpickling does not call __init__
+        old_index_config = IndexConfig.__new__(IndexConfig)
+        old_index_config.__dict__.update({
+            '_IndexConfig__index_config_dict': index_config_dict,
+            '_IndexConfig__schema': IndexConfig(index_config_dict).get_schema()
+        })
+        index_config = pickle.loads(pickle.dumps(old_index_config))
+
+        self.assertEqual([], index_config.get_weighting_profile_names())
+        self.assertIsNone(index_config.get_weighting_profile('default'))
+        self.assertEqual('id', index_config.get_doc_id_field())
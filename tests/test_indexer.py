@@ -19,7 +19,9 @@ import os
 import unittest
 import zipfile
 from logging import ERROR, Formatter, getLogger, INFO, NOTSET, StreamHandler
+from logging.handlers import BufferingHandler
 from tempfile import TemporaryDirectory
+from threading import Thread
 from time import sleep
 
 import yaml
@@ -64,11 +66,14 @@ class TestIndexer(unittest.TestCase):
         http_log_format = Formatter('%(message)s')
         http_log_handler.setFormatter(http_log_format)
         http_logger.addHandler(http_log_handler)
-        metrics_registry = CollectorRegistry()
+        self.slow_logger = getLogger(NAME + '_slow')
+        self.slow_logger.setLevel(INFO)
+        self.metrics_registry = CollectorRegistry()
 
         self.indexer = Indexer(host=host, port=port, seed_addr=seed_addr, conf=conf, data_dir=data_dir,
                                grpc_port=grpc_port, grpc_max_workers=grpc_max_workers, http_port=http_port,
-                               logger=logger, http_logger=http_logger, metrics_registry=metrics_registry)
+                               logger=logger, http_logger=http_logger, slow_logger=self.slow_logger,
+                               metrics_registry=self.metrics_registry)
 
     def tearDown(self):
         self.indexer.stop()
@@ -160,8 +165,51 @@ class TestIndexer(unittest.TestCase):
         self.assertTrue(success)
 
         # get document
-        results_page = self.indexer.get_document(index_name, test_doc_id)
-        self.assertEqual(1, results_page.total)
+        doc = self.indexer.get_document(index_name, test_doc_id)
+        self.assertIsNotNone(doc)
+
+    def test_index_locks(self):
+        # read index config
+        with open(self.example_dir + '/index_config.yaml', 'r', encoding='utf-8') as file_obj:
+            index_config_dict = yaml.safe_load(file_obj.read())
+
+        # read documents
+        with open(self.example_dir + '/bulk_put.json', 'r', encoding='utf-8') as file_obj:
+            test_docs = json.loads(file_obj.read(), encoding='utf-8')
+
+        # create two indices
+        for index_name in ['test_index_1', 'test_index_2']:
+            self.indexer.create_index(index_name, IndexConfig(index_config_dict), sync=True)
+            self.assertEqual(5, self.indexer.put_documents(index_name, test_docs, sync=True))
+            self.assertTrue(self.indexer.commit_index(index_name, sync=True))
+
+        # the lock of test_index_1 is held as by a long write
+        index_lock = self.indexer._Indexer__get_index_lock('test_index_1')
+        with index_lock:
+            # test_index_2 is written, committed and searched meanwhile
+            self.assertEqual(1, self.indexer.put_document('test_index_2', '6', {'id': '6', 'text': 'search'},
+                                                          sync=True))
+            self.assertTrue(self.indexer.commit_index('test_index_2', sync=True))
+            page = self.indexer.search_documents('test_index_2', 'search', search_field='text', page_num=1,
+                                                 page_len=10)
+            self.assertEqual(6, page.total)
+            self.assertIsNotNone(self.indexer.get_document('test_index_2', '6'))
+
+            # test_index_1 is searched meanwhile
+            page = self.indexer.search_documents('test_index_1', 'search', search_field='text', page_num=1,
+                                                 page_len=10)
+            self.assertEqual(5, page.total)
+
+            # a commit of test_index_1 waits for its lock
+            results = []
+            thread = Thread(target=lambda: results.append(self.indexer.commit_index('test_index_1', sync=True)))
+            thread.start()
+            thread.join(0.5)
+            self.assertTrue(thread.is_alive())
+
+        thread.join(10)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual([True], results)
 
     def test_rollback(self):
         # read index config
@@ -241,8 +289,8 @@ class TestIndexer(unittest.TestCase):
         self.assertTrue(success)
 
         # get document
-        results_page = self.indexer.get_document(index_name, test_doc_id)
-        self.assertEqual(1, results_page.total)
+        doc = self.indexer.get_document(index_name, test_doc_id)
+        self.assertIsNotNone(doc)
 
     def test_delete_document(self):
         # read index config
@@ -268,8 +316,8 @@ class TestIndexer(unittest.TestCase):
         self.assertTrue(success)
 
         # get document
-        results_page = self.indexer.get_document(index_name, test_doc_id)
-        self.assertEqual(1, results_page.total)
+        doc = self.indexer.get_document(index_name, test_doc_id)
+        self.assertIsNotNone(doc)
 
         # delete document
         count = self.indexer.delete_document(index_name, test_doc_id, sync=True)
@@ -280,8 +328,8 @@ class TestIndexer(unittest.TestCase):
         self.assertTrue(success)
 
         # get document
-        results_page = self.indexer.get_document(index_name, test_doc_id)
-        self.assertEqual(0, results_page.total)
+        doc = self.indexer.get_document(index_name, test_doc_id)
+        self.assertIsNone(doc)
 
     def test_put_documents(self):
         # read index config
@@ -305,20 +353,41 @@ class TestIndexer(unittest.TestCase):
         success = self.indexer.commit_index(index_name, sync=True)
         self.assertTrue(success)
 
-        results_page = self.indexer.get_document(index_name, '1')
-        self.assertEqual(1, results_page.total)
+        doc = self.indexer.get_document(index_name, '1')
+        self.assertIsNotNone(doc)
 
-        results_page = self.indexer.get_document(index_name, '2')
-        self.assertEqual(1, results_page.total)
+        doc = self.indexer.get_document(index_name, '2')
+        self.assertIsNotNone(doc)
 
-        results_page = self.indexer.get_document(index_name, '3')
-        self.assertEqual(1, results_page.total)
+        doc = self.indexer.get_document(index_name, '3')
+        self.assertIsNotNone(doc)
 
-        results_page = self.indexer.get_document(index_name, '4')
-        self.assertEqual(1, results_page.total)
+        doc = self.indexer.get_document(index_name, '4')
+        self.assertIsNotNone(doc)
 
-        results_page = self.indexer.get_document(index_name, '5')
-        self.assertEqual(1, results_page.total)
+        doc = self.indexer.get_document(index_name, '5')
+        self.assertIsNotNone(doc)
+
+    def test_close_index_queued_documents(self):
+        # read index config
+        with open(self.example_dir + '/index_config.yaml', 'r', encoding='utf-8') as file_obj:
+            index_config_dict = yaml.safe_load(file_obj.read())
+        index_config_dict['writer']['queue']['max_latency'] = 0.5
+        index_config = IndexConfig(index_config_dict)
+
+        # create index
+        index_name = 'test_file_index'
+        self.indexer.create_index(index_name, index_config, sync=True)
+        self.assertTrue(self.indexer.is_index_exist(index_name))
+
+        with open(self.example_dir + '/bulk_put.json', 'r', encoding='utf-8') as file_obj:
+            test_docs = json.loads(file_obj.read(), encoding='utf-8')
+
+        # the documents accepted by the write queue are applied before the index closes
+        self.assertIsNone(self.indexer.queue_put_documents(index_name, test_docs, sync=False))
+        self.indexer.close_index(index_name, sync=True)
+        self.indexer.open_index(index_name, index_config, sync=True)
+        self.assertEqual(5, self.indexer.get_doc_count(index_name))
 
     def test_delete_documents(self):
         # read index config
@@ -342,20 +411,20 @@ class TestIndexer(unittest.TestCase):
         success = self.indexer.commit_index(index_name, sync=True)
         self.assertTrue(success)
 
-        results_page = self.indexer.get_document(index_name, '1')
-        self.assertEqual(1, results_page.total)
+        doc = self.indexer.get_document(index_name, '1')
+        self.assertIsNotNone(doc)
 
-        results_page = self.indexer.get_document(index_name, '2')
-        self.assertEqual(1, results_page.total)
+        doc = self.indexer.get_document(index_name, '2')
+        self.assertIsNotNone(doc)
 
-        results_page = self.indexer.get_document(index_name, '3')
-        self.assertEqual(1, results_page.total)
+        doc = self.indexer.get_document(index_name, '3')
+        self.assertIsNotNone(doc)
 
-        results_page = self.indexer.get_document(index_name, '4')
-        self.assertEqual(1, results_page.total)
+        doc = self.indexer.get_document(index_name, '4')
+        self.assertIsNotNone(doc)
 
-        results_page = self.indexer.get_document(index_name, '5')
-        self.assertEqual(1, results_page.total)
+        doc = self.indexer.get_document(index_name, '5')
+        self.assertIsNotNone(doc)
 
         with open(self.example_dir + '/bulk_delete.json', 'r', encoding='utf-8') as file_obj:
             test_docs = json.loads(file_obj.read(), encoding='utf-8')
@@ -368,20 +437,115 @@ class TestIndexer(unittest.TestCase):
         success = self.indexer.commit_index(index_name, sync=True)
         self.assertTrue(success)
 
-        results_page = self.indexer.get_document(index_name, '1')
-        self.assertEqual(0, results_page.total)
+        doc = self.indexer.get_document(index_name, '1')
+        self.assertIsNone(doc)
+
+        doc = self.indexer.get_document(index_name, '2')
+        self.assertIsNone(doc)
+
+        doc = self.indexer.get_document(index_name, '3')
+        self.assertIsNone(doc)
+
+        doc = self.indexer.get_document(index_name, '4')
+        self.assertIsNone(doc)
+
+        doc = self.indexer.get_document(index_name, '5')
+        self.assertIsNone(doc)
+
+    def test_update_documents(self):
+        # read index config
+        with open(self.example_dir + '/index_config.yaml', 'r', encoding='utf-8') as file_obj:
+            index_config_dict = yaml.safe_load(file_obj.read())
+        index_config = IndexConfig(index_config_dict)
+
+        # create index
+        index_name = 'test_file_index'
+        self.indexer.create_index(index_name, index_config, sync=True)
+        self.assertTrue(self.indexer.is_index_exist(index_name))
+
+        with open(self.example_dir + '/bulk_put.json', 'r', encoding='utf-8') as file_obj:
+            test_docs = json.loads(file_obj.read(), encoding='utf-8')
+
+        # put documents in bulk in two segments
+        count = self.indexer.put_documents(index_name, test_docs[:3], sync=True)
+        self.assertEqual(3, count)
+        success = self.indexer.commit_index(index_name, sync=True)
+        self.assertTrue(success)
+        count = self.indexer.put_documents(index_name, test_docs[3:], sync=True)
+        self.assertEqual(2, count)
+        success = self.indexer.commit_index(index_name, sync=True)
+        self.assertTrue(success)
+        self.assertEqual(5, self.indexer.get_doc_count(index_name))
+
+        # replace documents across the segments, the last one wins for the same id
+        count = self.indexer.put_documents(index_name, [
+            {'id': '1', 'title': 'old'},
+            {'id': '5', 'title': 'replaced'},
+            {'id': '1', 'title': 'replaced'}
+        ], sync=True)
+        self.assertEqual(2, count)
+        success = self.indexer.commit_index(index_name, sync=True)
+        self.assertTrue(success)
+        self.assertEqual(5, self.indexer.get_doc_count(index_name))
+
+        doc = self.indexer.get_document(index_name, '1')
+        self.assertIsNotNone(doc)
+        self.assertEqual('replaced', doc['title'])
+
+        # delete existing and nonexistent documents
+        count = self.indexer.delete_documents(index_name, ['5', '2', '9', '2'], sync=True)
+        self.assertEqual(2, count)
+        success = self.indexer.commit_index(index_name, sync=True)
+        self.assertTrue(success)
+        self.assertEqual(3, self.indexer.get_doc_count(index_name))
+
+    def test_get_documents(self):
+        # read index config
+        with open(self.example_dir + '/index_config.yaml', 'r', encoding='utf-8') as file_obj:
+            index_config_dict = yaml.safe_load(file_obj.read())
+        index_config = IndexConfig(index_config_dict)
+
+        # create index
+        index_name = 'test_file_index'
+        self.indexer.create_index(index_name, index_config, sync=True)
+        self.assertTrue(self.indexer.is_index_exist(index_name))
 
-        results_page = self.indexer.get_document(index_name, '2')
-        self.assertEqual(0, results_page.total)
+        with open(self.example_dir + '/bulk_put.json', 'r', encoding='utf-8') as file_obj:
+            test_docs = json.loads(file_obj.read(), encoding='utf-8')
 
-        results_page = self.indexer.get_document(index_name, '3')
-        self.assertEqual(0, results_page.total)
+        # put documents in bulk in two segments
+        count = self.indexer.put_documents(index_name, test_docs[:3], sync=True)
+        self.assertEqual(3, count)
+        success = self.indexer.commit_index(index_name, sync=True)
+        self.assertTrue(success)
+        count = self.indexer.put_documents(index_name, test_docs[3:], sync=True)
+        self.assertEqual(2, count)
+        success = self.indexer.commit_index(index_name, sync=True)
+        self.assertTrue(success)
 
-        results_page = self.indexer.get_document(index_name, '4')
-        self.assertEqual(0, results_page.total)
+        # deleted documents are not returned
+        count = self.indexer.delete_document(index_name, '3', sync=True)
+        self.assertEqual(1, count)
+        success = self.indexer.commit_index(index_name, sync=True)
+        self.assertTrue(success)
 
-        results_page = self.indexer.get_document(index_name, '5')
-        self.assertEqual(0, results_page.total)
+        docs = self.indexer.get_documents(index_name, ['5', '1', '3', '9', '1'])
+        self.assertEqual(['1', '5'], sorted(docs.keys()))
+        self.assertEqual('1', docs['1']['id'])
+        self.assertEqual('5', docs['5']['id'])
+
+        # only the requested fields are returned
+        docs = self.indexer.get_documents(index_name, ['5', '1'], fields='id,title')
+        self.assertEqual(['id', 'title'], sorted(docs['1'].keys()))
+        fields = self.indexer.get_document(index_name, '1', fields=['title'])
+        self.assertEqual(['title'], list(fields.keys()))
+
+        # a field that does not exist
+        with self.assertRaises(ValueError):
+            self.indexer.get_documents(index_name, ['1'], fields=['unknown'])
+
+        docs = self.indexer.get_documents(index_name, [])
+        self.assertEqual({}, docs)
 
     def test_search_documents(self):
         # read index config
@@ -410,6 +574,889 @@ class TestIndexer(unittest.TestCase):
         page = self.indexer.search_documents(index_name, 'search', search_field='text', page_num=1, page_len=10)
         self.assertEqual(5, page.total)
 
+    def test_search_documents_weighting_profile(self):
+        # read index config
+        with open(self.example_dir + '/index_config.yaml', 'r', encoding='utf-8') as file_obj:
+            index_config_dict = yaml.safe_load(file_obj.read())
+        index_config = IndexConfig(index_config_dict)
+
+        # create file index
+        index_name = 'test_file_index'
+        self.indexer.create_index(index_name, index_config, sync=True)
+        self.assertTrue(self.indexer.is_index_exist(index_name))
+
+        # read documents
+        with open(self.example_dir + '/bulk_put.json', 'r', encoding='utf-8') as file_obj:
+            test_docs = json.loads(file_obj.read(), encoding='utf-8')
+
+        # put documents in bulk
+        count = self.indexer.put_documents(index_name, test_docs, sync=True)
+        self.assertEqual(5, count)
+
+        # commit
+        success = self.indexer.commit_index(index_name, sync=True)
+        self.assertTrue(success)
+
+        def get_scores(page):
+            return dict([(hit['id'], hit.score) for hit in page])
+
+        # the searches with no weighting are scored with the default profile of the index
+        page = self.indexer.search_documents(index_name, 'search', search_field='text', page_num=1, page_len=10)
+        self.assertEqual(5, page.total)
+        default_scores = get_scores(page)
+        page = self.indexer.search_documents(index_name, 'search', search_field='text', page_num=1, page_len=10,
+                                             weighting='default')
+        self.assertEqual(default_scores, get_scores(page))
+
+        # a profile scores the documents as the same weighting of a search request does
+        page = self.indexer.search_documents(index_name, 'search', search_field='text', page_num=1, page_len=10,
+                                             weighting='tf_idf')
+        self.assertEqual(5, page.total)
+        tf_idf_scores = get_scores(page)
+        self.assertNotEqual(default_scores, tf_idf_scores)
+        page = self.indexer.search_documents(index_name, 'search', search_field='text', page_num=1, page_len=10,
+                                             weighting={'default': {'class': 'whoosh.scoring.TF_IDF'}})
+        self.assertEqual(tf_idf_scores, get_scores(page))
+
+        # the pooled searcher is scored with the weighting of each search
+        page = self.indexer.search_documents(index_name, 'search', search_field='text', page_num=1, page_len=10)
+        self.assertEqual(default_scores, get_scores(page))
+
+        # a profile that does not exist
+        with self.assertRaises(ValueError):
+            self.indexer.search_documents(index_name, 'search', search_field='text', page_num=1, page_len=10,
+                                          weighting='not_exist')
+
+    def test_search_documents_query_cache(self):
+        # read index config
+        with open(self.example_dir + '/index_config.yaml', 'r', encoding='utf-8') as file_obj:
+            index_config_dict = yaml.safe_load(file_obj.read())
+        index_config = IndexConfig(index_config_dict)
+
+        # create file index
+        index_name = 'test_file_index'
+        self.indexer.create_index(index_name, index_config, sync=True)
+        self.assertTrue(self.indexer.is_index_exist(index_name))
+
+        # read documents
+        with open(self.example_dir + '/bulk_put.json', 'r', encoding='utf-8') as file_obj:
+            test_docs = json.loads(file_obj.read(), encoding='utf-8')
+
+        # put documents in bulk
+        count = self.indexer.put_documents(index_name, test_docs, sync=True)
+        self.assertEqual(5, count)
+
+        # commit
+        success = self.indexer.commit_index(index_name, sync=True)
+        self.assertTrue(success)
+
+        def get_sample_value(name, cache):
+            value = self.metrics_registry.get_sample_value('{0}_indexer_query_cache_{1}_total'.format(NAME, name),
+                                                           {'index_name': index_name, 'cache': cache})
+            return 0.0 if value is None else value
+
+        # the first search parses the query
+        page = self.indexer.search_documents(index_name, 'search', search_field='text', page_num=1, page_len=10)
+        self.assertEqual(5, page.total)
+        self.assertEqual(0.0, get_sample_value('hits', 'query'))
+        self.assertEqual(1.0, get_sample_value('misses', 'query'))
+        self.assertEqual(1.0, get_sample_value('misses', 'parser'))
+
+        # the same query is served from the cache
+        page = self.indexer.search_documents(index_name, 'search', search_field='text', page_num=1, page_len=10)
+        self.assertEqual(5, page.total)
+        self.assertEqual(1.0, get_sample_value('hits', 'query'))
+        self.assertEqual(1.0, get_sample_value('misses', 'query'))
+
+        # another query on the same field reuses the query parser
+        page = self.indexer.search_documents(index_name, 'engine', search_field='text', page_num=1, page_len=10)
+        self.assertEqual(2.0, get_sample_value('misses', 'query'))
+        self.assertEqual(1.0, get_sample_value('hits', 'parser'))
+        self.assertEqual(1.0, get_sample_value('misses', 'parser'))
+
+        # the cache is dropped when the index is reopened
+        self.indexer.close_index(index_name, sync=True)
+        self.indexer.open_index(index_name, index_config=index_config, sync=True)
+        page = self.indexer.search_documents(index_name, 'search', search_field='text', page_num=1, page_len=10)
+        self.assertEqual(5, page.total)
+        self.assertEqual(1.0, get_sample_value('hits', 'query'))
+        self.assertEqual(3.0, get_sample_value('misses', 'query'))
+
+    def test_search_documents_result_cache(self):
+        # read index config
+        with open(self.example_dir + '/index_config.yaml', 'r', encoding='utf-8') as file_obj:
+            index_config_dict = yaml.safe_load(file_obj.read())
+        index_config_dict['searcher']['result_cache']['size'] = 2
+        index_config = IndexConfig(index_config_dict)
+
+        # create file index
+        index_name = 'test_file_index'
+        self.indexer.create_index(index_name, index_config, sync=True)
+        self.assertTrue(self.indexer.is_index_exist(index_name))
+
+        # read documents
+        with open(self.example_dir + '/bulk_put.json', 'r', encoding='utf-8') as file_obj:
+            test_docs = json.loads(file_obj.read(), encoding='utf-8')
+
+        # put documents in bulk
+        count = self.indexer.put_documents(index_name, test_docs[:4], sync=True)
+        self.assertEqual(4, count)
+
+        # commit
+        success = self.indexer.commit_index(index_name, sync=True)
+        self.assertTrue(success)
+
+        def get_sample_value(name):
+            value = self.metrics_registry.get_sample_value('{0}_indexer_result_cache_{1}_total'.format(NAME, name),
+                                                           {'index_name': index_name})
+            return 0.0 if value is None else value
+
+        # the first search is cached
+        page = self.indexer.search_documents(index_name, 'search', search_field='text', page_num=1, page_len=10)
+        self.assertEqual(4, page.total)
+        self.assertEqual(0.0, get_sample_value('hits'))
+        self.assertEqual(1.0, get_sample_value('misses'))
+
+        # the same search is served from the cache
+        cached_page = self.indexer.search_documents(index_name, 'search', search_field='text', page_num=1,
+                                                    page_len=10)
+        self.assertEqual(4, cached_page.total)
+        self.assertEqual(1.0, get_sample_value('hits'))
+        self.assertEqual(1.0, get_sample_value('misses'))
+        self.assertEqual([(hit.docnum, hit.score, hit['id']) for hit in page],
+                         [(hit.docnum, hit.score, hit['id']) for hit in cached_page])
+
+        # a different page is another entry
+        page = self.indexer.search_documents(index_name, 'search', search_field='text', page_num=2, page_len=2)
+        self.assertEqual(2, len(list(page)))
+        self.assertEqual(2.0, get_sample_value('misses'))
+
+        # a commit invalidates the cached results
+        count = self.indexer.put_documents(index_name, test_docs[4:], sync=True)
+        self.assertEqual(1, count)
+        success = self.indexer.commit_index(index_name, sync=True)
+        self.assertTrue(success)
+        page = self.indexer.search_documents(index_name, 'search', search_field='text', page_num=1, page_len=10)
+        self.assertEqual(5, page.total)
+        self.assertEqual(1.0, get_sample_value('hits'))
+        self.assertEqual(3.0, get_sample_value('misses'))
+
+        # the least recently used entry is evicted when the cache is full
+        self.indexer.search_documents(index_name, 'engine', search_field='text', page_num=1, page_len=10)
+        self.assertEqual(0.0, get_sample_value('evictions'))
+        self.indexer.search_documents(index_name, 'system', search_field='text', page_num=1, page_len=10)
+        self.assertEqual(1.0, get_sample_value('evictions'))
+        self.indexer.search_documents(index_name, 'system', search_field='text', page_num=1, page_len=10)
+        self.assertEqual(2.0, get_sample_value('hits'))
+
+    def test_search_documents_filter(self):
+        # read index config
+        with open(self.example_dir + '/index_config.yaml', 'r', encoding='utf-8') as file_obj:
+            index_config_dict = yaml.safe_load(file_obj.read())
+        index_config = IndexConfig(index_config_dict)
+
+        # create file index
+        index_name = 'test_file_index'
+        self.indexer.create_index(index_name, index_config, sync=True)
+        self.assertTrue(self.indexer.is_index_exist(index_name))
+
+        # read documents
+        with open(self.example_dir + '/bulk_put.json', 'r', encoding='utf-8') as file_obj:
+            test_docs = json.loads(file_obj.read(), encoding='utf-8')
+
+        # put documents in bulk
+        count = self.indexer.put_documents(index_name, test_docs[:3], sync=True)
+        self.assertEqual(3, count)
+
+        # commit
+        success = self.indexer.commit_index(index_name, sync=True)
+        self.assertTrue(success)
+
+        def get_sample_value(name):
+            value = self.metrics_registry.get_sample_value('{0}_indexer_filter_cache_{1}_total'.format(NAME, name),
+                                                           {'index_name': index_name})
+            return 0.0 if value is None else value
+
+        # the filter restricts the results without affecting the scores
+        page = self.indexer.search_documents(index_name, 'search', search_field='text', page_num=1, page_len=10)
+        scores = dict([(hit['id'], hit.score) for hit in page])
+        page = self.indexer.search_documents(index_name, 'search', search_field='text', page_num=1, page_len=10,
+                                             filter_query='timestamp:[20180701 TO 20181231]')
+        self.assertEqual(2, page.total)
+        self.assertEqual(['1', '2'], sorted([hit['id'] for hit in page]))
+        self.assertTrue(all([hit.score == scores[hit['id']] for hit in page]))
+        self.assertEqual(1.0, get_sample_value('misses'))
+
+        # the bitset of the segment is reused by another search with the same filter
+        page = self.indexer.search_documents(index_name, 'engine', search_field='text', page_num=1, page_len=10,
+                                             filter_query='timestamp:[20180701 TO 20181231]')
+        self.assertEqual(['1', '2'], sorted([hit['id'] for hit in page]))
+        self.assertEqual(1.0, get_sample_value('hits'))
+        self.assertEqual(1.0, get_sample_value('misses'))
+
+        # a filter that allows no documents
+        page = self.indexer.search_documents(index_name, 'search', search_field='text', page_num=1, page_len=10,
+                                             filter_query='contributor:Nurg')
+        self.assertEqual(0, page.total)
+
+        # put the rest of the documents
+        count = self.indexer.put_documents(index_name, test_docs[3:], sync=True)
+        self.assertEqual(2, count)
+
+        # commit
+        success = self.indexer.commit_index(index_name, sync=True)
+        self.assertTrue(success)
+
+        page = self.indexer.search_documents(index_name, 'search', search_field='text', page_num=1, page_len=10,
+                                             filter_query='timestamp:[20180701 TO 20181231]')
+        self.assertEqual(4, page.total)
+        self.assertEqual(['1', '2', '4', '5'], sorted([hit['id'] for hit in page]))
+
+        page = self.indexer.search_documents(index_name, 'search', search_field='text', page_num=1, page_len=10,
+                                             filter_query='contributor:Nurg')
+        self.assertEqual(1, page.total)
+        self.assertEqual('5', page[0]['id'])
+
+    def test_search_documents_facets(self):
+        # read index config
+        with open(self.example_dir + '/index_config.yaml', 'r', encoding='utf-8') as file_obj:
+            index_config_dict = yaml.safe_load(file_obj.read())
+        index_config = IndexConfig(index_config_dict)
+
+        # create file index
+        index_name = 'test_file_index'
+        self.indexer.create_index(index_name, index_config, sync=True)
+        self.assertTrue(self.indexer.is_index_exist(index_name))
+
+        # read documents
+        with open(self.example_dir + '/bulk_put.json', 'r', encoding='utf-8') as file_obj:
+            test_docs = json.loads(file_obj.read(), encoding='utf-8')
+
+        # put documents in bulk
+        count = self.indexer.put_documents(index_name, test_docs, sync=True)
+        self.assertEqual(5, count)
+
+        # commit
+        success = self.indexer.commit_index(index_name, sync=True)
+        self.assertTrue(success)
+
+        def get_sample_value(name):
+            value = self.metrics_registry.get_sample_value('{0}_indexer_facet_cache_{1}_total'.format(NAME, name),
+                                                           {'index_name': index_name})
+            return 0.0 if value is None else value
+
+        facets = {
+            'contributor': {
+                'limit': 2
+            },
+            'month': {
+                'type': 'date_range',
+                'field': 'timestamp',
+                'start': '2018-07-01',
+                'end': '2018-10-01',
+                'gap': '1 month'
+            }
+        }
+
+        # the facets count every matching document, not only the documents of the page
+        page = self.indexer.search_documents(index_name, 'search', search_field='text', page_num=1, page_len=1,
+                                             facets=facets)
+        self.assertEqual(5, page.total)
+        self.assertEqual(1, len(list(page)))
+        self.assertEqual([{'value': '43.225.167.166', 'count': 1}, {'value': 'Aistoff', 'count': 1}],
+                         page.facets['contributor'])
+        self.assertEqual([
+            {'start': '2018-07-01T00:00:00', 'end': '2018-08-01T00:00:00', 'count': 2},
+            {'start': '2018-08-01T00:00:00', 'end': '2018-09-01T00:00:00', 'count': 0},
+            {'start': '2018-09-01T00:00:00', 'end': '2018-10-01T00:00:00', 'count': 1}
+        ], page.facets['month'])
+        self.assertEqual(2.0, get_sample_value('misses'))
+
+        # the ordinals of the segment are reused by another search
+        page = self.indexer.search_documents(index_name, 'search', search_field='text', page_num=1, page_len=10,
+                                             filter_query='timestamp:[20180701 TO 20181231]', facets=facets)
+        self.assertEqual(4, page.total)
+        # the document of october is outside of the buckets
+        self.assertEqual([2, 0, 1], [facet_count['count'] for facet_count in page.facets['month']])
+        self.assertEqual(2.0, get_sample_value('hits'))
+        self.assertEqual(2.0, get_sample_value('misses'))
+
+        # no facets are counted unless they are requested
+        page = self.indexer.search_documents(index_name, 'search', search_field='text', page_num=1, page_len=10)
+        self.assertIsNone(page.facets)
+
+        # a facet of a field that does not exist
+        with self.assertRaises(ValueError):
+            self.indexer.search_documents(index_name, 'search', search_field='text', page_num=1, page_len=10,
+                                          facets={'unknown': {}})
+
+    def test_search_documents_highlight(self):
+        # read index config
+        with open(self.example_dir + '/index_config.yaml', 'r', encoding='utf-8') as file_obj:
+            index_config_dict = yaml.safe_load(file_obj.read())
+        index_config = IndexConfig(index_config_dict)
+
+        # create file index
+        index_name = 'test_file_index'
+        self.indexer.create_index(index_name, index_config, sync=True)
+        self.assertTrue(self.indexer.is_index_exist(index_name))
+
+        # read documents
+        with open(self.example_dir + '/bulk_put.json', 'r', encoding='utf-8') as file_obj:
+            test_docs = json.loads(file_obj.read(), encoding='utf-8')
+
+        # put documents in bulk
+        count = self.indexer.put_documents(index_name, test_docs, sync=True)
+        self.assertEqual(5, count)
+
+        # commit
+        success = self.indexer.commit_index(index_name, sync=True)
+        self.assertTrue(success)
+
+        # the text field keeps the character positions of its terms, the title field is analyzed again
+        page = self.indexer.search_documents(index_name, 'text:search OR title:search', search_field='text',
+                                             page_num=1, page_len=10,
+                                             highlight={'fields': ['text', 'title'], 'tag': 'em', 'top': 1})
+        self.assertEqual(5, page.total)
+        for hit in page:
+            self.assertRegex(hit.highlights['text'].lower(), r'<em class="match term\d+">search</em>')
+            # only the best fragment is returned
+            self.assertNotIn('...', hit.highlights['text'])
+        self.assertTrue(any(['<em' in hit.highlights['title'] for hit in page]))
+
+        # no highlights are made unless they are requested
+        page = self.indexer.search_documents(index_name, 'search', search_field='text', page_num=1, page_len=10)
+        self.assertIsNone(page[0].highlights)
+
+        # a field that does not exist
+        with self.assertRaises(ValueError):
+            self.indexer.search_documents(index_name, 'search', search_field='text', page_num=1, page_len=10,
+                                          highlight={'fields': ['unknown']})
+
+    def test_search_documents_sort(self):
+        # read index config
+        with open(self.example_dir + '/index_config.yaml', 'r', encoding='utf-8') as file_obj:
+            index_config_dict = yaml.safe_load(file_obj.read())
+        index_config = IndexConfig(index_config_dict)
+
+        # create file index
+        index_name = 'test_file_index'
+        self.indexer.create_index(index_name, index_config, sync=True)
+        self.assertTrue(self.indexer.is_index_exist(index_name))
+
+        # read documents
+        with open(self.example_dir + '/bulk_put.json', 'r', encoding='utf-8') as file_obj:
+            test_docs = json.loads(file_obj.read(), encoding='utf-8')
+
+        # put documents in bulk
+        count = self.indexer.put_documents(index_name, test_docs, sync=True)
+        self.assertEqual(5, count)
+
+        # commit
+        success = self.indexer.commit_index(index_name, sync=True)
+        self.assertTrue(success)
+
+        # page through the documents from the newest one with the cursor of the previous page
+        for facets in [None, {'contributor': {}}]:
+            ids = []
+            search_after = None
+            while True:
+                page = self.indexer.search_documents(index_name, '*', search_field='text', page_num=1, page_len=2,
+                                                     sort='-timestamp', search_after=search_after, facets=facets)
+                self.assertEqual(5, page.total)
+                ids.extend([hit['id'] for hit in page])
+                if page.is_last_page():
+                    self.assertIsNone(page.search_after)
+                    break
+                search_after = page.search_after
+            self.assertEqual(['2', '4', '5', '1', '3'], ids)
+
+        # the sort orders of the segments are cached
+        self.assertTrue(self.metrics_registry.get_sample_value('cockatrice_indexer_sort_cache_hits_total',
+                                                               {'index_name': index_name}) > 0)
+
+        # sort by the score first
+        page = self.indexer.search_documents(index_name, 'search', search_field='text', page_num=1, page_len=10,
+                                             sort='_score,-timestamp')
+        self.assertEqual(5, page.total)
+        scores = [hit.score for hit in page]
+        self.assertEqual(sorted(scores, reverse=True), scores)
+
+        # the cursor can not be used with page_num
+        with self.assertRaises(ValueError):
+            self.indexer.search_documents(index_name, '*', search_field='text', page_num=2, page_len=2,
+                                          sort='-timestamp', search_after=search_after)
+
+        # a field that is not sortable
+        with self.assertRaises(ValueError):
+            self.indexer.search_documents(index_name, '*', search_field='text', page_num=1, page_len=2, sort='text')
+
+    def test_multi_search(self):
+        # read index config
+        with open(self.example_dir + '/index_config.yaml', 'r', encoding='utf-8') as file_obj:
+            index_config_dict = yaml.safe_load(file_obj.read())
+        index_config = IndexConfig(index_config_dict)
+
+        # create file index
+        index_name = 'test_file_index'
+        self.indexer.create_index(index_name, index_config, sync=True)
+        self.assertTrue(self.indexer.is_index_exist(index_name))
+
+        # read documents
+        with open(self.example_dir + '/bulk_put.json', 'r', encoding='utf-8') as file_obj:
+            test_docs = json.loads(file_obj.read(), encoding='utf-8')
+
+        # put documents in bulk
+        count = self.indexer.put_documents(index_name, test_docs, sync=True)
+        self.assertEqual(5, count)
+
+        # commit
+        success = self.indexer.commit_index(index_name, sync=True)
+        self.assertTrue(success)
+
+        # the results are returned in the order of the searches, with the errors of the searches that failed
+        searches = [
+            {'index_name': index_name, 'query': 'search', 'search_field': 'text', 'page_num': 1, 'page_len': 10},
+            {'index_name': index_name, 'query': 'search', 'search_field': 'text', 'page_num': 1, 'page_len': 10,
+             'sort': 'text'},
+            {'index_name': index_name, 'query': '*', 'search_field': 'text', 'page_num': 1, 'page_len': 1,
+             'filter_query': 'contributor:Nurg'}
+        ]
+        results = self.indexer.multi_search(searches)
+        self.assertEqual(3, len(results))
+
+        results_page, error, search_time = results[0]
+        self.assertIsNone(error)
+        self.assertEqual(5, results_page.total)
+        self.assertTrue(search_time >= 0.0)
+
+        results_page, error, search_time = results[1]
+        self.assertIsNone(results_page)
+        self.assertIsInstance(error, ValueError)
+
+        results_page, error, search_time = results[2]
+        self.assertIsNone(error)
+        self.assertEqual(1, results_page.total)
+        self.assertEqual('Nurg', results_page[0]['contributor'])
+
+        # no searches
+        self.assertEqual([], self.indexer.multi_search([]))
+
+    def test_search_documents_timeout(self):
+        # read index config
+        with open(self.example_dir + '/index_config.yaml', 'r', encoding='utf-8') as file_obj:
+            index_config_dict = yaml.safe_load(file_obj.read())
+        index_config = IndexConfig(index_config_dict)
+
+        # create file index
+        index_name = 'test_file_index'
+        self.indexer.create_index(index_name, index_config, sync=True)
+        self.assertTrue(self.indexer.is_index_exist(index_name))
+
+        # put enough documents to take longer than the timeout to collect
+        docs = [{'id': str(i), 'title': 'Search engine {0}'.format(i), 'text': 'A search engine.',
+                 'contributor': 'Nurg', 'timestamp': '20180704'} for i in range(20000)]
+        count = self.indexer.put_documents(index_name, docs, sync=True)
+        self.assertEqual(20000, count)
+
+        # commit
+        success = self.indexer.commit_index(index_name, sync=True)
+        self.assertTrue(success)
+
+        # a search that completes within the timeout
+        page = self.indexer.search_documents(index_name, 'search', 'text', 1, page_len=10, timeout=60.0)
+        self.assertFalse(page.timed_out)
+        self.assertEqual(20000, page.total)
+
+        # a search stopped by the timeout returns the documents collected until then, a complete page in the result
+        # cache is returned whatever the timeout is
+        page = self.indexer.search_documents(index_name, 'engine', 'text', 1, page_len=10, timeout=0.000001)
+        self.assertTrue(page.timed_out)
+        self.assertTrue(page.total < 20000)
+
+        # a sorted search stopped by the timeout has no cursor
+        page = self.indexer.search_documents(index_name, 'engine', 'text', 1, page_len=10, sort='-_score',
+                                             timeout=0.000001)
+        self.assertTrue(page.timed_out)
+        self.assertIsNone(page.search_after)
+
+        # the partial pages are not cached
+        page = self.indexer.search_documents(index_name, 'engine', 'text', 1, page_len=10)
+        self.assertFalse(page.timed_out)
+        self.assertEqual(20000, page.total)
+
+    def test_search_documents_parallel(self):
+        # read index config
+        with open(self.example_dir + '/index_config.yaml', 'r', encoding='utf-8') as file_obj:
+            index_config_dict = yaml.safe_load(file_obj.read())
+        index_config_dict['searcher']['result_cache']['size'] = 0
+
+        # create an index searched in this thread and an index whose segments are searched by worker processes
+        self.indexer.create_index('test_index', IndexConfig(index_config_dict), sync=True)
+        index_config_dict['searcher']['parallel_search']['processes'] = 2
+        self.indexer.create_index('test_parallel_index', IndexConfig(index_config_dict), sync=True)
+
+        # put the same documents in three segments of both indices
+        contributors = ['43.225.167.166', 'Aistoff', 'KolbertBot', 'Citation bot', 'Nurg']
+        for segment in range(3):
+            docs = [{'id': '{0}-{1}'.format(segment, i), 'title': 'Search engine {0}'.format(i),
+                     'text': 'A search engine is an information retrieval system.' if i % 3 else 'A search engine.',
+                     'contributor': contributors[i % len(contributors)], 'timestamp': '20180704'} for i in
+                    range(300)]
+            for index_name in ['test_index', 'test_parallel_index']:
+                count = self.indexer.put_documents(index_name, docs, sync=True)
+                self.assertEqual(300, count)
+                success = self.indexer.commit_index(index_name, sync=True)
+                self.assertTrue(success)
+        self.assertEqual(3, len(self.indexer.get_index('test_parallel_index').reader().leaf_readers()))
+
+        # the pages are the same whether the segments are searched in parallel or not
+        for query, page_num, filter_query, timeout in [('search', 1, None, None), ('retrieval', 3, None, None),
+                                                       ('search', 2, 'contributor:Nurg', None),
+                                                       ('retrieval OR engine', 1, None, 60.0)]:
+            expected = self.indexer.search_documents('test_index', query, 'text', page_num, page_len=10,
+                                                     filter_query=filter_query, timeout=timeout)
+            page = self.indexer.search_documents('test_parallel_index', query, 'text', page_num, page_len=10,
+                                                 filter_query=filter_query, timeout=timeout)
+            self.assertEqual(expected.total, page.total)
+            self.assertEqual(expected.pagecount, page.pagecount)
+            self.assertEqual([(hit['id'], hit.score) for hit in expected], [(hit['id'], hit.score) for hit in page])
+            self.assertFalse(page.timed_out)
+
+    def test_slow_log(self):
+        # read index config
+        with open(self.example_dir + '/index_config.yaml', 'r', encoding='utf-8') as file_obj:
+            index_config_dict = yaml.safe_load(file_obj.read())
+        index_config_dict['writer']['auto_commit']['period'] = 3600
+        index_config_dict['slow_log'] = {'search_threshold': 0, 'put_threshold': 0, 'commit_threshold': 0}
+
+        # read documents
+        with open(self.example_dir + '/bulk_put.json', 'r', encoding='utf-8') as file_obj:
+            test_docs = json.loads(file_obj.read(), encoding='utf-8')
+
+        log_handler = BufferingHandler(100)
+        self.slow_logger.addHandler(log_handler)
+        try:
+            # every operation is slower than a threshold of 0 seconds
+            self.indexer.create_index('test_index', IndexConfig(index_config_dict), sync=True)
+            count = self.indexer.put_documents('test_index', test_docs, sync=True)
+            self.assertEqual(5, count)
+            success = self.indexer.commit_index('test_index', sync=True)
+            self.assertTrue(success)
+            self.indexer.search_documents('test_index', 'search', 'text', 1, page_len=3, filter_query='id:1 OR id:2')
+            self.indexer.search_documents('test_index', 'search', 'text', 1, page_len=3, filter_query='id:1 OR id:2')
+
+            records = [json.loads(record.getMessage()) for record in log_handler.buffer]
+            self.assertEqual(['put', 'commit', 'search', 'search'], [record['operation'] for record in records])
+            for record in records:
+                self.assertEqual('test_index', record['index_name'])
+                self.assertEqual('leader', record['node_role'])
+                self.assertGreaterEqual(record['took'], 0)
+                self.assertEqual(0, record['threshold'])
+                self.assertTrue(record['slow'])
+            self.assertEqual(5, records[0]['docs'])
+            self.assertEqual(5, records[0]['count'])
+            self.assertTrue(records[1]['success'])
+            self.assertEqual('search', records[2]['query'])
+            self.assertEqual('id:1 OR id:2', records[2]['filter_query'])
+            self.assertEqual(3, records[2]['page_len'])
+            self.assertEqual(2, records[2]['total'])
+            self.assertEqual(2, records[2]['hits'])
+            self.assertFalse(records[2]['cached'])
+            self.assertIn('parse', records[2]['timings'])
+            self.assertIn('collect', records[2]['timings'])
+            self.assertTrue(records[3]['cached'])
+
+            # the operations under their thresholds are sampled
+            index_config_dict['slow_log'] = {'search_threshold': 60, 'sample_rate': 1.0}
+            self.indexer.close_index('test_index', sync=True)
+            self.indexer.open_index('test_index', IndexConfig(index_config_dict), sync=True)
+            log_handler.flush()
+            self.indexer.search_documents('test_index', 'search', 'text', 1)
+            records = [json.loads(record.getMessage()) for record in log_handler.buffer]
+            self.assertEqual(['search'], [record['operation'] for record in records])
+            self.assertFalse(records[0]['slow'])
+            self.assertEqual(60, records[0]['threshold'])
+
+            # the operations under their thresholds are not logged without sampling
+            index_config_dict['slow_log'] = {'search_threshold': 60}
+            self.indexer.close_index('test_index', sync=True)
+            self.indexer.open_index('test_index', IndexConfig(index_config_dict), sync=True)
+            log_handler.flush()
+            self.indexer.search_documents('test_index', 'search', 'text', 1)
+            self.assertEqual([], log_handler.buffer)
+
+            # nothing is logged when the slow logger is disabled
+            index_config_dict['slow_log'] = {'search_threshold': 0}
+            self.indexer.close_index('test_index', sync=True)
+            self.indexer.open_index('test_index', IndexConfig(index_config_dict), sync=True)
+            self.slow_logger.setLevel(ERROR)
+            self.indexer.search_documents('test_index', 'search', 'text', 1)
+            self.assertEqual([], log_handler.buffer)
+        finally:
+            self.slow_logger.setLevel(INFO)
+            self.slow_logger.removeHandler(log_handler)
+
+    def test_search_documents_profile(self):
+        # read index config
+        with open(self.example_dir + '/index_config.yaml', 'r', encoding='utf-8') as file_obj:
+            index_config_dict = yaml.safe_load(file_obj.read())
+        index_config = IndexConfig(index_config_dict)
+
+        # read documents
+        with open(self.example_dir + '/bulk_put.json', 'r', encoding='utf-8') as file_obj:
+            test_docs = json.loads(file_obj.read(), encoding='utf-8')
+
+        self.indexer.create_index('test_index', index_config, sync=True)
+        count = self.indexer.put_documents('test_index', test_docs, sync=True)
+        self.assertEqual(5, count)
+        success = self.indexer.commit_index('test_index', sync=True)
+        self.assertTrue(success)
+
+        # a search that is neither profiled nor explained
+        page = self.indexer.search_documents('test_index', 'search engine', 'text', 1)
+        self.assertIsNone(page.profile)
+        self.assertIsNone(page[0].explanation)
+
+        # the profile has the parsed query tree with the statistics of the matchers of its clauses
+        page = self.indexer.search_documents('test_index', 'search engine', 'text', 1, profile=True)
+        self.assertEqual('And', page.profile['query']['type'])
+        self.assertEqual('(text:search AND text:engine)', page.profile['query']['query'])
+        self.assertEqual(['text:search', 'text:engine'],
+                         [clause['query'] for clause in page.profile['query']['children']])
+        for clause in page.profile['query']['children']:
+            self.assertEqual('Term', clause['type'])
+            self.assertEqual(1, clause['matchers'])
+            self.assertGreater(clause['postings_read'], 0)
+            self.assertGreaterEqual(page.profile['query']['time'], clause['time'])
+        self.assertEqual(1, len(page.profile['segments']))
+        self.assertEqual(5, page.profile['segments'][0]['doc_count'])
+        self.assertEqual({'parse', 'collect', 'stored_fields'}, set(page.profile['timings'].keys()))
+        self.assertIsNone(page[0].explanation)
+
+        # the profiled search is executed again instead of being served from the result cache
+        page = self.indexer.search_documents('test_index', 'search engine', 'text', 1, profile=True)
+        self.assertEqual('And', page.profile['query']['type'])
+
+        # a sorted search with facets and highlights
+        page = self.indexer.search_documents('test_index', 'search', 'text', 1, sort='-timestamp',
+                                             facets={'contributor': {'field': 'contributor'}},
+                                             highlight={'fields': 'text'}, profile=True)
+        self.assertEqual('Term', page.profile['query']['type'])
+        self.assertEqual({'parse', 'collect', 'facets', 'highlight', 'stored_fields'},
+                         set(page.profile['timings'].keys()))
+
+        # the explanation of a hit has the score of each term with the statistics of the weighting model
+        page = self.indexer.search_documents('test_index', 'search engine', 'text', 1, explain=True)
+        self.assertIsNone(page.profile)
+        for hit in page:
+            terms = hit.explanation['terms']
+            self.assertEqual(['engine', 'search'], [term['term'] for term in terms])
+            self.assertAlmostEqual(hit.score, sum([term['score'] for term in terms]))
+            for term in terms:
+                self.assertEqual('text', term['field'])
+                self.assertEqual('BM25FScorer', term['scorer'])
+                self.assertGreater(term['frequency'], 0)
+                self.assertGreater(term['field_length'], 0)
+                self.assertEqual({'idf', 'avgfl', 'B', 'K1', 'qf'}, set(term['parameters'].keys()))
+
+        # the profiles of the searches of several indices
+        page = self.indexer.search_documents('test_index,test_index', 'search', 'text', 1, profile=True,
+                                             explain=True)
+        self.assertEqual(['test_index'], list(page.profile['indices'].keys()))
+        self.assertEqual('Term', page.profile['indices']['test_index']['query']['type'])
+        self.assertEqual(['search'], [term['term'] for term in page[0].explanation['terms']])
+
+    def test_search_indices(self):
+        # read index config
+        with open(self.example_dir + '/index_config.yaml', 'r', encoding='utf-8') as file_obj:
+            index_config_dict = yaml.safe_load(file_obj.read())
+        index_config = IndexConfig(index_config_dict)
+
+        # read documents
+        with open(self.example_dir + '/bulk_put.json', 'r', encoding='utf-8') as file_obj:
+            test_docs = json.loads(file_obj.read(), encoding='utf-8')
+
+        # create two indices with the documents split between them
+        for index_name, docs in [('test_index_1', test_docs[:3]), ('test_index_2', test_docs[3:])]:
+            self.indexer.create_index(index_name, index_config, sync=True)
+            count = self.indexer.put_documents(index_name, docs, sync=True)
+            self.assertEqual(len(docs), count)
+            success = self.indexer.commit_index(index_name, sync=True)
+            self.assertTrue(success)
+        self.indexer.create_index('other_index', index_config, sync=True)
+
+        # resolve index names
+        self.assertEqual(['test_index_1', 'test_index_2'], self.indexer.resolve_index_names('test_index_*'))
+        self.assertEqual(['test_index_2', 'other_index'], self.indexer.resolve_index_names('test_index_2,other_*'))
+        self.assertEqual([], self.indexer.resolve_index_names('unknown_*'))
+        with self.assertRaises(ValueError):
+            self.indexer.resolve_index_names('test_index_1,unknown_index')
+
+        # the hits of the indices are merged in the order of the sort values
+        page = self.indexer.search_documents('test_index_*', '*', 'text', 1, page_len=3, sort='-timestamp')
+        self.assertEqual(5, page.total)
+        self.assertEqual(2, page.pagecount)
+        self.assertFalse(page.is_last_page())
+        self.assertEqual(['2', '4', '5'], [hit['id'] for hit in page])
+        self.assertEqual(['test_index_1', 'test_index_2', 'test_index_2'], [hit.index_name for hit in page])
+        self.assertEqual([0, 1, 2], [hit.rank for hit in page])
+        page = self.indexer.search_documents('test_index_*', '*', 'text', 2, page_len=3, sort='-timestamp')
+        self.assertTrue(page.is_last_page())
+        self.assertEqual(['1', '3'], [hit['id'] for hit in page])
+        self.assertEqual(['test_index_1', 'test_index_1'], [hit.index_name for hit in page])
+
+        # the hits of the indices are merged in the order of the scores
+        page = self.indexer.search_documents('test_index_1,test_index_2', 'search', 'text', 1, page_len=10)
+        self.assertEqual(5, page.total)
+        scores = [hit.score for hit in page]
+        self.assertEqual(sorted(scores, reverse=True), scores)
+        self.assertEqual({'test_index_1', 'test_index_2'}, set([hit.index_name for hit in page]))
+
+        # the facet counts of the indices are summed up
+        page = self.indexer.search_documents('test_index_*', '*', 'text', 1, page_len=10, count_only=True,
+                                             facets={'contributor': {'field': 'contributor'}})
+        self.assertEqual(0, len(list(page)))
+        self.assertEqual(5, sum([facet_count['count'] for facet_count in page.facets['contributor']]))
+
+        # search_after is not merged
+        with self.assertRaises(ValueError):
+            self.indexer.search_documents('test_index_*', '*', 'text', 1, sort='-timestamp', search_after='xxx')
+
+        # a glob that matches no indices
+        page = self.indexer.search_documents('unknown_*', '*', 'text', 1)
+        self.assertEqual(0, page.total)
+
+    def test_count_documents(self):
+        # read index config
+        with open(self.example_dir + '/index_config.yaml', 'r', encoding='utf-8') as file_obj:
+            index_config_dict = yaml.safe_load(file_obj.read())
+        index_config = IndexConfig(index_config_dict)
+
+        # create file index
+        index_name = 'test_file_index'
+        self.indexer.create_index(index_name, index_config, sync=True)
+        self.assertTrue(self.indexer.is_index_exist(index_name))
+
+        # read documents
+        with open(self.example_dir + '/bulk_put.json', 'r', encoding='utf-8') as file_obj:
+            test_docs = json.loads(file_obj.read(), encoding='utf-8')
+
+        # put documents in bulk in two segments
+        count = self.indexer.put_documents(index_name, test_docs[:3], sync=True)
+        self.assertEqual(3, count)
+        success = self.indexer.commit_index(index_name, sync=True)
+        self.assertTrue(success)
+        count = self.indexer.put_documents(index_name, test_docs[3:], sync=True)
+        self.assertEqual(2, count)
+        success = self.indexer.commit_index(index_name, sync=True)
+        self.assertTrue(success)
+
+        # the count is the total of the search
+        count = self.indexer.count_documents(index_name, 'search', 'text')
+        self.assertEqual(5, count)
+        count = self.indexer.count_documents(index_name, 'search', 'text',
+                                             filter_query='timestamp:[20180701 TO 20181231]')
+        page = self.indexer.search_documents(index_name, 'search', 'text', 1, page_len=1,
+                                             filter_query='timestamp:[20180701 TO 20181231]')
+        self.assertEqual(page.total, count)
+        self.assertEqual(4, count)
+
+        # the deleted documents are not counted, even though the bitsets were cached before they were deleted
+        count = self.indexer.delete_document(index_name, '2', sync=True)
+        self.assertEqual(1, count)
+        success = self.indexer.commit_index(index_name, sync=True)
+        self.assertTrue(success)
+        count = self.indexer.count_documents(index_name, 'search', 'text')
+        self.assertEqual(4, count)
+        count = self.indexer.count_documents(index_name, 'search', 'text',
+                                             filter_query='timestamp:[20180701 TO 20181231]')
+        self.assertEqual(3, count)
+
+        # no documents
+        count = self.indexer.count_documents(index_name, 'nonexistent', 'text')
+        self.assertEqual(0, count)
+
+    def test_search_documents_fields(self):
+        # read index config
+        with open(self.example_dir + '/index_config.yaml', 'r', encoding='utf-8') as file_obj:
+            index_config_dict = yaml.safe_load(file_obj.read())
+        # the ids are read from the column of a sortable doc id field
+        index_config_dict['schema']['id']['args']['sortable'] = True
+        index_config = IndexConfig(index_config_dict)
+
+        # create file index
+        index_name = 'test_file_index'
+        self.indexer.create_index(index_name, index_config, sync=True)
+        self.assertTrue(self.indexer.is_index_exist(index_name))
+
+        # read documents
+        with open(self.example_dir + '/bulk_put.json', 'r', encoding='utf-8') as file_obj:
+            test_docs = json.loads(file_obj.read(), encoding='utf-8')
+
+        # put documents in bulk
+        count = self.indexer.put_documents(index_name, test_docs, sync=True)
+        self.assertEqual(5, count)
+
+        # commit
+        success = self.indexer.commit_index(index_name, sync=True)
+        self.assertTrue(success)
+
+        # only the requested fields are returned
+        page = self.indexer.search_documents(index_name, 'search', search_field='text', page_num=1, page_len=10,
+                                             fields='id,title')
+        self.assertEqual(5, page.total)
+        for hit in page:
+            self.assertEqual(['id', 'title'], sorted(hit.keys()))
+
+        # only the ids are returned
+        page = self.indexer.search_documents(index_name, 'search', search_field='text', page_num=1, page_len=10,
+                                             ids_only=True)
+        self.assertEqual(5, page.total)
+        self.assertEqual(['1', '2', '3', '4', '5'], sorted([hit['id'] for hit in page]))
+        for hit in page:
+            self.assertEqual(['id'], hit.keys())
+
+        # only the number of the documents is returned
+        page = self.indexer.search_documents(index_name, 'search', search_field='text', page_num=1, page_len=10,
+                                             count_only=True, highlight={'fields': ['text']})
+        self.assertEqual(5, page.total)
+        self.assertEqual([], list(page))
+
+        # a field that does not exist
+        with self.assertRaises(ValueError):
+            self.indexer.search_documents(index_name, 'search', search_field='text', page_num=1, page_len=10,
+                                          fields='unknown')
+
+    def test_scan_documents(self):
+        # read index config
+        with open(self.example_dir + '/index_config.yaml', 'r', encoding='utf-8') as file_obj:
+            index_config_dict = yaml.safe_load(file_obj.read())
+        index_config = IndexConfig(index_config_dict)
+
+        # create file index
+        index_name = 'test_file_index'
+        self.indexer.create_index(index_name, index_config, sync=True)
+        self.assertTrue(self.indexer.is_index_exist(index_name))
+
+        # read documents
+        with open(self.example_dir + '/bulk_put.json', 'r', encoding='utf-8') as file_obj:
+            test_docs = json.loads(file_obj.read(), encoding='utf-8')
+
+        # put documents in bulk
+        count = self.indexer.put_documents(index_name, test_docs, sync=True)
+        self.assertEqual(5, count)
+
+        # commit
+        success = self.indexer.commit_index(index_name, sync=True)
+        self.assertTrue(success)
+
+        # scan documents
+        hits = list(self.indexer.scan_documents(index_name, 'search', search_field='text'))
+        self.assertEqual(5, len(hits))
+        self.assertTrue(all([score > 0.0 for _, score, _ in hits]))
+        self.assertEqual(['1', '2', '3', '4', '5'], sorted([fields['id'] for _, _, fields in hits]))
+
     def test_snapshot_exists(self):
         # snapshot exists
         self.assertFalse(self.indexer.is_snapshot_exist())
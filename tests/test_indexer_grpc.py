@@ -15,6 +15,7 @@
 # limitations under the License.
 
 import _pickle as pickle
+import json
 import os
 import unittest
 import zipfile
@@ -29,12 +30,14 @@ from pysyncobj import SyncObjConf
 
 from cockatrice import NAME
 from cockatrice.indexer import Indexer
-from cockatrice.protobuf.index_pb2 import CloseIndexRequest, CommitIndexRequest, CreateIndexRequest, \
-    CreateSnapshotRequest, DeleteDocumentRequest, DeleteDocumentsRequest, DeleteIndexRequest, DeleteNodeRequest, \
-    GetDocumentRequest, GetIndexRequest, GetSnapshotRequest, GetStatusRequest, IsAliveRequest, IsReadyRequest, \
-    IsSnapshotExistRequest, OpenIndexRequest, OptimizeIndexRequest, PutDocumentRequest, PutDocumentsRequest, \
-    PutNodeRequest, SearchDocumentsRequest
+from cockatrice.protobuf.index_pb2 import CloseIndexRequest, CommitIndexRequest, CountDocumentsRequest, \
+    CreateIndexRequest, CreateSnapshotRequest, DeleteDocumentRequest, DeleteDocumentsRequest, DeleteIndexRequest, \
+    DeleteNodeRequest, GetDocumentRequest, GetDocumentsRequest, GetIndexRequest, GetSnapshotRequest, GetStatusRequest, \
+    IsAliveRequest, IsReadyRequest, IsSnapshotExistRequest, MultiSearchRequest, OpenIndexRequest, \
+    OptimizeIndexRequest, PutDocumentRequest, PutDocumentsRequest, PutNodeRequest, SearchDocumentsRequest, \
+    StreamDeleteDocumentsRequest, StreamPutDocumentsRequest, StreamSearchDocumentsRequest
 from cockatrice.protobuf.index_pb2_grpc import IndexStub
+from cockatrice.util.protobuf import dict_to_document, document_to_dict
 from tests import get_free_port
 
 
@@ -323,7 +326,7 @@ class TestIndexGRPCServicer(unittest.TestCase):
         request = PutDocumentRequest()
         request.index_name = 'test_index'
         request.doc_id = '1'
-        request.fields = pickle.dumps(fields_dict)
+        dict_to_document(fields_dict, request.doc)
         request.sync = True
         response = stub.PutDocument(request)
         self.assertEqual(True, response.status.success)
@@ -358,7 +361,7 @@ class TestIndexGRPCServicer(unittest.TestCase):
         request = PutDocumentRequest()
         request.index_name = 'test_index'
         request.doc_id = '1'
-        request.fields = pickle.dumps(fields_dict)
+        dict_to_document(fields_dict, request.doc)
         request.sync = True
         response = stub.PutDocument(request)
         self.assertEqual(1, response.count)
@@ -378,8 +381,8 @@ class TestIndexGRPCServicer(unittest.TestCase):
         response = stub.GetDocument(request)
 
         self.assertEqual(True, response.status.success)
-        self.assertEqual('1', pickle.loads(response.fields)['id'])
-        self.assertEqual('Search engine (computing)', pickle.loads(response.fields)['title'])
+        self.assertEqual('1', document_to_dict(response.doc)['id'])
+        self.assertEqual('Search engine (computing)', document_to_dict(response.doc)['title'])
 
     def test_delete_document(self):
         stub = IndexStub(self.channel)
@@ -411,7 +414,7 @@ class TestIndexGRPCServicer(unittest.TestCase):
         request = PutDocumentRequest()
         request.index_name = 'test_index'
         request.doc_id = '1'
-        request.fields = pickle.dumps(fields_dict)
+        dict_to_document(fields_dict, request.doc)
         request.sync = True
         response = stub.PutDocument(request)
         self.assertEqual(1, response.count)
@@ -430,8 +433,8 @@ class TestIndexGRPCServicer(unittest.TestCase):
         request.doc_id = '1'
         response = stub.GetDocument(request)
         self.assertEqual(True, response.status.success)
-        self.assertEqual('1', pickle.loads(response.fields)['id'])
-        self.assertEqual('Search engine (computing)', pickle.loads(response.fields)['title'])
+        self.assertEqual('1', document_to_dict(response.doc)['id'])
+        self.assertEqual('Search engine (computing)', document_to_dict(response.doc)['title'])
 
         # delete document
         request = DeleteDocumentRequest()
@@ -485,7 +488,7 @@ class TestIndexGRPCServicer(unittest.TestCase):
         # put documents
         request = PutDocumentsRequest()
         request.index_name = 'test_index'
-        request.docs = pickle.dumps(docs_dict)
+        request.docs.extend([dict_to_document(doc_dict) for doc_dict in docs_dict])
         request.sync = True
         response = stub.PutDocuments(request)
         self.assertEqual(5, response.count)
@@ -509,11 +512,64 @@ class TestIndexGRPCServicer(unittest.TestCase):
         request.search_field = 'text'
         request.page_num = 1
         request.page_len = 10
-        request.weighting = pickle.dumps(weighting_dict)
+        request.weighting = json.dumps(weighting_dict['weighting'])
         response = stub.SearchDocuments(request)
-        self.assertEqual(5, pickle.loads(response.results)['total'])
+        self.assertEqual(5, response.total)
         self.assertEqual(True, response.status.success)
 
+    def test_get_documents(self):
+        stub = IndexStub(self.channel)
+
+        # read index_config.yaml
+        with open(self.example_dir + '/index_config.yaml', 'r', encoding='utf-8') as file_obj:
+            index_config_dict = yaml.safe_load(file_obj.read())
+
+        # create index
+        request = CreateIndexRequest()
+        request.index_name = 'test_index'
+        request.index_config = pickle.dumps(index_config_dict)
+        request.sync = True
+        response = stub.CreateIndex(request)
+        self.assertEqual(True, response.status.success)
+
+        # read bulk_put.yaml
+        with open(self.example_dir + '/bulk_put.yaml', 'r', encoding='utf-8') as file_obj:
+            docs_dict = yaml.safe_load(file_obj.read())
+
+        # put documents
+        request = PutDocumentsRequest()
+        request.index_name = 'test_index'
+        request.docs.extend([dict_to_document(doc_dict) for doc_dict in docs_dict])
+        request.sync = True
+        response = stub.PutDocuments(request)
+        self.assertEqual(5, response.count)
+        self.assertEqual(True, response.status.success)
+
+        # commit
+        request = CommitIndexRequest()
+        request.index_name = 'test_index'
+        request.sync = True
+        response = stub.CommitIndex(request)
+        self.assertEqual(True, response.status.success)
+
+        # get documents
+        request = GetDocumentsRequest()
+        request.index_name = 'test_index'
+        request.doc_ids.extend(['3', '9', '1'])
+        response = stub.GetDocuments(request)
+        self.assertEqual(True, response.status.success)
+        self.assertEqual(['3', '1'], [document_to_dict(doc)['id'] for doc in response.docs])
+        self.assertEqual(['9'], list(response.not_found))
+
+        # get only the titles of the documents
+        request = GetDocumentsRequest()
+        request.index_name = 'test_index'
+        request.doc_ids.extend(['3', '1'])
+        request.fields.extend(['title'])
+        response = stub.GetDocuments(request)
+        self.assertEqual(True, response.status.success)
+        self.assertEqual(['title'], list(document_to_dict(response.docs[0]).keys()))
+
     def test_delete_documents(self):
         stub = IndexStub(self.channel)
 
@@ -543,7 +599,7 @@ class TestIndexGRPCServicer(unittest.TestCase):
         # put documents
         request = PutDocumentsRequest()
         request.index_name = 'test_index'
-        request.docs = pickle.dumps(docs_dict)
+        request.docs.extend([dict_to_document(doc_dict) for doc_dict in docs_dict])
         request.sync = True
         response = stub.PutDocuments(request)
         self.assertEqual(5, response.count)
@@ -567,9 +623,9 @@ class TestIndexGRPCServicer(unittest.TestCase):
         request.search_field = 'text'
         request.page_num = 1
         request.page_len = 10
-        request.weighting = pickle.dumps(weighting_dict)
+        request.weighting = json.dumps(weighting_dict['weighting'])
         response = stub.SearchDocuments(request)
-        self.assertEqual(5, pickle.loads(response.results)['total'])
+        self.assertEqual(5, response.total)
         self.assertEqual(True, response.status.success)
 
         # read bulk_delete.yaml
@@ -579,7 +635,7 @@ class TestIndexGRPCServicer(unittest.TestCase):
         # delete documents
         request = DeleteDocumentsRequest()
         request.index_name = 'test_index'
-        request.doc_ids = pickle.dumps(doc_ids_list)
+        request.doc_ids.extend(doc_ids_list)
         request.sync = True
         response = stub.DeleteDocuments(request)
         self.assertEqual(5, response.count)
@@ -603,11 +659,297 @@ class TestIndexGRPCServicer(unittest.TestCase):
         request.search_field = 'text'
         request.page_num = 1
         request.page_len = 10
-        request.weighting = pickle.dumps(weighting_dict)
+        request.weighting = json.dumps(weighting_dict['weighting'])
+        response = stub.SearchDocuments(request)
+        self.assertEqual(0, response.total)
+        self.assertEqual(True, response.status.success)
+
+    def test_stream_put_documents(self):
+        stub = IndexStub(self.channel)
+
+        # read index_config.yaml
+        with open(self.example_dir + '/index_config.yaml', 'r', encoding='utf-8') as file_obj:
+            index_config_dict = yaml.safe_load(file_obj.read())
+
+        # create index
+        request = CreateIndexRequest()
+        request.index_name = 'test_index'
+        request.index_config = pickle.dumps(index_config_dict)
+        request.sync = True
+        response = stub.CreateIndex(request)
+        self.assertEqual(True, response.status.success)
+
+        # read bulk_put.yaml
+        with open(self.example_dir + '/bulk_put.yaml', 'r', encoding='utf-8') as file_obj:
+            docs_dict = yaml.safe_load(file_obj.read())
+
+        def put_requests(chunk_size=2):
+            for i in range(0, len(docs_dict), chunk_size):
+                request = StreamPutDocumentsRequest()
+                request.index_name = 'test_index'
+                request.docs.extend([dict_to_document(doc_dict) for doc_dict in docs_dict[i:i + chunk_size]])
+                request.sync = True
+                yield request
+
+        # put documents over a stream
+        response = stub.StreamPutDocuments(put_requests())
+        self.assertEqual(5, response.count)
+        self.assertEqual(3, response.chunks)
+        self.assertEqual([], list(response.failed_chunks))
+        self.assertEqual(True, response.status.success)
+
+        # commit
+        request = CommitIndexRequest()
+        request.index_name = 'test_index'
+        request.sync = True
+        response = stub.CommitIndex(request)
+        self.assertEqual(True, response.status.success)
+
+        # get document
+        request = GetDocumentRequest()
+        request.index_name = 'test_index'
+        request.doc_id = '5'
+        response = stub.GetDocument(request)
+        self.assertEqual('5', document_to_dict(response.doc)['id'])
+        self.assertEqual(True, response.status.success)
+
+    def test_stream_delete_documents(self):
+        stub = IndexStub(self.channel)
+
+        # read index_config.yaml
+        with open(self.example_dir + '/index_config.yaml', 'r', encoding='utf-8') as file_obj:
+            index_config_dict = yaml.safe_load(file_obj.read())
+
+        # create index
+        request = CreateIndexRequest()
+        request.index_name = 'test_index'
+        request.index_config = pickle.dumps(index_config_dict)
+        request.sync = True
+        response = stub.CreateIndex(request)
+        self.assertEqual(True, response.status.success)
+
+        # read bulk_put.yaml
+        with open(self.example_dir + '/bulk_put.yaml', 'r', encoding='utf-8') as file_obj:
+            docs_dict = yaml.safe_load(file_obj.read())
+
+        # put documents
+        request = PutDocumentsRequest()
+        request.index_name = 'test_index'
+        request.docs.extend([dict_to_document(doc_dict) for doc_dict in docs_dict])
+        request.sync = True
+        response = stub.PutDocuments(request)
+        self.assertEqual(5, response.count)
+        self.assertEqual(True, response.status.success)
+
+        # commit
+        request = CommitIndexRequest()
+        request.index_name = 'test_index'
+        request.sync = True
+        response = stub.CommitIndex(request)
+        self.assertEqual(True, response.status.success)
+
+        # read bulk_delete.yaml
+        with open(self.example_dir + '/bulk_delete.yaml', 'r', encoding='utf-8') as file_obj:
+            doc_ids_list = yaml.safe_load(file_obj.read())
+
+        def delete_requests(chunk_size=2):
+            for i in range(0, len(doc_ids_list), chunk_size):
+                request = StreamDeleteDocumentsRequest()
+                request.index_name = 'test_index'
+                request.doc_ids.extend(doc_ids_list[i:i + chunk_size])
+                request.sync = True
+                yield request
+
+        # delete documents over a stream
+        response = stub.StreamDeleteDocuments(delete_requests())
+        self.assertEqual(5, response.count)
+        self.assertEqual(3, response.chunks)
+        self.assertEqual(True, response.status.success)
+
+        # commit
+        request = CommitIndexRequest()
+        request.index_name = 'test_index'
+        request.sync = True
+        response = stub.CommitIndex(request)
+        self.assertEqual(True, response.status.success)
+
+        # get document
+        request = GetDocumentRequest()
+        request.index_name = 'test_index'
+        request.doc_id = '5'
+        response = stub.GetDocument(request)
+        self.assertEqual(False, response.status.success)
+
+    def test_search_indices(self):
+        stub = IndexStub(self.channel)
+
+        # read index_config.yaml
+        with open(self.example_dir + '/index_config.yaml', 'r', encoding='utf-8') as file_obj:
+            index_config_dict = yaml.safe_load(file_obj.read())
+
+        # read bulk_put.yaml
+        with open(self.example_dir + '/bulk_put.yaml', 'r', encoding='utf-8') as file_obj:
+            docs_dict = yaml.safe_load(file_obj.read())
+
+        # create two indices with the documents split between them
+        for index_name, index_docs in [('test_index_1', docs_dict[:3]), ('test_index_2', docs_dict[3:])]:
+            request = CreateIndexRequest()
+            request.index_name = index_name
+            request.index_config = pickle.dumps(index_config_dict)
+            request.sync = True
+            response = stub.CreateIndex(request)
+            self.assertEqual(True, response.status.success)
+
+            request = PutDocumentsRequest()
+            request.index_name = index_name
+            request.docs.extend([dict_to_document(doc_dict) for doc_dict in index_docs])
+            request.sync = True
+            response = stub.PutDocuments(request)
+            self.assertEqual(len(index_docs), response.count)
+
+            request = CommitIndexRequest()
+            request.index_name = index_name
+            request.sync = True
+            response = stub.CommitIndex(request)
+            self.assertEqual(True, response.status.success)
+
+        # search a glob of indices
+        request = SearchDocumentsRequest()
+        request.index_name = 'test_index_*'
+        request.query = '*'
+        request.search_field = 'text'
+        request.page_num = 1
+        request.page_len = 3
+        request.sort = '-timestamp'
         response = stub.SearchDocuments(request)
-        self.assertEqual(0, pickle.loads(response.results)['total'])
+        self.assertEqual(True, response.status.success)
+        self.assertEqual(5, response.total)
+        self.assertEqual(['2', '4', '5'], [document_to_dict(hit.doc)['id'] for hit in response.hits])
+        self.assertEqual(['test_index_1', 'test_index_2', 'test_index_2'], [hit.index_name for hit in response.hits])
+
+    def test_multi_search(self):
+        stub = IndexStub(self.channel)
+
+        # read index_config.yaml
+        with open(self.example_dir + '/index_config.yaml', 'r', encoding='utf-8') as file_obj:
+            index_config_dict = yaml.safe_load(file_obj.read())
+
+        # create index
+        request = CreateIndexRequest()
+        request.index_name = 'test_index'
+        request.index_config = pickle.dumps(index_config_dict)
+        request.sync = True
+        response = stub.CreateIndex(request)
         self.assertEqual(True, response.status.success)
 
+        # read bulk_put.yaml
+        with open(self.example_dir + '/bulk_put.yaml', 'r', encoding='utf-8') as file_obj:
+            docs_dict = yaml.safe_load(file_obj.read())
+
+        # put documents
+        request = PutDocumentsRequest()
+        request.index_name = 'test_index'
+        request.docs.extend([dict_to_document(doc_dict) for doc_dict in docs_dict])
+        request.sync = True
+        response = stub.PutDocuments(request)
+        self.assertEqual(5, response.count)
+        self.assertEqual(True, response.status.success)
+
+        # commit
+        request = CommitIndexRequest()
+        request.index_name = 'test_index'
+        request.sync = True
+        response = stub.CommitIndex(request)
+        self.assertEqual(True, response.status.success)
+
+        # search documents in a batch
+        request = MultiSearchRequest()
+        search_request = request.searches.add()
+        search_request.index_name = 'test_index'
+        search_request.query = 'search'
+        search_request.search_field = 'text'
+        search_request.page_num = 1
+        search_request.page_len = 10
+        search_request = request.searches.add()
+        search_request.index_name = 'test_index'
+        search_request.query = '*'
+        search_request.search_field = 'text'
+        search_request.page_num = 1
+        search_request.page_len = 2
+        search_request.sort = '-timestamp'
+        search_request = request.searches.add()
+        search_request.index_name = 'test_index'
+        search_request.query = 'search'
+        search_request.search_field = 'text'
+        search_request.page_num = 1
+        search_request.page_len = 10
+        search_request.sort = 'unknown'
+        response = stub.MultiSearch(request)
+        self.assertEqual(True, response.status.success)
+        self.assertEqual(3, len(response.responses))
+
+        # the responses are in the order of the searches
+        self.assertEqual(True, response.responses[0].status.success)
+        self.assertEqual(5, response.responses[0].total)
+        self.assertTrue(response.responses[0].time > 0.0)
+        self.assertEqual(True, response.responses[1].status.success)
+        self.assertEqual(['2', '4'], [document_to_dict(hit.doc)['id'] for hit in response.responses[1].hits])
+        self.assertEqual(False, response.responses[2].status.success)
+
+    def test_count_documents(self):
+        stub = IndexStub(self.channel)
+
+        # read index_config.yaml
+        with open(self.example_dir + '/index_config.yaml', 'r', encoding='utf-8') as file_obj:
+            index_config_dict = yaml.safe_load(file_obj.read())
+
+        # create index
+        request = CreateIndexRequest()
+        request.index_name = 'test_index'
+        request.index_config = pickle.dumps(index_config_dict)
+        request.sync = True
+        response = stub.CreateIndex(request)
+        self.assertEqual(True, response.status.success)
+
+        # read bulk_put.yaml
+        with open(self.example_dir + '/bulk_put.yaml', 'r', encoding='utf-8') as file_obj:
+            docs_dict = yaml.safe_load(file_obj.read())
+
+        # put documents
+        request = PutDocumentsRequest()
+        request.index_name = 'test_index'
+        request.docs.extend([dict_to_document(doc_dict) for doc_dict in docs_dict])
+        request.sync = True
+        response = stub.PutDocuments(request)
+        self.assertEqual(5, response.count)
+        self.assertEqual(True, response.status.success)
+
+        # commit
+        request = CommitIndexRequest()
+        request.index_name = 'test_index'
+        request.sync = True
+        response = stub.CommitIndex(request)
+        self.assertEqual(True, response.status.success)
+
+        # count documents
+        request = CountDocumentsRequest()
+        request.index_name = 'test_index'
+        request.query = 'search'
+        request.search_field = 'text'
+        response = stub.CountDocuments(request)
+        self.assertEqual(True, response.status.success)
+        self.assertEqual(5, response.count)
+
+        # count documents with a filter
+        request = CountDocumentsRequest()
+        request.index_name = 'test_index'
+        request.query = 'search'
+        request.search_field = 'text'
+        request.filter = 'contributor:Nurg'
+        response = stub.CountDocuments(request)
+        self.assertEqual(True, response.status.success)
+        self.assertEqual(1, response.count)
+
     def test_search_documents(self):
         stub = IndexStub(self.channel)
 
@@ -637,7 +979,7 @@ class TestIndexGRPCServicer(unittest.TestCase):
         # put documents
         request = PutDocumentsRequest()
         request.index_name = 'test_index'
-        request.docs = pickle.dumps(docs_dict)
+        request.docs.extend([dict_to_document(doc_dict) for doc_dict in docs_dict])
         request.sync = True
         response = stub.PutDocuments(request)
         self.assertEqual(5, response.count)
@@ -661,10 +1003,242 @@ class TestIndexGRPCServicer(unittest.TestCase):
         request.search_field = 'text'
         request.page_num = 1
         request.page_len = 10
-        request.weighting = pickle.dumps(weighting_dict)
+        request.weighting = json.dumps(weighting_dict['weighting'])
+        response = stub.SearchDocuments(request)
+        self.assertEqual(5, response.total)
+        self.assertEqual(5, len(response.hits))
+        self.assertEqual(0, response.hits[0].rank)
+        self.assertIn('id', document_to_dict(response.hits[0].doc))
+        self.assertEqual(True, response.status.success)
+
+        # search documents with a weighting that is not a json object
+        request.weighting = json.dumps(['whoosh.scoring.BM25F'])
+        response = stub.SearchDocuments(request)
+        self.assertEqual(False, response.status.success)
+
+        # search documents with a weighting profile of the index
+        request = SearchDocumentsRequest()
+        request.index_name = 'test_index'
+        request.query = 'search'
+        request.search_field = 'text'
+        request.page_num = 1
+        request.page_len = 10
+        request.weighting_profile = 'tf_idf'
         response = stub.SearchDocuments(request)
-        self.assertEqual(5, pickle.loads(response.results)['total'])
         self.assertEqual(True, response.status.success)
+        self.assertEqual(5, response.total)
+
+        # search documents with a weighting profile that does not exist
+        request.weighting_profile = 'not_exist'
+        response = stub.SearchDocuments(request)
+        self.assertEqual(False, response.status.success)
+
+        # search documents with facets
+        request = SearchDocumentsRequest()
+        request.index_name = 'test_index'
+        request.query = 'search'
+        request.search_field = 'text'
+        request.page_num = 1
+        request.page_len = 10
+        request.facets = json.dumps({
+            'contributor': {'limit': 3},
+            'quarter': {'type': 'date_range', 'field': 'timestamp', 'start': '2018-01-01', 'end': '2019-01-01',
+                        'gap': '3 months'}
+        })
+        response = stub.SearchDocuments(request)
+        self.assertEqual(True, response.status.success)
+        facets = dict([(facet.name, facet.counts) for facet in response.facets])
+        self.assertEqual(3, len(facets['contributor']))
+        self.assertEqual([1, 0, 3, 1], [facet_count.count for facet_count in facets['quarter']])
+        self.assertEqual('2018-01-01T00:00:00', facets['quarter'][0].start)
+
+        # search documents with facets that are not json
+        request.facets = 'contributor'
+        response = stub.SearchDocuments(request)
+        self.assertEqual(False, response.status.success)
+
+        # search documents with highlights
+        request = SearchDocumentsRequest()
+        request.index_name = 'test_index'
+        request.query = 'search'
+        request.search_field = 'text'
+        request.page_num = 1
+        request.page_len = 10
+        request.highlight = json.dumps({'fields': ['text']})
+        response = stub.SearchDocuments(request)
+        self.assertEqual(True, response.status.success)
+        self.assertIn('<b class="match term0">', response.hits[0].highlights['text'])
+
+        # search documents with highlight options that are not a json object
+        request.highlight = json.dumps(['text'])
+        response = stub.SearchDocuments(request)
+        self.assertEqual(False, response.status.success)
+
+        # search documents sorted by the timestamp with the cursor of the previous page
+        ids = []
+        search_after = ''
+        while True:
+            request = SearchDocumentsRequest()
+            request.index_name = 'test_index'
+            request.query = '*'
+            request.search_field = 'text'
+            request.page_num = 1
+            request.page_len = 2
+            request.sort = '-timestamp'
+            request.search_after = search_after
+            response = stub.SearchDocuments(request)
+            self.assertEqual(True, response.status.success)
+            ids.extend([document_to_dict(hit.doc)['id'] for hit in response.hits])
+            if response.is_last_page:
+                self.assertEqual('', response.search_after)
+                break
+            search_after = response.search_after
+        self.assertEqual(['2', '4', '5', '1', '3'], ids)
+
+        # search only the ids of the documents
+        request = SearchDocumentsRequest()
+        request.index_name = 'test_index'
+        request.query = 'search'
+        request.search_field = 'text'
+        request.page_num = 1
+        request.page_len = 10
+        request.ids_only = True
+        response = stub.SearchDocuments(request)
+        self.assertEqual(True, response.status.success)
+        self.assertEqual(['id'], list(document_to_dict(response.hits[0].doc).keys()))
+
+        # count the documents
+        request = SearchDocumentsRequest()
+        request.index_name = 'test_index'
+        request.query = 'search'
+        request.search_field = 'text'
+        request.page_num = 1
+        request.page_len = 10
+        request.count_only = True
+        response = stub.SearchDocuments(request)
+        self.assertEqual(True, response.status.success)
+        self.assertEqual(5, response.total)
+        self.assertEqual(0, len(response.hits))
+
+        # search the documents within the timeout and the deadline of the call
+        request = SearchDocumentsRequest()
+        request.index_name = 'test_index'
+        request.query = 'search'
+        request.search_field = 'text'
+        request.page_num = 1
+        request.page_len = 10
+        request.timeout_ms = 60000
+        response = stub.SearchDocuments(request, timeout=60)
+        self.assertEqual(True, response.status.success)
+        self.assertEqual(5, response.total)
+        self.assertEqual(False, response.timed_out)
+
+        # search the documents with the profile of the search and the explanations of the hits
+        request = SearchDocumentsRequest()
+        request.index_name = 'test_index'
+        request.query = 'search engine'
+        request.search_field = 'text'
+        request.page_num = 1
+        request.page_len = 10
+        request.profile = True
+        request.explain = True
+        response = stub.SearchDocuments(request)
+        self.assertEqual(True, response.status.success)
+        profile = json.loads(response.profile)
+        self.assertEqual('(text:search AND text:engine)', profile['query']['query'])
+        self.assertEqual(1, len(profile['segments']))
+        self.assertIn('serialize', profile['timings'])
+        for hit in response.hits:
+            explanation = json.loads(hit.explanation)
+            self.assertEqual(['engine', 'search'], [term['term'] for term in explanation['terms']])
+            self.assertAlmostEqual(hit.score, sum([term['score'] for term in explanation['terms']]))
+
+    def test_stream_search_documents(self):
+        stub = IndexStub(self.channel)
+
+        # read index_config.yaml
+        with open(self.example_dir + '/index_config.yaml', 'r', encoding='utf-8') as file_obj:
+            index_config_dict = yaml.safe_load(file_obj.read())
+
+        # create index
+        request = CreateIndexRequest()
+        request.index_name = 'test_index'
+        request.index_config = pickle.dumps(index_config_dict)
+        request.sync = True
+        response = stub.CreateIndex(request)
+        self.assertEqual(True, response.status.success)
+
+        # read bulk_put.yaml
+        with open(self.example_dir + '/bulk_put.yaml', 'r', encoding='utf-8') as file_obj:
+            docs_dict = yaml.safe_load(file_obj.read())
+
+        # put documents
+        request = PutDocumentsRequest()
+        request.index_name = 'test_index'
+        request.docs.extend([dict_to_document(doc_dict) for doc_dict in docs_dict])
+        request.sync = True
+        response = stub.PutDocuments(request)
+        self.assertEqual(5, response.count)
+        self.assertEqual(True, response.status.success)
+
+        # commit
+        request = CommitIndexRequest()
+        request.index_name = 'test_index'
+        request.sync = True
+        response = stub.CommitIndex(request)
+        self.assertEqual(True, response.status.success)
+
+        # search documents over a stream
+        request = StreamSearchDocumentsRequest()
+        request.index_name = 'test_index'
+        request.query = 'search'
+        request.search_field = 'text'
+        request.batch_size = 2
+        responses = list(stub.StreamSearchDocuments(request))
+        self.assertEqual([2, 2, 1], [len(response.hits) for response in responses])
+        self.assertEqual(True, all([response.status.success for response in responses]))
+        doc_ids = [document_to_dict(hit.doc)['id'] for response in responses for hit in response.hits]
+        self.assertEqual(['1', '2', '3', '4', '5'], sorted(doc_ids))
+        self.assertEqual('5 documents were successfully searched from test_index', responses[-1].status.message)
+
+        # the last batch is full
+        request.batch_size = 5
+        responses = list(stub.StreamSearchDocuments(request))
+        self.assertEqual([5], [len(response.hits) for response in responses])
+
+        # search documents that do not exist
+        request.query = 'nonexistent'
+        responses = list(stub.StreamSearchDocuments(request))
+        self.assertEqual(1, len(responses))
+        self.assertEqual(0, len(responses[0].hits))
+        self.assertEqual(True, responses[0].status.success)
+
+        # the hits are not ranked
+        request.query = 'search'
+        responses = list(stub.StreamSearchDocuments(request))
+        self.assertEqual([0] * 5, [hit.rank for hit in responses[0].hits])
+        self.assertEqual([0, 1, 2, 3, 4], [hit.pos for hit in responses[0].hits])
+
+        # the searcher of a cancelled stream is released
+        request.batch_size = 1
+        responses = stub.StreamSearchDocuments(request)
+        next(responses)
+        responses.cancel()
+        searcher_manager = self.indexer._Indexer__searcher_managers['test_index']
+        for _ in range(50):
+            if searcher_manager.get_lease_count() == 0:
+                break
+            sleep(0.1)
+        self.assertEqual(0, searcher_manager.get_lease_count())
+
+        # search a nonexistent index
+        request = StreamSearchDocumentsRequest()
+        request.index_name = 'nonexistent_index'
+        request.query = 'search'
+        request.search_field = 'text'
+        responses = list(stub.StreamSearchDocuments(request))
+        self.assertEqual(1, len(responses))
+        self.assertEqual(False, responses[0].status.success)
 
     def test_put_node(self):
         stub = IndexStub(self.channel)
@@ -14,6 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import gzip
 import json
 import os
 import unittest
@@ -328,6 +329,154 @@ class TestIndexHTTPServicer(unittest.TestCase):
         data = json.loads(response.text)
         self.assertEqual('5', data['fields']['id'])
 
+    def test_commit_write_queue_timeout(self):
+        # read index config, the queued writes are applied after a second and a flush waits for them for 0.1 seconds
+        with open(self.example_dir + '/index_config.yaml', 'r', encoding='utf-8') as file_obj:
+            index_config_dict = yaml.safe_load(file_obj.read())
+        index_config_dict['writer']['queue']['max_latency'] = 1.0
+        index_config_dict['writer']['queue']['timeout'] = 0.1
+
+        # create index
+        response = requests.put('http://{0}:{1}/indices/test_index?sync=True'.format(self.host, self.port),
+                                data=yaml.safe_dump(index_config_dict).encode('utf-8'),
+                                headers={'Content-Type': 'application/yaml'})
+        self.assertEqual(HTTPStatus.CREATED, response.status_code)
+
+        # read documents
+        with open(self.example_dir + '/bulk_put.json', 'r', encoding='utf-8') as file_obj:
+            docs_json = file_obj.read()
+
+        # put documents
+        response = requests.put('http://{0}:{1}/indices/test_index/documents'.format(self.host, self.port),
+                                data=docs_json.encode('utf-8'), headers={'Content-Type': 'application/json'})
+        self.assertEqual(HTTPStatus.ACCEPTED, response.status_code)
+
+        # the commit is not applied before the queued writes
+        response = requests.get('http://{0}:{1}/indices/test_index/commit?sync=True'.format(self.host, self.port))
+        self.assertEqual(HTTPStatus.SERVICE_UNAVAILABLE, response.status_code)
+
+        sleep(1.5)
+        response = requests.get('http://{0}:{1}/indices/test_index/commit?sync=True'.format(self.host, self.port))
+        self.assertEqual(HTTPStatus.OK, response.status_code)
+
+    def test_put_documents_ndjson(self):
+        # read index config
+        with open(self.example_dir + '/index_config.yaml', 'r', encoding='utf-8') as file_obj:
+            index_config_yaml = file_obj.read()
+
+        # create index
+        response = requests.put('http://{0}:{1}/indices/test_index?sync=True'.format(self.host, self.port),
+                                data=index_config_yaml.encode('utf-8'), headers={'Content-Type': 'application/yaml'})
+        self.assertEqual(HTTPStatus.CREATED, response.status_code)
+
+        # read documents
+        with open(self.example_dir + '/bulk_put.ndjson', 'r', encoding='utf-8') as file_obj:
+            docs_ndjson = file_obj.read()
+
+        # put documents with a broken line
+        response = requests.put(
+            'http://{0}:{1}/indices/test_index/documents?sync=True&chunk_size=2'.format(self.host, self.port),
+            data=(docs_ndjson + '{"id": \n').encode('utf-8'), headers={'Content-Type': 'application/x-ndjson'})
+        self.assertEqual(HTTPStatus.CREATED, response.status_code)
+        data = json.loads(response.text)
+        self.assertEqual(5, data['count'])
+        self.assertEqual(3, len(data['chunks']))
+        self.assertEqual(1, len(data['errors']))
+        self.assertEqual(6, data['errors'][0]['line'])
+
+        # commit
+        response = requests.get('http://{0}:{1}/indices/test_index/commit?sync=True'.format(self.host, self.port))
+        self.assertEqual(HTTPStatus.OK, response.status_code)
+
+        # get document 5
+        response = requests.get(
+            'http://{0}:{1}/indices/test_index/documents/5?output=json'.format(self.host, self.port))
+        self.assertEqual(HTTPStatus.OK, response.status_code)
+        data = json.loads(response.text)
+        self.assertEqual('5', data['fields']['id'])
+
+    def test_put_documents_ndjson_gzip(self):
+        # read index config
+        with open(self.example_dir + '/index_config.yaml', 'r', encoding='utf-8') as file_obj:
+            index_config_yaml = file_obj.read()
+
+        # create index
+        response = requests.put('http://{0}:{1}/indices/test_index?sync=True'.format(self.host, self.port),
+                                data=index_config_yaml.encode('utf-8'), headers={'Content-Type': 'application/yaml'})
+        self.assertEqual(HTTPStatus.CREATED, response.status_code)
+
+        # read documents
+        with open(self.example_dir + '/bulk_put.ndjson', 'r', encoding='utf-8') as file_obj:
+            docs_ndjson = file_obj.read()
+
+        # put documents
+        response = requests.put('http://{0}:{1}/indices/test_index/documents?sync=True'.format(self.host, self.port),
+                                data=gzip.compress(docs_ndjson.encode('utf-8')),
+                                headers={'Content-Type': 'application/x-ndjson', 'Content-Encoding': 'gzip'})
+        self.assertEqual(HTTPStatus.CREATED, response.status_code)
+        data = json.loads(response.text)
+        self.assertEqual(5, data['count'])
+
+        # commit
+        response = requests.get('http://{0}:{1}/indices/test_index/commit?sync=True'.format(self.host, self.port))
+        self.assertEqual(HTTPStatus.OK, response.status_code)
+
+        # get document 1
+        response = requests.get(
+            'http://{0}:{1}/indices/test_index/documents/1?output=json'.format(self.host, self.port))
+        self.assertEqual(HTTPStatus.OK, response.status_code)
+        data = json.loads(response.text)
+        self.assertEqual('1', data['fields']['id'])
+
+    def test_get_documents(self):
+        # read index config
+        with open(self.example_dir + '/index_config.yaml', 'r', encoding='utf-8') as file_obj:
+            index_config_yaml = file_obj.read()
+
+        # create index
+        response = requests.put('http://{0}:{1}/indices/test_index?sync=True'.format(self.host, self.port),
+                                data=index_config_yaml.encode('utf-8'), headers={'Content-Type': 'application/yaml'})
+        self.assertEqual(HTTPStatus.CREATED, response.status_code)
+
+        # read documents
+        with open(self.example_dir + '/bulk_put.json', 'r', encoding='utf-8') as file_obj:
+            docs_json = file_obj.read()
+
+        # put documents
+        response = requests.put('http://{0}:{1}/indices/test_index/documents?sync=True'.format(self.host, self.port),
+                                data=docs_json.encode('utf-8'), headers={'Content-Type': 'application/json'})
+        self.assertEqual(HTTPStatus.CREATED, response.status_code)
+
+        # commit
+        response = requests.get('http://{0}:{1}/indices/test_index/commit?sync=True'.format(self.host, self.port))
+        self.assertEqual(HTTPStatus.OK, response.status_code)
+
+        # get documents 3, 1 and 9
+        response = requests.get(
+            'http://{0}:{1}/indices/test_index/documents?ids=3,1&ids=9&output=json'.format(self.host, self.port))
+        self.assertEqual(HTTPStatus.OK, response.status_code)
+        data = json.loads(response.text)
+        self.assertEqual(['3', '1'], [doc['id'] for doc in data['docs']])
+        self.assertEqual('3', data['docs'][0]['fields']['id'])
+        self.assertEqual('1', data['docs'][1]['fields']['id'])
+        self.assertEqual(['9'], data['not_found'])
+
+        # get only the titles of the documents
+        response = requests.get('http://{0}:{1}/indices/test_index/documents'.format(self.host, self.port),
+                                params={'ids': '3,1', 'fields': 'title'})
+        self.assertEqual(HTTPStatus.OK, response.status_code)
+        data = json.loads(response.text)
+        self.assertEqual(['title'], list(data['docs'][0]['fields'].keys()))
+
+        # get a document with a field that does not exist
+        response = requests.get('http://{0}:{1}/indices/test_index/documents/1'.format(self.host, self.port),
+                                params={'fields': 'unknown'})
+        self.assertEqual(HTTPStatus.BAD_REQUEST, response.status_code)
+
+        # get documents without ids
+        response = requests.get('http://{0}:{1}/indices/test_index/documents?output=json'.format(self.host, self.port))
+        self.assertEqual(HTTPStatus.BAD_REQUEST, response.status_code)
+
     def test_delete_documents_json(self):
         # read index config
         with open(self.example_dir + '/index_config.yaml', 'r', encoding='utf-8') as file_obj:
@@ -460,6 +609,531 @@ class TestIndexHTTPServicer(unittest.TestCase):
         data = json.loads(response.text)
         self.assertEqual(5, data['results']['total'])
 
+    def test_search_documents_weighting_profile(self):
+        # read index config
+        with open(self.example_dir + '/index_config.yaml', 'r', encoding='utf-8') as file_obj:
+            index_config_yaml = file_obj.read()
+
+        # create index
+        response = requests.put('http://{0}:{1}/indices/test_index?sync=True'.format(self.host, self.port),
+                                data=index_config_yaml.encode('utf-8'), headers={'Content-Type': 'application/yaml'})
+        self.assertEqual(HTTPStatus.CREATED, response.status_code)
+
+        # read documents
+        with open(self.example_dir + '/bulk_put.json', 'r', encoding='utf-8') as file_obj:
+            docs_json = file_obj.read()
+
+        # put documents
+        response = requests.put('http://{0}:{1}/indices/test_index/documents?sync=True'.format(self.host, self.port),
+                                data=docs_json.encode('utf-8'), headers={'Content-Type': 'application/json'})
+        self.assertEqual(HTTPStatus.CREATED, response.status_code)
+
+        # commit
+        response = requests.get('http://{0}:{1}/indices/test_index/commit?sync=True'.format(self.host, self.port))
+        self.assertEqual(HTTPStatus.OK, response.status_code)
+
+        # search documents with a weighting profile of the index
+        response = requests.get('http://{0}:{1}/indices/test_index/search'.format(self.host, self.port),
+                                params={'query': 'search', 'search_field': 'text', 'weighting_profile': 'tf_idf'})
+        self.assertEqual(HTTPStatus.OK, response.status_code)
+        data = json.loads(response.text)
+        self.assertEqual(5, data['results']['total'])
+        scores = dict([(hit['fields']['id'], hit['score']) for hit in data['results']['hits']])
+
+        # the profile scores the documents as the same weighting of a request body does
+        response = requests.post('http://{0}:{1}/indices/test_index/search'.format(self.host, self.port),
+                                 params={'query': 'search', 'search_field': 'text'},
+                                 data=json.dumps({'weighting': {'default': {'class': 'whoosh.scoring.TF_IDF'}}}),
+                                 headers={'Content-Type': 'application/json'})
+        self.assertEqual(HTTPStatus.OK, response.status_code)
+        data = json.loads(response.text)
+        self.assertEqual(scores, dict([(hit['fields']['id'], hit['score']) for hit in data['results']['hits']]))
+
+        # a weighting profile that does not exist
+        response = requests.get('http://{0}:{1}/indices/test_index/search'.format(self.host, self.port),
+                                params={'query': 'search', 'search_field': 'text', 'weighting_profile': 'not_exist'})
+        self.assertEqual(HTTPStatus.BAD_REQUEST, response.status_code)
+
+    def test_search_documents_filter(self):
+        # read index config
+        with open(self.example_dir + '/index_config.yaml', 'r', encoding='utf-8') as file_obj:
+            index_config_yaml = file_obj.read()
+
+        # create index
+        response = requests.put('http://{0}:{1}/indices/test_index?sync=True'.format(self.host, self.port),
+                                data=index_config_yaml.encode('utf-8'), headers={'Content-Type': 'application/yaml'})
+        self.assertEqual(HTTPStatus.CREATED, response.status_code)
+
+        # read documents
+        with open(self.example_dir + '/bulk_put.json', 'r', encoding='utf-8') as file_obj:
+            docs_json = file_obj.read()
+
+        # put documents
+        response = requests.put('http://{0}:{1}/indices/test_index/documents?sync=True'.format(self.host, self.port),
+                                data=docs_json.encode('utf-8'), headers={'Content-Type': 'application/json'})
+        self.assertEqual(HTTPStatus.CREATED, response.status_code)
+
+        # commit
+        response = requests.get('http://{0}:{1}/indices/test_index/commit?sync=True'.format(self.host, self.port))
+        self.assertEqual(HTTPStatus.OK, response.status_code)
+
+        # search documents with a filter
+        response = requests.get('http://{0}:{1}/indices/test_index/search'.format(self.host, self.port),
+                                params={'query': 'search', 'search_field': 'text',
+                                        'filter': 'contributor:Nurg OR timestamp:[20181001 TO 20181231]'})
+        self.assertEqual(HTTPStatus.OK, response.status_code)
+        data = json.loads(response.text)
+        self.assertEqual(2, data['results']['total'])
+        self.assertEqual(['2', '5'], sorted([hit['fields']['id'] for hit in data['results']['hits']]))
+
+    def test_search_documents_facets(self):
+        # read index config
+        with open(self.example_dir + '/index_config.yaml', 'r', encoding='utf-8') as file_obj:
+            index_config_yaml = file_obj.read()
+
+        # create index
+        response = requests.put('http://{0}:{1}/indices/test_index?sync=True'.format(self.host, self.port),
+                                data=index_config_yaml.encode('utf-8'), headers={'Content-Type': 'application/yaml'})
+        self.assertEqual(HTTPStatus.CREATED, response.status_code)
+
+        # read documents
+        with open(self.example_dir + '/bulk_put.json', 'r', encoding='utf-8') as file_obj:
+            docs_json = file_obj.read()
+
+        # put documents
+        response = requests.put('http://{0}:{1}/indices/test_index/documents?sync=True'.format(self.host, self.port),
+                                data=docs_json.encode('utf-8'), headers={'Content-Type': 'application/json'})
+        self.assertEqual(HTTPStatus.CREATED, response.status_code)
+
+        # commit
+        response = requests.get('http://{0}:{1}/indices/test_index/commit?sync=True'.format(self.host, self.port))
+        self.assertEqual(HTTPStatus.OK, response.status_code)
+
+        # search documents with facets
+        facets = {
+            'facets': {
+                'contributor': {},
+                'quarter': {
+                    'type': 'date_range',
+                    'field': 'timestamp',
+                    'start': '2018-01-01',
+                    'end': '2019-01-01',
+                    'gap': '3 months'
+                }
+            }
+        }
+        response = requests.post(
+            'http://{0}:{1}/indices/test_index/search?query=search&search_field=text&page_num=1&page_len=10'.format(
+                self.host, self.port),
+            data=json.dumps(facets).encode('utf-8'), headers={'Content-Type': 'application/json'})
+        self.assertEqual(HTTPStatus.OK, response.status_code)
+        data = json.loads(response.text)
+        self.assertEqual(5, data['results']['total'])
+        self.assertEqual(5, len(data['results']['facets']['contributor']))
+        self.assertEqual([1, 0, 3, 1], [facet_count['count'] for facet_count in data['results']['facets']['quarter']])
+
+        # an invalid gap
+        facets['facets']['quarter']['gap'] = '3 fortnights'
+        response = requests.post(
+            'http://{0}:{1}/indices/test_index/search?query=search&search_field=text&page_num=1&page_len=10'.format(
+                self.host, self.port),
+            data=json.dumps(facets).encode('utf-8'), headers={'Content-Type': 'application/json'})
+        self.assertEqual(HTTPStatus.BAD_REQUEST, response.status_code)
+
+    def test_search_documents_highlight(self):
+        # read index config
+        with open(self.example_dir + '/index_config.yaml', 'r', encoding='utf-8') as file_obj:
+            index_config_yaml = file_obj.read()
+
+        # create index
+        response = requests.put('http://{0}:{1}/indices/test_index?sync=True'.format(self.host, self.port),
+                                data=index_config_yaml.encode('utf-8'), headers={'Content-Type': 'application/yaml'})
+        self.assertEqual(HTTPStatus.CREATED, response.status_code)
+
+        # read documents
+        with open(self.example_dir + '/bulk_put.json', 'r', encoding='utf-8') as file_obj:
+            docs_json = file_obj.read()
+
+        # put documents
+        response = requests.put('http://{0}:{1}/indices/test_index/documents?sync=True'.format(self.host, self.port),
+                                data=docs_json.encode('utf-8'), headers={'Content-Type': 'application/json'})
+        self.assertEqual(HTTPStatus.CREATED, response.status_code)
+
+        # commit
+        response = requests.get('http://{0}:{1}/indices/test_index/commit?sync=True'.format(self.host, self.port))
+        self.assertEqual(HTTPStatus.OK, response.status_code)
+
+        # search documents with highlights
+        response = requests.get('http://{0}:{1}/indices/test_index/search'.format(self.host, self.port),
+                                params={'query': 'search', 'search_field': 'text', 'highlight': 'text'})
+        self.assertEqual(HTTPStatus.OK, response.status_code)
+        data = json.loads(response.text)
+        self.assertEqual(5, data['results']['total'])
+        for hit in data['results']['hits']:
+            self.assertIn('<b class="match term0">', hit['highlights']['text'])
+
+        # highlight options in the request body
+        highlight = {
+            'highlight': {
+                'fields': ['text'],
+                'tag': 'em',
+                'max_chars': 50
+            }
+        }
+        response = requests.post(
+            'http://{0}:{1}/indices/test_index/search?query=search&search_field=text'.format(self.host, self.port),
+            data=json.dumps(highlight).encode('utf-8'), headers={'Content-Type': 'application/json'})
+        self.assertEqual(HTTPStatus.OK, response.status_code)
+        data = json.loads(response.text)
+        for hit in data['results']['hits']:
+            self.assertIn('<em class="match term0">', hit['highlights']['text'])
+
+        # a field that does not exist
+        response = requests.get('http://{0}:{1}/indices/test_index/search'.format(self.host, self.port),
+                                params={'query': 'search', 'search_field': 'text', 'highlight': 'unknown'})
+        self.assertEqual(HTTPStatus.BAD_REQUEST, response.status_code)
+
+    def test_multi_search(self):
+        # read index config
+        with open(self.example_dir + '/index_config.yaml', 'r', encoding='utf-8') as file_obj:
+            index_config_yaml = file_obj.read()
+
+        # create index
+        response = requests.put('http://{0}:{1}/indices/test_index?sync=True'.format(self.host, self.port),
+                                data=index_config_yaml.encode('utf-8'), headers={'Content-Type': 'application/yaml'})
+        self.assertEqual(HTTPStatus.CREATED, response.status_code)
+
+        # read documents
+        with open(self.example_dir + '/bulk_put.json', 'r', encoding='utf-8') as file_obj:
+            docs_json = file_obj.read()
+
+        # put documents
+        response = requests.put('http://{0}:{1}/indices/test_index/documents?sync=True'.format(self.host, self.port),
+                                data=docs_json.encode('utf-8'), headers={'Content-Type': 'application/json'})
+        self.assertEqual(HTTPStatus.CREATED, response.status_code)
+
+        # commit
+        response = requests.get('http://{0}:{1}/indices/test_index/commit?sync=True'.format(self.host, self.port))
+        self.assertEqual(HTTPStatus.OK, response.status_code)
+
+        # search documents in a batch
+        searches = [
+            {
+                'index_name': 'test_index',
+                'query': 'search',
+                'search_field': 'text',
+                'fields': ['id', 'title'],
+                'highlight': {'fields': ['text']}
+            },
+            {
+                'index_name': 'test_index',
+                'query': '*',
+                'search_field': 'text',
+                'page_len': 2,
+                'sort': '-timestamp'
+            },
+            {
+                'index_name': 'test_index',
+                'query': 'search',
+                'search_field': 'text',
+                'sort': 'text'
+            },
+            {
+                'query': 'search'
+            }
+        ]
+        response = requests.post('http://{0}:{1}/_msearch'.format(self.host, self.port),
+                                 data=json.dumps(searches).encode('utf-8'),
+                                 headers={'Content-Type': 'application/json'})
+        self.assertEqual(HTTPStatus.OK, response.status_code)
+        data = json.loads(response.text)
+        self.assertEqual(4, len(data['responses']))
+
+        # the responses are in the order of the searches
+        self.assertEqual(HTTPStatus.OK, data['responses'][0]['status']['code'])
+        self.assertEqual(5, data['responses'][0]['results']['total'])
+        self.assertEqual(['id', 'title'], sorted(data['responses'][0]['results']['hits'][0]['fields'].keys()))
+        self.assertIn('text', data['responses'][0]['results']['hits'][0]['highlights'])
+        self.assertTrue(data['responses'][0]['time'] >= 0.0)
+        self.assertEqual(HTTPStatus.OK, data['responses'][1]['status']['code'])
+        self.assertEqual(['2', '4'], [hit['fields']['id'] for hit in data['responses'][1]['results']['hits']])
+        self.assertIn('search_after', data['responses'][1]['results'])
+        self.assertEqual(HTTPStatus.BAD_REQUEST, data['responses'][2]['status']['code'])
+        self.assertIn('error', data['responses'][2])
+        self.assertEqual(HTTPStatus.BAD_REQUEST, data['responses'][3]['status']['code'])
+
+        # the searches must be a list
+        response = requests.post('http://{0}:{1}/_msearch'.format(self.host, self.port),
+                                 data=json.dumps({'query': 'search'}).encode('utf-8'),
+                                 headers={'Content-Type': 'application/json'})
+        self.assertEqual(HTTPStatus.BAD_REQUEST, response.status_code)
+
+    def test_count_documents(self):
+        # read index config
+        with open(self.example_dir + '/index_config.yaml', 'r', encoding='utf-8') as file_obj:
+            index_config_yaml = file_obj.read()
+
+        # create index
+        response = requests.put('http://{0}:{1}/indices/test_index?sync=True'.format(self.host, self.port),
+                                data=index_config_yaml.encode('utf-8'), headers={'Content-Type': 'application/yaml'})
+        self.assertEqual(HTTPStatus.CREATED, response.status_code)
+
+        # read documents
+        with open(self.example_dir + '/bulk_put.json', 'r', encoding='utf-8') as file_obj:
+            docs_json = file_obj.read()
+
+        # put documents
+        response = requests.put('http://{0}:{1}/indices/test_index/documents?sync=True'.format(self.host, self.port),
+                                data=docs_json.encode('utf-8'), headers={'Content-Type': 'application/json'})
+        self.assertEqual(HTTPStatus.CREATED, response.status_code)
+
+        # commit
+        response = requests.get('http://{0}:{1}/indices/test_index/commit?sync=True'.format(self.host, self.port))
+        self.assertEqual(HTTPStatus.OK, response.status_code)
+
+        # count documents
+        response = requests.get('http://{0}:{1}/indices/test_index/count'.format(self.host, self.port),
+                                params={'query': 'search', 'search_field': 'text'})
+        self.assertEqual(HTTPStatus.OK, response.status_code)
+        data = json.loads(response.text)
+        self.assertEqual(5, data['count'])
+
+        # count documents with a filter
+        response = requests.get('http://{0}:{1}/indices/test_index/count'.format(self.host, self.port),
+                                params={'query': 'search', 'search_field': 'text', 'filter': 'contributor:Nurg'})
+        self.assertEqual(HTTPStatus.OK, response.status_code)
+        data = json.loads(response.text)
+        self.assertEqual(1, data['count'])
+
+    def test_search_documents_timeout(self):
+        # read index config
+        with open(self.example_dir + '/index_config.yaml', 'r', encoding='utf-8') as file_obj:
+            index_config_yaml = file_obj.read()
+
+        # create index
+        response = requests.put('http://{0}:{1}/indices/test_index?sync=True'.format(self.host, self.port),
+                                data=index_config_yaml.encode('utf-8'), headers={'Content-Type': 'application/yaml'})
+        self.assertEqual(HTTPStatus.CREATED, response.status_code)
+
+        # read documents
+        with open(self.example_dir + '/bulk_put.json', 'r', encoding='utf-8') as file_obj:
+            docs_json = file_obj.read()
+
+        # put documents
+        response = requests.put('http://{0}:{1}/indices/test_index/documents?sync=True'.format(self.host, self.port),
+                                data=docs_json.encode('utf-8'), headers={'Content-Type': 'application/json'})
+        self.assertEqual(HTTPStatus.CREATED, response.status_code)
+
+        # commit
+        response = requests.get('http://{0}:{1}/indices/test_index/commit?sync=True'.format(self.host, self.port))
+        self.assertEqual(HTTPStatus.OK, response.status_code)
+
+        # a search that completes within the timeout
+        response = requests.get('http://{0}:{1}/indices/test_index/search'.format(self.host, self.port),
+                                params={'query': 'search', 'search_field': 'text', 'timeout_ms': 60000})
+        self.assertEqual(HTTPStatus.OK, response.status_code)
+        data = json.loads(response.text)
+        self.assertEqual(5, data['results']['total'])
+        self.assertFalse(data['results']['timed_out'])
+
+        # a negative timeout
+        response = requests.get('http://{0}:{1}/indices/test_index/search'.format(self.host, self.port),
+                                params={'query': 'search', 'search_field': 'text', 'timeout_ms': -1})
+        self.assertEqual(HTTPStatus.BAD_REQUEST, response.status_code)
+
+    def test_search_documents_profile(self):
+        # read index config
+        with open(self.example_dir + '/index_config.yaml', 'r', encoding='utf-8') as file_obj:
+            index_config_yaml = file_obj.read()
+
+        # create index
+        response = requests.put('http://{0}:{1}/indices/test_index?sync=True'.format(self.host, self.port),
+                                data=index_config_yaml.encode('utf-8'), headers={'Content-Type': 'application/yaml'})
+        self.assertEqual(HTTPStatus.CREATED, response.status_code)
+
+        # read documents
+        with open(self.example_dir + '/bulk_put.json', 'r', encoding='utf-8') as file_obj:
+            docs_json = file_obj.read()
+
+        # put documents
+        response = requests.put('http://{0}:{1}/indices/test_index/documents?sync=True'.format(self.host, self.port),
+                                data=docs_json.encode('utf-8'), headers={'Content-Type': 'application/json'})
+        self.assertEqual(HTTPStatus.CREATED, response.status_code)
+
+        # commit
+        response = requests.get('http://{0}:{1}/indices/test_index/commit?sync=True'.format(self.host, self.port))
+        self.assertEqual(HTTPStatus.OK, response.status_code)
+
+        # a search that is neither profiled nor explained
+        response = requests.get('http://{0}:{1}/indices/test_index/search'.format(self.host, self.port),
+                                params={'query': 'search engine', 'search_field': 'text'})
+        self.assertEqual(HTTPStatus.OK, response.status_code)
+        data = json.loads(response.text)
+        self.assertNotIn('profile', data['results'])
+        self.assertNotIn('explanation', data['results']['hits'][0])
+
+        # a profiled and explained search
+        response = requests.get('http://{0}:{1}/indices/test_index/search'.format(self.host, self.port),
+                                params={'query': 'search engine', 'search_field': 'text', 'profile': 'true',
+                                        'explain': 'true'})
+        self.assertEqual(HTTPStatus.OK, response.status_code)
+        data = json.loads(response.text)
+        profile = data['results']['profile']
+        self.assertEqual('(text:search AND text:engine)', profile['query']['query'])
+        self.assertEqual(['text:search', 'text:engine'], [clause['query'] for clause in profile['query']['children']])
+        self.assertEqual(1, len(profile['segments']))
+        self.assertEqual({'parse', 'collect', 'explain', 'stored_fields', 'serialize'}, set(profile['timings'].keys()))
+        for hit in data['results']['hits']:
+            self.assertEqual(['engine', 'search'], [term['term'] for term in hit['explanation']['terms']])
+            self.assertAlmostEqual(hit['score'], sum([term['score'] for term in hit['explanation']['terms']]))
+
+    def test_search_indices(self):
+        # read index config
+        with open(self.example_dir + '/index_config.yaml', 'r', encoding='utf-8') as file_obj:
+            index_config_yaml = file_obj.read()
+
+        # read documents
+        with open(self.example_dir + '/bulk_put.json', 'r', encoding='utf-8') as file_obj:
+            docs = json.loads(file_obj.read())
+
+        # create two indices with the documents split between them
+        for index_name, index_docs in [('test_index_1', docs[:3]), ('test_index_2', docs[3:])]:
+            response = requests.put('http://{0}:{1}/indices/{2}?sync=True'.format(self.host, self.port, index_name),
+                                    data=index_config_yaml.encode('utf-8'),
+                                    headers={'Content-Type': 'application/yaml'})
+            self.assertEqual(HTTPStatus.CREATED, response.status_code)
+            response = requests.put(
+                'http://{0}:{1}/indices/{2}/documents?sync=True'.format(self.host, self.port, index_name),
+                data=json.dumps(index_docs).encode('utf-8'), headers={'Content-Type': 'application/json'})
+            self.assertEqual(HTTPStatus.CREATED, response.status_code)
+            response = requests.get(
+                'http://{0}:{1}/indices/{2}/commit?sync=True'.format(self.host, self.port, index_name))
+            self.assertEqual(HTTPStatus.OK, response.status_code)
+
+        # search a glob of indices
+        response = requests.get('http://{0}:{1}/indices/test_index_*/search'.format(self.host, self.port),
+                                params={'query': '*', 'search_field': 'text', 'sort': '-timestamp', 'page_len': 3})
+        self.assertEqual(HTTPStatus.OK, response.status_code)
+        data = json.loads(response.text)
+        self.assertEqual(5, data['results']['total'])
+        self.assertEqual(['2', '4', '5'], [hit['fields']['id'] for hit in data['results']['hits']])
+        self.assertEqual(['test_index_1', 'test_index_2', 'test_index_2'],
+                         [hit['index_name'] for hit in data['results']['hits']])
+
+        # search a list of indices
+        response = requests.get('http://{0}:{1}/indices/test_index_1,test_index_2/search'.format(self.host, self.port),
+                                params={'query': 'search', 'search_field': 'text'})
+        self.assertEqual(HTTPStatus.OK, response.status_code)
+        data = json.loads(response.text)
+        self.assertEqual(5, data['results']['total'])
+
+        # an index that does not exist
+        response = requests.get('http://{0}:{1}/indices/test_index_1,unknown/search'.format(self.host, self.port),
+                                params={'query': 'search', 'search_field': 'text'})
+        self.assertEqual(HTTPStatus.BAD_REQUEST, response.status_code)
+
+    def test_search_documents_fields(self):
+        # read index config
+        with open(self.example_dir + '/index_config.yaml', 'r', encoding='utf-8') as file_obj:
+            index_config_yaml = file_obj.read()
+
+        # create index
+        response = requests.put('http://{0}:{1}/indices/test_index?sync=True'.format(self.host, self.port),
+                                data=index_config_yaml.encode('utf-8'), headers={'Content-Type': 'application/yaml'})
+        self.assertEqual(HTTPStatus.CREATED, response.status_code)
+
+        # read documents
+        with open(self.example_dir + '/bulk_put.json', 'r', encoding='utf-8') as file_obj:
+            docs_json = file_obj.read()
+
+        # put documents
+        response = requests.put('http://{0}:{1}/indices/test_index/documents?sync=True'.format(self.host, self.port),
+                                data=docs_json.encode('utf-8'), headers={'Content-Type': 'application/json'})
+        self.assertEqual(HTTPStatus.CREATED, response.status_code)
+
+        # commit
+        response = requests.get('http://{0}:{1}/indices/test_index/commit?sync=True'.format(self.host, self.port))
+        self.assertEqual(HTTPStatus.OK, response.status_code)
+
+        # search documents with only the requested fields
+        response = requests.get('http://{0}:{1}/indices/test_index/search'.format(self.host, self.port),
+                                params={'query': 'search', 'search_field': 'text', 'fields': 'id,title'})
+        self.assertEqual(HTTPStatus.OK, response.status_code)
+        data = json.loads(response.text)
+        self.assertEqual(5, data['results']['total'])
+        for hit in data['results']['hits']:
+            self.assertEqual(['id', 'title'], sorted(hit['fields'].keys()))
+
+        # search only the ids of the documents
+        response = requests.get('http://{0}:{1}/indices/test_index/search'.format(self.host, self.port),
+                                params={'query': 'search', 'search_field': 'text', 'ids_only': 'true'})
+        self.assertEqual(HTTPStatus.OK, response.status_code)
+        data = json.loads(response.text)
+        self.assertEqual(['1', '2', '3', '4', '5'], sorted([hit['fields']['id'] for hit in data['results']['hits']]))
+
+        # count the documents
+        response = requests.get('http://{0}:{1}/indices/test_index/search'.format(self.host, self.port),
+                                params={'query': 'search', 'search_field': 'text', 'count_only': 'true'})
+        self.assertEqual(HTTPStatus.OK, response.status_code)
+        data = json.loads(response.text)
+        self.assertEqual(5, data['results']['total'])
+        self.assertEqual([], data['results']['hits'])
+
+        # a field that does not exist
+        response = requests.get('http://{0}:{1}/indices/test_index/search'.format(self.host, self.port),
+                                params={'query': 'search', 'search_field': 'text', 'fields': 'unknown'})
+        self.assertEqual(HTTPStatus.BAD_REQUEST, response.status_code)
+
+    def test_search_documents_sort(self):
+        # read index config
+        with open(self.example_dir + '/index_config.yaml', 'r', encoding='utf-8') as file_obj:
+            index_config_yaml = file_obj.read()
+
+        # create index
+        response = requests.put('http://{0}:{1}/indices/test_index?sync=True'.format(self.host, self.port),
+                                data=index_config_yaml.encode('utf-8'), headers={'Content-Type': 'application/yaml'})
+        self.assertEqual(HTTPStatus.CREATED, response.status_code)
+
+        # read documents
+        with open(self.example_dir + '/bulk_put.json', 'r', encoding='utf-8') as file_obj:
+            docs_json = file_obj.read()
+
+        # put documents
+        response = requests.put('http://{0}:{1}/indices/test_index/documents?sync=True'.format(self.host, self.port),
+                                data=docs_json.encode('utf-8'), headers={'Content-Type': 'application/json'})
+        self.assertEqual(HTTPStatus.CREATED, response.status_code)
+
+        # commit
+        response = requests.get('http://{0}:{1}/indices/test_index/commit?sync=True'.format(self.host, self.port))
+        self.assertEqual(HTTPStatus.OK, response.status_code)
+
+        # page through the documents from the newest one with the cursor of the previous page
+        ids = []
+        params = {'query': '*', 'search_field': 'text', 'page_len': 2, 'sort': '-timestamp'}
+        while True:
+            response = requests.get('http://{0}:{1}/indices/test_index/search'.format(self.host, self.port),
+                                    params=params)
+            self.assertEqual(HTTPStatus.OK, response.status_code)
+            data = json.loads(response.text)
+            self.assertEqual(5, data['results']['total'])
+            ids.extend([hit['fields']['id'] for hit in data['results']['hits']])
+            if data['results']['is_last_page']:
+                self.assertNotIn('search_after', data['results'])
+                break
+            params['search_after'] = data['results']['search_after']
+        self.assertEqual(['2', '4', '5', '1', '3'], ids)
+
+        # a field that is not sortable
+        response = requests.get('http://{0}:{1}/indices/test_index/search'.format(self.host, self.port),
+                                params={'query': '*', 'search_field': 'text', 'sort': 'text'})
+        self.assertEqual(HTTPStatus.BAD_REQUEST, response.status_code)
+
+        # an invalid cursor
+        response = requests.get('http://{0}:{1}/indices/test_index/search'.format(self.host, self.port),
+                                params={'query': '*', 'search_field': 'text', 'sort': 'timestamp',
+                                        'search_after': 'invalid'})
+        self.assertEqual(HTTPStatus.BAD_REQUEST, response.status_code)
+
     def test_put_node(self):
         # get status
         response = requests.get('http://{0}:{1}/status'.format(self.host, self.port))
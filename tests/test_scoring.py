@@ -17,7 +17,10 @@
 import os
 import unittest
 
-from cockatrice.scoring import MultiWeighting
+import yaml
+from whoosh.scoring import BM25F
+
+from cockatrice.scoring import get_multi_weighting, get_weighting_dict, get_weighting_key, MultiWeighting
 
 
 class TestMultiWeighting(unittest.TestCase):
@@ -46,3 +49,55 @@ class TestMultiWeighting(unittest.TestCase):
         weighting = MultiWeighting(weighting_json)
 
         self.assertIsNotNone(weighting)
+
+
+class TestGetWeightingKey(unittest.TestCase):
+    def setUp(self):
+        self.example_dir = os.path.normpath(os.path.join(os.path.dirname(__file__), '../example'))
+
+    def tearDown(self):
+        pass
+
+    def test_get_weighting_key(self):
+        weighting_file = self.example_dir + '/weighting.yaml'
+
+        with open(weighting_file, 'r', encoding='utf-8') as file_obj:
+            weighting_dict = yaml.safe_load(file_obj.read())
+
+        # the same weighting built twice has the same key
+        key = get_weighting_key(get_multi_weighting(weighting_dict))
+        self.assertEqual(key, get_weighting_key(get_multi_weighting(weighting_dict)))
+        self.assertEqual(hash(key), hash(get_weighting_key(get_multi_weighting(weighting_dict))))
+
+        # different arguments give a different key
+        weighting_dict['weighting']['default']['args']['K1'] = 2.0
+        self.assertNotEqual(key, get_weighting_key(get_multi_weighting(weighting_dict)))
+
+        self.assertEqual(BM25F, get_weighting_key(BM25F))
+        self.assertEqual(get_weighting_key(BM25F(B=0.5)), get_weighting_key(BM25F(B=0.5)))
+        self.assertNotEqual(get_weighting_key(BM25F(B=0.5)), get_weighting_key(BM25F(B=0.75)))
+
+
+class TestGetWeightingDict(unittest.TestCase):
+    def setUp(self):
+        self.example_dir = os.path.normpath(os.path.join(os.path.dirname(__file__), '../example'))
+
+    def tearDown(self):
+        pass
+
+    def test_get_weighting_dict(self):
+        weighting_file = self.example_dir + '/weighting.yaml'
+
+        with open(weighting_file, 'r', encoding='utf-8') as file_obj:
+            weighting_dict = yaml.safe_load(file_obj.read())
+
+        # the dict of a weighting builds the same weighting again
+        weighting = get_multi_weighting(weighting_dict)
+        self.assertEqual({'default': {'class': 'whoosh.scoring.BM25F', 'args': {'B': 0.75, 'K1': 1.2}},
+                          'title': {'class': 'whoosh.scoring.TF_IDF'},
+                          'text': {'class': 'whoosh.scoring.PL2', 'args': {'c': 1.0}}}, get_weighting_dict(weighting))
+        self.assertEqual(get_weighting_key(weighting),
+                         get_weighting_key(get_multi_weighting({'weighting': get_weighting_dict(weighting)})))
+
+        self.assertEqual({'default': {'class': 'whoosh.scoring.BM25F'}}, get_weighting_dict(BM25F))
+        self.assertIsNone(get_weighting_dict(None))
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2019 Minoru Osuka
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 		http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from whoosh.fields import ID, Schema, TEXT
+from whoosh.filedb.filestore import RamStorage
+from whoosh.scoring import BM25F, TF_IDF
+
+from cockatrice.searcher_manager import SearcherManager
+
+
+class TestSearcherManager(unittest.TestCase):
+    def setUp(self):
+        self.storage = RamStorage()
+        self.index = self.storage.create_index(Schema(id=ID(unique=True, stored=True), text=TEXT(stored=True)),
+                                               indexname='test_index')
+
+        writer = self.index.writer()
+        writer.add_document(id='1', text='search engine')
+        writer.commit()
+
+        self.searcher_manager = SearcherManager(self.index, pool_size=2)
+
+    def tearDown(self):
+        self.searcher_manager.close()
+        self.index.close()
+
+    def test_acquire_release(self):
+        searcher = self.searcher_manager.acquire()
+        self.assertEqual(1, self.searcher_manager.get_lease_count())
+        self.assertEqual(1, searcher.doc_count())
+
+        self.searcher_manager.release(searcher)
+        self.assertEqual(0, self.searcher_manager.get_lease_count())
+        self.assertEqual(1, self.searcher_manager.get_idle_count())
+
+        # the idle searcher is reused
+        self.assertIs(searcher, self.searcher_manager.acquire())
+
+    def test_weighting(self):
+        searcher = self.searcher_manager.acquire(weighting=TF_IDF)
+        self.assertIsInstance(searcher.weighting, TF_IDF)
+        self.searcher_manager.release(searcher)
+
+        # the idf cache of the searcher is kept by the searches of the same weighting object
+        weighting = BM25F()
+        searcher = self.searcher_manager.acquire(weighting=weighting)
+        idf = searcher.idf('text', 'search')
+        self.searcher_manager.release(searcher)
+        searcher = self.searcher_manager.acquire(weighting=weighting)
+        self.assertIs(weighting, searcher.weighting)
+        self.assertEqual({('text', 'search'): idf}, searcher._idf_cache)
+        self.searcher_manager.release(searcher)
+
+        # and is cleared when the weighting is swapped
+        searcher = self.searcher_manager.acquire(weighting=TF_IDF())
+        self.assertEqual({}, searcher._idf_cache)
+        self.searcher_manager.release(searcher)
+
+    def test_refresh(self):
+        searcher = self.searcher_manager.acquire()
+
+        # no changes since the searcher was opened
+        self.assertFalse(self.searcher_manager.refresh())
+
+        writer = self.index.writer()
+        writer.add_document(id='2', text='search index')
+        writer.commit()
+
+        # the searcher of the old generation still works until it is released
+        self.assertTrue(self.searcher_manager.refresh())
+        self.assertEqual(1, searcher.doc_count())
+
+        self.searcher_manager.release(searcher)
+        self.assertEqual(0, self.searcher_manager.get_idle_count())
+        self.assertTrue(searcher.is_closed)
+
+        searcher = self.searcher_manager.acquire()
+        self.assertEqual(2, searcher.doc_count())
+        self.searcher_manager.release(searcher)
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2019 Minoru Osuka
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 		http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from whoosh.fields import ID, KEYWORD, NUMERIC, Schema, TEXT
+from whoosh.filedb.filestore import RamStorage
+from whoosh.query import Every, Term
+from whoosh.sorting import FieldFacet, MultiFacet
+
+from cockatrice.filter_cache import FilterDocIdSet, get_segment_bitset
+from cockatrice.sort import decode_search_after, encode_search_after, get_segment_sort_order, get_sort_fields, \
+    SearchAfterCollector
+
+
+class TestSort(unittest.TestCase):
+    def setUp(self):
+        self.schema = Schema(id=ID(unique=True, stored=True), n=NUMERIC(sortable=True), tag=KEYWORD(sortable=True),
+                             text=TEXT)
+        self.index = RamStorage().create_index(self.schema)
+
+        # two segments, with ties in both of the sort fields
+        for start in [0, 20]:
+            writer = self.index.writer()
+            for i in range(start, start + 20):
+                writer.add_document(id=str(i), n=i % 7, tag='tag{0}'.format(i % 3), text='a b' if i % 2 else 'a')
+            writer.commit(merge=False)
+
+    def tearDown(self):
+        self.index.close()
+
+    def test_get_sort_fields(self):
+        self.assertEqual((('n', True), ('tag', False)), get_sort_fields('-n, tag', self.schema))
+        self.assertEqual((('_score', True), ('n', False)), get_sort_fields(['_score', 'n'], self.schema))
+
+        # a field that does not exist
+        with self.assertRaises(ValueError):
+            get_sort_fields('unknown', self.schema)
+
+        # a field that is not sortable
+        with self.assertRaises(ValueError):
+            get_sort_fields('text', self.schema)
+
+        # no fields
+        with self.assertRaises(ValueError):
+            get_sort_fields(' , ', self.schema)
+
+    def test_search_after(self):
+        search_after = encode_search_after([3, b'tag1'], 10)
+        self.assertEqual(([3, b'tag1'], 10), decode_search_after(search_after))
+
+        with self.assertRaises(ValueError):
+            decode_search_after('invalid')
+
+    def __search_all(self, searcher, query, sort, page_len, sorted_order):
+        sort_fields = get_sort_fields(sort, self.schema)
+        matches = None
+        get_sort_order = None
+        if sorted_order:
+            matches = FilterDocIdSet([(offset, get_segment_bitset(query, subsearcher)) for subsearcher, offset in
+                                      searcher.leaf_searchers()])
+            get_sort_order = get_segment_sort_order
+
+        docnums = []
+        search_after = None
+        while True:
+            collector = SearchAfterCollector(sort_fields, limit=page_len, search_after=search_after, matches=matches,
+                                             get_sort_order=get_sort_order)
+            searcher.search_with_collector(query, collector)
+            results = collector.results()
+            self.assertEqual(len(searcher.search(query, limit=None)), len(results))
+            docnums.extend([hit.docnum for hit in results])
+
+            encoded = collector.get_search_after()
+            if encoded is None:
+                break
+            self.assertEqual(page_len, len(results.top_n))
+            search_after = decode_search_after(encoded)
+
+        return docnums
+
+    def test_search_after_collector(self):
+        facets = {
+            '-tag,n': MultiFacet([FieldFacet('tag', reverse=True), FieldFacet('n')]),
+            'n': FieldFacet('n'),
+            '-n,-tag': MultiFacet([FieldFacet('n', reverse=True), FieldFacet('tag', reverse=True)])
+        }
+
+        with self.index.searcher() as searcher:
+            self.assertEqual(2, len(searcher.leaf_searchers()))
+
+            for query in [Every(), Term('text', 'b')]:
+                for sort, facet in facets.items():
+                    expected = [hit.docnum for hit in searcher.search(query, sortedby=facet, limit=None)]
+                    # the pages are the same whether the matcher, the sort order or the matching documents are walked
+                    for sorted_order, page_len in [(False, 3), (True, 3), (True, 9)]:
+                        self.assertEqual(expected, self.__search_all(searcher, query, sort, page_len, sorted_order))
+
+                # the documents with the same score are in the order of the document numbers
+                expected = [hit.docnum for hit in searcher.search(query, limit=None)]
+                self.assertEqual(expected, self.__search_all(searcher, query, '_score', 4, False))
+
+    def test_deleted_documents(self):
+        writer = self.index.writer()
+        writer.delete_by_term('id', '0')
+        writer.commit(merge=False)
+
+        with self.index.searcher() as searcher:
+            # the bitset was made before the document was deleted
+            matches = FilterDocIdSet([(offset, get_segment_bitset(Every(), subsearcher)) for subsearcher, offset in
+                                      searcher.leaf_searchers()])
+            writer = self.index.writer()
+            writer.delete_by_term('id', '1')
+            writer.commit(merge=False)
+
+        with self.index.searcher() as searcher:
+            collector = SearchAfterCollector(get_sort_fields('n', self.schema), limit=100, matches=matches,
+                                             get_sort_order=get_segment_sort_order)
+            searcher.search_with_collector(Every(), collector)
+            results = collector.results()
+            self.assertEqual(38, len(results))
+            self.assertEqual(38, len(results.top_n))
+            self.assertNotIn('1', [hit['id'] for hit in results])
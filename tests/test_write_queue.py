@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2019 Minoru Osuka
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 		http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from threading import Event, Thread, Timer
+
+from cockatrice.write_queue import WriteQueue, WriteQueueTimeoutError
+
+
+class TestWriteQueue(unittest.TestCase):
+    def setUp(self):
+        self.batches = []
+        self.blocked = Event()
+        self.unblock = Event()
+        self.unblock.set()
+
+        self.write_queue = WriteQueue('test_index', self.write, batch_size=5)
+
+    def tearDown(self):
+        self.unblock.set()
+        self.write_queue.close()
+
+    def write(self, index_name, ops, callback):
+        self.blocked.set()
+        self.unblock.wait()
+
+        self.batches.append(ops)
+        counts = []
+        for op, items in ops:
+            if op == 'fail':
+                raise ValueError('failed to write')
+            counts.append(len(items))
+
+        callback(counts, None)
+
+    def test_put(self):
+        future = self.write_queue.put('put', [{'id': '1'}, {'id': '2'}])
+        self.assertEqual(2, future.result(timeout=5))
+        self.assertEqual([[('put', [{'id': '1'}, {'id': '2'}])]], self.batches)
+
+    def test_group_commit(self):
+        # hold the worker in the first batch so that the following writes are queued
+        self.unblock.clear()
+        first = self.write_queue.put('put', [{'id': '1'}])
+        self.assertTrue(self.blocked.wait(timeout=5))
+
+        futures = [
+            self.write_queue.put('put', [{'id': '2'}, {'id': '3'}]),
+            self.write_queue.put('delete', ['1']),
+            self.write_queue.put('put', [{'id': '4'}, {'id': '5'}]),
+            self.write_queue.put('put', [{'id': '6'}])
+        ]
+        self.assertEqual(6, self.write_queue.get_depth())
+
+        self.unblock.set()
+        self.assertEqual(1, first.result(timeout=5))
+        self.assertEqual([2, 1, 2, 1], [future.result(timeout=5) for future in futures])
+
+        # the queued writes are applied in order, in batches of at most 5 documents
+        self.assertEqual(3, len(self.batches))
+        self.assertEqual([('put', [{'id': '2'}, {'id': '3'}]), ('delete', ['1']), ('put', [{'id': '4'}, {'id': '5'}])],
+                         self.batches[1])
+        self.assertEqual([('put', [{'id': '6'}])], self.batches[2])
+        self.assertEqual(0, self.write_queue.get_depth())
+
+    def test_flush(self):
+        self.unblock.clear()
+        future = self.write_queue.put('put', [{'id': '1'}])
+        self.assertFalse(self.write_queue.flush(timeout=0.1))
+
+        self.unblock.set()
+        self.assertTrue(self.write_queue.flush(timeout=5))
+        self.assertTrue(future.done())
+
+    def test_failure(self):
+        future = self.write_queue.put('fail', [{'id': '1'}])
+        with self.assertRaises(ValueError):
+            future.result(timeout=5)
+
+        # the worker keeps running after a failed batch
+        future = self.write_queue.put('put', [{'id': '1'}])
+        self.assertEqual(1, future.result(timeout=5))
+
+    def test_max_in_flight(self):
+        callbacks = []
+
+        def write(index_name, ops, callback):
+            callbacks.append((ops, callback))
+
+        write_queue = WriteQueue('test_index', write, batch_size=1, max_in_flight=2)
+        try:
+            futures = [write_queue.put('put', [{'id': str(i)}]) for i in range(3)]
+            self.assertFalse(write_queue.flush(timeout=0.1))
+            self.assertEqual(2, len(callbacks))
+
+            # the third batch is sent once the first one has completed
+            callbacks[0][1]([1], None)
+            self.assertEqual(1, futures[0].result(timeout=5))
+            self.assertFalse(write_queue.flush(timeout=0.1))
+            self.assertEqual(3, len(callbacks))
+
+            callbacks[1][1]([1], None)
+            callbacks[2][1](None, ValueError('failed to write'))
+            self.assertTrue(write_queue.flush(timeout=5))
+            self.assertEqual(1, futures[1].result(timeout=5))
+            with self.assertRaises(ValueError):
+                futures[2].result(timeout=5)
+        finally:
+            write_queue.close()
+
+    def test_max_depth(self):
+        write_queue = WriteQueue('test_index', self.write, batch_size=2, max_depth=3)
+        try:
+            # hold the worker in the first batch so that the following writes are queued
+            self.unblock.clear()
+            first = write_queue.put('put', [{'id': '1'}])
+            self.assertTrue(self.blocked.wait(timeout=5))
+            futures = [write_queue.put('put', [{'id': '2'}, {'id': '3'}]), write_queue.put('put', [{'id': '4'}])]
+            self.assertEqual(3, write_queue.get_depth())
+
+            # the queue is full
+            with self.assertRaises(WriteQueueTimeoutError):
+                write_queue.put('put', [{'id': '5'}], timeout=0.1)
+
+            # a write waits for room in the queue
+            waiting = []
+            thread = Thread(target=lambda: waiting.append(write_queue.put('put', [{'id': '5'}])))
+            thread.start()
+            thread.join(0.1)
+            self.assertTrue(thread.is_alive())
+
+            self.unblock.set()
+            thread.join(5)
+            self.assertFalse(thread.is_alive())
+            self.assertEqual([1, 2, 1, 1], [future.result(timeout=5) for future in [first] + futures + waiting])
+
+            # a write larger than max_depth is queued once the queue is empty
+            future = write_queue.put('put', [{'id': str(i)} for i in range(5)], timeout=5)
+            self.assertEqual(5, future.result(timeout=5))
+        finally:
+            write_queue.close()
+
+    def test_close(self):
+        self.write_queue.close()
+        with self.assertRaises(ValueError):
+            self.write_queue.put('put', [{'id': '1'}])
+
+    def test_close_queued(self):
+        # hold the worker in the first batch so that the following write is queued
+        self.unblock.clear()
+        first = self.write_queue.put('put', [{'id': '1'}])
+        self.assertTrue(self.blocked.wait(timeout=5))
+        second = self.write_queue.put('put', [{'id': '2'}])
+
+        # the queued writes are applied before the queue has closed
+        Timer(0.1, self.unblock.set).start()
+        self.assertTrue(self.write_queue.close(timeout=5))
+        self.assertEqual([1, 1], [first.result(timeout=5), second.result(timeout=5)])
+
+    def test_close_timeout(self):
+        # hold the worker in the first batch so that the following write is queued
+        self.unblock.clear()
+        first = self.write_queue.put('put', [{'id': '1'}])
+        self.assertTrue(self.blocked.wait(timeout=5))
+        second = self.write_queue.put('put', [{'id': '2'}])
+
+        # the writes still queued after the timeout are not applied
+        self.assertFalse(self.write_queue.close(timeout=0.1))
+        with self.assertRaises(ValueError):
+            second.result(timeout=5)
+        self.assertEqual(0, self.write_queue.get_depth())
+
+        self.unblock.set()
+        self.assertEqual(1, first.result(timeout=5))
+        self.assertTrue(self.write_queue.flush(timeout=5))
+        self.assertEqual([[('put', [{'id': '1'}])]], self.batches)
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2019 Minoru Osuka
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 		http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from cockatrice.util.cache import LRUCache
+
+
+class TestLRUCache(unittest.TestCase):
+    def test_get(self):
+        cache = LRUCache(max_size=10)
+
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(0, cache.get('a', default=0))
+
+        cache.put('a', 1)
+        self.assertEqual(1, cache.get('a'))
+        self.assertTrue('a' in cache)
+        self.assertEqual(1, len(cache))
+
+    def test_evict(self):
+        cache = LRUCache(max_size=2)
+
+        cache.put('a', 1)
+        cache.put('b', 2)
+
+        # touch a, so b is the least recently used
+        self.assertEqual(1, cache.get('a'))
+        self.assertEqual(1, cache.put('c', 3))
+
+        self.assertEqual(2, len(cache))
+        self.assertEqual(1, cache.get('a'))
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(3, cache.get('c'))
+
+    def test_evict_bytes(self):
+        cache = LRUCache(max_size=10, max_bytes=100)
+
+        self.assertEqual(0, cache.put('a', 1, size=40))
+        self.assertEqual(0, cache.put('b', 2, size=40))
+        self.assertEqual(80, cache.get_bytes())
+
+        # a and b have to be evicted to fit c
+        self.assertEqual(2, cache.put('c', 3, size=90))
+        self.assertEqual(90, cache.get_bytes())
+        self.assertIsNone(cache.get('a'))
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(3, cache.get('c'))
+
+        # replacing an entry does not count its old size
+        self.assertEqual(0, cache.put('c', 4, size=50))
+        self.assertEqual(50, cache.get_bytes())
+
+        # a value larger than the cache is not stored
+        self.assertEqual(0, cache.put('d', 5, size=101))
+        self.assertIsNone(cache.get('d'))
+        self.assertEqual(50, cache.get_bytes())
+
+    def test_pop(self):
+        cache = LRUCache(max_size=10)
+
+        cache.put('a', 1)
+        self.assertEqual(1, cache.pop('a'))
+        self.assertIsNone(cache.pop('a'))
+        self.assertEqual(0, len(cache))
+
+    def test_clear(self):
+        cache = LRUCache(max_size=10)
+
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.clear()
+
+        self.assertEqual(0, len(cache))
+        self.assertIsNone(cache.get('a'))
+
+    def test_disabled(self):
+        cache = LRUCache(max_size=0)
+
+        cache.put('a', 1)
+        self.assertEqual(0, len(cache))
+        self.assertIsNone(cache.get('a'))
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2019 Minoru Osuka
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 		http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import socket
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from threading import Barrier, Event, Thread
+
+import requests
+from flask import Flask
+
+from cockatrice.util.http import ThreadPoolWSGIServer
+from tests import get_free_port
+
+
+class TestThreadPoolWSGIServer(unittest.TestCase):
+    def setUp(self):
+        self.released = Event()
+        self.barrier = Barrier(4)
+
+        def slow():
+            self.released.wait(timeout=10)
+            return 'OK'
+
+        def together():
+            # fails unless 4 requests are being served at the same time
+            self.barrier.wait(timeout=5)
+            return 'OK'
+
+        self.app = Flask('test_http')
+        self.app.add_url_rule('/slow', endpoint='slow', view_func=slow, methods=['GET'])
+        self.app.add_url_rule('/together', endpoint='together', view_func=together, methods=['GET'])
+        self.app.add_url_rule('/ok', endpoint='ok', view_func=lambda: 'OK', methods=['GET'])
+
+        self.port = get_free_port()
+
+    def tearDown(self):
+        self.released.set()
+        self.barrier.abort()
+        self.server.shutdown()
+
+    def __start_server(self, max_workers, max_queue_size, keep_alive_idle_timeout=1):
+        self.server = ThreadPoolWSGIServer('localhost', self.port, self.app, max_workers=max_workers,
+                                           max_queue_size=max_queue_size,
+                                           keep_alive_idle_timeout=keep_alive_idle_timeout)
+        Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def test_concurrent_requests(self):
+        self.__start_server(max_workers=4, max_queue_size=0)
+
+        url = 'http://localhost:{0}/together'.format(self.port)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            responses = [executor.submit(requests.get, url) for _ in range(4)]
+
+            for response in responses:
+                self.assertEqual(HTTPStatus.OK, response.result(timeout=10).status_code)
+
+    def test_queue_full(self):
+        self.__start_server(max_workers=1, max_queue_size=0)
+
+        url = 'http://localhost:{0}/slow'.format(self.port)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            busy = executor.submit(requests.get, url)
+            time.sleep(0.5)
+
+            # no worker and no queue slot left
+            response = requests.get(url)
+            self.assertEqual(HTTPStatus.SERVICE_UNAVAILABLE, response.status_code)
+
+            self.released.set()
+            self.assertEqual(HTTPStatus.OK, busy.result(timeout=5).status_code)
+
+    def __request(self, sock):
+        sock.sendall('GET /ok HTTP/1.1\r\nHost: localhost:{0}\r\n\r\n'.format(self.port).encode('utf-8'))
+        data = b''
+        while not data.endswith(b'OK'):
+            chunk = sock.recv(1024)
+            if not chunk:
+                break
+            data += chunk
+        return data
+
+    def test_keep_alive_idle_timeout(self):
+        self.__start_server(max_workers=1, max_queue_size=0, keep_alive_idle_timeout=0.5)
+
+        with socket.create_connection(('localhost', self.port), timeout=5) as sock:
+            # the requests of a keep-alive connection are served by the same worker
+            self.assertTrue(self.__request(sock).startswith(b'HTTP/1.1 200'))
+            self.assertTrue(self.__request(sock).startswith(b'HTTP/1.1 200'))
+
+            # the idle connection is closed after the idle timeout
+            start_time = time.time()
+            self.assertEqual(b'', sock.recv(1024))
+            self.assertLess(time.time() - start_time, 3)
+
+    def test_idle_connection_released(self):
+        self.__start_server(max_workers=1, max_queue_size=1, keep_alive_idle_timeout=10)
+
+        with socket.create_connection(('localhost', self.port), timeout=5) as sock:
+            # the idle connection holds the only worker
+            self.assertTrue(self.__request(sock).startswith(b'HTTP/1.1 200'))
+
+            # and is closed as soon as another connection waits for the worker
+            start_time = time.time()
+            response = requests.get('http://localhost:{0}/ok'.format(self.port), timeout=5)
+            self.assertEqual(HTTPStatus.OK, response.status_code)
+            self.assertLess(time.time() - start_time, 3)
+            self.assertEqual(b'', sock.recv(1024))
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2019 Minoru Osuka
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 		http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from datetime import datetime
+
+from cockatrice.util.protobuf import dict_to_document, document_to_dict
+
+
+class TestProtobuf(unittest.TestCase):
+    def test_document(self):
+        fields_dict = {
+            'id': '1',
+            'title': 'Search engine (computing)',
+            'count': 10,
+            'score': 1.5,
+            'published': True,
+            'blob': b'\x00\x01',
+            'timestamp': datetime(2019, 1, 2, 3, 4, 5)
+        }
+
+        doc = dict_to_document(fields_dict)
+        self.assertEqual(7, len(doc.fields))
+        self.assertEqual('bool_value', doc.fields[4].WhichOneof('value'))
+
+        self.assertEqual(fields_dict, document_to_dict(doc))
+
+    def test_document_unsupported_type(self):
+        with self.assertRaises(ValueError):
+            dict_to_document({'id': '1', 'tags': {'a', 'b'}})